@@ -20,6 +20,8 @@ limitations under the License.
 
 import os
 import logging
+from typing import TYPE_CHECKING, Any
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -28,17 +30,33 @@ from aixplain._compat import install as _install_compat  # noqa: E402
 
 _install_compat()
 
-from .v2.core import Aixplain  # noqa: E402
+if TYPE_CHECKING:
+    from .v2.core import Aixplain, AsyncAixplain
 
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=LOG_LEVEL)
 
 
-aixplain_v2 = None
-try:
-    aixplain_v2 = Aixplain()
-except Exception:
-    pass
+def __getattr__(name: str) -> Any:
+    """Load the v2 client lazily (PEP 562) so ``import aixplain`` stays cheap.
+
+    ``Aixplain`` and ``AsyncAixplain`` import the v2 resources on first access;
+    ``aixplain_v2`` builds a default ``Aixplain()`` context (or ``None`` when no
+    API key is configured) the first time it is used.
+    """
+    if name in ("Aixplain", "AsyncAixplain"):
+        from .v2 import core
+
+        value = getattr(core, name)
+    elif name == "aixplain_v2":
+        try:
+            value = __getattr__("Aixplain")()
+        except Exception:
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
-__all__ = ["Aixplain", "aixplain_v2"]
+__all__ = ["Aixplain", "AsyncAixplain", "aixplain_v2"]
@@ -3,21 +3,33 @@
 This module provides a generic caching system for aiXplain assets (Models, Pipelines,
 Agents, etc.) with file-based persistence, automatic serialization, expiration,
 and thread-safe operations.
+
+There is one :class:`AssetCache` per asset type and cache file in each process:
+``AssetCache(Model)`` returns the shared instance, so a warm lookup is a dict
+access. Entries are persisted in a SQLite file keyed by asset id and are only
+deserialized when they are first requested.
+
+Each entry also carries :class:`~aixplain.utils.cache_utils.CacheValidators`
+(ETag / updatedAt and when it was last confirmed current). An expired entry is
+kept as *stale* and revalidated on its own with a conditional request, so a
+cache refresh costs one small request per asset used instead of a full
+catalog download.
 """
 
 import os
 import logging
-import json
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, MutableMapping, Optional, Tuple
 from dataclasses import dataclass
-from filelock import FileLock
-
-logging.getLogger("filelock").setLevel(logging.INFO)
 
 from typing import TypeVar, Generic, Type
 from typing import List
 
+from aixplain.utils.cache_utils import CacheValidators
+from aixplain.utils.json_utils import dumps, loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +56,35 @@ class Store(Generic[T]):
     expiry: int
 
 
+class _LazyAssets(MutableMapping):
+    """Mapping view over an :class:`AssetCache` that deserializes entries on access."""
+
+    def __init__(self, cache: "AssetCache") -> None:
+        self._cache = cache
+
+    def __getitem__(self, asset_id: str) -> Any:
+        asset = self._cache._lookup(asset_id)
+        if asset is None:
+            raise KeyError(asset_id)
+        return asset
+
+    def __setitem__(self, asset_id: str, asset: Any) -> None:
+        self._cache._put(asset_id, asset)
+
+    def __delitem__(self, asset_id: str) -> None:
+        if not self._cache._remove(asset_id):
+            raise KeyError(asset_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._cache._ids())
+
+    def __len__(self) -> int:
+        return self._cache._count()
+
+    def __contains__(self, asset_id: object) -> bool:
+        return isinstance(asset_id, str) and self._cache._lookup(asset_id) is not None
+
+
 class AssetCache(Generic[T]):
     """A modular caching system for aiXplain assets with file-based persistence.
 
@@ -51,27 +92,42 @@ class AssetCache(Generic[T]):
     (Models, Pipelines, Agents, etc.) with automatic serialization, expiration,
     and thread-safe file persistence.
 
-    The cache uses JSON files for storage and implements file locking to ensure
-    thread safety. It also supports automatic cache invalidation based on
-    expiration time.
+    Instances are process-wide singletons per asset type and cache file. Assets
+    are stored one row per id in a SQLite file, so adding an asset writes one
+    row instead of rewriting the whole cache, and looking one up reads (and
+    deserializes) only that row. Deserialized assets are kept in memory.
 
     Attributes:
         cls (Type[T]): The class type of assets to be cached.
-        cache_file (str): Path to the JSON file storing the cached data.
-        lock_file (str): Path to the lock file for thread-safe operations.
-        store (Store[T]): The in-memory store containing cached data and expiry.
+        cache_file (str): Path to the SQLite file storing the cached data.
+        store (Store[T]): Lazy view of the cached data and its expiry.
 
     Note:
         The cached assets must be serializable to JSON and should implement
         either a to_dict() method or have a standard __dict__ attribute.
     """
 
+    _instances: Dict[Tuple[type, str], "AssetCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, asset_cls: Type[T], cache_filename: Optional[str] = None) -> "AssetCache[T]":
+        """Return the shared cache for ``asset_cls`` and its cache file."""
+        cache_file = cls._cache_path(asset_cls, cache_filename)
+        key = (asset_cls, os.path.abspath(cache_file))
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._instances[key] = instance
+            return instance
+
     def __init__(
         self,
         cls: Type[T],
         cache_filename: Optional[str] = None,
     ) -> None:
-        """Initialize a new AssetCache instance.
+        """Initialize the shared AssetCache instance (no-op when already initialized).
 
         Args:
             cls (Type[T]): The class type of assets to be cached. Must be
@@ -79,22 +135,68 @@ class AssetCache(Generic[T]):
             cache_filename (Optional[str], optional): Base name for the cache file.
                 If None, uses lowercase class name. Defaults to None.
         """
+        if self._initialized:
+            return
+
         self.cls = cls
+        self.cache_file = self._cache_path(cls, cache_filename)
+        self.legacy_cache_file = os.path.splitext(self.cache_file)[0] + ".json"
+        self._lock = threading.RLock()
+        self._entries: Dict[str, T] = {}
+        self._known: Optional[set] = None
+        self._validators: Dict[str, CacheValidators] = {}
+        self._expiry = self.compute_expiry()
+
+        logger.info(f"Initializing AssetCache for {self.cls.__name__} with cache file: {self.cache_file}")
+        self.load()
+        self._initialized = True
+
+    @staticmethod
+    def _cache_path(cls: type, cache_filename: Optional[str]) -> str:
+        """Return the SQLite file used for ``cls``."""
         if cache_filename is None:
-            cache_filename = self.cls.__name__.lower()
+            cache_filename = cls.__name__.lower()
+        return os.path.join(CACHE_FOLDER, f"{cache_filename}.sqlite")
+
+    @classmethod
+    def clear_instances(cls) -> None:
+        """Forget every shared instance; the next ``AssetCache(...)`` reloads from disk."""
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, creating its schema on first use."""
+        os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.cache_file, timeout=30)
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS assets (id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS validators (id TEXT PRIMARY KEY, etag TEXT, updated_at TEXT, checked_at REAL)"
+        )
+        return conn
 
-        # create cache file and lock file name
-        self.cache_file = os.path.join(CACHE_FOLDER, f"{cache_filename}.json")
-        self.lock_file = os.path.join(CACHE_FOLDER, f"{cache_filename}.lock")
+    def __len__(self) -> int:
+        """Number of cached assets, fresh or stale."""
+        return self._count()
 
-        logger.info(f"Initializing AssetCache for {self.cls.__name__} with cache file: {self.cache_file}")
+    @property
+    def store(self) -> Store[T]:
+        """Lazy view of the cached assets and expiry (assets load on access)."""
+        return Store(data=_LazyAssets(self), expiry=self._expiry)
 
-        self.store = Store(data={}, expiry=self.compute_expiry())
-        self.load()
+    def expiry_duration(self) -> int:
+        """Return how long, in seconds, cached data stays fresh.
 
-        if not os.path.exists(self.cache_file):
-            logger.info(f"Cache file doesn't exist, creating new one: {self.cache_file}")
-            self.save()
+        Uses CACHE_EXPIRY_TIME environment variable if set, otherwise falls back
+        to the default CACHE_DURATION.
+        """
+        try:
+            return int(os.getenv("CACHE_EXPIRY_TIME", CACHE_DURATION))
+        except Exception as e:
+            logger.warning(f"Failed to parse CACHE_EXPIRY_TIME: {e}, fallback to default value {CACHE_DURATION}")
+            # remove the CACHE_EXPIRY_TIME from the environment variables
+            del os.environ["CACHE_EXPIRY_TIME"]
+            return CACHE_DURATION
 
     def compute_expiry(self) -> int:
         """Calculate the expiration timestamp for cached data.
@@ -110,132 +212,174 @@ class AssetCache(Generic[T]):
             If CACHE_EXPIRY_TIME is invalid, it will be removed from environment
             variables and the default duration will be used.
         """
-        try:
-            expiry = int(os.getenv("CACHE_EXPIRY_TIME", CACHE_DURATION))
-        except Exception as e:
-            logger.warning(f"Failed to parse CACHE_EXPIRY_TIME: {e}, fallback to default value {CACHE_DURATION}")
-            # remove the CACHE_EXPIRY_TIME from the environment variables
-            del os.environ["CACHE_EXPIRY_TIME"]
-            expiry = CACHE_DURATION
-
-        return time.time() + int(expiry)
+        return time.time() + self.expiry_duration()
 
     def invalidate(self) -> None:
-        """Clear the cache and remove cache files.
-
-        This method:
-        1. Resets the in-memory store with empty data and new expiry
-        2. Deletes the cache file if it exists
-        3. Deletes the lock file if it exists
-        """
+        """Clear the cache in memory and on disk and start a new expiry period."""
         logger.info(f"Invalidating cache for {self.cls.__name__}")
-        self.store = Store(data={}, expiry=self.compute_expiry())
-        # delete cache file and lock file
-        if os.path.exists(self.cache_file):
-            os.remove(self.cache_file)
-            logger.info(f"Removed cache file: {self.cache_file}")
-        if os.path.exists(self.lock_file):
-            os.remove(self.lock_file)
-            logger.info(f"Removed lock file: {self.lock_file}")
+        with self._lock:
+            self._entries = {}
+            self._known = set()
+            self._validators = {}
+            self._expiry = self.compute_expiry()
+            try:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM assets")
+                    conn.execute("DELETE FROM validators")
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES ('expiry', ?)", (str(self._expiry),))
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to invalidate cache file {self.cache_file}: {e}")
+            if os.path.exists(self.legacy_cache_file):
+                os.remove(self.legacy_cache_file)
 
     def load(self) -> None:
-        """Load cached data from the cache file.
-
-        This method reads the cache file (if it exists) and loads the data into
-        the in-memory store. It performs the following:
-        1. Checks if cache file exists, if not, invalidates cache
-        2. Uses file locking to ensure thread-safe reading
-        3. Deserializes JSON data and converts to appropriate asset instances
-        4. Checks expiration time and invalidates if expired
-        5. Handles any errors by invalidating the cache
+        """Load the cache expiry and the set of cached ids from disk.
 
-        Note:
-            If any errors occur during loading (file not found, invalid JSON,
-            deserialization errors), the cache will be invalidated.
+        Asset payloads are not read here; each one is read and deserialized
+        the first time it is requested. A cache file written by older SDK
+        versions (one JSON document) is imported once. Unreadable caches are
+        invalidated; expired ones are kept so their entries can be revalidated
+        individually (see :meth:`is_fresh`).
         """
         logger.info(f"Loading cache for {self.cls.__name__} from {self.cache_file}")
-
-        if not os.path.exists(self.cache_file):
-            logger.info(f"Cache file doesn't exist: {self.cache_file}")
-            self.invalidate()
-            return
-
+        with self._lock:
+            self._entries = {}
+            try:
+                if not os.path.exists(self.cache_file) and os.path.exists(self.legacy_cache_file):
+                    self._import_legacy()
+                with self._connect() as conn:
+                    row = conn.execute("SELECT value FROM meta WHERE key = 'expiry'").fetchone()
+                    ids = {r[0] for r in conn.execute("SELECT id FROM assets")}
+                    validators = {
+                        r[0]: CacheValidators(etag=r[1], updated_at=r[2], checked_at=r[3] or 0.0)
+                        for r in conn.execute("SELECT id, etag, updated_at, checked_at FROM validators")
+                    }
+                conn.close()
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.error(f"Failed to load cache data for {self.cls.__name__}: {e}")
+                self._reset_file()
+                self.invalidate()
+                return
+
+            if row is None:
+                self.invalidate()
+                return
+
+            self._expiry = float(row[0])
+            self._known = ids
+            self._validators = validators
+            if self._expiry < time.time():
+                logger.info(f"Cache expired for {self.cls.__name__}; {len(ids)} stale items will be revalidated on use")
+            else:
+                logger.info(f"Found {len(ids)} cached items for {self.cls.__name__}")
+
+    def _import_legacy(self) -> None:
+        """Import a JSON cache file written by older SDK versions."""
+        with open(self.legacy_cache_file, "r") as f:
+            legacy = loads(f.read())
+        rows = [(asset_id, dumps(data, ensure_ascii=False)) for asset_id, data in (legacy.get("data") or {}).items()]
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('expiry', ?)", (str(legacy.get("expiry", 0)),))
+            conn.executemany("INSERT OR REPLACE INTO assets VALUES (?, ?)", rows)
+        conn.close()
+        os.remove(self.legacy_cache_file)
+        logger.info(f"Imported {len(rows)} items from legacy cache file {self.legacy_cache_file}")
+
+    def _reset_file(self) -> None:
+        """Delete an unreadable cache file so it can be recreated."""
         try:
-            with FileLock(self.lock_file):
-                logger.info(f"Acquired file lock for loading: {self.lock_file}")
-                with open(self.cache_file, "r") as f:
-                    cache_data = json.load(f)
-                    expiry = cache_data["expiry"]
-                    raw_data = cache_data["data"]
-
-                    logger.info(f"Found {len(raw_data)} cached items for {self.cls.__name__}")
-
-                    parsed_data = {k: self.cls.from_dict(v) for k, v in raw_data.items()}
-
-                    self.store = Store(data=parsed_data, expiry=expiry)
-
-                    if self.store.expiry < time.time():
-                        logger.warning(
-                            f"Cache expired for {self.cls.__name__} (expiry: {self.store.expiry}, current: {time.time()})"
-                        )
-                        self.invalidate()
-                    else:
-                        logger.info(f"Successfully loaded {len(parsed_data)} cached items for {self.cls.__name__}")
-
-        except Exception as e:
-            logger.error(f"Failed to load cache data for {self.cls.__name__}: {e}")
-            self.invalidate()
+            if os.path.exists(self.cache_file):
+                os.remove(self.cache_file)
+        except OSError as e:
+            logger.error(f"Failed to remove cache file {self.cache_file}: {e}")
 
     def save(self) -> None:
-        """Save the current cache state to the cache file.
+        """Persist the expiry and every in-memory asset to the cache file.
 
-        This method serializes the current cache state to JSON and writes it
-        to the cache file. It performs the following:
-        1. Creates the cache directory if it doesn't exist
-        2. Uses file locking to ensure thread-safe writing
-        3. Serializes each cached asset to a JSON-compatible format
-        4. Writes the serialized data and expiry time to the cache file
-
-        Note:
-            If serialization fails for any asset, that asset will be skipped
-            and an error will be logged, but the save operation will continue
-            for other assets.
+        Individual ``add`` calls already write their row, so this is only
+        needed after modifying cached assets in place.
         """
-        logger.info(f"Saving cache for {self.cls.__name__} with {len(self.store.data)} items")
-
-        try:
-            os.makedirs(CACHE_FOLDER, exist_ok=True)
-            logger.info(f"Cache directory created/verified: {CACHE_FOLDER}")
-
-            with FileLock(self.lock_file):
-                logger.info(f"Acquired file lock for saving: {self.lock_file}")
-                with open(self.cache_file, "w") as f:
-                    data_dict = {}
-                    serialization_errors = 0
-
-                    for asset_id, asset in self.store.data.items():
-                        try:
-                            data_dict[asset_id] = serialize(asset)
-                        except Exception as e:
-                            logger.error(f"Error serializing {asset_id}: {e}")
-                            serialization_errors += 1
-
-                    serializable_store = {
-                        "expiry": self.store.expiry,
-                        "data": data_dict,
-                    }
-
-                    json.dump(serializable_store, f, indent=4)
-
-                    if serialization_errors > 0:
-                        logger.warning(
-                            f"Saved cache for {self.cls.__name__} with {serialization_errors} serialization errors"
-                        )
-                    else:
-                        logger.info(f"Successfully saved cache for {self.cls.__name__} with {len(data_dict)} items")
-
-        except Exception as e:
-            logger.error(f"Failed to save cache for {self.cls.__name__}: {e}")
+        with self._lock:
+            rows = []
+            for asset_id, asset in self._entries.items():
+                try:
+                    payload = serialize(asset.__dict__ if hasattr(asset, "__dict__") else asset)
+                    rows.append((asset_id, dumps(payload, ensure_ascii=False)))
+                except Exception as e:
+                    logger.error(f"Error serializing {asset_id}: {e}")
+            try:
+                with self._connect() as conn:
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES ('expiry', ?)", (str(self._expiry),))
+                    conn.executemany("INSERT OR REPLACE INTO assets VALUES (?, ?)", rows)
+                conn.close()
+                logger.info(f"Saved cache for {self.cls.__name__} with {len(rows)} items")
+            except sqlite3.Error as e:
+                logger.error(f"Failed to save cache for {self.cls.__name__}: {e}")
+
+    def _lookup(self, asset_id: str) -> Optional[T]:
+        """Return the asset from memory, reading and deserializing its row on first access."""
+        asset = self._entries.get(asset_id)
+        if asset is not None:
+            return asset
+        with self._lock:
+            asset = self._entries.get(asset_id)
+            if asset is not None:
+                return asset
+            if self._known is not None and asset_id not in self._known:
+                return None
+            try:
+                with self._connect() as conn:
+                    row = conn.execute("SELECT data FROM assets WHERE id = ?", (asset_id,)).fetchone()
+                conn.close()
+                if row is None:
+                    return None
+                asset = self.cls.from_dict(loads(row[0]))
+            except Exception as e:
+                logger.error(f"Failed to load cached {self.cls.__name__} {asset_id}: {e}")
+                return None
+            self._entries[asset_id] = asset
+            return asset
+
+    def _put(self, asset_id: str, asset: T, validators: Optional[CacheValidators] = None) -> None:
+        """Store ``asset`` in memory and write its row, stamped as checked now."""
+        payload = dumps(serialize(asset.__dict__ if hasattr(asset, "__dict__") else asset), ensure_ascii=False)
+        validators = self._stamp(validators)
+        with self._lock:
+            self._entries[asset_id] = asset
+            self._validators[asset_id] = validators
+            if self._known is not None:
+                self._known.add(asset_id)
+            try:
+                with self._connect() as conn:
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES ('expiry', ?)", (str(self._expiry),))
+                    conn.execute("INSERT OR REPLACE INTO assets VALUES (?, ?)", (asset_id, payload))
+                    self._write_validators(conn, [(asset_id, validators)])
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to save {self.cls.__name__} {asset_id} to cache: {e}")
+
+    def _remove(self, asset_id: str) -> bool:
+        """Remove ``asset_id`` from memory and disk; return whether it was cached."""
+        with self._lock:
+            self._entries.pop(asset_id, None)
+            self._validators.pop(asset_id, None)
+            if self._known is not None:
+                self._known.discard(asset_id)
+            with self._connect() as conn:
+                conn.execute("DELETE FROM validators WHERE id = ?", (asset_id,))
+                deleted = conn.execute("DELETE FROM assets WHERE id = ?", (asset_id,)).rowcount
+            conn.close()
+            return deleted > 0
+
+    def _ids(self) -> List[str]:
+        """Return the ids of every cached asset."""
+        with self._lock:
+            return sorted(self._known or ())
+
+    def _count(self) -> int:
+        """Return the number of cached assets."""
+        return len(self._known or ())
 
     def get(self, asset_id: str) -> Optional[T]:
         """Retrieve a cached asset by its ID.
@@ -246,53 +390,122 @@ class AssetCache(Generic[T]):
         Returns:
             Optional[T]: The cached asset instance if found, None otherwise.
         """
-        result = self.store.data.get(asset_id)
-        if result:
-            logger.info(f"Cache hit for {self.cls.__name__} asset: {asset_id}")
+        result = self._lookup(asset_id)
+        if result is not None:
+            logger.debug(f"Cache hit for {self.cls.__name__} asset: {asset_id}")
         else:
-            logger.info(f"Cache miss for {self.cls.__name__} asset: {asset_id}")
+            logger.debug(f"Cache miss for {self.cls.__name__} asset: {asset_id}")
         return result
 
-    def add(self, asset: T) -> None:
+    def add(self, asset: T, validators: Optional[CacheValidators] = None) -> None:
         """Add a single asset to the cache.
 
         Args:
             asset (T): The asset instance to cache. Must have an 'id' attribute
                 and be serializable to JSON.
+            validators (Optional[CacheValidators], optional): ETag / updatedAt
+                returned with the asset, used to revalidate it once stale.
 
         Note:
-            This method automatically saves the updated cache to disk after
-            adding the asset.
+            Only this asset's row is written to disk.
         """
         logger.info(f"Adding {self.cls.__name__} asset to cache: {asset.id}")
-        self.store.data[asset.id] = asset.__dict__
-        self.save()
+        self._put(asset.id, asset, validators)
 
-    def add_list(self, assets: List[T]) -> None:
+    def add_list(self, assets: List[T], validators: Optional[Dict[str, CacheValidators]] = None) -> None:
         """Add multiple assets to the cache at once.
 
-        This method replaces all existing cached assets with the new list.
+        This method replaces all existing cached assets with the new list and
+        starts a new expiry period.
 
         Args:
             assets (List[T]): List of asset instances to cache. Each asset must
                 have an 'id' attribute and be serializable to JSON.
-
-        Note:
-            This method automatically saves the updated cache to disk after
-            adding the assets.
+            validators (Optional[Dict[str, CacheValidators]], optional): Validators
+                keyed by asset id.
         """
         logger.info(f"Adding {len(assets)} {self.cls.__name__} assets to cache (replacing existing)")
-        self.store.data = {asset.id: asset.__dict__ for asset in assets}
-        self.save()
+        rows = []
+        for asset in assets:
+            try:
+                rows.append((asset.id, dumps(serialize(asset.__dict__), ensure_ascii=False)))
+            except Exception as e:
+                logger.error(f"Error serializing {getattr(asset, 'id', asset)}: {e}")
+        stamped = {asset_id: self._stamp((validators or {}).get(asset_id)) for asset_id, _ in rows}
+        with self._lock:
+            self._entries = {asset.id: asset for asset in assets}
+            self._known = set(stamped)
+            self._validators = stamped
+            self._expiry = self.compute_expiry()
+            try:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM assets")
+                    conn.execute("DELETE FROM validators")
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES ('expiry', ?)", (str(self._expiry),))
+                    conn.executemany("INSERT OR REPLACE INTO assets VALUES (?, ?)", rows)
+                    self._write_validators(conn, stamped.items())
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to save cache for {self.cls.__name__}: {e}")
+
+    @staticmethod
+    def _stamp(validators: Optional[CacheValidators]) -> CacheValidators:
+        """Return a copy of ``validators`` marked as checked now."""
+        validators = validators or CacheValidators()
+        return CacheValidators(etag=validators.etag, updated_at=validators.updated_at, checked_at=time.time())
+
+    @staticmethod
+    def _write_validators(conn: sqlite3.Connection, items: Any) -> None:
+        """Upsert ``(asset_id, CacheValidators)`` pairs."""
+        conn.executemany(
+            "INSERT OR REPLACE INTO validators VALUES (?, ?, ?, ?)",
+            [(asset_id, v.etag, v.updated_at, v.checked_at) for asset_id, v in items],
+        )
+
+    def validators(self, asset_id: str) -> CacheValidators:
+        """Return the validators of a cached asset (empty if it has none)."""
+        return self._validators.get(asset_id) or CacheValidators()
+
+    def is_fresh(self, asset_id: str) -> bool:
+        """Whether ``asset_id`` was confirmed current within CACHE_EXPIRY_TIME.
+
+        Stale assets are still returned by :meth:`get`; callers should
+        revalidate them (e.g. with a conditional request) before relying on them.
+        """
+        return self.validators(asset_id).is_fresh(self.expiry_duration())
+
+    def mark_valid(self, asset_id: str, validators: Optional[CacheValidators] = None) -> None:
+        """Record that a cached asset is still current (e.g. after ``304 Not Modified``).
+
+        Args:
+            asset_id (str): Id of the revalidated asset.
+            validators (Optional[CacheValidators], optional): Validators sent
+                with the response; missing values keep the previous ones.
+        """
+        previous = self.validators(asset_id)
+        merged = self._stamp(
+            CacheValidators(
+                etag=(validators.etag if validators else None) or previous.etag,
+                updated_at=(validators.updated_at if validators else None) or previous.updated_at,
+            )
+        )
+        with self._lock:
+            self._validators[asset_id] = merged
+            try:
+                with self._connect() as conn:
+                    self._write_validators(conn, [(asset_id, merged)])
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to update validators of {self.cls.__name__} {asset_id}: {e}")
 
     def get_all(self) -> List[T]:
         """Retrieve all cached assets.
 
         Returns:
-            List[T]: List of all cached asset instances. Returns an empty list
-                if the cache is empty.
+            List[T]: List of all cached asset instances (deserializing any not
+                yet loaded). Returns an empty list if the cache is empty.
         """
-        return list(self.store.data.values())
+        return [asset for asset in (self._lookup(asset_id) for asset_id in self._ids()) if asset is not None]
 
     def has_valid_cache(self) -> bool:
         """Check if the cache is valid and not expired.
@@ -301,11 +514,7 @@ class AssetCache(Generic[T]):
             bool: True if the cache has not expired and contains data,
                 False otherwise.
         """
-        is_valid = self.store.expiry >= time.time() and bool(self.store.data)
-        logger.info(
-            f"Cache validity check for {self.cls.__name__}: {is_valid} (expiry: {self.store.expiry}, current: {time.time()}, data count: {len(self.store.data)})"
-        )
-        return is_valid
+        return self._expiry >= time.time() and self._count() > 0
 
 
 def serialize(obj: Any) -> Any:
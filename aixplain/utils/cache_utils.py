@@ -2,6 +2,10 @@ import os
 import json
 import time
 import logging
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import format_datetime
+from typing import Any, Dict, Mapping, Optional, Text
 from filelock import FileLock
 
 logging.getLogger("filelock").setLevel(logging.INFO)
@@ -26,6 +30,79 @@ def get_cache_expiry() -> int:
     return int(os.getenv("CACHE_EXPIRY_TIME", CACHE_DURATION))
 
 
+@dataclass
+class CacheValidators:
+    """HTTP validators of a cached record, used to revalidate it once stale.
+
+    Attributes:
+        etag (Optional[Text]): ``ETag`` header returned with the record.
+        updated_at (Optional[Text]): ``updatedAt`` of the record (ISO 8601) or
+            its ``Last-Modified`` header.
+        checked_at (float): Unix time the record was last confirmed current.
+    """
+
+    etag: Optional[Text] = None
+    updated_at: Optional[Text] = None
+    checked_at: float = 0.0
+
+    def is_fresh(self, max_age: Optional[int] = None) -> bool:
+        """Whether the record was confirmed current less than ``max_age`` seconds ago.
+
+        Args:
+            max_age (Optional[int], optional): Freshness window in seconds.
+                Defaults to CACHE_EXPIRY_TIME.
+        """
+        max_age = get_cache_expiry() if max_age is None else max_age
+        return time.time() - self.checked_at < max_age
+
+
+def validators_from_response(headers: Mapping[Text, Text], body: Any = None) -> CacheValidators:
+    """Extract the validators of a freshly fetched record.
+
+    Args:
+        headers (Mapping[Text, Text]): Response headers.
+        body (Any, optional): Decoded response body; its ``updatedAt`` is used
+            when present.
+
+    Returns:
+        CacheValidators: Validators stamped with the current time.
+    """
+    headers = headers if isinstance(headers, Mapping) else {}
+    etag = headers.get("ETag")
+    updated_at = body.get("updatedAt") if isinstance(body, dict) else None
+    last_modified = headers.get("Last-Modified")
+    if not isinstance(updated_at, str):
+        updated_at = last_modified if isinstance(last_modified, str) else None
+    return CacheValidators(etag=etag if isinstance(etag, str) else None, updated_at=updated_at, checked_at=time.time())
+
+
+def conditional_headers(validators: Optional[CacheValidators]) -> Dict[Text, Text]:
+    """Build ``If-None-Match`` / ``If-Modified-Since`` headers for a revalidation request.
+
+    Backends that do not support conditional requests ignore these headers and
+    answer with the full record, so they are always safe to send.
+
+    Args:
+        validators (Optional[CacheValidators]): Validators of the cached record.
+
+    Returns:
+        Dict[Text, Text]: Headers to merge into the request (empty without validators).
+    """
+    headers = {}
+    if validators is None:
+        return headers
+    if validators.etag:
+        headers["If-None-Match"] = validators.etag
+    if validators.updated_at:
+        try:
+            updated_at = datetime.fromisoformat(validators.updated_at.replace("Z", "+00:00"))
+            headers["If-Modified-Since"] = format_datetime(updated_at, usegmt=updated_at.tzinfo is not None)
+        except ValueError:
+            # Already an HTTP date (Last-Modified header)
+            headers["If-Modified-Since"] = validators.updated_at
+    return headers
+
+
 def save_to_cache(cache_file: str, data: dict, lock_file: str) -> None:
     """Save data to a cache file with thread-safe file locking.
 
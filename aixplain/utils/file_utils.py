@@ -21,6 +21,7 @@ import requests
 import aixplain.utils.config as config
 from aixplain.enums.license import License
 from aixplain.utils.request_utils import _request_with_retry
+from aixplain.utils.transfer_utils import DEFAULT_MAX_WORKERS, download_file, stream_upload
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Optional, Text, Union, Dict, List
@@ -29,11 +30,20 @@ from urllib.parse import urljoin, urlparse
 from pandas import DataFrame
 
 
-def save_file(download_url: Text, download_file_path: Optional[Union[str, Path]] = None) -> Union[str, Path]:
+def save_file(
+    download_url: Text,
+    download_file_path: Optional[Union[str, Path]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    checksum: Optional[Text] = None,
+    checksum_algorithm: Text = "sha256",
+) -> Union[str, Path]:
     """Download and save a file from a given URL.
 
     This function downloads a file from the specified URL and saves it either
     to a specified path or to a generated path in the 'aiXplain' directory.
+    The file is streamed to disk in chunks; when the server supports HTTP
+    range requests, chunks are fetched in parallel and an interrupted download
+    resumes where it stopped the next time the same path is requested.
 
     Args:
         download_url (Text): URL of the file to download.
@@ -41,10 +51,19 @@ def save_file(download_url: Text, download_file_path: Optional[Union[str, Path]]
             downloaded file should be saved. If None, generates a folder 'aiXplain'
             in the current working directory and saves the file there with a UUID
             name. Defaults to None.
+        max_workers (int, optional): Number of ranged requests run in parallel.
+            Defaults to 4.
+        checksum (Optional[Text], optional): Expected hex digest of the file,
+            verified before the file is saved. Defaults to None.
+        checksum_algorithm (Text, optional): hashlib algorithm of ``checksum``.
+            Defaults to "sha256".
 
     Returns:
         Union[str, Path]: Path where the file was downloaded.
 
+    Raises:
+        TransferError: If the download fails or the size or checksum does not match.
+
     Note:
         If download_file_path is None, the file will be saved with a UUID name
         and the original file extension in the 'aiXplain' directory.
@@ -55,9 +74,14 @@ def save_file(download_url: Text, download_file_path: Optional[Union[str, Path]]
         save_dir.mkdir(parents=True, exist_ok=True)
         file_ext = Path(download_url).suffix.split("?")[0]
         download_file_path = save_dir / (str(uuid4()) + file_ext)
-    r = _request_with_retry("get", download_url)
-    with open(download_file_path, "wb") as f:
-        f.write(r.content)
+    download_file(
+        download_url,
+        download_file_path,
+        max_workers=max_workers,
+        checksum=checksum,
+        checksum_algorithm=checksum_algorithm,
+        request=_request_with_retry,
+    )
     return download_file_path
 
 
@@ -124,7 +148,8 @@ def upload_data(
     """Upload a file to S3 using pre-signed URLs with retry support.
 
     This function handles file uploads to S3 by first obtaining a pre-signed URL
-    from the aiXplain backend and then using it to upload the file. It supports
+    from the aiXplain backend and then streaming the file to it from disk, so
+    memory use does not grow with the file size. It supports
     both temporary and permanent storage with optional metadata like tags and
     license information.
 
@@ -188,25 +213,9 @@ def upload_data(
         headers = {"Content-Type": content_type}
         if content_encoding is not None:
             headers["Content-Encoding"] = content_encoding
-        payload = open(file_name, "rb").read()
-        # saving the file into the pre-signed URL
-        r = _request_with_retry("put", presigned_url, headers=headers, data=payload)
-
-        # if the process fail, try one more
-        if r.status_code != 200:
-            if nattempts > 0:
-                return upload_data(
-                    file_name=file_name,
-                    content_type=content_type,
-                    tags=tags,
-                    license=license,
-                    is_temp=is_temp,
-                    content_encoding=content_encoding,
-                    nattempts=nattempts - 1,
-                    return_download_link=return_download_link,
-                )
-            else:
-                raise Exception("File Uploading Error: Failure on Uploading to S3.")
+        # stream the file from disk into the pre-signed URL; a rejected upload
+        # raises TransferError and is retried below
+        stream_upload(file_name, presigned_url, headers=headers, request=_request_with_retry)
         if return_download_link is False:
             return _build_s3_link_from_presigned_url(presigned_url, path)
         return download_link
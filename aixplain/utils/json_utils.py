@@ -0,0 +1,185 @@
+"""JSON codec shared by the SDK hot paths.
+
+Response decoding, streamed chunks, request payloads and the local caches all
+go through :func:`loads` and :func:`dumps`. They use `orjson
+<https://github.com/ijl/orjson>`_ or `ujson <https://github.com/ultrajson/ultrajson>`_
+when one is installed (``pip install aixplain[fast-json]``) and the standard
+library :mod:`json` module otherwise.
+
+The fast backends are only a speed-up: documents or objects they reject
+(``NaN`` literals, integers wider than 64 bits when encoding, indents other
+than 2) are retried with :mod:`json`, so callers see the same
+:class:`json.JSONDecodeError` and :class:`TypeError` exceptions whichever
+backend is active. orjson decodes integers wider than 64 bits as floats.
+
+The backend can be forced with the ``AIXPLAIN_JSON_BACKEND`` environment
+variable (``orjson``, ``ujson`` or ``json``) or :func:`set_backend`.
+"""
+
+import importlib
+import json
+import logging
+import os
+from typing import Any, Callable, Optional, Text, Union
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ENV = "AIXPLAIN_JSON_BACKEND"
+BACKENDS = ("orjson", "ujson", "json")
+
+JSONDecodeError = json.JSONDecodeError
+
+_backend_name: Text = "json"
+_module: Any = None
+_orjson_options = {}
+
+
+def _import(name: Text) -> Any:
+    if name == "json":
+        return json
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def set_backend(name: Optional[Text] = None) -> Text:
+    """Select the JSON backend used by :func:`loads` and :func:`dumps`.
+
+    Args:
+        name (Optional[Text], optional): One of ``"orjson"``, ``"ujson"`` or ``"json"``.
+            When None, the fastest installed backend is used. Defaults to None.
+
+    Returns:
+        Text: Name of the selected backend.
+
+    Raises:
+        ValueError: If ``name`` is not a known backend.
+        ImportError: If the requested backend is not installed.
+    """
+    global _backend_name, _module, _orjson_options
+    if name is None:
+        name = next(candidate for candidate in BACKENDS if _import(candidate) is not None)
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name!r}; expected one of {', '.join(BACKENDS)}.")
+    module = _import(name)
+    if module is None:
+        raise ImportError(f"JSON backend {name!r} is not installed. Please install it using 'pip install {name}'.")
+    if name == "orjson":
+        # Datetimes and dataclasses go through ``default`` as they would with the standard library.
+        passthrough = module.OPT_PASSTHROUGH_DATETIME | module.OPT_PASSTHROUGH_DATACLASS | module.OPT_NON_STR_KEYS
+        _orjson_options = {
+            (indent, sort_keys): passthrough
+            | (module.OPT_INDENT_2 if indent else 0)
+            | (module.OPT_SORT_KEYS if sort_keys else 0)
+            for indent in (False, True)
+            for sort_keys in (False, True)
+        }
+    _backend_name, _module = name, module
+    return name
+
+
+def get_backend() -> Text:
+    """Return the name of the active JSON backend."""
+    return _backend_name
+
+
+def loads(data: Union[Text, bytes, bytearray]) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data (Union[Text, bytes, bytearray]): JSON document; bytes must be UTF-8 encoded.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If ``data`` is not valid JSON.
+    """
+    if _backend_name != "json":
+        try:
+            return _module.loads(data)
+        except ValueError:
+            # Let the standard library decide: it accepts a few documents the fast
+            # backends reject (e.g. ``NaN``) and raises the error callers expect.
+            pass
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+    ensure_ascii: bool = True,
+) -> Text:
+    """Encode ``obj`` as a JSON string.
+
+    The fast backends produce compact output (no spaces after separators) when
+    ``indent`` is None; orjson writes non-finite floats as ``null``.
+
+    Args:
+        obj (Any): Value to encode.
+        indent (Optional[int], optional): Indentation of nested values. Defaults to None.
+        sort_keys (bool, optional): Whether to sort the keys of objects. Defaults to False.
+        default (Optional[Callable[[Any], Any]], optional): Called for objects that can not
+            be serialized otherwise. Defaults to None.
+        ensure_ascii (bool, optional): Whether non-ASCII characters are escaped, as
+            needed for payloads sent as ``str`` request bodies. Defaults to True.
+
+    Returns:
+        Text: The JSON document.
+
+    Raises:
+        TypeError: If ``obj`` contains a value that can not be serialized.
+    """
+    if _backend_name == "orjson" and indent in (None, 2):
+        try:
+            text = _module.dumps(obj, default=default, option=_orjson_options[bool(indent), sort_keys]).decode("utf-8")
+        except TypeError:
+            pass
+        else:
+            if not ensure_ascii or text.isascii():
+                return text
+    elif _backend_name == "ujson":
+        try:
+            return _module.dumps(
+                obj,
+                indent=indent or 0,
+                sort_keys=sort_keys,
+                default=default,
+                ensure_ascii=ensure_ascii,
+                escape_forward_slashes=False,
+            )
+        except (TypeError, OverflowError, ValueError):
+            pass
+    return json.dumps(obj, indent=indent, sort_keys=sort_keys, default=default, ensure_ascii=ensure_ascii)
+
+
+def response_json(response: Any) -> Any:
+    """Decode the JSON body of a ``requests`` or ``httpx`` response.
+
+    Equivalent to ``response.json()``, which is used for bodies the codec can
+    not decode so the original exception types are preserved.
+
+    Args:
+        response (Any): Response whose body has been read.
+
+    Returns:
+        Any: The decoded body.
+    """
+    content = getattr(response, "content", None)
+    if _backend_name != "json" and content and isinstance(content, (bytes, str)):
+        try:
+            return _module.loads(content)
+        except ValueError:
+            pass
+    return response.json()
+
+
+try:
+    set_backend(os.getenv(BACKEND_ENV) or None)
+except (ImportError, ValueError) as e:
+    logger.warning(f"Ignoring {BACKEND_ENV}: {e}")
+    set_backend()
@@ -0,0 +1,111 @@
+"""Lazy iteration over paginated listings with background prefetch.
+
+:func:`iter_paginated` turns a "fetch page N" function into a generator over
+every item of every page. While the caller consumes page N, page N+1 is
+requested on a worker thread, so network latency overlaps with processing.
+Only the page being consumed and the one being prefetched are held in memory.
+
+Example:
+    >>> def fetch(page_number):
+    ...     page = ModelFactory.list(page_number=page_number, page_size=50)
+    ...     return page["results"], page["total"]
+    >>> for model in iter_paginated(fetch, page_size=50):
+    ...     print(model.id)
+
+:func:`iter_list` does the same for a v1 factory's ``list`` method.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[int], Tuple[List[T], Optional[int]]]
+
+
+def _has_more(items: List, page_size: int, consumed: int, total: Optional[int]) -> bool:
+    """Return whether another page should exist after one holding ``items``."""
+    if not items or len(items) < page_size:
+        return False
+    return total is None or consumed < total
+
+
+def iter_paginated(
+    fetch_page: PageFetcher,
+    page_size: int,
+    start_page: int = 0,
+    prefetch: bool = True,
+) -> Iterator[T]:
+    """Yield every item of a paginated listing, one page at a time.
+
+    The next page is only requested once the current one shows there is more
+    to read (a full page and fewer items consumed than ``total``), so no
+    request is wasted past the last page.
+
+    Args:
+        fetch_page (Callable[[int], Tuple[List[T], Optional[int]]]): Returns the
+            items of a page number and the total number of items (None if unknown).
+        page_size (int): Number of items requested per page.
+        start_page (int, optional): First page number to read. Defaults to 0.
+        prefetch (bool, optional): Fetch page N+1 on a worker thread while page
+            N is consumed. Defaults to True.
+
+    Yields:
+        T: Items in listing order.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aixplain-prefetch") if prefetch else None
+    pending: Optional[Future] = None
+    try:
+        page_number = start_page
+        items, total = fetch_page(page_number)
+        consumed = start_page * page_size
+        while True:
+            consumed += len(items)
+            more = _has_more(items, page_size, consumed, total)
+            if more and executor is not None:
+                pending = executor.submit(fetch_page, page_number + 1)
+
+            yield from items
+            # drop the consumed page before waiting on the next one
+            items = None
+
+            if not more:
+                return
+            page_number += 1
+            if pending is not None:
+                items, total = pending.result()
+                pending = None
+            else:
+                items, total = fetch_page(page_number)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iter_list(list_fn: Callable[..., Dict], page_size: int = 20, prefetch: bool = True, **kwargs: Any) -> Iterator:
+    """Yield every item returned by a v1 factory ``list`` method, across pages.
+
+    Pages are fetched lazily with ``list_fn``; consumed pages are not retained.
+
+    Args:
+        list_fn (Callable[..., Dict]): Factory ``list`` method, called with
+            ``page_number``, ``page_size`` and ``kwargs`` and returning a dict
+            with ``results`` and ``total``.
+        page_size (int, optional): Number of items per page. Defaults to 20.
+        prefetch (bool, optional): Fetch the next page in the background.
+            Defaults to True.
+        **kwargs: Filters passed to ``list_fn``. ``page_number`` sets the first
+            page to read.
+
+    Returns:
+        Iterator: Items in listing order.
+    """
+    start_page = kwargs.pop("page_number", 0)
+
+    def fetch_page(page_number: int):
+        page = list_fn(page_number=page_number, page_size=page_size, **kwargs)
+        return page["results"], page["total"]
+
+    return iter_paginated(fetch_page, page_size=page_size, start_page=start_page, prefetch=prefetch)
@@ -0,0 +1,353 @@
+"""Multiplexed poller for many in-flight asynchronous runs.
+
+``sync_poll`` on every runnable (v1 ``Model``/``Agent``/``TeamAgent``/``Pipeline``
+and v2 resources) spins its own sleep/poll loop, so tracking hundreds of
+``run_async`` jobs costs hundreds of sleeping threads. :class:`PollManager`
+tracks all of them from one scheduler thread: each job keeps its own
+exponential backoff (also applied when a poll hits a transport error or an
+HTTP 5xx), a token
+bucket caps the global poll rate, a small worker pool performs the HTTP calls,
+and every job resolves a
+:class:`concurrent.futures.Future` as soon as it completes.
+
+Example:
+    >>> with PollManager(max_requests_per_second=20) as manager:
+    ...     futures = [manager.submit(model, model.run_async(text=t).url) for t in texts]
+    ...     results = [f.result() for f in futures]
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Set, Text
+
+import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+_TRANSPORT_ERRORS = (ConnectionError, TimeoutError, requests.ConnectionError, requests.Timeout) + (
+    (httpx.TransportError,) if httpx is not None else ()
+)
+_HTTP_STATUS_ERRORS = (requests.HTTPError,) + ((httpx.HTTPStatusError,) if httpx is not None else ())
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Return whether a failed poll is worth retrying: a transport or timeout error, or an HTTP 5xx.
+
+    Anything else, such as the v2 ``APIError`` raised for a ``FAILED`` run or a 4xx, fails the job at once,
+    as in ``sync_poll``.
+    """
+    if isinstance(error, _TRANSPORT_ERRORS):
+        return True
+    if isinstance(error, _HTTP_STATUS_ERRORS):
+        status_code = getattr(error.response, "status_code", None)
+        return isinstance(status_code, int) and status_code >= 500
+    return False
+
+
+def _is_completed(response: Any) -> bool:
+    """Return the ``completed`` flag of a v1 or v2 poll response."""
+    completed = getattr(response, "completed", None)
+    if completed is None:
+        try:
+            completed = response["completed"]
+        except (KeyError, TypeError):
+            completed = False
+    return completed is True
+
+
+class _RateLimiter:
+    """Thread-safe token bucket allowing ``rate`` acquisitions per second."""
+
+    def __init__(self, rate: Optional[float]) -> None:
+        self.rate = rate
+        self._capacity = max(1.0, rate or 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available (no-op when the rate is unlimited)."""
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+class PollJob:
+    """State of a single tracked run.
+
+    Attributes:
+        poller (Any): Object exposing ``poll(poll_url)`` (any v1 or v2 runnable).
+        poll_url (Text): URL returned by ``run_async``.
+        future (Future): Resolved with the final poll response.
+        wait_time (float): Current delay before the next poll of this job.
+        deadline (float): Monotonic time after which the job times out.
+        polls (int): Number of poll requests made so far.
+        errors (int): Consecutive poll requests that failed transiently.
+    """
+
+    def __init__(self, poller: Any, poll_url: Text, wait_time: float, timeout: float) -> None:
+        self.poller = poller
+        self.poll_url = poll_url
+        self.future: Future = Future()
+        self.wait_time = wait_time
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout
+        self.polls = 0
+        self.errors = 0
+
+
+class PollManager:
+    """Track many asynchronous runs from one shared scheduler.
+
+    Attributes:
+        max_requests_per_second (Optional[float]): Global cap on poll requests; ``None`` disables it.
+        wait_time (float): Default initial delay between polls of a job.
+        max_wait_time (float): Upper bound of the per-job backoff.
+        backoff_factor (float): Multiplier applied to a job's delay after each incomplete poll.
+        timeout (float): Default time after which a job fails with ``TimeoutError``.
+        max_poll_errors (int): Consecutive transient poll failures retried before a job fails.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_second: Optional[float] = 10.0,
+        max_workers: int = 8,
+        wait_time: float = 0.5,
+        max_wait_time: float = 60.0,
+        backoff_factor: float = 1.1,
+        timeout: float = 300.0,
+        max_poll_errors: int = 3,
+    ) -> None:
+        """Initialize the manager; the scheduler thread starts on the first submit.
+
+        Args:
+            max_requests_per_second (float, optional): Global poll rate cap. Defaults to 10.
+            max_workers (int, optional): Concurrent poll requests in flight. Defaults to 8.
+            wait_time (float, optional): Initial delay between polls of a job. Defaults to 0.5.
+            max_wait_time (float, optional): Maximum delay between polls of a job. Defaults to 60.
+            backoff_factor (float, optional): Per-job backoff multiplier. Defaults to 1.1.
+            timeout (float, optional): Default per-job timeout in seconds. Defaults to 300.
+            max_poll_errors (int, optional): Consecutive transport errors or HTTP 5xx responses
+                retried with backoff before the job fails with the last error; any other poll
+                error fails the job at once. Defaults to 3.
+        """
+        self.max_requests_per_second = max_requests_per_second
+        self.wait_time = max(wait_time, 0.0)
+        self.max_wait_time = max_wait_time
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.max_poll_errors = max(max_poll_errors, 0)
+        self._max_workers = max_workers
+        self._limiter = _RateLimiter(max_requests_per_second)
+        self._heap: List = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._active = 0
+        self._jobs: Set[PollJob] = set()
+
+    def submit(
+        self,
+        poller: Any,
+        poll_url: Text,
+        timeout: Optional[float] = None,
+        wait_time: Optional[float] = None,
+        callback: Optional[Callable[[Future], None]] = None,
+    ) -> Future:
+        """Start tracking a run.
+
+        Args:
+            poller (Any): The resource that started the run; its ``poll(poll_url)`` is used.
+            poll_url (Text): Poll URL returned by ``run_async``.
+            timeout (float, optional): Per-job timeout. Defaults to the manager's timeout.
+            wait_time (float, optional): Initial delay for this job. Defaults to the manager's wait_time.
+            callback (Callable, optional): Called with the future once the job is done.
+
+        Returns:
+            Future: Resolves with the final poll response, or raises the poll error /
+                ``TimeoutError``.
+
+        Raises:
+            RuntimeError: If the manager has been shut down.
+        """
+        job = PollJob(
+            poller,
+            poll_url,
+            wait_time=self.wait_time if wait_time is None else wait_time,
+            timeout=self.timeout if timeout is None else timeout,
+        )
+        if callback is not None:
+            job.future.add_done_callback(callback)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("PollManager has been shut down")
+            self._ensure_started()
+            self._active += 1
+            self._jobs.add(job)
+            self._push(job, delay=0.0)
+        return job.future
+
+    def submit_result(self, poller: Any, result: Any, **kwargs: Any) -> Future:
+        """Track a ``run_async`` result, resolving immediately if it already completed.
+
+        Args:
+            poller (Any): The resource that started the run.
+            result (Any): The v1 response dict or v2 ``Result`` returned by ``run_async``.
+            **kwargs: Extra arguments forwarded to :meth:`submit`.
+
+        Returns:
+            Future: See :meth:`submit`.
+        """
+        url = getattr(result, "url", None)
+        if url is None and isinstance(result, dict):
+            url = result.get("url")
+        if _is_completed(result) or not url:
+            future: Future = Future()
+            future.set_result(result)
+            if kwargs.get("callback") is not None:
+                future.add_done_callback(kwargs["callback"])
+            return future
+        return self.submit(poller, url, **kwargs)
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs not yet resolved."""
+        with self._cond:
+            return self._active
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Stop the scheduler.
+
+        Args:
+            wait (bool, optional): Block until tracked jobs finish (or are cancelled). Defaults to True.
+            cancel_pending (bool, optional): Cancel jobs that have not completed. Defaults to False.
+        """
+        with self._cond:
+            if cancel_pending:
+                for job in list(self._jobs):
+                    job.future.cancel()
+                # Waiting jobs are dropped now; in-flight ones stop after their current poll.
+                waiting = [job for _, _, job in self._heap]
+                self._heap.clear()
+                for job in waiting:
+                    self._finish(job)
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+    def __enter__(self) -> "PollManager":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - waits for every tracked job."""
+        self.shutdown(wait=True, cancel_pending=exc_type is not None)
+
+    def _ensure_started(self) -> None:
+        """Start the scheduler thread and worker pool (caller holds the lock)."""
+        if self._thread is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="aixplain-poll")
+            self._thread = threading.Thread(target=self._schedule, name="aixplain-poll-scheduler", daemon=True)
+            self._thread.start()
+
+    def _push(self, job: PollJob, delay: float) -> None:
+        """Schedule ``job`` to be polled after ``delay`` seconds (caller holds the lock)."""
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._counter), job))
+        self._cond.notify()
+
+    def _finish(self, job: PollJob, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Resolve a job's future (unless it was cancelled) and stop tracking it."""
+        if not job.future.done():
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(result)
+        with self._cond:
+            self._active -= 1
+            self._jobs.discard(job)
+            self._cond.notify_all()
+
+    def _schedule(self) -> None:
+        """Scheduler loop: dispatch due jobs to the worker pool under the rate cap."""
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed and self._active == 0:
+                        self._executor.shutdown(wait=False)
+                        return
+                    if self._heap and self._heap[0][0] <= time.monotonic():
+                        _, _, job = heapq.heappop(self._heap)
+                        break
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._cond.wait(timeout=timeout)
+
+            if job.future.cancelled():
+                self._finish(job)
+                continue
+            if time.monotonic() > job.deadline:
+                error = TimeoutError(f"Polling {job.poll_url} timed out after {job.timeout} seconds")
+                self._finish(job, error=error)
+                continue
+
+            self._limiter.acquire()
+            self._executor.submit(self._poll_once, job)
+
+    def _poll_once(self, job: PollJob) -> None:
+        """Poll ``job`` once and either resolve it or reschedule it with backoff."""
+        try:
+            job.polls += 1
+            response = job.poller.poll(job.poll_url)
+        except Exception as e:
+            if not _is_transient(e):
+                logger.error(f"PollManager: polling {job.poll_url} failed: {e}")
+                self._finish(job, error=e)
+                return
+            job.errors += 1
+            if job.errors > self.max_poll_errors:
+                logger.error(f"PollManager: polling {job.poll_url} failed: {e}")
+                self._finish(job, error=e)
+                return
+            logger.warning(
+                f"PollManager: polling {job.poll_url} failed ({job.errors}/{self.max_poll_errors}), retrying: {e}"
+            )
+            self._reschedule(job)
+            return
+
+        job.errors = 0
+        if _is_completed(response):
+            self._finish(job, result=response)
+            return
+        self._reschedule(job)
+
+    def _reschedule(self, job: PollJob) -> None:
+        """Push ``job`` back after its current delay and grow the delay, unless it was cancelled."""
+        delay = job.wait_time
+        job.wait_time = min(job.wait_time * self.backoff_factor, self.max_wait_time)
+        with self._cond:
+            # Checked under the lock so a concurrent shutdown(cancel_pending=True) cannot miss it.
+            if job.future.cancelled():
+                self._finish(job)
+                return
+            self._push(job, delay=delay)
@@ -0,0 +1,487 @@
+"""Per-request instrumentation hooks for the SDK HTTP clients.
+
+Every request sent by :class:`~aixplain.v2.client.AixplainClient`,
+:class:`~aixplain.v2.async_client.AsyncAixplainClient` and the v1
+``_request_with_retry`` helper can be reported to hooks: callables receiving a
+:class:`RequestEvent` (method, endpoint template, status, bytes, latency,
+retries) once the request completes or fails.
+
+Hooks registered with :func:`add_request_hook` observe every client of the
+process; hooks added to ``client.hooks`` only observe that client. When no hook
+is registered, requests are sent without any timing or bookkeeping.
+
+Two hooks are provided: :class:`RequestMetrics` aggregates events into
+in-process latency histograms per endpoint, and :class:`OpenTelemetryExporter`
+records them as OpenTelemetry metrics.
+
+Example:
+    >>> metrics = RequestMetrics()
+    >>> add_request_hook(metrics)
+    >>> aix.Model.get("model-id")
+    >>> metrics.snapshot()["GET /sdk/models/{id}"]["latency"]["p50"]
+    0.25
+"""
+
+import bisect
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Text, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is unbounded.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+ID_PLACEHOLDER = "{id}"
+
+_ID_SEGMENT = re.compile(
+    r"^(?:\d+|[0-9a-fA-F]{24}|[0-9a-fA-F]{32}|[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12})$"
+)
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """What a client observed while sending one request.
+
+    Attributes:
+        method: Upper-case HTTP method.
+        endpoint: URL path with resource ids replaced by ``{id}``, e.g. ``/sdk/models/{id}``.
+        host: Host (and port) the request was sent to.
+        status: HTTP status code, or None when no response was received.
+        latency: Seconds from sending the request to receiving the response,
+            including its body unless the request is streamed.
+        request_bytes: Size of the request body, or None when unknown.
+        response_bytes: Size of the response body, or None when unknown (streamed
+            responses without ``Content-Length``).
+        retries: Number of retries before the final attempt.
+        error: Exception type name when the request failed without a response.
+        stream: Whether the response body was streamed.
+    """
+
+    method: str
+    endpoint: str
+    host: str
+    status: Optional[int]
+    latency: float
+    request_bytes: Optional[int] = None
+    response_bytes: Optional[int] = None
+    retries: int = 0
+    error: Optional[str] = None
+    stream: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether a response with a non-error status was received."""
+        return self.error is None and self.status is not None and self.status < 400
+
+
+RequestHook = Callable[[RequestEvent], Any]
+
+
+@lru_cache(maxsize=2048)
+def endpoint_template(url: Text) -> Tuple[str, str]:
+    """Split ``url`` into its host and its path with resource ids replaced by ``{id}``.
+
+    Numeric ids, ObjectIds, UUIDs and long alphanumeric tokens are treated as
+    ids, so requests for different resources share one endpoint.
+
+    Args:
+        url (Text): Absolute URL or path.
+
+    Returns:
+        Tuple[str, str]: ``(host, template)``.
+    """
+    parts = urlsplit(url)
+    segments = [ID_PLACEHOLDER if _is_id(segment) else segment for segment in parts.path.split("/")]
+    return parts.netloc.lower(), "/".join(segments) or "/"
+
+
+def _is_id(segment: str) -> bool:
+    if _ID_SEGMENT.match(segment):
+        return True
+    return (
+        len(segment) >= 20
+        and segment.replace("_", "").isalnum()
+        and any(c.isdigit() for c in segment)
+        and any(c.isalpha() for c in segment)
+    )
+
+
+class RequestHooks:
+    """Thread-safe, ordered collection of request hooks.
+
+    Args:
+        hooks (Iterable[RequestHook], optional): Initial hooks. Defaults to none.
+    """
+
+    def __init__(self, hooks: Iterable[RequestHook] = ()) -> None:
+        """Initialize the collection with ``hooks``."""
+        self._hooks: Tuple[RequestHook, ...] = tuple(hooks)
+        self._lock = threading.Lock()
+
+    def add(self, hook: RequestHook) -> RequestHook:
+        """Register ``hook`` and return it, so this can be used as a decorator."""
+        with self._lock:
+            self._hooks = self._hooks + (hook,)
+        return hook
+
+    def remove(self, hook: RequestHook) -> None:
+        """Unregister ``hook``; does nothing if it is not registered."""
+        with self._lock:
+            self._hooks = tuple(h for h in self._hooks if h != hook)
+
+    def clear(self) -> None:
+        """Unregister every hook."""
+        with self._lock:
+            self._hooks = ()
+
+    def __bool__(self) -> bool:
+        """Whether at least one hook is registered."""
+        return bool(self._hooks)
+
+    def __len__(self) -> int:
+        """Number of registered hooks."""
+        return len(self._hooks)
+
+    def __iter__(self) -> Iterator[RequestHook]:
+        """Iterate over a snapshot of the registered hooks."""
+        return iter(self._hooks)
+
+
+_global_hooks = RequestHooks()
+
+
+def add_request_hook(hook: RequestHook) -> RequestHook:
+    """Register ``hook`` for the requests of every SDK client of the process."""
+    return _global_hooks.add(hook)
+
+
+def remove_request_hook(hook: RequestHook) -> None:
+    """Unregister a hook added with :func:`add_request_hook`."""
+    _global_hooks.remove(hook)
+
+
+def global_request_hooks() -> RequestHooks:
+    """Return the process-wide hook collection."""
+    return _global_hooks
+
+
+def hooks_enabled(hooks: Optional[RequestHooks] = None) -> bool:
+    """Whether any hook would receive events for a client with ``hooks``."""
+    return bool(_global_hooks) or bool(hooks)
+
+
+def emit(event: RequestEvent, hooks: Optional[RequestHooks] = None) -> None:
+    """Send ``event`` to ``hooks`` then to the process-wide hooks.
+
+    Hooks must not break requests: their exceptions are logged and swallowed.
+    """
+    for hook in (*(hooks or ()), *_global_hooks):
+        try:
+            hook(event)
+        except Exception:
+            logger.warning(f"Request hook {hook!r} failed", exc_info=True)
+
+
+def _body_size(body: Any) -> Optional[int]:
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    return None
+
+
+def _request_body_size(response: Any) -> Optional[int]:
+    try:
+        request = response.request
+        # requests' PreparedRequest has ``body``, httpx's Request has ``content``.
+        return _body_size(request.body if hasattr(request, "body") else request.content)
+    except Exception:
+        return None
+
+
+def _content_length(headers: Any) -> Optional[int]:
+    try:
+        return int(headers["Content-Length"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _urllib3_retries(response: Any) -> int:
+    """Number of retries urllib3 performed before returning ``response``."""
+    history = getattr(getattr(getattr(response, "raw", None), "retries", None), "history", None)
+    return len(history) if isinstance(history, tuple) else 0
+
+
+def response_event(
+    method: Text, url: Text, response: Any, started: float, retries: Optional[int] = None, stream: bool = False
+) -> RequestEvent:
+    """Build the event of a ``requests`` or ``httpx`` response received after ``started``.
+
+    Args:
+        method (Text): HTTP method.
+        url (Text): Requested URL.
+        response (Any): The response.
+        started (float): ``time.perf_counter()`` when the request was sent.
+        retries (Optional[int], optional): Retries before the response; read from
+            urllib3 when None. Defaults to None.
+        stream (bool, optional): Whether the body is streamed and must not be read. Defaults to False.
+    """
+    latency = time.perf_counter() - started
+    host, endpoint = endpoint_template(url)
+    status = getattr(response, "status_code", None)
+    if stream:
+        response_bytes = _content_length(getattr(response, "headers", None))
+    else:
+        content = getattr(response, "content", None)
+        response_bytes = len(content) if isinstance(content, bytes) else None
+    return RequestEvent(
+        method=method.upper(),
+        endpoint=endpoint,
+        host=host,
+        status=status if isinstance(status, int) else None,
+        latency=latency,
+        request_bytes=_request_body_size(response),
+        response_bytes=response_bytes,
+        retries=_urllib3_retries(response) if retries is None else retries,
+        stream=stream,
+    )
+
+
+def error_event(method: Text, url: Text, error: BaseException, started: float, retries: int = 0) -> RequestEvent:
+    """Build the event of a request that failed with ``error`` before a response was received."""
+    host, endpoint = endpoint_template(url)
+    return RequestEvent(
+        method=method.upper(),
+        endpoint=endpoint,
+        host=host,
+        status=None,
+        latency=time.perf_counter() - started,
+        retries=retries,
+        error=type(error).__name__,
+    )
+
+
+def instrumented_request(
+    session: Any, method: Text, url: Text, request_hooks: Optional[RequestHooks] = None, **kwargs: Any
+) -> Any:
+    """Send ``session.request(method=method, url=url, **kwargs)``, reporting it to the hooks.
+
+    Args:
+        session (Any): ``requests.Session`` sending the request.
+        method (Text): HTTP method.
+        url (Text): Absolute URL.
+        request_hooks (Optional[RequestHooks], optional): Client hooks, notified
+            before the process-wide ones. Defaults to None.
+        **kwargs: Keyword arguments of ``session.request``.
+
+    Returns:
+        requests.Response: The response.
+    """
+    if not hooks_enabled(request_hooks):
+        return session.request(method=method, url=url, **kwargs)
+    started = time.perf_counter()
+    try:
+        response = session.request(method=method, url=url, **kwargs)
+    except Exception as e:
+        emit(error_event(method, url, e, started), request_hooks)
+        raise
+    emit(response_event(method, url, response, started, stream=bool(kwargs.get("stream"))), request_hooks)
+    return response
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of latencies, in seconds.
+
+    Args:
+        buckets (Sequence[float], optional): Increasing bucket upper bounds.
+            Defaults to ``DEFAULT_LATENCY_BUCKETS``.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        """Record one latency."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the ``q`` quantile by interpolating inside its bucket (None when empty)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * max(rank - seen, 0) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary statistics and per-bucket counts keyed by upper bound (``"+Inf"`` for the last)."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": {str(bound): n for bound, n in zip((*self.buckets, "+Inf"), self.counts)},
+        }
+
+
+class _EndpointStats:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.latency = LatencyHistogram(buckets)
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.statuses: Dict[str, int] = {}
+
+
+class RequestMetrics:
+    """Request hook aggregating events per method and endpoint, in process.
+
+    Args:
+        buckets (Sequence[float], optional): Latency histogram bucket upper bounds,
+            in seconds. Defaults to ``DEFAULT_LATENCY_BUCKETS``.
+
+    Example:
+        >>> metrics = RequestMetrics()
+        >>> client.hooks.add(metrics)
+        >>> metrics.snapshot()
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialize empty metrics."""
+        self.buckets = tuple(buckets)
+        self._stats: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Record ``event``."""
+        with self._lock:
+            stats = self._stats.get((event.method, event.endpoint))
+            if stats is None:
+                stats = self._stats[(event.method, event.endpoint)] = _EndpointStats(self.buckets)
+            stats.latency.observe(event.latency)
+            stats.errors += not event.ok
+            stats.retries += event.retries
+            stats.request_bytes += event.request_bytes or 0
+            stats.response_bytes += event.response_bytes or 0
+            status = str(event.status) if event.status is not None else event.error or "unknown"
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the aggregated metrics keyed by ``"<METHOD> <endpoint>"``.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For each endpoint, the request ``count``,
+            ``errors``, ``retries``, ``statuses`` counts, total ``request_bytes``
+            and ``response_bytes``, and the ``latency`` histogram summary.
+        """
+        with self._lock:
+            return {
+                f"{method} {endpoint}": {
+                    "count": stats.latency.count,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "statuses": dict(stats.statuses),
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "latency": stats.latency.to_dict(),
+                }
+                for (method, endpoint), stats in self._stats.items()
+            }
+
+    def endpoints(self) -> List[str]:
+        """Return the ``"<METHOD> <endpoint>"`` keys seen so far."""
+        with self._lock:
+            return [f"{method} {endpoint}" for method, endpoint in self._stats]
+
+    def reset(self) -> None:
+        """Drop every aggregated value."""
+        with self._lock:
+            self._stats.clear()
+
+
+class OpenTelemetryExporter:
+    """Request hook recording events as OpenTelemetry metrics.
+
+    Records the ``<prefix>.request.duration`` histogram (seconds) and the
+    ``<prefix>.request.body.size``, ``<prefix>.response.body.size`` (bytes) and
+    ``<prefix>.request.retries`` counters, with the HTTP semantic-convention
+    attributes ``http.request.method``, ``url.template``, ``server.address``,
+    ``http.response.status_code`` and ``error.type``.
+
+    Args:
+        meter (Any, optional): OpenTelemetry ``Meter``. Defaults to the ``aixplain``
+            meter of the global meter provider.
+        prefix (Text, optional): Prefix of the instrument names. Defaults to "aixplain.client".
+
+    Raises:
+        ImportError: If no meter is given and ``opentelemetry-api`` is not installed.
+    """
+
+    def __init__(self, meter: Any = None, prefix: Text = "aixplain.client") -> None:
+        """Create the instruments on ``meter``."""
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError:
+                raise ImportError(
+                    "OpenTelemetryExporter requires opentelemetry-api. "
+                    "Please install it using 'pip install opentelemetry-api' (or 'pip install aixplain[otel]')."
+                )
+            meter = metrics.get_meter("aixplain")
+        self._duration = meter.create_histogram(
+            f"{prefix}.request.duration", unit="s", description="Duration of aiXplain HTTP requests."
+        )
+        self._request_size = meter.create_counter(
+            f"{prefix}.request.body.size", unit="By", description="Bytes sent in aiXplain request bodies."
+        )
+        self._response_size = meter.create_counter(
+            f"{prefix}.response.body.size", unit="By", description="Bytes received in aiXplain response bodies."
+        )
+        self._retries = meter.create_counter(
+            f"{prefix}.request.retries", unit="{retry}", description="Retries of aiXplain HTTP requests."
+        )
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Record ``event``."""
+        attributes = {"http.request.method": event.method, "url.template": event.endpoint, "server.address": event.host}
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.error is not None:
+            attributes["error.type"] = event.error
+        elif event.status is not None and event.status >= 400:
+            attributes["error.type"] = str(event.status)
+        self._duration.record(event.latency, attributes)
+        if event.request_bytes:
+            self._request_size.add(event.request_bytes, attributes)
+        if event.response_bytes:
+            self._response_size.add(event.response_bytes, attributes)
+        if event.retries:
+            self._retries.add(event.retries, attributes)
@@ -1,10 +1,264 @@
-from requests.adapters import HTTPAdapter, Retry
+"""Shared HTTP session handling for the v1 request helpers.
+
+Every v1 call goes through :func:`_request_with_retry`. Instead of building a
+new ``requests.Session`` (and therefore a new TCP+TLS connection) per call,
+sessions are kept in a process-wide :class:`SessionPool` keyed by
+``scheme://host[:port]`` so keep-alive connections are reused across polls,
+factory lookups and uploads.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Text
+from urllib.parse import urlsplit
+
 import requests
-from typing import Text
+from requests.adapters import HTTPAdapter, Retry
+
+from aixplain.utils.request_hooks import instrumented_request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_RETRY_TOTAL = 5
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.1
+DEFAULT_RETRY_STATUS_FORCELIST = [500, 502, 503, 504]
+
+
+def _int_from_env(name: Text, default: int) -> int:
+    """Read a positive integer from ``name``, falling back to ``default``."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {name}={raw!r}; using {default}")
+        return default
+    if value <= 0:
+        logger.warning(f"Ignoring non-positive {name}={raw!r}; using {default}")
+        return default
+    return value
+
+
+class SessionPool:
+    """Thread-safe registry of pooled ``requests.Session`` objects, one per host.
+
+    Attributes:
+        pool_connections (int): Number of urllib3 connection pools cached per session.
+        pool_maxsize (int): Maximum number of keep-alive connections per host.
+        keep_alive (bool): Whether connections are kept open between requests.
+        retry_total (int): Total number of retries per request.
+        retry_backoff_factor (float): Backoff factor between retry attempts.
+        retry_status_forcelist (List[int]): HTTP status codes that trigger a retry.
+    """
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        keep_alive: bool = True,
+        retry_total: int = DEFAULT_RETRY_TOTAL,
+        retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+        retry_status_forcelist: Optional[List[int]] = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            pool_connections (int, optional): Connection pools cached per session.
+                Defaults to AIXPLAIN_HTTP_POOL_CONNECTIONS or 10.
+            pool_maxsize (int, optional): Keep-alive connections per host.
+                Defaults to AIXPLAIN_HTTP_POOL_MAXSIZE or 10.
+            keep_alive (bool, optional): Reuse connections between requests. Defaults to True.
+            retry_total (int, optional): Total number of retries. Defaults to 5.
+            retry_backoff_factor (float, optional): Backoff factor between retries. Defaults to 0.1.
+            retry_status_forcelist (List[int], optional): Status codes to retry on.
+                Defaults to [500, 502, 503, 504].
+        """
+        self.pool_connections = pool_connections or _int_from_env(
+            "AIXPLAIN_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS
+        )
+        self.pool_maxsize = pool_maxsize or _int_from_env("AIXPLAIN_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE)
+        self.keep_alive = keep_alive
+        self.retry_total = retry_total
+        self.retry_backoff_factor = retry_backoff_factor
+        self.retry_status_forcelist = list(retry_status_forcelist or DEFAULT_RETRY_STATUS_FORCELIST)
+        self._sessions: Dict[Text, requests.Session] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _key(url: Text) -> Text:
+        """Return the ``scheme://netloc`` key used to share a session."""
+        parts = urlsplit(url)
+        return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+    def _build_session(self) -> requests.Session:
+        """Create a session mounted with a pooled, retrying adapter."""
+        retries = Retry(
+            total=self.retry_total,
+            backoff_factor=self.retry_backoff_factor,
+            status_forcelist=self.retry_status_forcelist,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retries,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def get(self, url: Text) -> requests.Session:
+        """Return the shared session for the host of ``url``, creating it on first use.
+
+        Args:
+            url (Text): URL of the resource about to be requested.
+
+        Returns:
+            requests.Session: Session bound to the URL's host.
+        """
+        key = self._key(url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._hits += 1
+                return session
+            self._misses += 1
+            session = self._build_session()
+            self._sessions[key] = session
+            return session
+
+    def configure(self, **settings) -> None:
+        """Update pool settings and drop existing sessions so the new settings apply.
+
+        Args:
+            **settings: Any of the keyword arguments accepted by :class:`SessionPool`.
+
+        Raises:
+            TypeError: If an unknown setting is given.
+        """
+        allowed = {
+            "pool_connections",
+            "pool_maxsize",
+            "keep_alive",
+            "retry_total",
+            "retry_backoff_factor",
+            "retry_status_forcelist",
+        }
+        unknown = set(settings) - allowed
+        if unknown:
+            raise TypeError(f"Unknown session pool setting(s): {', '.join(sorted(unknown))}")
+        with self._lock:
+            for name, value in settings.items():
+                if name == "retry_status_forcelist":
+                    value = list(value)
+                setattr(self, name, value)
+        self.close()
+
+    def close(self) -> None:
+        """Close and forget every pooled session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def stats(self) -> Dict:
+        """Return pool usage counters for monitoring.
+
+        ``hits``/``misses`` count session lookups; ``connections`` and
+        ``requests`` are aggregated from the underlying urllib3 pools, so
+        ``requests - connections`` is the number of reused connections.
+
+        Returns:
+            Dict: Counters keyed by name, plus a per-host breakdown.
+        """
+        with self._lock:
+            sessions = dict(self._sessions)
+            hits, misses = self._hits, self._misses
+        hosts = {}
+        total_connections = total_requests = 0
+        for key, session in sessions.items():
+            connections = requests_count = 0
+            for adapter in set(session.adapters.values()):
+                poolmanager = getattr(adapter, "poolmanager", None)
+                if poolmanager is None:
+                    continue
+                for pool_key in list(poolmanager.pools.keys()):
+                    pool = poolmanager.pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    connections += getattr(pool, "num_connections", 0)
+                    requests_count += getattr(pool, "num_requests", 0)
+            hosts[key] = {"connections": connections, "requests": requests_count}
+            total_connections += connections
+            total_requests += requests_count
+        return {
+            "hits": hits,
+            "misses": misses,
+            "sessions": len(sessions),
+            "connections": total_connections,
+            "requests": total_requests,
+            "hosts": hosts,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the session hit/miss counters."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+
+_session_pool = SessionPool()
+
+
+def get_session(url: Text) -> requests.Session:
+    """Return the shared pooled session for the host of ``url``.
+
+    Args:
+        url (Text): URL of the resource about to be requested.
+
+    Returns:
+        requests.Session: Session bound to the URL's host.
+    """
+    return _session_pool.get(url)
+
+
+def configure_session_pool(**settings) -> None:
+    """Reconfigure the process-wide session pool (pool size, keep-alive, retry policy).
+
+    Args:
+        **settings: Any of the keyword arguments accepted by :class:`SessionPool`.
+    """
+    _session_pool.configure(**settings)
+
+
+def session_pool_stats() -> Dict:
+    """Return hit/miss and connection counters of the process-wide session pool.
+
+    Returns:
+        Dict: See :meth:`SessionPool.stats`.
+    """
+    return _session_pool.stats()
+
+
+def close_sessions() -> None:
+    """Close every pooled session of the process-wide pool."""
+    _session_pool.close()
 
 
 def _request_with_retry(method: Text, url: Text, **params) -> requests.Response:
-    """Wrapper around requests with Session to retry in case it fails
+    """Wrapper around requests with a pooled Session to retry in case it fails
+
+    The request is reported to the process-wide request hooks (see
+    :mod:`aixplain.utils.request_hooks`).
 
     Args:
         method (Text): HTTP method, such as 'GET' or 'HEAD'.
@@ -14,8 +268,6 @@ def _request_with_retry(method: Text, url: Text, **params) -> requests.Response:
     Returns:
         requests.Response: Response object of the request.
     """
-    session = requests.Session()
-    retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-    session.mount("https://", HTTPAdapter(max_retries=retries))
-    response = session.request(method=method.upper(), url=url, **params)
+    session = get_session(url)
+    response = instrumented_request(session, method.upper(), url, **params)
     return response
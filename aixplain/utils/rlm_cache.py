@@ -0,0 +1,262 @@
+"""Content-addressed cache of RLM worker outputs.
+
+RLM parallel and RAG runs call the worker model once per chunk (map), once
+per group of partial answers (reduce) and once for single-call or synthesis
+prompts. Each call is fully determined by the worker, the prompt template and
+the text substituted into it, so its output can be reused when the same
+document is analysed again: a follow-up run over the same context, or a re-run
+after a partial failure, only pays for the calls that did not succeed before.
+
+Pass a cache to the RLM (``cache=MemoryRLMCache()`` or
+``cache=SQLiteRLMCache("rlm_cache.db")``) to enable it. Keys are SHA-256
+digests of the call inputs (see :func:`rlm_cache_key`); failed worker calls
+are never cached.
+
+Example:
+    >>> cache = SQLiteRLMCache(".cache/rlm.sqlite", ttl=7 * 86400)
+    >>> rlm = ModelFactory.create_rlm(orchestrator_id, worker_id, cache=cache)
+    >>> rlm.run(data={"context": report, "query": "List the risks."}, mode="parallel")
+    >>> rlm.run(data={"context": report, "query": "List the risks."}, mode="parallel")  # no worker calls
+    >>> cache.stats().hits
+    5
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Text, Tuple
+
+DEFAULT_MAX_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class RLMCacheStats:
+    """Counters of an :class:`RLMCache`.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups of absent or expired entries.
+        size: Number of entries currently stored.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def rlm_cache_key(worker_id: Text, template: Text, *parts: Text) -> Text:
+    """Build the cache key of a worker call.
+
+    Args:
+        worker_id (Text): Id of the worker model answering the call.
+        template (Text): Prompt template the call is built from.
+        *parts (Text): Values substituted into the template that determine the
+            answer (e.g. the chunk and the query).
+
+    Returns:
+        Text: Hex SHA-256 digest of the length-prefixed inputs.
+    """
+    digest = hashlib.sha256()
+    for part in (worker_id, template) + parts:
+        data = str(part).encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class RLMCache:
+    """Base class of RLM worker output caches.
+
+    Subclasses store text values under the keys built by :func:`rlm_cache_key`
+    and must be safe to use from the worker threads of a parallel run.
+    """
+
+    def get(self, key: Text) -> Optional[Text]:
+        """Return the cached value of ``key``, or None if it is absent or expired."""
+        raise NotImplementedError
+
+    def put(self, key: Text, value: Text) -> None:
+        """Store ``value`` under ``key``."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        raise NotImplementedError
+
+    def stats(self) -> RLMCacheStats:
+        """Return a snapshot of the cache counters."""
+        raise NotImplementedError
+
+    def __deepcopy__(self, memo: dict) -> "RLMCache":
+        """Return self: a cache is shared state, not part of the RLM configuration."""
+        return self
+
+
+class MemoryRLMCache(RLMCache):
+    """Thread-safe in-process LRU cache with an optional TTL."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: Optional[float] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size (int, optional): Maximum number of cached outputs; the least
+                recently used one is evicted beyond it. Defaults to 4096.
+            ttl (Optional[float], optional): Time to live in seconds; None keeps
+                entries until evicted. Defaults to None.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Text, Tuple[Text, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached entries (including expired ones not yet dropped)."""
+        return len(self._entries)
+
+    def get(self, key: Text) -> Optional[Text]:
+        """Return the cached value of ``key``, or None if it is absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Text, value: Text) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entries."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def stats(self) -> RLMCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return RLMCacheStats(hits=self._hits, misses=self._misses, size=len(self._entries))
+
+
+class SQLiteRLMCache(RLMCache):
+    """On-disk cache backed by a SQLite database, shared across processes and runs.
+
+    Entries carry their creation time; with ``ttl`` set, older entries are
+    treated as absent and removed by :meth:`prune` (also run when the cache is
+    opened). With ``max_size`` set, the least recently used entries beyond it
+    are removed on write.
+    """
+
+    def __init__(self, path: Text, ttl: Optional[float] = None, max_size: Optional[int] = None) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path (Text): Path of the SQLite file; parent directories are created.
+            ttl (Optional[float], optional): Time to live in seconds; None keeps
+                entries forever. Defaults to None.
+            max_size (Optional[int], optional): Maximum number of stored outputs;
+                None for no limit. Defaults to None.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS rlm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+        self.prune()
+
+    def _expired_before(self) -> float:
+        return time.time() - self.ttl if self.ttl is not None else float("-inf")
+
+    def get(self, key: Text) -> Optional[Text]:
+        """Return the cached value of ``key``, or None if it is absent or expired."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value FROM rlm_cache WHERE key = ? AND created_at > ?", (key, self._expired_before())
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            if self.max_size is not None:
+                self._connection.execute("UPDATE rlm_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._hits += 1
+            return row[0]
+
+    def put(self, key: Text, value: Text) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entries beyond ``max_size``."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO rlm_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            if self.max_size is not None:
+                self._connection.execute(
+                    "DELETE FROM rlm_cache WHERE key IN "
+                    "(SELECT key FROM rlm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+
+    def prune(self) -> int:
+        """Remove expired entries from the database.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        if self.ttl is None:
+            return 0
+        with self._lock, self._connection:
+            cursor = self._connection.execute("DELETE FROM rlm_cache WHERE created_at <= ?", (self._expired_before(),))
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM rlm_cache")
+            self._hits = self._misses = 0
+
+    def stats(self) -> RLMCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            (size,) = self._connection.execute("SELECT COUNT(*) FROM rlm_cache").fetchone()
+            return RLMCacheStats(hits=self._hits, misses=self._misses, size=size)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
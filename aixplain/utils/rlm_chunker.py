@@ -0,0 +1,276 @@
+"""Token-aware chunking of RLM contexts.
+
+:func:`iter_chunks` splits a text, list or dict context into chunks that fit a
+token budget, lazily, so the RLM map step can start on the first chunks while
+the rest of a large context is still being split.
+
+- Text is split on paragraph breaks, then sentence or line breaks, then
+  whitespace; a run of text with no break at all is the only thing cut
+  mid-word. Consecutive chunks share up to ``overlap_tokens`` of trailing
+  sentences so facts on a boundary are seen by both calls.
+- List items and dict entries are serialized once, measured, and grouped into
+  JSON arrays / objects (lists of strings are joined by blank lines). An item
+  larger than the budget on its own is split as text.
+
+Tokens are counted with `tiktoken <https://github.com/openai/tiktoken>`_'s
+``cl100k_base`` encoding when it is installed and available offline
+(``pip install aixplain[tokenizer]``), and with :func:`estimate_tokens`
+otherwise.
+"""
+
+import json
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Callable, Iterator, List, Optional, Text, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Characters per token of English prose, the floor of the estimator.
+CHARS_PER_TOKEN = 4
+
+# Default overlap (tokens) between consecutive text chunks.
+DEFAULT_OVERLAP_TOKENS = 100
+
+TokenCounter = Callable[[Text], int]
+
+# Pieces that map to at least one token each in BPE vocabularies: ASCII words,
+# groups of up to three digits, single non-ASCII characters and punctuation.
+_TOKEN_PIECES = re.compile(r"[A-Za-z]+|\d{1,3}|[^\x00-\x7F]|[^\w\s]")
+
+# Text boundaries, coarsest first; each match ends a piece (separator included).
+_BOUNDARIES = (
+    re.compile(r"\n[ \t]*\n\s*"),
+    re.compile(r"(?<=[.!?;])\s+|\n\s*"),
+    re.compile(r"\s+"),
+)
+
+Span = Tuple[int, int, int]
+
+
+def estimate_tokens(text: Text) -> int:
+    """Estimate the number of tokens of ``text`` without a tokenizer.
+
+    Takes the larger of one token per :data:`CHARS_PER_TOKEN` characters and one
+    token per word, digit group, non-ASCII character or punctuation mark, which
+    stays at or slightly above ``cl100k_base`` counts for prose, code, JSON and
+    non-Latin scripts.
+    """
+    if not text:
+        return 0
+    return max(-(-len(text) // CHARS_PER_TOKEN), len(_TOKEN_PIECES.findall(text)))
+
+
+@lru_cache(maxsize=None)
+def get_token_counter(encoding: Text = "cl100k_base") -> TokenCounter:
+    """Return the token counter used for chunking.
+
+    Args:
+        encoding (Text, optional): tiktoken encoding name. Defaults to "cl100k_base".
+
+    Returns:
+        TokenCounter: tiktoken-based counter, or :func:`estimate_tokens` when
+            tiktoken is not installed or the encoding is not available offline.
+    """
+    try:
+        import tiktoken
+
+        tokenizer = tiktoken.get_encoding(encoding)
+    except Exception as e:
+        logger.debug(f"RLM chunker: using the token estimator ({e}).")
+        return estimate_tokens
+    return lambda text: len(tokenizer.encode(text, disallowed_special=()))
+
+
+def count_tokens(text: Text) -> int:
+    """Count the tokens of ``text`` with :func:`get_token_counter`."""
+    return get_token_counter()(text)
+
+
+def iter_chunks(
+    context: Union[Text, dict, list],
+    max_tokens: int,
+    max_chars: Optional[int] = None,
+    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    count: Optional[TokenCounter] = None,
+) -> Iterator[Text]:
+    """Split ``context`` into chunks of at most ``max_tokens`` tokens, lazily.
+
+    Args:
+        context (Union[Text, dict, list]): Context to split; other types are
+            split as ``str(context)``.
+        max_tokens (int): Token budget of a chunk.
+        max_chars (Optional[int], optional): Additional cap on the characters of
+            a chunk (e.g. an embedding model's input limit). Defaults to None.
+        overlap_tokens (int, optional): Tokens of trailing sentences repeated at
+            the start of the next text chunk. Defaults to 100.
+        count (Optional[TokenCounter], optional): Token counter. Defaults to
+            :func:`get_token_counter`.
+
+    Yields:
+        Text: The chunks, in document order.
+    """
+    budget = _Budget(max(int(max_tokens), 1), max_chars, count or get_token_counter())
+    if isinstance(context, list):
+        yield from _list_chunks(context, budget, overlap_tokens)
+    elif isinstance(context, dict):
+        yield from _dict_chunks(context, budget, overlap_tokens)
+    else:
+        yield from _text_chunks(context if isinstance(context, str) else str(context), budget, overlap_tokens)
+
+
+class _Budget:
+    __slots__ = ("max_tokens", "max_chars", "count")
+
+    def __init__(self, max_tokens: int, max_chars: Optional[int], count: TokenCounter) -> None:
+        self.max_tokens = max_tokens
+        self.max_chars = max_chars if max_chars and max_chars > 0 else None
+        self.count = count
+
+    def fits(self, tokens: int, chars: int) -> bool:
+        return tokens <= self.max_tokens and (self.max_chars is None or chars <= self.max_chars)
+
+
+# Text
+
+
+def _text_chunks(text: Text, budget: _Budget, overlap_tokens: int) -> Iterator[Text]:
+    """Pack consecutive boundary-aligned spans of ``text`` into chunks."""
+    window: List[Span] = []
+    tokens = 0
+    for span in _spans(text, 0, len(text), budget, 0):
+        start, end, span_tokens = span
+        if window and not budget.fits(tokens + span_tokens, end - window[0][0]):
+            chunk = text[window[0][0] : window[-1][1]].strip()
+            if chunk:
+                yield chunk
+            window, tokens = _overlap(text, window, span, budget, overlap_tokens)
+        window.append(span)
+        tokens += span_tokens
+    if window:
+        chunk = text[window[0][0] : window[-1][1]].strip()
+        if chunk:
+            yield chunk
+
+
+def _overlap(
+    text: Text, window: List[Span], following: Span, budget: _Budget, overlap_tokens: int
+) -> Tuple[List[Span], int]:
+    """Trailing spans (or sentences of the last span) of ``window`` to repeat before ``following``."""
+
+    def fits(start: int, tokens: int) -> bool:
+        return tokens <= overlap_tokens and budget.fits(tokens + following[2], following[1] - start)
+
+    kept: List[Span] = []
+    tokens = 0
+    for span in reversed(window):
+        if not fits(span[0], tokens + span[2]):
+            break
+        kept.append(span)
+        tokens += span[2]
+    if not kept and overlap_tokens > 0:
+        # The last span is a whole paragraph: repeat its trailing sentences instead.
+        start, end, _ = window[-1]
+        sentence_starts = [m.end() for m in _BOUNDARIES[1].finditer(text, start, end) if m.end() < end]
+        for sentence_start in reversed(sentence_starts):
+            sentence_tokens = budget.count(text[sentence_start:end])
+            if not fits(sentence_start, sentence_tokens):
+                break
+            kept, tokens = [(sentence_start, end, sentence_tokens)], sentence_tokens
+    kept.reverse()
+    return kept, tokens
+
+
+def _spans(text: Text, start: int, end: int, budget: _Budget, level: int) -> Iterator[Span]:
+    """Yield consecutive ``(start, end, tokens)`` spans covering ``text[start:end]``.
+
+    Pieces are cut at the boundaries of ``level``; a piece over the budget is
+    cut again at the next finer boundary, and as a last resort by characters.
+    """
+    position = start
+    for match in _BOUNDARIES[level].finditer(text, start, end):
+        if match.end() > position:
+            yield from _fit(text, position, match.end(), budget, level)
+            position = match.end()
+    if position < end:
+        yield from _fit(text, position, end, budget, level)
+
+
+def _fit(text: Text, start: int, end: int, budget: _Budget, level: int) -> Iterator[Span]:
+    tokens = budget.count(text[start:end])
+    if budget.fits(tokens, end - start):
+        yield (start, end, tokens)
+    elif level + 1 < len(_BOUNDARIES):
+        yield from _spans(text, start, end, budget, level + 1)
+    else:
+        yield from _hard_split(text, start, end, tokens, budget)
+
+
+def _hard_split(text: Text, start: int, end: int, tokens: int, budget: _Budget) -> Iterator[Span]:
+    """Cut a run of text without boundaries into pieces that fit the budget."""
+    size = max((end - start) * budget.max_tokens // max(tokens, 1), 1)
+    if budget.max_chars is not None:
+        size = min(size, budget.max_chars)
+    position = start
+    while position < end:
+        piece_end = min(position + size, end)
+        piece_tokens = budget.count(text[position:piece_end])
+        while piece_tokens > budget.max_tokens and piece_end - position > 1:
+            piece_end = position + (piece_end - position) // 2
+            piece_tokens = budget.count(text[position:piece_end])
+        yield (position, piece_end, piece_tokens)
+        position = piece_end
+
+
+# Lists and dicts
+
+
+def _dumps(value: Any) -> Text:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _list_chunks(items: list, budget: _Budget, overlap_tokens: int) -> Iterator[Text]:
+    """Group list items into chunks, serializing each item once."""
+    group: List[Tuple[Any, Text]] = []
+    tokens = chars = 0
+
+    def flush() -> Text:
+        if all(isinstance(item, str) for item, _ in group):
+            return "\n\n".join(text for _, text in group)
+        return "[\n" + ",\n".join(text if not isinstance(item, str) else _dumps(item) for item, text in group) + "\n]"
+
+    for item in items:
+        text = item if isinstance(item, str) else _dumps(item)
+        # +1 token / +2 chars for the separator between items.
+        item_tokens, item_chars = budget.count(text) + 1, len(text) + 2
+        if group and not budget.fits(tokens + item_tokens, chars + item_chars):
+            yield flush()
+            group, tokens, chars = [], 0, 0
+        if not budget.fits(item_tokens, item_chars):
+            yield from _text_chunks(text, budget, overlap_tokens)
+            continue
+        group.append((item, text))
+        tokens += item_tokens
+        chars += item_chars
+    if group:
+        yield flush()
+
+
+def _dict_chunks(mapping: dict, budget: _Budget, overlap_tokens: int) -> Iterator[Text]:
+    """Group dict entries into JSON object chunks, serializing each entry once."""
+    entries: List[Text] = []
+    tokens = chars = 0
+    for key, value in mapping.items():
+        entry = f"  {_dumps(str(key))}: {_dumps(value)}"
+        entry_tokens, entry_chars = budget.count(entry) + 1, len(entry) + 2
+        if entries and not budget.fits(tokens + entry_tokens, chars + entry_chars):
+            yield "{\n" + ",\n".join(entries) + "\n}"
+            entries, tokens, chars = [], 0, 0
+        if not budget.fits(entry_tokens, entry_chars):
+            yield from _text_chunks("{" + entry.strip() + "}", budget, overlap_tokens)
+            continue
+        entries.append(entry)
+        tokens += entry_tokens
+        chars += entry_chars
+    if entries:
+        yield "{\n" + ",\n".join(entries) + "\n}"
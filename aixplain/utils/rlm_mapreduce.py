@@ -0,0 +1,355 @@
+"""Streaming map → tree-reduce scheduler for RLM parallel mode.
+
+:class:`StreamingMapReduce` runs the map calls of an RLM parallel run and, when
+the partial answers are too large for a single reduce call, reduces them in a
+tree without level barriers: a group of ``fan_in`` consecutive answers is
+reduced as soon as its members are ready, while later chunks are still being
+mapped, and each reduced group feeds the next level the same way. Groups keep
+document order, so the result matches the level-by-level reduction.
+
+Calls that run much longer than their peers (past ``hedge_quantile`` of the
+stage's observed latency times ``hedge_factor``) are duplicated on an idle
+worker; whichever copy finishes first is used. Per-stage latency histograms
+and hedging counters are collected in :class:`MapReduceMetrics`.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Text, Tuple
+
+from aixplain.utils.request_hooks import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+MAP = "map"
+REDUCE = "reduce"
+
+# Tokens of "[Part N]: " framing counted per partial answer in a reduce prompt.
+_PART_OVERHEAD_TOKENS = 8
+
+# Latency buckets (seconds) of LLM calls.
+_CALL_LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0, 300.0)
+
+
+class MapReduceMetrics:
+    """Latency and hedging statistics of a :class:`StreamingMapReduce` run.
+
+    Attributes:
+        latency (Dict[Text, LatencyHistogram]): Latency of successful calls per stage.
+        wall_time (Dict[Text, float]): Seconds from the first call start to the last
+            call end, per stage.
+        hedged (int): Duplicate calls issued for stragglers.
+        hedge_wins (int): Hedged calls whose duplicate finished first.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.latency = {MAP: LatencyHistogram(_CALL_LATENCY_BUCKETS), REDUCE: LatencyHistogram(_CALL_LATENCY_BUCKETS)}
+        self.wall_time = {MAP: 0.0, REDUCE: 0.0}
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._spans: Dict[Text, List[float]] = {}
+
+    def observe(self, stage: Text, started: float, ended: float) -> None:
+        """Record a successful call of ``stage``."""
+        self.latency[stage].observe(ended - started)
+        span = self._spans.setdefault(stage, [started, ended])
+        span[0], span[1] = min(span[0], started), max(span[1], ended)
+        self.wall_time[stage] = span[1] - span[0]
+
+    def to_dict(self) -> Dict[Text, Any]:
+        """Per-stage latency summaries, wall times and hedging counters."""
+        return {
+            "stages": {
+                stage: {**histogram.to_dict(), "wall_time": self.wall_time[stage]}
+                for stage, histogram in self.latency.items()
+            },
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+class _Task:
+    """One logical call (a map of a chunk or a reduce of a group), possibly hedged."""
+
+    __slots__ = ("stage", "key", "fn", "started", "futures", "hedged", "done")
+
+    def __init__(self, stage: Text, key: Tuple, fn: Callable[[], Text]) -> None:
+        self.stage = stage
+        self.key = key
+        self.fn = fn
+        self.started: Optional[float] = None
+        self.futures: List[Future] = []
+        self.hedged = False
+        self.done = False
+
+
+class StreamingMapReduce:
+    """Map chunks and tree-reduce the answers as they arrive.
+
+    The reduce tree is only built when the non-empty answers exceed
+    ``budget_tokens``: below that, :meth:`run` returns the map answers alone so
+    the caller can synthesize them with a single reduce call.
+
+    Args:
+        map_call (Callable[[int, Text], Text]): Answers chunk ``idx``.
+        reduce_call (Callable[[List[Text]], Text]): Combines partial answers
+            (in document order) into one.
+        is_empty (Callable[[Text], bool]): Whether an answer carries nothing to
+            reduce (e.g. ``"NONE"``).
+        count_tokens (Callable[[Text], int]): Token counter of answers.
+        budget_tokens (Optional[int]): Size of the partial answers one reduce
+            call can take; None never builds the reduce tree.
+        map_error (Callable[[int, Exception], Text]): Answer used for a chunk
+            whose map call failed; reduce failures are raised.
+        fan_in (int, optional): Answers combined per reduce call. Defaults to 8.
+        max_workers (int, optional): Concurrent calls. Defaults to 8.
+        max_pending (int, optional): Map calls submitted ahead while chunks are
+            still produced. Defaults to ``2 * max_workers``.
+        hedge_quantile (float, optional): Latency quantile of a stage after
+            which a call is a straggler. Defaults to 0.9.
+        hedge_factor (float, optional): Multiplier of that quantile. Defaults to 1.5.
+        hedge_min_samples (int, optional): Completed calls of a stage needed
+            before hedging it. Defaults to 4.
+        hedge_max_fraction (float, optional): Cap on duplicate calls relative
+            to the calls made; 0 disables hedging. Defaults to 0.1.
+        hedge_min_delay (float, optional): Seconds a call runs at least before
+            it is hedged. Defaults to 1.0.
+    """
+
+    def __init__(
+        self,
+        map_call: Callable[[int, Text], Text],
+        reduce_call: Callable[[List[Text]], Text],
+        is_empty: Callable[[Text], bool],
+        count_tokens: Callable[[Text], int],
+        budget_tokens: Optional[int],
+        map_error: Callable[[int, Exception], Text],
+        fan_in: int = 8,
+        max_workers: int = 8,
+        max_pending: Optional[int] = None,
+        hedge_quantile: float = 0.9,
+        hedge_factor: float = 1.5,
+        hedge_min_samples: int = 4,
+        hedge_max_fraction: float = 0.1,
+        hedge_min_delay: float = 1.0,
+    ) -> None:
+        """Initialize the scheduler."""
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2")
+        self.map_call = map_call
+        self.reduce_call = reduce_call
+        self.is_empty = is_empty
+        self.count_tokens = count_tokens
+        self.budget_tokens = budget_tokens
+        self.map_error = map_error
+        self.fan_in = fan_in
+        self.max_workers = max_workers
+        self.max_pending = max_pending or 2 * max_workers
+        self.hedge_quantile = hedge_quantile
+        self.hedge_factor = hedge_factor
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_max_fraction = hedge_max_fraction
+        self.hedge_min_delay = hedge_min_delay
+        self.metrics = MapReduceMetrics()
+
+    def run(self, chunks: Iterable[Text]) -> Tuple[List[Text], Optional[Text]]:
+        """Map every chunk and, when needed, reduce the answers.
+
+        Args:
+            chunks (Iterable[Text]): Chunks in document order; consumed lazily.
+
+        Returns:
+            Tuple[List[Text], Optional[Text]]: The map answers in chunk order, and
+                the reduced answer — None when the answers fit a single reduce
+                call (or are all empty) and were not reduced.
+        """
+        self._chunks: Iterator[Text] = iter(chunks)
+        self._exhausted = False
+        # levels[0] holds map answers; levels[k] the outputs of level-k groups.
+        # A slot is None until computed; empty groups produce "".
+        self._levels: List[List[Optional[Text]]] = [[]]
+        self._passed_through: Dict[Tuple[int, int], bool] = {}
+        self._sizes: Dict[int, int] = {}
+        self._submitted: set = set()
+        self._tasks: Dict[Future, _Task] = {}
+        self._active: List[_Task] = []
+        self._calls = 0
+        self._answer_tokens = 0
+        self._tree = False
+        self._lock = threading.Lock()
+
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            result = self._loop()
+        finally:
+            # Losing copies of hedged calls may still be running: don't wait for them.
+            for future in self._tasks:
+                future.cancel()
+            self._pool.shutdown(wait=False)
+        answers = [answer if answer is not None else "" for answer in self._levels[0]]
+        return answers, result
+
+    # Scheduling
+
+    def _loop(self) -> Optional[Text]:
+        while True:
+            self._feed()
+            if self._tree:
+                self._schedule_groups()
+            if self._exhausted and not self._active:
+                if not self._tree:
+                    return None
+                final = self._final()
+                if final is not None:
+                    return final
+                continue
+            done, _ = wait(list(self._tasks), timeout=self._hedge_timeout(), return_when=FIRST_COMPLETED)
+            for future in done:
+                self._complete(future)
+            self._hedge()
+
+    def _feed(self) -> None:
+        """Pull chunks and submit their map calls while few are pending."""
+        while not self._exhausted and sum(task.stage == MAP for task in self._active) < self.max_pending:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._exhausted = True
+                self._sizes[0] = len(self._levels[0])
+                break
+            index = len(self._levels[0])
+            self._levels[0].append(None)
+            self._submit(_Task(MAP, (0, index), lambda index=index, chunk=chunk: self.map_call(index, chunk)))
+
+    def _submit(self, task: _Task) -> None:
+        self._active.append(task)
+        self._calls += 1
+        self._start(task)
+
+    def _start(self, task: _Task) -> None:
+        def call() -> Tuple[Text, float, float]:
+            started = time.monotonic()
+            with self._lock:
+                if task.started is None:
+                    task.started = started
+            result = task.fn()
+            return result, started, time.monotonic()
+
+        future = self._pool.submit(call)
+        task.futures.append(future)
+        self._tasks[future] = task
+
+    def _complete(self, future: Future) -> None:
+        task = self._tasks.pop(future)
+        if task.done:
+            return
+        try:
+            result, started, ended = future.result()
+        except Exception as e:
+            if any(not other.done() for other in task.futures):
+                return  # the other copy may still succeed
+            if task.stage == REDUCE:
+                raise
+            result = self.map_error(task.key[1], e)
+        else:
+            self.metrics.observe(task.stage, started, ended)
+            if future is not task.futures[0]:
+                self.metrics.hedge_wins += 1
+        task.done = True
+        self._active.remove(task)
+        level, index = task.key
+        self._levels[level][index] = result
+        if level == 0 and not self.is_empty(result) and not self._tree and self.budget_tokens is not None:
+            self._answer_tokens += self.count_tokens(result) + _PART_OVERHEAD_TOKENS
+            if self._answer_tokens > self.budget_tokens:
+                logger.debug("RLM map/reduce: answers exceed one reduce call, reducing groups as they complete.")
+                self._tree = True
+
+    # Tree reduce
+
+    def _schedule_groups(self) -> None:
+        """Submit every group whose members are all computed."""
+        level = 0
+        while level < len(self._levels):
+            members = self._levels[level]
+            size = self._sizes.get(level)
+            if size == 0 or (size == 1 and level > 0):
+                break
+            # While a level is still growing, only its full groups are known.
+            group_count = -(-size // self.fan_in) if size is not None else len(members) // self.fan_in
+            if not group_count:
+                break
+            if len(self._levels) == level + 1:
+                self._levels.append([])
+            parents = self._levels[level + 1]
+            while len(parents) < group_count:
+                parents.append(None)
+            if size is not None:
+                self._sizes[level + 1] = group_count
+            for group in range(group_count):
+                key = (level + 1, group)
+                if key in self._submitted:
+                    continue
+                group_members = members[group * self.fan_in : (group + 1) * self.fan_in]
+                if any(member is None for member in group_members):
+                    continue
+                self._submitted.add(key)
+                self._reduce_group(key, [member for member in group_members if member and not self.is_empty(member)])
+            level += 1
+
+    def _reduce_group(self, key: Tuple[int, int], parts: List[Text]) -> None:
+        level, group = key
+        if len(parts) <= 1:
+            # Nothing to combine: pass the answer (or "" for an empty group) up.
+            self._levels[level][group] = parts[0] if parts else ""
+            self._passed_through[key] = True
+            return
+        self._submit(_Task(REDUCE, key, lambda: self.reduce_call(parts)))
+
+    def _final(self) -> Optional[Text]:
+        """The root answer once the tree has collapsed to one computed node, else None."""
+        top = max(level for level, size in self._sizes.items() if level > 0) if len(self._sizes) > 1 else None
+        if top is None or self._sizes[top] != 1 or self._levels[top][0] is None:
+            return None
+        answer = self._levels[top][0]
+        if not answer:
+            return ""
+        if self._passed_through.get((top, 0)):
+            # A lone answer still goes through one reduce call so it answers the query.
+            return self.reduce_call([answer])
+        return answer
+
+    # Hedging
+
+    def _deadline(self, stage: Text) -> Optional[float]:
+        histogram = self.metrics.latency[stage]
+        if self.hedge_max_fraction <= 0 or histogram.count < self.hedge_min_samples:
+            return None
+        return max(histogram.quantile(self.hedge_quantile) * self.hedge_factor, self.hedge_min_delay)
+
+    def _hedge_timeout(self) -> Optional[float]:
+        """Seconds until the next running call may become a straggler (None to wait for a completion)."""
+        now = time.monotonic()
+        waits = []
+        for task in self._active:
+            deadline = self._deadline(task.stage)
+            if deadline is not None and not task.hedged and task.started is not None:
+                waits.append(max(task.started + deadline - now, 0.0))
+        return min(waits) + 0.01 if waits else None
+
+    def _hedge(self) -> None:
+        """Duplicate stragglers onto idle workers, within the hedging budget."""
+        now = time.monotonic()
+        for task in list(self._active):
+            if len(self._tasks) >= self.max_workers or self.metrics.hedged >= self.hedge_max_fraction * self._calls:
+                return
+            deadline = self._deadline(task.stage)
+            if task.hedged or task.started is None or deadline is None or now - task.started < deadline:
+                continue
+            task.hedged = True
+            self.metrics.hedged += 1
+            logger.debug(f"RLM map/reduce: hedging slow {task.stage} call {task.key} after {now - task.started:.1f}s.")
+            self._start(task)
@@ -0,0 +1,318 @@
+"""In-process vector index for RLM rag mode.
+
+RLM rag mode normally creates an aIR index, upserts every chunk, searches it
+and deletes it on each run. :class:`LocalVectorIndex` replaces those remote
+round-trips with an exact cosine-similarity search over a NumPy matrix, and
+keeps embeddings so that iterating over the same document only pays for
+chunks (and queries) it has not embedded before:
+
+- Embeddings are stored per embedding model, keyed by the SHA-256 of the
+  embedded text. A document that changed slightly re-embeds only its new
+  chunks.
+- Each document's matrix is keyed by the hash of its chunk list and kept in
+  memory (LRU over ``max_documents``) and, with ``path`` set, saved as a
+  ``.npy`` file that later processes memory-map instead of rebuilding.
+
+On disk, each embedding model gets a directory under ``path`` holding an
+append-only ``vectors.f32`` matrix, the matching ``keys.txt`` (one text hash
+per row), ``meta.json`` (the dimension) and ``documents/<hash>.npy``.
+Writers take a file lock, so processes can share the directory.
+
+Example:
+    >>> index = LocalVectorIndex(".cache/rlm-vectors")
+    >>> rlm = ModelFactory.create_rlm(orchestrator_id, worker_id, rag_local_index=index)
+    >>> rlm.run(data={"context": report, "query": "Who signed?"}, mode="rag")  # embeds every chunk
+    >>> rlm.run(data={"context": report, "query": "When?"}, mode="rag")  # embeds the query only
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Text, Tuple
+
+import numpy as np
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[List[Text]], List[Sequence[float]]]
+
+DEFAULT_MAX_DOCUMENTS = 16
+
+# Texts sent to the embedder per call; new embeddings are stored after each batch.
+EMBED_BATCH_SIZE = 64
+
+
+@dataclass(frozen=True)
+class VectorIndexStats:
+    """Counters of a :class:`LocalVectorIndex`.
+
+    Attributes:
+        embedded: Texts sent to the embedder.
+        reused: Texts whose stored embedding was reused.
+        documents: Document matrices currently held in memory.
+    """
+
+    embedded: int = 0
+    reused: int = 0
+    documents: int = 0
+
+
+def text_hash(text: Text) -> Text:
+    """Hex SHA-256 digest of ``text``, the key of its embedding."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def parse_embedding(data: Any) -> List[float]:
+    """Extract a vector from an embedding model output.
+
+    Accepts a list of numbers, a JSON string of one, a dict holding it under
+    ``embedding``/``vector``/``data``/``values``, or a one-element list of any
+    of these.
+
+    Raises:
+        ValueError: If no vector can be found.
+    """
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            raise ValueError(f"Embedding output is not a vector: {data[:100]!r}")
+    if isinstance(data, dict):
+        for key in ("embedding", "vector", "data", "values"):
+            if key in data:
+                return parse_embedding(data[key])
+    if isinstance(data, list) and len(data) == 1 and not isinstance(data[0], (int, float)):
+        return parse_embedding(data[0])
+    if isinstance(data, list) and data and all(isinstance(value, (int, float)) for value in data):
+        return [float(value) for value in data]
+    raise ValueError(f"Embedding output is not a vector: {str(data)[:100]!r}")
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+class _EmbeddingStore:
+    """Normalized embeddings of one embedding model, keyed by text hash."""
+
+    def __init__(self, directory: Optional[Text]) -> None:
+        self.directory = directory
+        self.dim: Optional[int] = None
+        self.rows: Dict[Text, int] = {}
+        self._memory: List[np.ndarray] = []
+        self._vectors: Optional[np.ndarray] = None
+        self._keys: List[Text] = []
+        self._keys_size = 0
+        self._row_count = 0
+        if directory is not None:
+            os.makedirs(os.path.join(directory, "documents"), exist_ok=True)
+            self._lock = FileLock(os.path.join(directory, ".lock"))
+            with self._lock:
+                self._reload()
+
+    def _grown(self) -> bool:
+        """Return whether ``keys.txt`` holds rows written since the last reload."""
+        try:
+            return os.path.getsize(os.path.join(self.directory, "keys.txt")) != self._keys_size
+        except FileNotFoundError:
+            return False
+
+    def _reload(self) -> None:
+        """Read the rows appended since the last reload (by this or another process)."""
+        if not self._grown():
+            return
+        if self.dim is None:
+            with open(os.path.join(self.directory, "meta.json")) as f:
+                self.dim = json.load(f)["dim"]
+        with open(os.path.join(self.directory, "keys.txt"), "rb") as f:
+            f.seek(self._keys_size)
+            appended = f.read()
+        self._keys_size += len(appended)
+        self._keys.extend(appended.decode("ascii").split())
+        vectors_path = os.path.join(self.directory, "vectors.f32")
+        # Vectors are written before their keys: extra rows belong to an interrupted write.
+        rows = min(len(self._keys), os.path.getsize(vectors_path) // (4 * self.dim))
+        for row in range(self._row_count, rows):
+            self.rows[self._keys[row]] = row
+        self._row_count = rows
+        self._vectors = np.memmap(vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim)) if rows else None
+
+    def missing(self, keys: List[Text]) -> List[Text]:
+        absent = [key for key in keys if key not in self.rows]
+        if absent and self.directory is not None and self._grown():
+            with self._lock:
+                self._reload()
+            absent = [key for key in absent if key not in self.rows]
+        return absent
+
+    def add(self, keys: List[Text], vectors: np.ndarray) -> None:
+        vectors = _normalize(vectors)
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Embedding dimension changed from {self.dim} to {vectors.shape[1]}")
+        if self.directory is None:
+            for key, vector in zip(keys, vectors):
+                if key not in self.rows:
+                    self.rows[key] = len(self._memory)
+                    self._memory.append(vector)
+            return
+        with self._lock:
+            self._reload()
+            fresh = [(key, vector) for key, vector in zip(keys, vectors) if key not in self.rows]
+            if not fresh:
+                return
+            with open(os.path.join(self.directory, "meta.json"), "w") as f:
+                json.dump({"dim": self.dim}, f)
+            with open(os.path.join(self.directory, "vectors.f32"), "ab") as f:
+                f.truncate(self._row_count * 4 * self.dim)
+                f.write(np.stack([vector for _, vector in fresh]).tobytes())
+            with open(os.path.join(self.directory, "keys.txt"), "a") as f:
+                f.write("".join(f"{key}\n" for key, _ in fresh))
+            self._reload()
+
+    def matrix(self, keys: List[Text]) -> np.ndarray:
+        rows = [self.rows[key] for key in keys]
+        if self.directory is None:
+            return np.stack([self._memory[row] for row in rows]) if rows else np.zeros((0, self.dim or 0), np.float32)
+        return np.ascontiguousarray(self._vectors[rows]) if rows else np.zeros((0, self.dim or 0), np.float32)
+
+
+class LocalVectorIndex:
+    """Exact cosine-similarity retrieval over locally stored chunk embeddings.
+
+    Thread-safe; one instance can serve several RLMs, each embedding model
+    getting its own namespace.
+    """
+
+    def __init__(self, path: Optional[Text] = None, max_documents: int = DEFAULT_MAX_DOCUMENTS) -> None:
+        """Initialize the index.
+
+        Args:
+            path (Optional[Text], optional): Directory where embeddings and
+                document matrices are persisted; None keeps them in memory for
+                the lifetime of the instance. Defaults to None.
+            max_documents (int, optional): Document matrices kept in memory; the
+                least recently used one is dropped beyond it. Defaults to 16.
+        """
+        if max_documents < 1:
+            raise ValueError("max_documents must be at least 1")
+        self.path = path
+        self.max_documents = max_documents
+        self._stores: Dict[Text, _EmbeddingStore] = {}
+        self._documents: "OrderedDict[Tuple[Text, Text], np.ndarray]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._embedded = 0
+        self._reused = 0
+
+    def search(
+        self, namespace: Text, chunks: List[Text], query: Text, embed: Embedder, top_k: int
+    ) -> List[Tuple[int, float]]:
+        """Return the ``top_k`` chunks most similar to ``query``.
+
+        Args:
+            namespace (Text): Embedding model id; embeddings are only shared
+                within a namespace.
+            chunks (List[Text]): The document's chunks, in document order.
+            query (Text): Search query.
+            embed (Embedder): Embeds a batch of texts; only called for texts
+                without a stored embedding.
+            top_k (int): Number of chunks to return.
+
+        Returns:
+            List[Tuple[int, float]]: ``(position, cosine similarity)`` of the best
+                chunks, most similar first.
+        """
+        matrix = self.document(namespace, chunks, embed)
+        if not len(matrix) or top_k < 1:
+            return []
+        (query_vector,) = self._vectors(namespace, [query], embed)
+        scores = matrix @ query_vector
+        top_k = min(top_k, len(scores))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(int(position), float(scores[position])) for position in best]
+
+    def document(self, namespace: Text, chunks: List[Text], embed: Embedder) -> np.ndarray:
+        """Return the normalized embedding matrix of a document, embedding only new chunks."""
+        keys = [text_hash(chunk) for chunk in chunks]
+        document_key = text_hash("\n".join(keys))
+        with self._lock:
+            matrix = self._documents.get((namespace, document_key))
+            if matrix is not None:
+                self._documents.move_to_end((namespace, document_key))
+                self._reused += len(chunks)
+                return matrix
+        store = self._store(namespace)
+        document_path = None
+        if store.directory is not None:
+            document_path = os.path.join(store.directory, "documents", f"{document_key}.npy")
+        if document_path is not None and os.path.exists(document_path):
+            matrix = np.load(document_path, mmap_mode="r")
+            with self._lock:
+                self._reused += len(chunks)
+        else:
+            matrix = self._vectors(namespace, chunks, embed, keys)
+            if document_path is not None:
+                temporary = f"{document_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temporary, "wb") as f:
+                    np.save(f, matrix)
+                os.replace(temporary, document_path)
+        with self._lock:
+            self._documents[(namespace, document_key)] = matrix
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+        return matrix
+
+    def stats(self) -> VectorIndexStats:
+        """Return a snapshot of the index counters."""
+        with self._lock:
+            return VectorIndexStats(embedded=self._embedded, reused=self._reused, documents=len(self._documents))
+
+    def clear(self) -> None:
+        """Drop the in-memory document matrices and reset the statistics (files are kept)."""
+        with self._lock:
+            self._documents.clear()
+            self._embedded = self._reused = 0
+
+    def _store(self, namespace: Text) -> _EmbeddingStore:
+        with self._lock:
+            store = self._stores.get(namespace)
+            if store is None:
+                directory = None if self.path is None else os.path.join(self.path, text_hash(namespace)[:16])
+                store = self._stores[namespace] = _EmbeddingStore(directory)
+            return store
+
+    def _vectors(
+        self, namespace: Text, texts: List[Text], embed: Embedder, keys: Optional[List[Text]] = None
+    ) -> np.ndarray:
+        """Normalized embeddings of ``texts``, calling ``embed`` for the new ones only."""
+        keys = keys or [text_hash(text) for text in texts]
+        store = self._store(namespace)
+        with self._lock:
+            missing = set(store.missing(keys))
+        pending = [(key, text) for key, text in dict(zip(keys, texts)).items() if key in missing]
+        for start in range(0, len(pending), EMBED_BATCH_SIZE):
+            batch = pending[start : start + EMBED_BATCH_SIZE]
+            # Not under the lock: remote embedding calls of RLMs sharing the index run concurrently.
+            vectors = embed([text for _, text in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(f"Embedder returned {len(vectors)} vectors for {len(batch)} texts")
+            with self._lock:
+                store.add([key for key, _ in batch], np.asarray(vectors, dtype=np.float32))
+        with self._lock:
+            self._embedded += len(pending)
+            self._reused += len(keys) - len(pending)
+            logger.debug(f"RLM vector index: embedded {len(pending)} of {len(keys)} text(s).")
+            return store.matrix(keys)
+
+    def __deepcopy__(self, memo: dict) -> "LocalVectorIndex":
+        """Return self: the index is shared state, not part of the RLM configuration."""
+        return self
@@ -0,0 +1,211 @@
+"""Index of agent execution steps for delta-aware polling.
+
+Each agent poll returns every step produced so far. :class:`StepIndex`
+remembers what was already seen, keyed by step id, and reports only steps that
+are new or whose content changed. Steps that have finished (produced an
+output or an error) never change again, so they form a stable prefix that
+later snapshots skip without comparing, keeping the per-poll work
+proportional to the number of new or still-running steps.
+
+Example:
+    >>> index = StepIndex()
+    >>> for delta in index.iter_deltas(response.data.steps):
+    ...     print(delta.index, delta.step_id, "new" if delta.is_new else "updated")
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Text
+
+
+def step_id(step: Dict, index: int) -> Text:
+    """Return the identifier used to match a step across polls.
+
+    Args:
+        step (Dict): Step payload.
+        index (int): Position of the step in the execution.
+
+    Returns:
+        Text: ``id``, ``step_id`` or ``idx-<index>`` when the step has no id.
+    """
+    return step.get("id") or step.get("step_id") or f"idx-{index}"
+
+
+def step_finished(step: Dict) -> bool:
+    """Return True once a step carries an output or an error."""
+    return bool(step.get("output") or step.get("error") or step.get("error_message"))
+
+
+@dataclass
+class StepDelta:
+    """A step that is new or changed since the previous update.
+
+    Attributes:
+        index (int): Position of the step in the execution.
+        step_id (Text): Identifier of the step.
+        step (Dict): Latest payload of the step.
+        is_new (bool): True the first time the step is seen.
+        previous (Optional[Dict]): Payload reported before this change, if any.
+    """
+
+    index: int
+    step_id: Text
+    step: Dict
+    is_new: bool
+    previous: Optional[Dict] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the step has produced its output (or failed)."""
+        return step_finished(self.step)
+
+
+class StepIndex:
+    """Steps seen so far, keyed by step id, with change detection."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._fingerprints: Dict[Text, Text] = {}
+        self._positions: Dict[Text, int] = {}
+        self._steps: List[Dict] = []
+        self._stable = 0
+
+    def __len__(self) -> int:
+        """Number of steps seen so far."""
+        return len(self._steps)
+
+    @property
+    def steps(self) -> List[Dict]:
+        """Latest payload of every step, in execution order."""
+        return list(self._steps)
+
+    @property
+    def stable(self) -> int:
+        """Length of the prefix of finished steps that is no longer compared."""
+        return self._stable
+
+    def get(self, sid: Text) -> Optional[Dict]:
+        """Return the latest payload of step ``sid``, if seen."""
+        position = self._positions.get(sid)
+        return self._steps[position] if position is not None else None
+
+    def reset(self) -> None:
+        """Forget every step."""
+        self.__init__()
+
+    def upsert(self, step: Dict, index: Optional[int] = None) -> Optional[StepDelta]:
+        """Record a single step.
+
+        Args:
+            step (Dict): Step payload.
+            index (int, optional): Position of the step. Looked up by id, or
+                appended, when omitted.
+
+        Returns:
+            Optional[StepDelta]: The delta, or None if the step is unchanged.
+        """
+        if index is None:
+            sid = step.get("id") or step.get("step_id")
+            index = self._positions.get(sid, len(self._steps)) if sid else len(self._steps)
+        sid = step_id(step, index)
+        fingerprint = json.dumps(step, sort_keys=True, default=str)
+        previous_fingerprint = self._fingerprints.get(sid)
+        if previous_fingerprint == fingerprint:
+            return None
+
+        previous = self.get(sid)
+        self._fingerprints[sid] = fingerprint
+        self._positions[sid] = index
+        if index < len(self._steps):
+            self._steps[index] = step
+        else:
+            self._steps.extend({} for _ in range(index - len(self._steps)))
+            self._steps.append(step)
+        while self._stable < len(self._steps) and step_finished(self._steps[self._stable]):
+            self._stable += 1
+        return StepDelta(index=index, step_id=sid, step=step, is_new=previous_fingerprint is None, previous=previous)
+
+    def iter_deltas(self, steps: Optional[Iterable[Any]]) -> Iterator[StepDelta]:
+        """Yield the steps of a full snapshot that are new or changed.
+
+        Steps in the stable prefix are skipped without being compared.
+
+        Args:
+            steps (Iterable): All steps of the execution so far.
+
+        Yields:
+            StepDelta: One delta per new or changed step, in execution order.
+        """
+        if not isinstance(steps, list):
+            steps = list(steps or [])
+        for index in range(self._stable, len(steps)):
+            step = steps[index]
+            if not isinstance(step, dict):
+                continue
+            delta = self.upsert(step, index)
+            if delta is not None:
+                yield delta
+
+    def update(self, steps: Optional[Iterable[Any]]) -> List[StepDelta]:
+        """Record a full snapshot and return its deltas (see :meth:`iter_deltas`)."""
+        return list(self.iter_deltas(steps))
+
+
+def response_steps(response: Any) -> List:
+    """Return the step list of a v1 or v2 agent poll response (or an empty list).
+
+    Args:
+        response (Any): Poll response whose ``data`` is a dict or carries ``steps``.
+
+    Returns:
+        List: The steps reported so far.
+    """
+    data = getattr(response, "data", None)
+    if data is None and isinstance(response, dict):
+        data = response.get("data")
+    if isinstance(data, dict):
+        steps = data.get("steps")
+    else:
+        steps = getattr(data, "steps", None)
+    return steps if isinstance(steps, list) else []
+
+
+def iter_poll_deltas(
+    poll: Callable[[Text], Any],
+    poll_url: Text,
+    wait_time: float = 0.5,
+    timeout: float = 300,
+) -> Generator[StepDelta, None, Any]:
+    """Poll ``poll_url`` until completion, yielding only new or changed steps.
+
+    Args:
+        poll (Callable): Single-poll function, e.g. ``agent.poll``.
+        poll_url (Text): URL returned by ``run_async``.
+        wait_time (float, optional): Initial delay between polls. Defaults to 0.5.
+        timeout (float, optional): Maximum polling time in seconds. Defaults to 300.
+
+    Yields:
+        StepDelta: New or changed steps, in execution order.
+
+    Returns:
+        Any: The final poll response (the generator's return value).
+
+    Raises:
+        TimeoutError: If the execution does not complete within ``timeout``.
+    """
+    index = StepIndex()
+    wait_time = max(wait_time, 0.2)
+    start = time.time()
+    while (time.time() - start) < timeout:
+        response = poll(poll_url)
+        yield from index.iter_deltas(response_steps(response))
+        completed = getattr(response, "completed", None)
+        if completed is None and isinstance(response, dict):
+            completed = response.get("completed")
+        if completed is True:
+            return response
+        time.sleep(wait_time)
+        if wait_time < 60:
+            wait_time *= 1.1
+    raise TimeoutError(f"Polling {poll_url} timed out after {timeout} seconds")
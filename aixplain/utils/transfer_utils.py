@@ -0,0 +1,540 @@
+"""Streaming transfers between local files and presigned URLs.
+
+Transfers never hold a whole file in memory: upload bodies are file-like views
+of the file on disk that are read in blocks while the socket drains them, and
+downloads are written to disk chunk by chunk, so a multi-GB transfer uses the
+same memory as a small one.
+
+Two upload paths are provided:
+
+* :func:`stream_upload` sends a whole file with one presigned ``PUT``.
+* :func:`multipart_upload` sends the parts of an S3 multipart upload over
+  several connections at once, retries each part on its own, and completes
+  the upload once every part is in.
+
+:func:`download_file` is the counterpart for downloads: it fetches HTTP
+``Range`` segments in parallel, resumes partially downloaded files and verifies
+their size and checksum.
+
+All three return a :class:`TransferStats` with the transferred size and throughput.
+
+Example:
+    >>> stats = stream_upload("audio.tar", presigned_url, headers={"Content-Type": "application/x-tar"})
+    >>> print(stats)
+    2048.0 MB in 41.20s (49.7 MB/s, 1 part, 0 retries)
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Text, Tuple, Union
+from xml.sax.saxutils import escape
+
+import requests
+
+from aixplain.utils.request_utils import _request_with_retry
+
+logger = logging.getLogger(__name__)
+
+RequestFn = Callable[..., requests.Response]
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PART_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+class TransferError(Exception):
+    """Raised when a transfer is rejected by the server or runs out of attempts."""
+
+
+@dataclass
+class TransferStats:
+    """Size and timing of a finished transfer.
+
+    Attributes:
+        bytes_transferred (int): Payload bytes sent or received.
+        seconds (float): Wall-clock duration of the transfer.
+        parts (int): Number of parts (1 for single-request transfers).
+        retries (int): Part attempts that failed and were retried.
+    """
+
+    bytes_transferred: int
+    seconds: float
+    parts: int = 1
+    retries: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Average rate in bytes per second (0.0 when the duration is zero)."""
+        return self.bytes_transferred / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        """Human-readable summary, e.g. ``12.0 MB in 1.50s (8.0 MB/s, 3 parts, 0 retries)``."""
+        mb = self.bytes_transferred / 1048576
+        rate = self.throughput / 1048576
+        parts = "part" if self.parts == 1 else "parts"
+        retries = "retry" if self.retries == 1 else "retries"
+        return f"{mb:.1f} MB in {self.seconds:.2f}s ({rate:.1f} MB/s, {self.parts} {parts}, {self.retries} {retries})"
+
+
+@dataclass
+class MultipartUpload:
+    """Presigned URLs of an S3 multipart upload.
+
+    Attributes:
+        part_urls (List[Text]): Presigned ``UploadPart`` URL of each part, in part-number order.
+        complete_url (Text): Presigned ``CompleteMultipartUpload`` URL (sent as ``POST``).
+        part_size (int): Size of every part but the last, in bytes. S3 requires at
+            least 5 MB. Defaults to 8 MB.
+        abort_url (Optional[Text]): Presigned ``AbortMultipartUpload`` URL (sent as
+            ``DELETE``) used to discard the uploaded parts when a part fails for good.
+    """
+
+    part_urls: List[Text]
+    complete_url: Text
+    part_size: int = DEFAULT_PART_SIZE
+    abort_url: Optional[Text] = None
+
+    @staticmethod
+    def part_count(file_size: int, part_size: int = DEFAULT_PART_SIZE) -> int:
+        """Return how many part URLs are needed to upload ``file_size`` bytes."""
+        return max(1, math.ceil(file_size / part_size))
+
+
+class FileSlice:
+    """Read-only, file-like view of ``length`` bytes of a file starting at ``offset``.
+
+    ``requests`` streams it as a request body with a ``Content-Length`` header,
+    reading one block at a time; ``seek``/``tell`` let the transport rewind it
+    when a request is retried.
+    """
+
+    def __init__(self, path: Union[Text, Path], offset: int = 0, length: Optional[int] = None) -> None:
+        """Open ``path`` and position the view.
+
+        Args:
+            path (Union[Text, Path]): File to read.
+            offset (int, optional): First byte of the view. Defaults to 0.
+            length (Optional[int], optional): Number of bytes in the view.
+                Defaults to the rest of the file.
+        """
+        self._file = open(path, "rb")
+        if length is None:
+            length = os.fstat(self._file.fileno()).st_size - offset
+        self._offset = offset
+        self._length = max(0, length)
+        self._pos = 0
+        self._file.seek(offset)
+
+    def __len__(self) -> int:
+        """Number of bytes in the view."""
+        return self._length
+
+    def __iter__(self):
+        """Yield the remaining bytes in blocks of ``READ_BLOCK_SIZE``."""
+        while True:
+            block = self.read(READ_BLOCK_SIZE)
+            if not block:
+                return
+            yield block
+
+    def __enter__(self) -> "FileSlice":
+        """Return self for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Close the underlying file."""
+        self.close()
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read up to ``size`` bytes (all remaining bytes when negative or None)."""
+        remaining = self._length - self._pos
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        data = self._file.read(size)
+        self._pos += len(data)
+        return data
+
+    def tell(self) -> int:
+        """Return the current position within the view."""
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Move within the view; positions are clamped to ``[0, len(self)]``."""
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._pos, os.SEEK_END: self._length}[whence]
+        self._pos = min(max(base + offset, 0), self._length)
+        self._file.seek(self._offset + self._pos)
+        return self._pos
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+
+def _is_success(response: requests.Response) -> bool:
+    return 200 <= response.status_code < 300
+
+
+def stream_upload(
+    file_path: Union[Text, Path],
+    url: Text,
+    headers: Optional[Dict[Text, Text]] = None,
+    request: RequestFn = _request_with_retry,
+) -> TransferStats:
+    """Upload a whole file with one ``PUT`` without reading it into memory.
+
+    Args:
+        file_path (Union[Text, Path]): Local file to upload.
+        url (Text): Presigned ``PUT`` URL.
+        headers (Optional[Dict[Text, Text]], optional): Extra request headers
+            (``Content-Type``, ``Content-Encoding``...). Defaults to None.
+        request (Callable, optional): ``request(method, url, **kwargs)`` function
+            used to send the request. Defaults to the pooled ``_request_with_retry``.
+
+    Returns:
+        TransferStats: Size and throughput of the upload.
+
+    Raises:
+        TransferError: If the server does not answer with a 2xx status.
+    """
+    start = time.monotonic()
+    with FileSlice(file_path) as body:
+        size = len(body)
+        # an empty stream would be sent chunked, which presigned PUTs reject
+        response = request("put", url, headers=headers, data=body if size else b"")
+    if not _is_success(response):
+        raise TransferError(f"Upload to presigned URL failed with status {response.status_code}.")
+    stats = TransferStats(bytes_transferred=size, seconds=time.monotonic() - start)
+    logger.debug(f"Uploaded {file_path}: {stats}")
+    return stats
+
+
+def _upload_part(
+    file_path: Union[Text, Path],
+    url: Text,
+    offset: int,
+    length: int,
+    headers: Optional[Dict[Text, Text]],
+    attempts: int,
+    backoff: float,
+    request: RequestFn,
+) -> Tuple[Text, int]:
+    """Upload one part, retrying it alone; return its ETag and the number of retries."""
+    error: Optional[Exception] = None
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            with FileSlice(file_path, offset, length) as body:
+                response = request("put", url, headers=headers, data=body if length else b"")
+            etag = response.headers.get("ETag")
+            if _is_success(response) and etag:
+                return etag, attempt
+            error = TransferError(
+                f"status {response.status_code}" if not _is_success(response) else "response has no ETag"
+            )
+        except (requests.RequestException, OSError) as e:
+            error = e
+    raise TransferError(f"Part at offset {offset} failed after {attempts} attempts: {error}") from error
+
+
+def _complete_multipart_body(etags: List[Text]) -> Text:
+    parts = "".join(
+        f"<Part><PartNumber>{number}</PartNumber><ETag>{escape(etag)}</ETag></Part>"
+        for number, etag in enumerate(etags, start=1)
+    )
+    return f"<CompleteMultipartUpload>{parts}</CompleteMultipartUpload>"
+
+
+def multipart_upload(
+    file_path: Union[Text, Path],
+    upload: MultipartUpload,
+    headers: Optional[Dict[Text, Text]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    part_attempts: int = DEFAULT_PART_ATTEMPTS,
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    request: RequestFn = _request_with_retry,
+) -> TransferStats:
+    """Upload a file as the parts of an S3 multipart upload, several parts at a time.
+
+    Each worker streams its part straight from disk, so memory use does not
+    depend on the file or part size. A failed part is retried on its own with
+    exponential backoff; if it still fails, the upload is aborted (when
+    ``upload.abort_url`` is set) and :class:`TransferError` is raised.
+
+    Args:
+        file_path (Union[Text, Path]): Local file to upload.
+        upload (MultipartUpload): Presigned part, complete and abort URLs.
+        headers (Optional[Dict[Text, Text]], optional): Extra headers sent with
+            every part. Defaults to None.
+        max_workers (int, optional): Parts uploaded in parallel. Defaults to 4.
+        part_attempts (int, optional): Attempts per part. Defaults to 3.
+        retry_backoff (float, optional): Seconds to wait before the first retry
+            of a part, doubled on each further retry. Defaults to 0.5.
+        request (Callable, optional): ``request(method, url, **kwargs)`` function
+            used to send requests. Defaults to the pooled ``_request_with_retry``.
+
+    Returns:
+        TransferStats: Size, part count, retries and throughput of the upload.
+
+    Raises:
+        ValueError: If the number of part URLs does not match the file size.
+        TransferError: If a part or the completion request fails.
+    """
+    size = os.path.getsize(file_path)
+    n_parts = MultipartUpload.part_count(size, upload.part_size)
+    if len(upload.part_urls) != n_parts:
+        raise ValueError(
+            f"{file_path} needs {n_parts} parts of {upload.part_size} bytes, got {len(upload.part_urls)} part URLs."
+        )
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, n_parts)), thread_name_prefix="aixplain-upload") as pool:
+        futures = []
+        for index, url in enumerate(upload.part_urls):
+            offset = index * upload.part_size
+            length = min(upload.part_size, size - offset)
+            futures.append(
+                pool.submit(
+                    _upload_part, file_path, url, offset, length, headers, part_attempts, retry_backoff, request
+                )
+            )
+        try:
+            results = [future.result() for future in futures]
+        except Exception:
+            for future in futures:
+                future.cancel()
+            _abort_multipart(upload, request)
+            raise
+
+    response = request(
+        "post",
+        upload.complete_url,
+        headers={"Content-Type": "application/xml"},
+        data=_complete_multipart_body([etag for etag, _ in results]),
+    )
+    # S3 can report a failed completion in the body of a 200 response
+    if not _is_success(response) or "<Error>" in (response.text or ""):
+        _abort_multipart(upload, request)
+        raise TransferError(f"Completing the multipart upload failed with status {response.status_code}.")
+
+    stats = TransferStats(
+        bytes_transferred=size,
+        seconds=time.monotonic() - start,
+        parts=n_parts,
+        retries=sum(retries for _, retries in results),
+    )
+    logger.debug(f"Uploaded {file_path}: {stats}")
+    return stats
+
+
+def _abort_multipart(upload: MultipartUpload, request: RequestFn) -> None:
+    """Best-effort discard of uploaded parts so the bucket is not billed for them."""
+    if upload.abort_url is None:
+        return
+    try:
+        request("delete", upload.abort_url)
+    except requests.RequestException as e:
+        logger.warning(f"Could not abort multipart upload: {e}")
+
+
+def _content_range_total(response: requests.Response) -> Optional[int]:
+    """Return the full size announced by a ``Content-Range: bytes a-b/total`` header."""
+    match = re.match(r"bytes \d+-\d+/(\d+)", response.headers.get("Content-Range", ""))
+    return int(match.group(1)) if match else None
+
+
+def _load_progress(state_path: Path, size: int, etag: Optional[Text]) -> Set[int]:
+    """Return the finished segments recorded for a partial download of the same object."""
+    try:
+        state = json.loads(state_path.read_text())
+    except (OSError, ValueError):
+        return set()
+    if state.get("size") != size or state.get("etag") != etag:
+        return set()
+    return set(state.get("done", []))
+
+
+def _save_progress(state_path: Path, size: int, etag: Optional[Text], done: Set[int]) -> None:
+    tmp = state_path.with_name(state_path.name + ".tmp")
+    tmp.write_text(json.dumps({"size": size, "etag": etag, "done": sorted(done)}))
+    os.replace(tmp, state_path)
+
+
+def _write_response(response: requests.Response, fh) -> int:
+    """Copy a streamed response body into ``fh``; return the number of bytes written."""
+    written = 0
+    for chunk in response.iter_content(chunk_size=READ_BLOCK_SIZE):
+        fh.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def _download_segment(
+    url: Text,
+    part_path: Path,
+    offset: int,
+    length: int,
+    attempts: int,
+    backoff: float,
+    request: RequestFn,
+) -> int:
+    """Download ``length`` bytes at ``offset`` into ``part_path``; return the number of retries."""
+    error: Optional[Exception] = None
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            headers = {"Range": f"bytes={offset}-{offset + length - 1}"}
+            with request("get", url, headers=headers, stream=True) as response:
+                if response.status_code != 206:
+                    raise TransferError(f"status {response.status_code}")
+                with open(part_path, "r+b") as fh:
+                    fh.seek(offset)
+                    written = _write_response(response, fh)
+            if written == length:
+                return attempt
+            error = TransferError(f"received {written} of {length} bytes")
+        except (requests.RequestException, OSError, TransferError) as e:
+            error = e
+    raise TransferError(f"Segment at offset {offset} failed after {attempts} attempts: {error}") from error
+
+
+def _file_digest(path: Path, algorithm: Text) -> Text:
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(READ_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def download_file(
+    url: Text,
+    file_path: Union[Text, Path],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    segment_size: int = DEFAULT_PART_SIZE,
+    checksum: Optional[Text] = None,
+    checksum_algorithm: Text = "sha256",
+    segment_attempts: int = DEFAULT_PART_ATTEMPTS,
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    request: RequestFn = _request_with_retry,
+) -> TransferStats:
+    """Download ``url`` to ``file_path`` in chunks, in parallel and resumably when possible.
+
+    The download is written to ``<file_path>.part`` and only renamed to
+    ``file_path`` once its size (and ``checksum``, if given) is verified, so an
+    interrupted download never leaves a truncated file under the final name.
+
+    When the server honours HTTP ``Range`` requests, the file is split into
+    segments fetched by ``max_workers`` threads; finished segments are recorded
+    in ``<file_path>.part.json`` and skipped when the download is restarted
+    (as long as the object's size and ETag are unchanged). Otherwise the body is
+    streamed to disk in a single request.
+
+    Args:
+        url (Text): URL to download (presigned URLs work, ``HEAD`` is not used).
+        file_path (Union[Text, Path]): Destination path.
+        max_workers (int, optional): Segments downloaded in parallel. Defaults to 4.
+        segment_size (int, optional): Bytes per ranged request. Defaults to 8 MB.
+        checksum (Optional[Text], optional): Expected hex digest of the file. Defaults to None.
+        checksum_algorithm (Text, optional): ``hashlib`` algorithm of ``checksum``.
+            Defaults to "sha256".
+        segment_attempts (int, optional): Attempts per segment. Defaults to 3.
+        retry_backoff (float, optional): Seconds to wait before the first retry
+            of a segment, doubled on each further retry. Defaults to 0.5.
+        request (Callable, optional): ``request(method, url, **kwargs)`` function
+            used to send requests. Defaults to the pooled ``_request_with_retry``.
+
+    Returns:
+        TransferStats: Bytes downloaded by this call (excluding resumed segments),
+            number of segments and throughput.
+
+    Raises:
+        TransferError: If the server rejects the download, a segment keeps
+            failing, or the size or checksum does not match.
+    """
+    file_path = Path(file_path)
+    part_path = file_path.with_name(file_path.name + ".part")
+    state_path = file_path.with_name(file_path.name + ".part.json")
+    start = time.monotonic()
+
+    # A one-byte ranged GET tells whether ranges are supported and the full size
+    probe = request("get", url, headers={"Range": "bytes=0-0"}, stream=True)
+    size = _content_range_total(probe) if probe.status_code == 206 else None
+    # ranges of a content-encoded body cannot be decoded independently
+    if probe.headers.get("Content-Encoding", "identity") != "identity":
+        size = None
+    if size is None:
+        if probe.status_code in (206, 416):
+            # 416: empty objects cannot satisfy any range
+            probe.close()
+            probe = request("get", url, stream=True)
+        if not _is_success(probe):
+            probe.close()
+            raise TransferError(f"Download failed with status {probe.status_code}.")
+        with probe, open(part_path, "wb") as fh:
+            received = _write_response(probe, fh)
+        expected = probe.headers.get("Content-Length")
+        if expected is not None and "Content-Encoding" not in probe.headers and int(expected) != received:
+            raise TransferError(f"Download of {url} ended after {received} of {expected} bytes.")
+        stats = TransferStats(bytes_transferred=received, seconds=0.0)
+        size = received
+    else:
+        etag = probe.headers.get("ETag")
+        probe.close()
+        done = _load_progress(state_path, size, etag) if part_path.exists() else set()
+        if not done:
+            with open(part_path, "wb") as fh:
+                fh.truncate(size)
+            _save_progress(state_path, size, etag, done)
+        segments = [
+            (index, offset, min(segment_size, size - offset))
+            for index, offset in enumerate(range(0, size, segment_size))
+            if index not in done
+        ]
+        lock = threading.Lock()
+
+        def fetch(index: int, offset: int, length: int) -> int:
+            retries = _download_segment(url, part_path, offset, length, segment_attempts, retry_backoff, request)
+            with lock:
+                done.add(index)
+                _save_progress(state_path, size, etag, done)
+            return retries
+
+        workers = max(1, min(max_workers, len(segments)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aixplain-download") as pool:
+            futures = [pool.submit(fetch, *segment) for segment in segments]
+            try:
+                retries = sum(future.result() for future in futures)
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+        stats = TransferStats(
+            bytes_transferred=sum(length for _, _, length in segments),
+            seconds=0.0,
+            parts=len(segments),
+            retries=retries,
+        )
+
+    if part_path.stat().st_size != size:
+        raise TransferError(f"Downloaded file has {part_path.stat().st_size} bytes, expected {size}.")
+    if checksum is not None and _file_digest(part_path, checksum_algorithm) != checksum.lower():
+        part_path.unlink()
+        state_path.unlink(missing_ok=True)
+        raise TransferError(f"{checksum_algorithm} checksum mismatch for {url}.")
+    os.replace(part_path, file_path)
+    state_path.unlink(missing_ok=True)
+    stats.seconds = time.monotonic() - start
+    logger.debug(f"Downloaded {file_path}: {stats}")
+    return stats
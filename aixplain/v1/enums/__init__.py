@@ -1,17 +1,16 @@
 # flake8: noqa: F401 // to ignore the F401 (unused import)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .data_split import DataSplit
 from .data_subtype import DataSubtype
 from .data_type import DataType
 from .error_handler import ErrorHandler
 from .file_type import FileType
-from .function import Function, FunctionInputOutput
-from .language import Language
-from .license import License
 from .onboard_status import OnboardStatus
 from .ownership_type import OwnershipType
 from .privacy import Privacy
 from .storage_type import StorageType
-from .supplier import Supplier
 from .sort_by import SortBy
 from .sort_order import SortOrder
 from .response_status import ResponseStatus
@@ -22,3 +21,34 @@ from .index_stores import IndexStores
 from .function_type import FunctionType
 from .evolve_type import EvolveType
 from .code_interpreter import CodeInterpreterModel
+
+# The enums generated from the backend catalog are large; they are only built
+# when first used (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "Function": ".function",
+    "FunctionInputOutput": ".function",
+    "Language": ".language",
+    "License": ".license",
+    "Supplier": ".supplier",
+}
+
+if TYPE_CHECKING:
+    from .function import Function, FunctionInputOutput
+    from .language import Language
+    from .license import License
+    from .supplier import Supplier
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining a generated enum on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the lazily loaded enums alongside the loaded module globals."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -39,10 +39,11 @@ from aixplain.enums.language import Language
 from aixplain.enums.license import License
 from aixplain.enums.privacy import Privacy
 from aixplain.utils.request_utils import _request_with_retry
+from aixplain.utils.pagination import iter_list
 from aixplain.utils import config
 from pathlib import Path
 from tqdm import tqdm
-from typing import Any, Dict, List, Optional, Text, Union
+from typing import Any, Dict, Iterator, List, Optional, Text, Union
 from urllib.parse import urljoin
 from warnings import warn
 
@@ -272,6 +273,11 @@ class CorpusFactory(AssetFactory):
             logging.error(error_message)
             raise Exception(error_message)
 
+    @classmethod
+    def iter_list(cls, page_size: int = 20, prefetch: bool = True, **kwargs) -> Iterator[Corpus]:
+        """Lazily iterate over every corpus matching the ``list`` filters, page by page."""
+        return iter_list(cls.list, page_size=page_size, prefetch=prefetch, **kwargs)
+
     @classmethod
     def get_assets_from_page(
         cls, page_number: int = 1, task: Optional[Function] = None, language: Optional[Text] = None
@@ -42,11 +42,12 @@ from aixplain.enums.privacy import Privacy
 from aixplain.utils import config
 from aixplain.utils.convert_datatype_utils import dict_to_metadata
 from aixplain.utils.request_utils import _request_with_retry
+from aixplain.utils.pagination import iter_list
 from aixplain.utils.file_utils import s3_to_csv
 from aixplain.utils.validation_utils import dataset_onboarding_validation
 from pathlib import Path
 from tqdm import tqdm
-from typing import Any, Dict, List, Optional, Text, Union
+from typing import Any, Dict, Iterator, List, Optional, Text, Union
 from urllib.parse import urljoin
 from uuid import uuid4
 
@@ -327,6 +328,11 @@ class DatasetFactory(AssetFactory):
             logging.error(error_message)
             raise Exception(error_message)
 
+    @classmethod
+    def iter_list(cls, page_size: int = 20, prefetch: bool = True, **kwargs) -> Iterator[Dataset]:
+        """Lazily iterate over every dataset matching the ``list`` filters, page by page."""
+        return iter_list(cls.list, page_size=page_size, prefetch=prefetch, **kwargs)
+
     @classmethod
     def create(
         cls,
@@ -34,11 +34,15 @@ from aixplain.utils import config
 from aixplain.utils.request_utils import _request_with_retry
 from urllib.parse import urljoin
 from aixplain.factories.model_factory.mixins import ModelGetterMixin, ModelListMixin
-from typing import Callable, Dict, List, Optional, Text, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Text, Union
 from aixplain.modules.model.integration import AuthenticationSchema
 from aixplain.modules.model.rlm import RLM
+from aixplain.utils.rlm_cache import RLMCache
 import uuid
 
+if TYPE_CHECKING:
+    from aixplain.utils.rlm_vector_index import LocalVectorIndex
+
 
 class ModelFactory(ModelGetterMixin, ModelListMixin):
     """Factory class for creating, managing, and exploring models.
@@ -430,6 +434,8 @@ class ModelFactory(ModelGetterMixin, ModelListMixin):
         description: Text = "Recursive Language Model for long-context analysis.",
         max_iterations: int = 10,
         api_key: Optional[Text] = None,
+        cache: Optional[RLMCache] = None,
+        rag_local_index: Optional["LocalVectorIndex"] = None,
     ) -> RLM:
         """Create an RLM (Recursive Language Model) instance for long-context analysis.
 
@@ -452,6 +458,12 @@ class ModelFactory(ModelGetterMixin, ModelListMixin):
                 before a forced final answer is requested. Defaults to 10.
             api_key (Optional[Text], optional): API key for model lookups.
                 Defaults to ``config.TEAM_API_KEY``.
+            cache (Optional[RLMCache], optional): Cache of worker outputs reused
+                across runs, e.g. ``MemoryRLMCache()`` or
+                ``SQLiteRLMCache("rlm_cache.db", ttl=86400)``. Defaults to None.
+            rag_local_index (Optional[LocalVectorIndex], optional): In-process
+                vector index used by ``mode="rag"`` instead of an aIR index,
+                e.g. ``LocalVectorIndex(".cache/rlm-vectors")``. Defaults to None.
 
         Returns:
             RLM: A configured RLM instance ready to call ``run()``.
@@ -491,6 +503,8 @@ class ModelFactory(ModelGetterMixin, ModelListMixin):
             worker=worker,
             max_iterations=max_iterations,
             api_key=resolved_api_key,
+            cache=cache,
+            rag_local_index=rag_local_index,
         )
         logging.info(
             f"RLM Creation: instance created — orchestrator='{orchestrator.name}', "
@@ -11,8 +11,9 @@ from aixplain.modules.model import Model
 from aixplain.utils import config
 from aixplain.utils.request_utils import _request_with_retry
 from aixplain.utils.asset_cache import AssetCache
+from aixplain.utils.cache_utils import CacheValidators, conditional_headers, validators_from_response
 from urllib.parse import urljoin
-from typing import Optional, Text
+from typing import Optional, Text, Tuple
 
 
 class ModelGetterMixin:
@@ -33,7 +34,10 @@ class ModelGetterMixin:
         """Retrieve a model instance by its ID or name.
 
         This method attempts to retrieve a model from the cache if enabled,
-        falling back to fetching from the backend if necessary.
+        falling back to fetching from the backend if necessary. Cached models
+        older than CACHE_EXPIRY_TIME are revalidated individually with a
+        conditional request (ETag / updatedAt) instead of refetching the
+        whole model list.
 
         Args:
             model_id (Optional[Text], optional): ID of the model to retrieve.
@@ -66,14 +70,19 @@ class ModelGetterMixin:
 
         if use_cache:
             try:
-                if cache.has_valid_cache():
-                    cached_model = cache.store.data.get(model_id)
-                    if cached_model:
+                cached_model = cache.get(model_id)
+                if cached_model is not None:
+                    if cache.is_fresh(model_id):
                         return cached_model
-                    logging.info("Model not found in valid cache, fetching individually...")
-                    model = cls._fetch_model_by_id(model_id, api_key)
-                    cache.add(model)
+                    logging.info(f"Cached model {model_id} is stale, revalidating...")
+                    model, validators = cls._request_model_by_id(model_id, api_key, cache.validators(model_id))
+                    if model is None:
+                        cache.mark_valid(model_id, validators)
+                        return cached_model
+                    cache.add(model, validators)
                     return model
+                if len(cache) > 0:
+                    logging.info("Model not found in cache, fetching individually...")
                 else:
                     model_list_resp = cls.list(model_ids=None, api_key=api_key)
                     models = model_list_resp["results"]
@@ -85,8 +94,8 @@ class ModelGetterMixin:
                 logging.warning(f"Cache lookup failed, falling back to direct fetch: {e}")
 
         logging.info("Fetching model directly without cache...")
-        model = cls._fetch_model_by_id(model_id, api_key)
-        cache.add(model)
+        model, validators = cls._request_model_by_id(model_id, api_key)
+        cache.add(model, validators)
         return model
 
     @classmethod
@@ -156,6 +165,32 @@ class ModelGetterMixin:
         Returns:
             Model: Fetched model instance.
 
+        Raises:
+            Exception: If the API request fails or returns an error.
+        """
+        model, _ = cls._request_model_by_id(model_id, api_key)
+        return model
+
+    @classmethod
+    def _request_model_by_id(
+        cls,
+        model_id: Text,
+        api_key: Optional[Text] = None,
+        validators: Optional[CacheValidators] = None,
+    ) -> Tuple[Optional[Model], CacheValidators]:
+        """Fetch a model by ID, conditionally when validators of a cached copy are given.
+
+        Args:
+            model_id (Text): ID of the model to fetch.
+            api_key (Optional[Text], optional): API key for authentication.
+                Defaults to None, using the configured TEAM_API_KEY.
+            validators (Optional[CacheValidators], optional): ETag / updatedAt of
+                the cached copy, sent as If-None-Match / If-Modified-Since.
+
+        Returns:
+            Tuple[Optional[Model], CacheValidators]: The model (None when the
+                backend answered 304 Not Modified) and its validators.
+
         Raises:
             Exception: If the API request fails or returns an error.
         """
@@ -167,7 +202,10 @@ class ModelGetterMixin:
                 "Content-Type": "application/json",
             }
             logging.info(f"Start service for GET Model  - {url} - {headers}")
-            r = _request_with_retry("get", url, headers=headers)
+            r = _request_with_retry("get", url, headers={**headers, **conditional_headers(validators)})
+            if validators is not None and r.status_code == 304:
+                logging.info(f"Model {model_id} not modified since it was cached.")
+                return None, validators_from_response(r.headers)
             resp = r.json()
         except Exception:
             if resp and "statusCode" in resp:
@@ -185,7 +223,7 @@ class ModelGetterMixin:
 
             model = create_model_from_response(resp)
             logging.info(f"Model Creation: Model {model_id} instantiated.")
-            return model
+            return model, validators_from_response(r.headers, resp)
         else:
             error_message = (
                 f"Model GET Error: Failed to retrieve model {model_id}. Status Code: {r.status_code}. Error: {resp}"
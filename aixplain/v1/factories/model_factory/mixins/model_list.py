@@ -1,7 +1,8 @@
-from typing import Optional, Union, List, Tuple, Text
+from typing import Iterator, Optional, Union, List, Tuple, Text
 from aixplain.factories.model_factory.utils import get_model_from_ids, get_assets_from_page
 from aixplain.enums import Function, Language, OwnershipType, SortBy, SortOrder, Supplier
 from aixplain.modules.model import Model
+from aixplain.utils.pagination import iter_list
 
 
 class ModelListMixin:
@@ -112,3 +113,8 @@ class ModelListMixin:
             "page_number": page_number,
             "total": total,
         }
+
+    @classmethod
+    def iter_list(cls, page_size: int = 20, prefetch: bool = True, **kwargs) -> Iterator[Model]:
+        """Lazily iterate over every model matching the ``list`` filters, page by page."""
+        return iter_list(cls.list, page_size=page_size, prefetch=prefetch, **kwargs)
@@ -32,6 +32,7 @@ from aixplain.modules.model.model_response_streamer import ModelResponseStreamer
 from aixplain.modules.model.utils import build_payload, call_run_endpoint
 from aixplain.utils import config
 from urllib.parse import urljoin
+from aixplain.utils.json_utils import response_json
 from aixplain.utils.request_utils import _request_with_retry
 from typing import Union, Optional, Text, Dict
 from datetime import datetime
@@ -281,7 +282,7 @@ class Model(Asset):
         headers = {"x-api-key": self.api_key, "Content-Type": "application/json"}
         r = _request_with_retry("get", poll_url, headers=headers)
         try:
-            resp = r.json()
+            resp = response_json(r)
             if resp["completed"] is True:
                 status = ResponseStatus.SUCCESS
                 if "error_message" in resp or "supplierError" in resp:
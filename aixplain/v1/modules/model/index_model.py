@@ -1,13 +1,17 @@
 """Index model module for document indexing and search operations."""
 
+import logging
 import os
+import time
 import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from uuid import uuid4
 from aixplain.enums import EmbeddingModel, Function, Supplier, ResponseStatus, StorageType, FunctionType
 from aixplain.modules.model import Model
-from aixplain.utils import config
+from aixplain.utils import config, json_utils
 from aixplain.modules.model.response import ModelResponse
-from typing import Text, Optional, Union, Dict
+from typing import Iterable, Text, Optional, Union, Dict
 from aixplain.modules.model.record import Record
 from enum import Enum
 from typing import List
@@ -16,6 +20,9 @@ import os
 
 DOCLING_MODEL_ID = "677bee6c6eb56331f9192a91"
 
+# Upper bound on the serialized records of one upsert_bulk request.
+DEFAULT_UPSERT_BATCH_BYTES = 4 * 1024 * 1024
+
 
 class IndexFilterOperator(Enum):
     """Enumeration of operators available for filtering index records.
@@ -123,6 +130,34 @@ class Splitter:
         self.split_overlap = split_overlap
 
 
+@dataclass
+class UpsertBatchStats:
+    """Outcome of one batch of :meth:`IndexModel.upsert_bulk`.
+
+    Attributes:
+        index (int): Position of the batch in the upload, starting at 0.
+        records (int): Number of records in the batch.
+        bytes (int): Size of the serialized records.
+        status (ResponseStatus): SUCCESS, or FAILED when every attempt failed.
+        attempts (int): Number of ingest calls made for the batch.
+        run_time (float): Seconds spent on the batch, retries included.
+        used_credits (float): Credits reported by the ingest calls.
+        error_message (Text): Error of the last failed attempt, if any.
+        document_ids (Optional[List[Text]]): IDs of the records of a failed
+            batch, to find and re-send them; None for successful batches.
+    """
+
+    index: int
+    records: int
+    bytes: int
+    status: ResponseStatus = ResponseStatus.SUCCESS
+    attempts: int = 0
+    run_time: float = 0.0
+    used_credits: float = 0.0
+    error_message: Text = ""
+    document_ids: Optional[List[Text]] = None
+
+
 class IndexModel(Model):
     """A model for indexing and searching documents using vector embeddings."""
 
@@ -265,7 +300,16 @@ class IndexModel(Model):
             doc.validate()
         # Convert documents to payloads
         payloads = [doc.to_dict() for doc in documents]
-        # Build payload
+        # Run the indexing service
+        response = self.run(data=self._ingest_data(payloads, splitter))
+        if response.status == ResponseStatus.SUCCESS:
+            response.data = payloads
+            return response
+        raise Exception(f"Failed to upsert documents: {response.error_message}")
+
+    @staticmethod
+    def _ingest_data(payloads: List[Dict], splitter: Optional[Splitter] = None) -> Dict:
+        """Build the ingest request of ``payloads`` (record dicts)."""
         data = {
             "action": "ingest",
             "data": payloads,
@@ -279,12 +323,118 @@ class IndexModel(Model):
                     "split_overlap": splitter.split_overlap,
                 }
             }
-        # Run the indexing service
-        response = self.run(data=data)
-        if response.status == ResponseStatus.SUCCESS:
-            response.data = payloads
-            return response
-        raise Exception(f"Failed to upsert documents: {response.error_message}")
+        return data
+
+    def upsert_bulk(
+        self,
+        records: Iterable[Record],
+        batch_size: int = 100,
+        max_workers: int = 4,
+        max_batch_bytes: int = DEFAULT_UPSERT_BATCH_BYTES,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        splitter: Optional[Splitter] = None,
+    ) -> List[UpsertBatchStats]:
+        """Upsert a large stream of records in concurrent batches.
+
+        Records are consumed lazily (a generator of millions of records is
+        fine), validated and grouped into batches of at most ``batch_size``
+        records and ``max_batch_bytes`` of serialized data; a single record
+        larger than ``max_batch_bytes`` is sent alone. Up to ``max_workers``
+        batches are uploaded at once. A failed batch is retried with the same
+        document IDs, so a retry that follows a partially applied attempt
+        overwrites rather than duplicates records.
+
+        Args:
+            records (Iterable[Record]): Records to upsert.
+            batch_size (int, optional): Maximum records per batch. Defaults to 100.
+            max_workers (int, optional): Batches uploaded concurrently. Defaults to 4.
+            max_batch_bytes (int, optional): Maximum serialized size of a batch.
+                Defaults to 4 MiB.
+            max_retries (int, optional): Retries of a failed batch. Defaults to 3.
+            retry_backoff (float, optional): Seconds before the first retry, doubled
+                after each one. Defaults to 1.0.
+            splitter (Splitter, optional): Splitter applied to every batch. Defaults to None.
+
+        Returns:
+            List[UpsertBatchStats]: Per-batch outcome, in batch order. Batches that
+                failed after all retries have status FAILED; the other batches are
+                uploaded regardless.
+
+        Raises:
+            AssertionError: If a record fails validation; batches already submitted
+                are still uploaded.
+
+        Example:
+            >>> records = (Record(value=row["text"], id=row["id"]) for row in rows)
+            >>> stats = index_model.upsert_bulk(records, batch_size=500, max_workers=8)
+            >>> failed = [batch for batch in stats if batch.status == ResponseStatus.FAILED]
+        """
+        assert batch_size >= 1, "Index Upsert Error: batch_size must be at least 1"
+        assert max_workers >= 1, "Index Upsert Error: max_workers must be at least 1"
+        stats: List[UpsertBatchStats] = []
+        pending = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            def submit(batch: List[Dict], size: int) -> None:
+                batch_stats = UpsertBatchStats(index=len(stats), records=len(batch), bytes=size)
+                stats.append(batch_stats)
+                if len(pending) >= 2 * max_workers:
+                    pending.difference_update(wait(pending, return_when=FIRST_COMPLETED).done)
+                pending.add(
+                    executor.submit(self._upsert_batch, batch, batch_stats, splitter, max_retries, retry_backoff)
+                )
+
+            batch: List[Dict] = []
+            size = 0
+            for record in records:
+                record.validate()
+                payload = record.to_dict()
+                # +1 byte for the separator between records in the request body.
+                payload_size = len(json_utils.dumps(payload, default=str).encode("utf-8")) + 1
+                if batch and (len(batch) >= batch_size or size + payload_size > max_batch_bytes):
+                    submit(batch, size)
+                    batch, size = [], 0
+                batch.append(payload)
+                size += payload_size
+            if batch:
+                submit(batch, size)
+        return stats
+
+    def _upsert_batch(
+        self,
+        payloads: List[Dict],
+        stats: UpsertBatchStats,
+        splitter: Optional[Splitter],
+        max_retries: int,
+        retry_backoff: float,
+    ) -> None:
+        """Ingest one batch of :meth:`upsert_bulk`, retrying failures; results go to ``stats``."""
+        start = time.time()
+        data = self._ingest_data(payloads, splitter)
+        for attempt in range(max_retries + 1):
+            if attempt:
+                time.sleep(retry_backoff * 2 ** (attempt - 1))
+            stats.attempts += 1
+            try:
+                response = self.run(data=data)
+            except Exception as e:
+                stats.error_message = str(e)
+            else:
+                stats.used_credits += float(getattr(response, "used_credits", 0) or 0)
+                if response.status == ResponseStatus.SUCCESS:
+                    stats.status, stats.error_message = ResponseStatus.SUCCESS, ""
+                    break
+                stats.error_message = response.error_message or str(response.status)
+            logging.warning(
+                f"Index Upsert: batch {stats.index} failed (attempt {stats.attempts} of {max_retries + 1}): "
+                f"{stats.error_message}"
+            )
+        else:
+            stats.status = ResponseStatus.FAILED
+            stats.document_ids = [payload["document_id"] for payload in payloads]
+        stats.run_time = time.time() - start
 
     def count(self) -> int:
         """Get the total number of documents in the index.
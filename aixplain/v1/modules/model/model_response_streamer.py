@@ -1,9 +1,9 @@
 """Streaming response handler for model execution."""
 
-import json
 from typing import Iterator
 
 from aixplain.modules.model.response import ModelResponse, ResponseStatus
+from aixplain.utils.json_utils import JSONDecodeError, loads
 
 
 class ModelResponseStreamer:
@@ -31,8 +31,8 @@ class ModelResponseStreamer:
         """
         line = next(self.iterator).replace("data: ", "")
         try:
-            data = json.loads(line)
-        except json.JSONDecodeError:
+            data = loads(line)
+        except JSONDecodeError:
             data = {"data": line}
         content = data.get("data", "")
         if isinstance(content, dict):
@@ -25,6 +25,7 @@ Description:
     analysis via llm_query() calls injected into the sandbox session.
 """
 
+import itertools
 import json
 import logging
 import os
@@ -35,13 +36,19 @@ import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Text, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Text, Union
 
-from aixplain.enums import Function, FunctionType, Supplier
+from aixplain.enums import EmbeddingModel, Function, FunctionType, Supplier
 from aixplain.enums.response_status import ResponseStatus
 from aixplain.modules.model import Model
 from aixplain.modules.model.response import ModelResponse
 from aixplain.utils import config
+from aixplain.utils.rlm_cache import RLMCache, rlm_cache_key
+from aixplain.utils.rlm_chunker import count_tokens, iter_chunks
+from aixplain.utils.rlm_mapreduce import StreamingMapReduce
+
+if TYPE_CHECKING:
+    from aixplain.utils.rlm_vector_index import LocalVectorIndex
 
 
 # Sandbox
@@ -115,7 +122,8 @@ _DEFAULT_QUERY = (
 # map call inside the "comfortable" zone where recall stays high.
 _CONTEXT_ROT_FRACTION = 0.80
 
-# Rough char→token conversion. English text averages ~4 chars per token.
+# Rough char→token conversion (English text averages ~4 chars per token),
+# used to compare character caps with token budgets.
 _CHARS_PER_TOKEN = 4
 
 # Per-chunk overhead reserved (tokens) for the map prompt template + query.
@@ -127,12 +135,17 @@ _RESERVED_OUTPUT_TOKENS = 4096
 # Fallback worker window if not declared in model metadata.
 _DEFAULT_WORKER_WINDOW_TOKENS = 32_000
 
-# Overlap (chars) between adjacent text chunks so boundary facts aren't lost.
-_CHUNK_OVERLAP_CHARS = 400
+# Overlap (tokens of whole sentences) between adjacent text chunks so
+# boundary facts aren't lost.
+_CHUNK_OVERLAP_TOKENS = 100
 
 # Cap on concurrent worker calls to avoid hammering the API.
 _MAX_PARALLEL_WORKERS = 8
 
+# Map calls submitted ahead of the workers while the context is still being
+# chunked; bounds the chunks held in memory.
+_MAX_PENDING_MAP_CALLS = 2 * _MAX_PARALLEL_WORKERS
+
 # Number of partial answers combined per call in hierarchical reduce.
 _REDUCE_FAN_IN = 8
 
@@ -153,7 +166,7 @@ _RECURSIVE_QUERY_HINTS = (
     "reason across",
 )
 
-_MAP_PROMPT = """You are analyzing part {idx} of {total} of a larger document.
+_MAP_PROMPT = """You are analyzing part {idx} of a larger document.
 
 User's query: {query}
 
@@ -184,14 +197,15 @@ Answer the user's query using the context above. Be complete and accurate."""
 # RAG Mode (aIR-backed retrieval)
 
 # Fraction of the worker's context window allocated to the assembled
-# retrieved chunks in the synthesis call. Chunk size is derived as
-#     (worker_window_tokens × _RAG_ASSEMBLY_FRACTION × _CHARS_PER_TOKEN) / rag_top_k
+# retrieved chunks in the synthesis call. Chunk size (tokens) is derived as
+#     (worker_window_tokens × _RAG_ASSEMBLY_FRACTION) / rag_top_k
 # so the top_k retrieved chunks together fit comfortably in the worker call.
 _RAG_ASSEMBLY_FRACTION = 0.80
 
 # Floor for derived chunk size (chars). Very tiny chunks lose too much
 # surrounding context to embed well.
 _RAG_MIN_CHUNK_CHARS = 500
+_RAG_MIN_CHUNK_TOKENS = _RAG_MIN_CHUNK_CHARS // _CHARS_PER_TOKEN
 
 # Upper bound on chunk size (chars) imposed by the embedding model's input
 # limit. The aIR-backing model's actual token limit isn't known to this
@@ -205,6 +219,9 @@ _RAG_DEFAULT_MAX_CHUNK_CHARS = 30_000
 # Default number of chunks retrieved from the index per query.
 _RAG_DEFAULT_TOP_K = 10
 
+# Embedding model of local rag retrieval (the aIR default).
+_RAG_DEFAULT_EMBEDDING_MODEL_ID = EmbeddingModel.OPENAI_ADA002.value
+
 _RAG_SYNTHESIS_PROMPT = """User's query: {query}
 
 Below are excerpts retrieved from a larger document, ordered by their position in the original document. Use these excerpts to answer the user's query as completely and accurately as possible.
@@ -263,100 +280,20 @@ def _truncate(text: str, max_chars: int = _REPL_OUTPUT_MAX_CHARS) -> str:
 # Chunking Helpers (shared by parallel and rag modes)
 
 
-def _compute_chunk_budget_chars(worker_window_tokens: int) -> int:
-    """Compute the per-chunk content budget in characters.
+def _compute_chunk_budget_tokens(worker_window_tokens: int) -> int:
+    """Compute the per-chunk content budget in tokens.
 
     Applies the context-rot fraction first (each map call uses only a
     comfortable portion of the worker's window), then subtracts overhead for
     the map prompt template and the reserved output budget.
     """
     usable_tokens = int(worker_window_tokens * _CONTEXT_ROT_FRACTION)
-    content_tokens = max(usable_tokens - _RESERVED_PROMPT_TOKENS - _RESERVED_OUTPUT_TOKENS, 1000)
-    return content_tokens * _CHARS_PER_TOKEN
-
-
-def _chunk_text(text: str, budget_chars: int, overlap: int = _CHUNK_OVERLAP_CHARS) -> List[str]:
-    """Split text into overlapping chunks no larger than `budget_chars`."""
-    if len(text) <= budget_chars:
-        return [text]
-    chunks: List[str] = []
-    step = max(budget_chars - overlap, 1)
-    i = 0
-    while i < len(text):
-        chunks.append(text[i:i + budget_chars])
-        if i + budget_chars >= len(text):
-            break
-        i += step
-    return chunks
-
-
-def _serialize_group(group: list) -> str:
-    if all(isinstance(x, str) for x in group):
-        return "\n\n".join(group)
-    return json.dumps(group, ensure_ascii=False, indent=2)
-
-
-def _chunk_list_items(items: list, budget_chars: int) -> List[str]:
-    """Group list items into string chunks each fitting within `budget_chars`."""
-    chunks: List[str] = []
-    current: List = []
-    current_size = 0
-    for item in items:
-        s = item if isinstance(item, str) else json.dumps(item, ensure_ascii=False)
-        size = len(s) + 2  # separator overhead
-        if current_size + size > budget_chars and current:
-            chunks.append(_serialize_group(current))
-            current = []
-            current_size = 0
-        current.append(item)
-        current_size += size
-    if current:
-        chunks.append(_serialize_group(current))
-    return chunks
-
-
-def _chunk_dict_items(d: dict, budget_chars: int) -> List[str]:
-    """Group dict items into JSON-serialized chunks within `budget_chars`."""
-    chunks: List[str] = []
-    current: Dict = {}
-    current_size = 0
-    for k, v in d.items():
-        size = len(json.dumps({k: v}, ensure_ascii=False))
-        if current_size + size > budget_chars and current:
-            chunks.append(json.dumps(current, ensure_ascii=False, indent=2))
-            current = {}
-            current_size = 0
-        current[k] = v
-        current_size += size
-    if current:
-        chunks.append(json.dumps(current, ensure_ascii=False, indent=2))
-    return chunks
-
-
-def _chunk_context(context: Union[str, dict, list], budget_chars: int) -> List[str]:
-    """Dispatch chunking by context type; safety-pass re-chunks oversize results.
-
-    A single dict value or list item can blow the budget on its own; the
-    safety pass re-chunks any output exceeding 1.5× budget by falling back
-    to character-based splitting on its serialized form.
-    """
-    if isinstance(context, str):
-        raw_chunks = _chunk_text(context, budget_chars)
-    elif isinstance(context, list):
-        raw_chunks = _chunk_list_items(context, budget_chars)
-    elif isinstance(context, dict):
-        raw_chunks = _chunk_dict_items(context, budget_chars)
-    else:
-        raw_chunks = _chunk_text(str(context), budget_chars)
-
-    safe_chunks: List[str] = []
-    oversize_limit = int(budget_chars * 1.5)
-    for c in raw_chunks:
-        if len(c) > oversize_limit:
-            safe_chunks.extend(_chunk_text(c, budget_chars))
-        else:
-            safe_chunks.append(c)
-    return safe_chunks
+    return max(usable_tokens - _RESERVED_PROMPT_TOKENS - _RESERVED_OUTPUT_TOKENS, 1000)
+
+
+def _is_empty_answer(answer: str) -> bool:
+    """Whether a map answer is the worker's "nothing relevant" reply (``NONE``)."""
+    return answer.strip().rstrip(".").upper() == "NONE"
 
 
 def _select_mode(query: str) -> str:
@@ -399,8 +336,9 @@ class RLM(Model):
       the top-k most relevant chunks for the query, then make a single worker
       call to synthesize an answer. The win is amortizing the upfront index
       build across many queries: set ``rag_index_id`` to reuse a pre-built
-      index and skip create + upsert + delete on each call. Best for
-      needle-in-haystack questions on very large contexts.
+      index and skip create + upsert + delete on each call, or set
+      ``rag_local_index`` to retrieve in-process, embedding only chunks not
+      seen before. Best for needle-in-haystack questions on very large contexts.
     - ``"recursive"`` (adaptive, expensive): the original iterative REPL loop
       where the orchestrator drives chunking and analysis. Best for multi-hop
       reasoning or queries that need to compare information across chunks.
@@ -453,6 +391,9 @@ class RLM(Model):
         rag_index_id: Optional[Text] = None,
         rag_top_k: int = _RAG_DEFAULT_TOP_K,
         rag_max_chunk_chars: int = _RAG_DEFAULT_MAX_CHUNK_CHARS,
+        cache: Optional[RLMCache] = None,
+        rag_local_index: Optional["LocalVectorIndex"] = None,
+        rag_embedding_model_id: Text = _RAG_DEFAULT_EMBEDDING_MODEL_ID,
         **additional_info,
     ) -> None:
         """Initialize a new RLM instance.
@@ -483,6 +424,17 @@ class RLM(Model):
                 fits 8K-token models (ada-002, text-embedding-3, BGE-M3).
                 Tune down for 512-token models (multilingual-E5, Jina CLIP)
                 or up when the backing model supports it. Defaults to 30000.
+            cache (RLMCache, optional): Cache of worker outputs (e.g.
+                ``MemoryRLMCache`` or ``SQLiteRLMCache``). Map, reduce and
+                synthesis calls of parallel and rag runs are looked up by
+                content hash first, so repeated analyses of the same context
+                skip the worker calls already made. Defaults to None.
+            rag_local_index (LocalVectorIndex, optional): In-process vector
+                index used by ``mode="rag"`` instead of an aIR index. Only
+                chunks without a stored embedding are sent to the embedding
+                model. Defaults to None.
+            rag_embedding_model_id (Text, optional): Embedding model of
+                ``rag_local_index``. Defaults to ``EmbeddingModel.OPENAI_ADA002``.
             **additional_info: Additional metadata stored on the instance.
         """
         super().__init__(
@@ -501,12 +453,17 @@ class RLM(Model):
         self.rag_index_id = rag_index_id
         self.rag_top_k = rag_top_k
         self.rag_max_chunk_chars = rag_max_chunk_chars
+        self.cache = cache
+        self.rag_local_index = rag_local_index
+        self.rag_embedding_model_id = rag_embedding_model_id
+        self._embedder: Optional[Model] = None
 
         # State reset on each run() call
         self._session_id: Optional[str] = None
         self._sandbox_tool: Optional[Model] = None
         self._messages: List[Dict[str, str]] = []
         self._used_credits: float = 0.0
+        self._cache_hits: int = 0
         # Guards _used_credits across concurrent worker calls in parallel mode.
         self._credits_lock = threading.Lock()
 
@@ -880,6 +837,34 @@ def llm_query(prompt):
             return str(response["data"])
         raise RuntimeError(f"Worker model failed: {response.get('error_message', 'Unknown error')}")
 
+    def _cached_worker_call(self, prompt: str, template: str, *parts: str) -> str:
+        """Call the worker through ``self.cache`` when one is configured.
+
+        The cache key covers the worker, the prompt template and the ``parts``
+        substituted into it (chunk or partial answers, and the query), so the
+        same analysis of the same content is answered without a worker call.
+        Failed calls raise before anything is stored.
+        """
+        cache = self.cache
+        if cache is None:
+            return self._worker_call(prompt)
+        key = rlm_cache_key(self.worker.id, template, *parts)
+        try:
+            answer = cache.get(key)
+        except Exception as e:
+            logging.warning(f"RLM cache: lookup failed: {e}")
+            answer = None
+        if answer is not None:
+            with self._credits_lock:
+                self._cache_hits += 1
+            return answer
+        answer = self._worker_call(prompt)
+        try:
+            cache.put(key, answer)
+        except Exception as e:
+            logging.warning(f"RLM cache: store failed: {e}")
+        return answer
+
     @staticmethod
     def _resolve_url_context(context: Union[str, dict, list]) -> Union[str, dict, list]:
         """If `context` is an HTTP/HTTPS URL, fetch it locally and return parsed content.
@@ -902,37 +887,54 @@ def llm_query(prompt):
                 return r.text
         return r.text
 
-    def _parallel_map(self, chunks: List[str], query: str) -> List[str]:
+    def _map_reducer(self, query: str, budget_tokens: Optional[int] = None) -> StreamingMapReduce:
+        """Build the scheduler of the map and tree-reduce calls of one run.
+
+        With ``budget_tokens`` set, groups of ``_REDUCE_FAN_IN`` partial answers
+        are reduced as soon as they are ready once the answers outgrow a single
+        reduce call; slow calls are hedged with a duplicate on an idle worker.
+        """
+
+        def _map_one(idx: int, chunk: str) -> str:
+            prompt = _MAP_PROMPT.format(idx=idx + 1, query=query, chunk=chunk)
+            return self._cached_worker_call(prompt, _MAP_PROMPT, chunk, query)
+
+        def _reduce_group(group: List[str]) -> str:
+            formatted = "\n\n".join(f"[Part]: {a}" for a in group)
+            return self._reduce_call(formatted, query, len(group))
+
+        def _map_failed(idx: int, e: Exception) -> str:
+            logging.warning(f"RLM parallel: chunk {idx} failed: {e}")
+            return f"[Error analyzing this part: {e}]"
+
+        return StreamingMapReduce(
+            _map_one,
+            _reduce_group,
+            is_empty=_is_empty_answer,
+            count_tokens=count_tokens,
+            budget_tokens=budget_tokens,
+            map_error=_map_failed,
+            fan_in=_REDUCE_FAN_IN,
+            max_workers=_MAX_PARALLEL_WORKERS,
+            max_pending=_MAX_PENDING_MAP_CALLS,
+        )
+
+    def _parallel_map(self, chunks: Iterable[str], query: str) -> List[str]:
         """Run the map step: one worker call per chunk, in parallel.
 
+        ``chunks`` may be a lazy iterator: calls are submitted as chunks are
+        produced, so mapping starts before a large context is fully split.
         Returns answers in original chunk order. A single chunk failure does
         not fail the whole run — its slot is replaced with an error marker
         and the reduce step proceeds with what's available.
         """
-        n = len(chunks)
-        answers: List[Optional[str]] = [None] * n
-
-        def _map_one(idx: int) -> str:
-            prompt = _MAP_PROMPT.format(idx=idx + 1, total=n, query=query, chunk=chunks[idx])
-            return self._worker_call(prompt)
-
-        max_workers = min(n, _MAX_PARALLEL_WORKERS)
-        with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            futures = {ex.submit(_map_one, i): i for i in range(n)}
-            for f in as_completed(futures):
-                i = futures[f]
-                try:
-                    answers[i] = f.result()
-                except Exception as e:
-                    logging.warning(f"RLM parallel: chunk {i} failed: {e}")
-                    answers[i] = f"[Error analyzing this part: {e}]"
-
-        return [a if a is not None else "NONE" for a in answers]
+        answers, _ = self._map_reducer(query).run(chunks)
+        return answers
 
     def _reduce_call(self, formatted_answers: str, query: str, n: int) -> str:
         """Single reduce call: synthesize partial answers into one final answer."""
         prompt = _REDUCE_PROMPT.format(n=n, query=query, answers=formatted_answers)
-        return self._worker_call(prompt)
+        return self._cached_worker_call(prompt, _REDUCE_PROMPT, formatted_answers, query)
 
     def _hierarchical_reduce(self, answers: List[str], query: str) -> str:
         """Multi-level reduce when partial answers don't all fit in one call.
@@ -957,9 +959,9 @@ def llm_query(prompt):
             answers = [a for a in next_level if a is not None]
         return answers[0]
 
-    def _reduce(self, chunk_answers: List[str], query: str, budget_chars: int) -> str:
+    def _reduce(self, chunk_answers: List[str], query: str, budget_tokens: int) -> str:
         """Reduce step: drop NONE responses, then synthesize the rest."""
-        meaningful = [(i, a) for i, a in enumerate(chunk_answers) if a.strip().rstrip(".").upper() != "NONE"]
+        meaningful = [(i, a) for i, a in enumerate(chunk_answers) if not _is_empty_answer(a)]
 
         if not meaningful:
             return "No information relevant to the query was found in the document."
@@ -970,7 +972,7 @@ def llm_query(prompt):
             return self._reduce_call(f"[Part]: {meaningful[0][1]}", query, 1)
 
         formatted = "\n\n".join(f"[Part {i + 1}]: {a}" for i, a in meaningful)
-        if len(formatted) <= budget_chars:
+        if count_tokens(formatted) <= budget_tokens:
             return self._reduce_call(formatted, query, len(meaningful))
 
         return self._hierarchical_reduce([a for _, a in meaningful], query)
@@ -984,28 +986,39 @@ def llm_query(prompt):
     ) -> ModelResponse:
         """Deterministic chunk → parallel map → reduce. No orchestrator, no sandbox."""
         iterations_used = 0
+        stage_metrics = None
         try:
             context = self._resolve_url_context(context)
 
             worker_tokens = self._get_worker_context_tokens()
-            budget_chars = _compute_chunk_budget_chars(worker_tokens)
-            chunks = _chunk_context(context, budget_chars)
-            n_chunks = len(chunks)
+            budget_tokens = _compute_chunk_budget_tokens(worker_tokens)
             logging.info(
-                f"RLM '{name}' parallel: {n_chunks} chunk(s), ~{budget_chars} chars/chunk "
+                f"RLM '{name}' parallel: ~{budget_tokens} tokens/chunk "
                 f"(worker={worker_tokens} tokens, "
                 f"{int(_CONTEXT_ROT_FRACTION * 100)}% utilization to mitigate context rot)."
             )
+            # Chunks are produced lazily; peek at two to pick the fast path.
+            chunks = iter_chunks(context, budget_tokens, overlap_tokens=_CHUNK_OVERLAP_TOKENS)
+            head = list(itertools.islice(chunks, 2))
 
-            if n_chunks == 1:
+            if len(head) < 2:
                 # Fast path: context fits comfortably in one worker call.
-                prompt = _SINGLE_CALL_PROMPT.format(query=query, context=chunks[0])
-                final_answer = self._worker_call(prompt)
+                chunk = head[0] if head else ""
+                prompt = _SINGLE_CALL_PROMPT.format(query=query, context=chunk)
+                final_answer = self._cached_worker_call(prompt, _SINGLE_CALL_PROMPT, chunk, query)
                 iterations_used = 1
             else:
-                chunk_answers = self._parallel_map(chunks, query)
-                final_answer = self._reduce(chunk_answers, query, budget_chars)
-                iterations_used = n_chunks
+                # Answers too large for one reduce call are tree-reduced while
+                # the map is still running; otherwise a single reduce follows.
+                map_reduce = self._map_reducer(query, budget_tokens)
+                chunk_answers, final_answer = map_reduce.run(itertools.chain(head, chunks))
+                logging.info(f"RLM '{name}' parallel: mapped {len(chunk_answers)} chunk(s).")
+                if final_answer is None:
+                    reduce_start = time.monotonic()
+                    final_answer = self._reduce(chunk_answers, query, budget_tokens)
+                    map_reduce.metrics.observe("reduce", reduce_start, time.monotonic())
+                stage_metrics = map_reduce.metrics.to_dict()
+                iterations_used = len(chunk_answers)
         except Exception as e:
             error_msg = f"RLM parallel error: {str(e)}"
             logging.error(error_msg)
@@ -1019,7 +1032,10 @@ def llm_query(prompt):
             )
 
         run_time = time.time() - start_time
-        logging.info(f"RLM '{name}' parallel: done in {run_time:.1f}s ({iterations_used} worker calls).")
+        logging.info(
+            f"RLM '{name}' parallel: done in {run_time:.1f}s "
+            f"({iterations_used} worker calls, {self._cache_hits} answered from cache)."
+        )
         return ModelResponse(
             status=ResponseStatus.SUCCESS,
             data=final_answer,
@@ -1027,6 +1043,8 @@ def llm_query(prompt):
             run_time=run_time,
             used_credits=self._used_credits,
             iterations_used=iterations_used,
+            cache_hits=self._cache_hits,
+            stage_metrics=stage_metrics,
         )
 
     # RAG Mode (aIR-backed retrieval)
@@ -1067,9 +1085,37 @@ def llm_query(prompt):
             out.append({"text": str(text), "position": position, "score": r.get("score", 0)})
         return out
 
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed ``texts`` with the embedding model, one call per text, in parallel."""
+        from aixplain.utils.rlm_vector_index import parse_embedding
+
+        if self._embedder is None:
+            from aixplain.factories import ModelFactory
+
+            self._embedder = ModelFactory.get(self.rag_embedding_model_id, api_key=self.api_key)
+
+        def _embed_one(text: str) -> List[float]:
+            response = self._embedder.run(data=text)
+            with self._credits_lock:
+                self._used_credits += float(getattr(response, "used_credits", 0) or 0)
+            if not (response.get("completed") or response["status"] == ResponseStatus.SUCCESS):
+                raise RuntimeError(f"Embedding model failed: {response.get('error_message', 'Unknown error')}")
+            return parse_embedding(response["data"])
+
+        if len(texts) == 1:
+            return [_embed_one(texts[0])]
+        with ThreadPoolExecutor(max_workers=min(len(texts), _MAX_PARALLEL_WORKERS)) as ex:
+            return list(ex.map(_embed_one, texts))
+
+    def _local_rag_search(self, chunks: List[str], query: str, top_k: int) -> List[Dict]:
+        """Retrieve the ``top_k`` chunks closest to ``query`` from ``self.rag_local_index``."""
+        hits = self.rag_local_index.search(self.rag_embedding_model_id, chunks, query, self._embed_texts, top_k)
+        return [{"text": chunks[position], "position": position, "score": score} for position, score in hits]
+
     def _run_rag(self, context, query: str, name: Text, start_time: float) -> ModelResponse:
         """RAG path: chunk → upsert to aIR → retrieve top-k → single worker call.
 
+        If ``self.rag_local_index`` is set, retrieve in-process from it instead.
         If ``self.rag_index_id`` is set, reuse that pre-built index and skip
         create/upsert/delete entirely (just retrieve + synthesize). Otherwise
         an ephemeral index is created for this run and deleted in ``finally``.
@@ -1088,19 +1134,21 @@ def llm_query(prompt):
             # but never exceed the embedding model's input limit.
             worker_tokens = self._get_worker_context_tokens()
             top_k = max(self.rag_top_k, 1)
-            assembly_budget = int(worker_tokens * _RAG_ASSEMBLY_FRACTION * _CHARS_PER_TOKEN / top_k)
-            rag_budget = min(assembly_budget, self.rag_max_chunk_chars)
-            rag_budget = max(rag_budget, _RAG_MIN_CHUNK_CHARS)
-            chunks = _chunk_context(context, rag_budget)
+            rag_budget = max(int(worker_tokens * _RAG_ASSEMBLY_FRACTION / top_k), _RAG_MIN_CHUNK_TOKENS)
+            max_chars = max(self.rag_max_chunk_chars, _RAG_MIN_CHUNK_CHARS)
+            chunks = list(iter_chunks(context, rag_budget, max_chars=max_chars, overlap_tokens=_CHUNK_OVERLAP_TOKENS))
             n_chunks = len(chunks)
-            bound_by = "embedding cap" if rag_budget < assembly_budget else "assembly budget"
+            bound_by = "embedding cap" if max_chars < rag_budget * _CHARS_PER_TOKEN else "assembly budget"
             logging.info(
-                f"RLM '{name}' rag: {n_chunks} chunk(s), ~{rag_budget} chars/chunk "
+                f"RLM '{name}' rag: {n_chunks} chunk(s), ≤{rag_budget} tokens / {max_chars} chars per chunk "
                 f"(worker={worker_tokens} tokens, top_k={top_k}, bound by {bound_by})."
             )
 
             # Resolve or create the index.
-            if self.rag_index_id:
+            if self.rag_local_index is not None:
+                index = None
+                logging.info(f"RLM '{name}' rag: using the local vector index.")
+            elif self.rag_index_id:
                 index = ModelFactory.get(self.rag_index_id, api_key=self.api_key)
                 logging.info(f"RLM '{name}' rag: using existing index id={self.rag_index_id!r}.")
             else:
@@ -1127,10 +1175,12 @@ def llm_query(prompt):
 
             # Retrieve. Clamp top_k to available chunks so we never ask for more.
             top_k = min(top_k, max(n_chunks, 1))
-            search_resp = index.search(query=query, top_k=top_k)
-            self._used_credits += float(getattr(search_resp, "used_credits", 0) or 0)
-
-            retrieved = self._parse_rag_search_response(search_resp)
+            if index is None:
+                retrieved = self._local_rag_search(chunks, query, top_k)
+            else:
+                search_resp = index.search(query=query, top_k=top_k)
+                self._used_credits += float(getattr(search_resp, "used_credits", 0) or 0)
+                retrieved = self._parse_rag_search_response(search_resp)
             logging.info(f"RLM '{name}' rag: retrieved {len(retrieved)} chunk(s) (top_k={top_k}).")
 
             if not retrieved:
@@ -1139,7 +1189,7 @@ def llm_query(prompt):
                 retrieved.sort(key=lambda x: x["position"])
                 formatted = "\n\n---\n\n".join(r["text"] for r in retrieved)
                 prompt = _RAG_SYNTHESIS_PROMPT.format(query=query, chunks=formatted)
-                final_answer = self._worker_call(prompt)
+                final_answer = self._cached_worker_call(prompt, _RAG_SYNTHESIS_PROMPT, formatted, query)
 
             iterations_used = 1
         except Exception as e:
@@ -1170,6 +1220,7 @@ def llm_query(prompt):
             run_time=run_time,
             used_credits=self._used_credits,
             iterations_used=iterations_used,
+            cache_hits=self._cache_hits,
         )
 
     # Core Orchestration Loop
@@ -1289,6 +1340,7 @@ def llm_query(prompt):
         logging.info(f"RLM '{name}': starting (mode={mode}). Query: {query[:120]!r}")
         start_time = time.time()
         self._used_credits = 0.0
+        self._cache_hits = 0
 
         # Normalize context: resolve file paths and pathlib.Path objects
         context = self._resolve_context(context)
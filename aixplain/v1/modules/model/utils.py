@@ -6,11 +6,11 @@ and handling model execution endpoints.
 
 __author__ = "thiagocastroferreira"
 
-import json
 import logging
 import ast
 import inspect
 from aixplain.utils.file_utils import _request_with_retry
+from aixplain.utils.json_utils import dumps, loads, response_json
 from typing import Callable, Dict, List, Text, Tuple, Union, Optional
 from aixplain.exceptions import get_error_from_status_code
 import copy
@@ -128,7 +128,7 @@ def build_payload(
         payload = data
     else:
         try:
-            payload = json.loads(data)
+            payload = loads(data)
             if isinstance(payload, dict) is False:
                 if isinstance(payload, int) is True or isinstance(payload, float) is True:
                     payload = str(payload)
@@ -156,13 +156,13 @@ def build_payload(
             payload = parameters
         else:
             payload.update(parameters)
-        # Serialize enums and other non-serializable objects before json.dumps
+        # Serialize enums and other non-serializable objects before dumps
         payload = _serialize_value(payload)
-        payload = json.dumps(payload)
+        payload = dumps(payload)
     except (TypeError, ValueError):
         # If serialization fails, try to serialize the payload again
         payload = _serialize_value(parametersTemp)
-        payload = json.dumps(payload)
+        payload = dumps(payload)
 
     return payload
 
@@ -197,7 +197,7 @@ def call_run_endpoint(url: Text, api_key: Text, payload: Dict) -> Dict:
     try:
         logging.debug(f"Calling {url} with payload: {payload}")
         r = _request_with_retry("post", url, headers=headers, data=payload)
-        resp = r.json()
+        resp = response_json(r)
     except Exception as e:
         logging.error(f"Error in request: {e}")
         response = {
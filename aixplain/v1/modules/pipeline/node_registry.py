@@ -0,0 +1,190 @@
+"""Registry materializing the generated pipeline node classes on demand.
+
+The generated :mod:`aixplain.modules.pipeline.pipeline` module only holds a
+compact table of node specs. The ``<Name>``, ``<Name>Inputs`` and
+``<Name>Outputs`` classes of a node are built the first time one of them is
+looked up, so importing the pipeline module does not pay for the hundreds of
+node classes a program never uses. Type checkers read the classes and factory
+signatures from the generated ``pipeline.pyi`` stub instead.
+"""
+
+import textwrap
+import types
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple, Type, Union
+
+from aixplain.enums import DataType
+from aixplain.modules.asset import Asset
+
+from .designer import AssetNode, BaseMetric, BaseReconstructor, BaseSegmentor, Inputs, InputParam, Outputs, OutputParam
+
+NODE_BASES = {
+    "AssetNode": AssetNode,
+    "BaseMetric": BaseMetric,
+    "BaseReconstructor": BaseReconstructor,
+    "BaseSegmentor": BaseSegmentor,
+}
+
+
+class NodeSpec(NamedTuple):
+    """Static description of a generated pipeline node.
+
+    Attributes:
+        class_name (str): Name of the node class, e.g. ``"Translation"``.
+        function (str): Function id of the node, e.g. ``"translation"``.
+        method_name (str): Name of the ``Pipeline`` factory method.
+        base_class (str): Key of the node base class in ``NODE_BASES``.
+        input_type (str): ``DataType`` member name of the node input.
+        output_type (str): ``DataType`` member name of the node output.
+        inputs (Tuple[Tuple[str, str, bool], ...]): ``(code, data type, is_required)`` of each input.
+        outputs (Tuple[Tuple[str, str], ...]): ``(code, data type)`` of each output.
+        description (str): Description of the node function.
+    """
+
+    class_name: str
+    function: str
+    method_name: str
+    base_class: str
+    input_type: str
+    output_type: str
+    inputs: Tuple[Tuple[str, str, bool], ...]
+    outputs: Tuple[Tuple[str, str], ...]
+    description: str
+
+
+def _wrap(text: str, indent: str) -> str:
+    """Wrap a description into a docstring paragraph, empty when there is no description."""
+    if not text:
+        return ""
+    return f"\n\n{indent}" + textwrap.fill(text, width=80, subsequent_indent=indent, break_on_hyphens=False)
+
+
+def _param_proxy_class(name: str, base: Type, annotation: Type, params: List[Tuple], module: str, doc: str) -> Type:
+    """Build an ``Inputs``/``Outputs`` subclass creating ``params`` on init, like the generated classes did."""
+
+    def __init__(self, node=None):
+        base.__init__(self, node=node)
+        for code, data_type, *required in params:
+            kwargs = {"is_required": required[0]} if required else {}
+            setattr(self, code, self.create_param(code=code, data_type=DataType[data_type], **kwargs))
+
+    __init__.__qualname__ = f"{name}.__init__"
+    __init__.__doc__ = f"Initialize {name}."
+    namespace = {code: None for code, *_ in params}
+    namespace.update(
+        {
+            "__annotations__": {code: annotation for code, *_ in params},
+            "__doc__": doc,
+            "__init__": __init__,
+            "__module__": module,
+        }
+    )
+    return type(name, (base,), namespace)
+
+
+class NodeRegistry:
+    """Lazily materialized classes of the nodes described by a spec table.
+
+    Args:
+        module (str): Name of the module the classes belong to (their ``__module__``).
+        specs (Iterable[NodeSpec]): Specs of the nodes.
+    """
+
+    def __init__(self, module: str, specs: Iterable[NodeSpec]) -> None:
+        """Index the specs by class name."""
+        self.module = module
+        self.specs: Dict[str, NodeSpec] = {spec.class_name: spec for spec in specs}
+        self._classes: Dict[str, Type] = {}
+
+    def names(self) -> List[str]:
+        """Return the names of every class the registry can build."""
+        return [f"{name}{suffix}" for name in self.specs for suffix in ("", "Inputs", "Outputs")]
+
+    def __contains__(self, name: str) -> bool:
+        """Whether ``name`` is the node, inputs or outputs class of a spec."""
+        return self._spec_for(name) is not None
+
+    def _spec_for(self, name: str):
+        for suffix in ("Inputs", "Outputs", ""):
+            if name.endswith(suffix) and name[: len(name) - len(suffix)] in self.specs:
+                return self.specs[name[: len(name) - len(suffix)]]
+        return None
+
+    def _materialize(self, spec: NodeSpec) -> None:
+        """Build the inputs, outputs and node classes of ``spec``."""
+        name = spec.class_name
+        outputs = list(spec.outputs)
+        if spec.base_class == "BaseSegmentor":
+            outputs.append(("audio", "AUDIO"))
+        inputs_class = _param_proxy_class(
+            f"{name}Inputs", Inputs, InputParam, list(spec.inputs), self.module, f"Input parameters for {name}."
+        )
+        outputs_class = _param_proxy_class(
+            f"{name}Outputs", Outputs, OutputParam, outputs, self.module, f"Output parameters for {name}."
+        )
+        input_type, output_type = DataType[spec.input_type], DataType[spec.output_type]
+        doc = (
+            f"{name} node.{_wrap(spec.description, '    ')}\n\n"
+            f"    InputType: {input_type.value}\n    OutputType: {output_type.value}\n    "
+        )
+
+        def exec_body(namespace: Dict[str, Any]) -> None:
+            namespace.update(
+                {
+                    "__doc__": doc,
+                    "__module__": self.module,
+                    "function": spec.function,
+                    "input_type": input_type,
+                    "output_type": output_type,
+                    "inputs_class": inputs_class,
+                    "outputs_class": outputs_class,
+                }
+            )
+
+        base = NODE_BASES[spec.base_class][inputs_class, outputs_class]
+        node_class = types.new_class(name, (base,), exec_body=exec_body)
+        self._classes.update(
+            {name: node_class, inputs_class.__name__: inputs_class, outputs_class.__name__: outputs_class}
+        )
+
+    def get(self, name: str) -> Type:
+        """Return the class called ``name``, building it on first use.
+
+        Raises:
+            KeyError: If no spec defines a class called ``name``.
+        """
+        if name not in self._classes:
+            spec = self._spec_for(name)
+            if spec is None:
+                raise KeyError(name)
+            self._materialize(spec)
+        return self._classes[name]
+
+    def install_factories(self, pipeline_class: Type) -> None:
+        """Add a ``Pipeline.<method_name>()`` factory method for every node spec."""
+        for spec in self.specs.values():
+            setattr(pipeline_class, spec.method_name, NodeFactory(self, spec))
+
+
+class NodeFactory:
+    """``Pipeline`` factory method creating a node, whose class is built on first access."""
+
+    def __init__(self, registry: NodeRegistry, spec: NodeSpec) -> None:
+        """Bind the factory to a node spec."""
+        self.registry = registry
+        self.spec = spec
+        self.__doc__ = f"Create a {spec.class_name} node.{_wrap(spec.description, '        ')}\n        "
+
+    def __get__(self, instance: Any, owner: Type = None) -> Callable:
+        """Return the factory, bound to ``instance`` when accessed on a pipeline."""
+        node_class = self.registry.get(self.spec.class_name)
+
+        def factory(pipeline, asset_id: Union[str, Asset], *args, **kwargs):
+            return node_class(*args, asset_id=asset_id, pipeline=pipeline, **kwargs)
+
+        factory.__name__ = self.spec.method_name
+        factory.__qualname__ = f"{getattr(owner, '__name__', 'Pipeline')}.{self.spec.method_name}"
+        factory.__doc__ = self.__doc__
+        factory.__annotations__ = {"asset_id": Union[str, Asset], "return": node_class}
+        if instance is None:
+            return factory
+        return types.MethodType(factory, instance)
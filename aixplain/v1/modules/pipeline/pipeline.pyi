@@ -0,0 +1,1360 @@
+"""Type stub of the auto-generated pipeline module.
+
+The node classes and ``Pipeline`` factory methods declared here are built at
+runtime from NODE_SPECS, see node_registry.
+"""
+
+# This is an auto generated module. PLEASE DO NOT EDIT
+
+from typing import Any, List, Tuple, Union
+
+from aixplain.modules.asset import Asset
+
+from .default import DefaultPipeline
+from .designer import AssetNode, BaseMetric, BaseReconstructor, BaseSegmentor, InputParam, Inputs, OutputParam, Outputs
+from .node_registry import NodeSpec
+
+NODE_SPECS: Tuple[NodeSpec, ...]
+
+class TextNormalizationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    settings: InputParam
+
+class TextNormalizationOutputs(Outputs):
+    data: OutputParam
+
+class TextNormalization(AssetNode[TextNormalizationInputs, TextNormalizationOutputs]): ...
+
+class ParaphrasingInputs(Inputs):
+    text: InputParam
+    language: InputParam
+
+class ParaphrasingOutputs(Outputs):
+    data: OutputParam
+
+class Paraphrasing(AssetNode[ParaphrasingInputs, ParaphrasingOutputs]): ...
+
+class LanguageIdentificationInputs(Inputs):
+    text: InputParam
+
+class LanguageIdentificationOutputs(Outputs):
+    data: OutputParam
+
+class LanguageIdentification(AssetNode[LanguageIdentificationInputs, LanguageIdentificationOutputs]): ...
+
+class BenchmarkScoringAsrInputs(Inputs):
+    input: InputParam
+    text: InputParam
+
+class BenchmarkScoringAsrOutputs(Outputs):
+    data: OutputParam
+
+class BenchmarkScoringAsr(AssetNode[BenchmarkScoringAsrInputs, BenchmarkScoringAsrOutputs]): ...
+
+class MultiClassTextClassificationInputs(Inputs):
+    language: InputParam
+    text: InputParam
+
+class MultiClassTextClassificationOutputs(Outputs):
+    data: OutputParam
+
+class MultiClassTextClassification(AssetNode[MultiClassTextClassificationInputs, MultiClassTextClassificationOutputs]): ...
+
+class SpeechEmbeddingInputs(Inputs):
+    audio: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class SpeechEmbeddingOutputs(Outputs):
+    data: OutputParam
+
+class SpeechEmbedding(AssetNode[SpeechEmbeddingInputs, SpeechEmbeddingOutputs]): ...
+
+class DocumentImageParsingInputs(Inputs):
+    image: InputParam
+
+class DocumentImageParsingOutputs(Outputs):
+    data: OutputParam
+
+class DocumentImageParsing(AssetNode[DocumentImageParsingInputs, DocumentImageParsingOutputs]): ...
+
+class TranslationInputs(Inputs):
+    text: InputParam
+    sourcelanguage: InputParam
+    targetlanguage: InputParam
+    script_in: InputParam
+    script_out: InputParam
+    dialect_in: InputParam
+    dialect_out: InputParam
+    context: InputParam
+
+class TranslationOutputs(Outputs):
+    data: OutputParam
+
+class Translation(AssetNode[TranslationInputs, TranslationOutputs]): ...
+
+class AudioSourceSeparationInputs(Inputs):
+    audio: InputParam
+
+class AudioSourceSeparationOutputs(Outputs):
+    data: OutputParam
+
+class AudioSourceSeparation(AssetNode[AudioSourceSeparationInputs, AudioSourceSeparationOutputs]): ...
+
+class SpeechRecognitionInputs(Inputs):
+    language: InputParam
+    dialect: InputParam
+    voice: InputParam
+    source_audio: InputParam
+    script: InputParam
+
+class SpeechRecognitionOutputs(Outputs):
+    data: OutputParam
+
+class SpeechRecognition(AssetNode[SpeechRecognitionInputs, SpeechRecognitionOutputs]): ...
+
+class KeywordSpottingInputs(Inputs):
+    audio: InputParam
+
+class KeywordSpottingOutputs(Outputs):
+    data: OutputParam
+
+class KeywordSpotting(AssetNode[KeywordSpottingInputs, KeywordSpottingOutputs]): ...
+
+class PartOfSpeechTaggingInputs(Inputs):
+    language: InputParam
+    text: InputParam
+
+class PartOfSpeechTaggingOutputs(Outputs):
+    data: OutputParam
+
+class PartOfSpeechTagging(AssetNode[PartOfSpeechTaggingInputs, PartOfSpeechTaggingOutputs]): ...
+
+class ReferencelessAudioGenerationMetricInputs(Inputs):
+    hypotheses: InputParam
+    sources: InputParam
+    score_identifier: InputParam
+
+class ReferencelessAudioGenerationMetricOutputs(Outputs):
+    data: OutputParam
+
+class ReferencelessAudioGenerationMetric(BaseMetric[ReferencelessAudioGenerationMetricInputs, ReferencelessAudioGenerationMetricOutputs]): ...
+
+class VoiceActivityDetectionInputs(Inputs):
+    audio: InputParam
+    onset: InputParam
+    offset: InputParam
+    min_duration_on: InputParam
+    min_duration_off: InputParam
+
+class VoiceActivityDetectionOutputs(Outputs):
+    data: OutputParam
+    audio: OutputParam
+
+class VoiceActivityDetection(BaseSegmentor[VoiceActivityDetectionInputs, VoiceActivityDetectionOutputs]): ...
+
+class SentimentAnalysisInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class SentimentAnalysisOutputs(Outputs):
+    data: OutputParam
+
+class SentimentAnalysis(AssetNode[SentimentAnalysisInputs, SentimentAnalysisOutputs]): ...
+
+class SubtitlingInputs(Inputs):
+    source_audio: InputParam
+    sourcelanguage: InputParam
+    dialect_in: InputParam
+    source_supplier: InputParam
+    target_supplier: InputParam
+    targetlanguages: InputParam
+
+class SubtitlingOutputs(Outputs):
+    data: OutputParam
+
+class Subtitling(AssetNode[SubtitlingInputs, SubtitlingOutputs]): ...
+
+class MultiLabelTextClassificationInputs(Inputs):
+    language: InputParam
+    text: InputParam
+
+class MultiLabelTextClassificationOutputs(Outputs):
+    data: OutputParam
+
+class MultiLabelTextClassification(AssetNode[MultiLabelTextClassificationInputs, MultiLabelTextClassificationOutputs]): ...
+
+class VisemeGenerationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class VisemeGenerationOutputs(Outputs):
+    data: OutputParam
+
+class VisemeGeneration(AssetNode[VisemeGenerationInputs, VisemeGenerationOutputs]): ...
+
+class TextSegmenationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+
+class TextSegmenationOutputs(Outputs):
+    data: OutputParam
+
+class TextSegmenation(AssetNode[TextSegmenationInputs, TextSegmenationOutputs]): ...
+
+class ZeroShotClassificationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    script_in: InputParam
+
+class ZeroShotClassificationOutputs(Outputs):
+    data: OutputParam
+
+class ZeroShotClassification(AssetNode[ZeroShotClassificationInputs, ZeroShotClassificationOutputs]): ...
+
+class TextGenerationInputs(Inputs):
+    text: InputParam
+    temperature: InputParam
+    prompt: InputParam
+    context: InputParam
+    language: InputParam
+    script: InputParam
+
+class TextGenerationOutputs(Outputs):
+    data: OutputParam
+
+class TextGeneration(AssetNode[TextGenerationInputs, TextGenerationOutputs]): ...
+
+class AudioIntentDetectionInputs(Inputs):
+    audio: InputParam
+
+class AudioIntentDetectionOutputs(Outputs):
+    data: OutputParam
+
+class AudioIntentDetection(AssetNode[AudioIntentDetectionInputs, AudioIntentDetectionOutputs]): ...
+
+class EntityLinkingInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    domain: InputParam
+
+class EntityLinkingOutputs(Outputs):
+    data: OutputParam
+
+class EntityLinking(AssetNode[EntityLinkingInputs, EntityLinkingOutputs]): ...
+
+class ConnectionInputs(Inputs):
+    name: InputParam
+
+class ConnectionOutputs(Outputs):
+    data: OutputParam
+
+class Connection(AssetNode[ConnectionInputs, ConnectionOutputs]): ...
+
+class VisualQuestionAnsweringInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    image: InputParam
+
+class VisualQuestionAnsweringOutputs(Outputs):
+    data: OutputParam
+
+class VisualQuestionAnswering(AssetNode[VisualQuestionAnsweringInputs, VisualQuestionAnsweringOutputs]): ...
+
+class LoglikelihoodInputs(Inputs):
+    text: InputParam
+
+class LoglikelihoodOutputs(Outputs):
+    data: OutputParam
+
+class Loglikelihood(AssetNode[LoglikelihoodInputs, LoglikelihoodOutputs]): ...
+
+class LanguageIdentificationAudioInputs(Inputs):
+    audio: InputParam
+
+class LanguageIdentificationAudioOutputs(Outputs):
+    data: OutputParam
+
+class LanguageIdentificationAudio(AssetNode[LanguageIdentificationAudioInputs, LanguageIdentificationAudioOutputs]): ...
+
+class FactCheckingInputs(Inputs):
+    language: InputParam
+    text: InputParam
+
+class FactCheckingOutputs(Outputs):
+    data: OutputParam
+
+class FactChecking(AssetNode[FactCheckingInputs, FactCheckingOutputs]): ...
+
+class TableQuestionAnsweringInputs(Inputs):
+    text: InputParam
+    language: InputParam
+
+class TableQuestionAnsweringOutputs(Outputs):
+    data: OutputParam
+
+class TableQuestionAnswering(AssetNode[TableQuestionAnsweringInputs, TableQuestionAnsweringOutputs]): ...
+
+class SpeechClassificationInputs(Inputs):
+    audio: InputParam
+    language: InputParam
+    script: InputParam
+    dialect: InputParam
+
+class SpeechClassificationOutputs(Outputs):
+    data: OutputParam
+
+class SpeechClassification(AssetNode[SpeechClassificationInputs, SpeechClassificationOutputs]): ...
+
+class InverseTextNormalizationInputs(Inputs):
+    text: InputParam
+
+class InverseTextNormalizationOutputs(Outputs):
+    data: OutputParam
+
+class InverseTextNormalization(AssetNode[InverseTextNormalizationInputs, InverseTextNormalizationOutputs]): ...
+
+class MultiClassImageClassificationInputs(Inputs):
+    image: InputParam
+
+class MultiClassImageClassificationOutputs(Outputs):
+    data: OutputParam
+
+class MultiClassImageClassification(AssetNode[MultiClassImageClassificationInputs, MultiClassImageClassificationOutputs]): ...
+
+class AsrGenderClassificationInputs(Inputs):
+    source_audio: InputParam
+
+class AsrGenderClassificationOutputs(Outputs):
+    data: OutputParam
+
+class AsrGenderClassification(AssetNode[AsrGenderClassificationInputs, AsrGenderClassificationOutputs]): ...
+
+class SummarizationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    script: InputParam
+    dialect: InputParam
+
+class SummarizationOutputs(Outputs):
+    data: OutputParam
+
+class Summarization(AssetNode[SummarizationInputs, SummarizationOutputs]): ...
+
+class TopicModelingInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    script: InputParam
+
+class TopicModelingOutputs(Outputs):
+    data: OutputParam
+
+class TopicModeling(AssetNode[TopicModelingInputs, TopicModelingOutputs]): ...
+
+class AudioReconstructionInputs(Inputs):
+    audio: InputParam
+
+class AudioReconstructionOutputs(Outputs):
+    data: OutputParam
+
+class AudioReconstruction(BaseReconstructor[AudioReconstructionInputs, AudioReconstructionOutputs]): ...
+
+class TextEmbeddingInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class TextEmbeddingOutputs(Outputs):
+    data: OutputParam
+
+class TextEmbedding(AssetNode[TextEmbeddingInputs, TextEmbeddingOutputs]): ...
+
+class DetectLanguageFromTextInputs(Inputs):
+    text: InputParam
+
+class DetectLanguageFromTextOutputs(Outputs):
+    data: OutputParam
+
+class DetectLanguageFromText(AssetNode[DetectLanguageFromTextInputs, DetectLanguageFromTextOutputs]): ...
+
+class ExtractAudioFromVideoInputs(Inputs):
+    video: InputParam
+
+class ExtractAudioFromVideoOutputs(Outputs):
+    data: OutputParam
+
+class ExtractAudioFromVideo(AssetNode[ExtractAudioFromVideoInputs, ExtractAudioFromVideoOutputs]): ...
+
+class SceneDetectionInputs(Inputs):
+    image: InputParam
+
+class SceneDetectionOutputs(Outputs):
+    data: OutputParam
+
+class SceneDetection(AssetNode[SceneDetectionInputs, SceneDetectionOutputs]): ...
+
+class TextToImageGenerationInputs(Inputs):
+    text: InputParam
+
+class TextToImageGenerationOutputs(Outputs):
+    data: OutputParam
+
+class TextToImageGeneration(AssetNode[TextToImageGenerationInputs, TextToImageGenerationOutputs]): ...
+
+class AutoMaskGenerationInputs(Inputs):
+    image: InputParam
+
+class AutoMaskGenerationOutputs(Outputs):
+    data: OutputParam
+
+class AutoMaskGeneration(AssetNode[AutoMaskGenerationInputs, AutoMaskGenerationOutputs]): ...
+
+class AudioLanguageIdentificationInputs(Inputs):
+    audio: InputParam
+
+class AudioLanguageIdentificationOutputs(Outputs):
+    data: OutputParam
+
+class AudioLanguageIdentification(AssetNode[AudioLanguageIdentificationInputs, AudioLanguageIdentificationOutputs]): ...
+
+class FacialRecognitionInputs(Inputs):
+    video: InputParam
+
+class FacialRecognitionOutputs(Outputs):
+    data: OutputParam
+
+class FacialRecognition(AssetNode[FacialRecognitionInputs, FacialRecognitionOutputs]): ...
+
+class QuestionAnsweringInputs(Inputs):
+    text: InputParam
+    language: InputParam
+
+class QuestionAnsweringOutputs(Outputs):
+    data: OutputParam
+
+class QuestionAnswering(AssetNode[QuestionAnsweringInputs, QuestionAnsweringOutputs]): ...
+
+class ImageImpaintingInputs(Inputs):
+    image: InputParam
+
+class ImageImpaintingOutputs(Outputs):
+    image: OutputParam
+
+class ImageImpainting(AssetNode[ImageImpaintingInputs, ImageImpaintingOutputs]): ...
+
+class TextReconstructionInputs(Inputs):
+    text: InputParam
+
+class TextReconstructionOutputs(Outputs):
+    data: OutputParam
+
+class TextReconstruction(BaseReconstructor[TextReconstructionInputs, TextReconstructionOutputs]): ...
+
+class ScriptExecutionInputs(Inputs):
+    text: InputParam
+
+class ScriptExecutionOutputs(Outputs):
+    data: OutputParam
+
+class ScriptExecution(AssetNode[ScriptExecutionInputs, ScriptExecutionOutputs]): ...
+
+class SemanticSegmentationInputs(Inputs):
+    image: InputParam
+
+class SemanticSegmentationOutputs(Outputs):
+    data: OutputParam
+
+class SemanticSegmentation(AssetNode[SemanticSegmentationInputs, SemanticSegmentationOutputs]): ...
+
+class AudioEmotionDetectionInputs(Inputs):
+    audio: InputParam
+
+class AudioEmotionDetectionOutputs(Outputs):
+    data: OutputParam
+
+class AudioEmotionDetection(AssetNode[AudioEmotionDetectionInputs, AudioEmotionDetectionOutputs]): ...
+
+class ImageCaptioningInputs(Inputs):
+    image: InputParam
+
+class ImageCaptioningOutputs(Outputs):
+    data: OutputParam
+
+class ImageCaptioning(AssetNode[ImageCaptioningInputs, ImageCaptioningOutputs]): ...
+
+class SplitOnLinebreakInputs(Inputs):
+    text: InputParam
+
+class SplitOnLinebreakOutputs(Outputs):
+    data: OutputParam
+    audio: OutputParam
+
+class SplitOnLinebreak(BaseSegmentor[SplitOnLinebreakInputs, SplitOnLinebreakOutputs]): ...
+
+class StyleTransferInputs(Inputs):
+    image: InputParam
+
+class StyleTransferOutputs(Outputs):
+    image: OutputParam
+
+class StyleTransfer(AssetNode[StyleTransferInputs, StyleTransferOutputs]): ...
+
+class BaseModelInputs(Inputs):
+    language: InputParam
+    text: InputParam
+
+class BaseModelOutputs(Outputs):
+    data: OutputParam
+
+class BaseModel(AssetNode[BaseModelInputs, BaseModelOutputs]): ...
+
+class ImageManipulationInputs(Inputs):
+    image: InputParam
+    targetimage: InputParam
+
+class ImageManipulationOutputs(Outputs):
+    image: OutputParam
+
+class ImageManipulation(AssetNode[ImageManipulationInputs, ImageManipulationOutputs]): ...
+
+class VideoEmbeddingInputs(Inputs):
+    language: InputParam
+    video: InputParam
+
+class VideoEmbeddingOutputs(Outputs):
+    data: OutputParam
+
+class VideoEmbedding(AssetNode[VideoEmbeddingInputs, VideoEmbeddingOutputs]): ...
+
+class DialectDetectionInputs(Inputs):
+    audio: InputParam
+    language: InputParam
+
+class DialectDetectionOutputs(Outputs):
+    data: OutputParam
+
+class DialectDetection(AssetNode[DialectDetectionInputs, DialectDetectionOutputs]): ...
+
+class FillTextMaskInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class FillTextMaskOutputs(Outputs):
+    data: OutputParam
+
+class FillTextMask(AssetNode[FillTextMaskInputs, FillTextMaskOutputs]): ...
+
+class ActivityDetectionInputs(Inputs):
+    image: InputParam
+
+class ActivityDetectionOutputs(Outputs):
+    data: OutputParam
+
+class ActivityDetection(AssetNode[ActivityDetectionInputs, ActivityDetectionOutputs]): ...
+
+class SelectSupplierForTranslationInputs(Inputs):
+    language: InputParam
+    text: InputParam
+
+class SelectSupplierForTranslationOutputs(Outputs):
+    data: OutputParam
+
+class SelectSupplierForTranslation(AssetNode[SelectSupplierForTranslationInputs, SelectSupplierForTranslationOutputs]): ...
+
+class ExpressionDetectionInputs(Inputs):
+    media: InputParam
+
+class ExpressionDetectionOutputs(Outputs):
+    data: OutputParam
+
+class ExpressionDetection(AssetNode[ExpressionDetectionInputs, ExpressionDetectionOutputs]): ...
+
+class VideoGenerationInputs(Inputs):
+    text: InputParam
+
+class VideoGenerationOutputs(Outputs):
+    data: OutputParam
+
+class VideoGeneration(AssetNode[VideoGenerationInputs, VideoGenerationOutputs]): ...
+
+class ImageAnalysisInputs(Inputs):
+    image: InputParam
+
+class ImageAnalysisOutputs(Outputs):
+    data: OutputParam
+
+class ImageAnalysis(AssetNode[ImageAnalysisInputs, ImageAnalysisOutputs]): ...
+
+class NoiseRemovalInputs(Inputs):
+    audio: InputParam
+
+class NoiseRemovalOutputs(Outputs):
+    data: OutputParam
+
+class NoiseRemoval(AssetNode[NoiseRemovalInputs, NoiseRemovalOutputs]): ...
+
+class ImageAndVideoAnalysisInputs(Inputs):
+    image: InputParam
+
+class ImageAndVideoAnalysisOutputs(Outputs):
+    data: OutputParam
+
+class ImageAndVideoAnalysis(AssetNode[ImageAndVideoAnalysisInputs, ImageAndVideoAnalysisOutputs]): ...
+
+class KeywordExtractionInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class KeywordExtractionOutputs(Outputs):
+    data: OutputParam
+
+class KeywordExtraction(AssetNode[KeywordExtractionInputs, KeywordExtractionOutputs]): ...
+
+class SplitOnSilenceInputs(Inputs):
+    audio: InputParam
+
+class SplitOnSilenceOutputs(Outputs):
+    data: OutputParam
+
+class SplitOnSilence(AssetNode[SplitOnSilenceInputs, SplitOnSilenceOutputs]): ...
+
+class IntentRecognitionInputs(Inputs):
+    audio: InputParam
+    language: InputParam
+    dialect: InputParam
+
+class IntentRecognitionOutputs(Outputs):
+    data: OutputParam
+
+class IntentRecognition(AssetNode[IntentRecognitionInputs, IntentRecognitionOutputs]): ...
+
+class DepthEstimationInputs(Inputs):
+    language: InputParam
+    image: InputParam
+
+class DepthEstimationOutputs(Outputs):
+    data: OutputParam
+
+class DepthEstimation(AssetNode[DepthEstimationInputs, DepthEstimationOutputs]): ...
+
+class ConnectorInputs(Inputs):
+    name: InputParam
+
+class ConnectorOutputs(Outputs):
+    data: OutputParam
+
+class Connector(AssetNode[ConnectorInputs, ConnectorOutputs]): ...
+
+class SpeakerRecognitionInputs(Inputs):
+    audio: InputParam
+    language: InputParam
+    script: InputParam
+    dialect: InputParam
+
+class SpeakerRecognitionOutputs(Outputs):
+    data: OutputParam
+
+class SpeakerRecognition(AssetNode[SpeakerRecognitionInputs, SpeakerRecognitionOutputs]): ...
+
+class SyntaxAnalysisInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    script: InputParam
+
+class SyntaxAnalysisOutputs(Outputs):
+    data: OutputParam
+
+class SyntaxAnalysis(AssetNode[SyntaxAnalysisInputs, SyntaxAnalysisOutputs]): ...
+
+class EntitySentimentAnalysisInputs(Inputs):
+    text: InputParam
+
+class EntitySentimentAnalysisOutputs(Outputs):
+    data: OutputParam
+
+class EntitySentimentAnalysis(AssetNode[EntitySentimentAnalysisInputs, EntitySentimentAnalysisOutputs]): ...
+
+class ClassificationMetricInputs(Inputs):
+    hypotheses: InputParam
+    references: InputParam
+    lowerIsBetter: InputParam
+    sources: InputParam
+    score_identifier: InputParam
+
+class ClassificationMetricOutputs(Outputs):
+    data: OutputParam
+
+class ClassificationMetric(BaseMetric[ClassificationMetricInputs, ClassificationMetricOutputs]): ...
+
+class TextDetectionInputs(Inputs):
+    image: InputParam
+
+class TextDetectionOutputs(Outputs):
+    data: OutputParam
+
+class TextDetection(AssetNode[TextDetectionInputs, TextDetectionOutputs]): ...
+
+class GuardrailsInputs(Inputs):
+    text: InputParam
+
+class GuardrailsOutputs(Outputs):
+    data: OutputParam
+
+class Guardrails(AssetNode[GuardrailsInputs, GuardrailsOutputs]): ...
+
+class EmotionDetectionInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class EmotionDetectionOutputs(Outputs):
+    data: OutputParam
+
+class EmotionDetection(AssetNode[EmotionDetectionInputs, EmotionDetectionOutputs]): ...
+
+class VideoForcedAlignmentInputs(Inputs):
+    video: InputParam
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class VideoForcedAlignmentOutputs(Outputs):
+    text: OutputParam
+    video: OutputParam
+
+class VideoForcedAlignment(AssetNode[VideoForcedAlignmentInputs, VideoForcedAlignmentOutputs]): ...
+
+class ImageContentModerationInputs(Inputs):
+    image: InputParam
+    min_confidence: InputParam
+
+class ImageContentModerationOutputs(Outputs):
+    data: OutputParam
+
+class ImageContentModeration(AssetNode[ImageContentModerationInputs, ImageContentModerationOutputs]): ...
+
+class TextSummarizationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    script: InputParam
+    dialect: InputParam
+
+class TextSummarizationOutputs(Outputs):
+    data: OutputParam
+
+class TextSummarization(AssetNode[TextSummarizationInputs, TextSummarizationOutputs]): ...
+
+class ImageToVideoGenerationInputs(Inputs):
+    language: InputParam
+    image: InputParam
+
+class ImageToVideoGenerationOutputs(Outputs):
+    data: OutputParam
+
+class ImageToVideoGeneration(AssetNode[ImageToVideoGenerationInputs, ImageToVideoGenerationOutputs]): ...
+
+class VideoUnderstandingInputs(Inputs):
+    video: InputParam
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class VideoUnderstandingOutputs(Outputs):
+    text: OutputParam
+
+class VideoUnderstanding(AssetNode[VideoUnderstandingInputs, VideoUnderstandingOutputs]): ...
+
+class TextGenerationMetricDefaultInputs(Inputs):
+    hypotheses: InputParam
+    references: InputParam
+    sources: InputParam
+    score_identifier: InputParam
+
+class TextGenerationMetricDefaultOutputs(Outputs):
+    data: OutputParam
+
+class TextGenerationMetricDefault(BaseMetric[TextGenerationMetricDefaultInputs, TextGenerationMetricDefaultOutputs]): ...
+
+class TextToVideoGenerationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+
+class TextToVideoGenerationOutputs(Outputs):
+    data: OutputParam
+
+class TextToVideoGeneration(AssetNode[TextToVideoGenerationInputs, TextToVideoGenerationOutputs]): ...
+
+class VideoLabelDetectionInputs(Inputs):
+    video: InputParam
+    min_confidence: InputParam
+
+class VideoLabelDetectionOutputs(Outputs):
+    data: OutputParam
+
+class VideoLabelDetection(AssetNode[VideoLabelDetectionInputs, VideoLabelDetectionOutputs]): ...
+
+class TextSpamDetectionInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class TextSpamDetectionOutputs(Outputs):
+    data: OutputParam
+
+class TextSpamDetection(AssetNode[TextSpamDetectionInputs, TextSpamDetectionOutputs]): ...
+
+class TextContentModerationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class TextContentModerationOutputs(Outputs):
+    data: OutputParam
+
+class TextContentModeration(AssetNode[TextContentModerationInputs, TextContentModerationOutputs]): ...
+
+class AudioTranscriptImprovementInputs(Inputs):
+    language: InputParam
+    dialect: InputParam
+    source_supplier: InputParam
+    is_medical: InputParam
+    source_audio: InputParam
+    script: InputParam
+
+class AudioTranscriptImprovementOutputs(Outputs):
+    data: OutputParam
+
+class AudioTranscriptImprovement(AssetNode[AudioTranscriptImprovementInputs, AudioTranscriptImprovementOutputs]): ...
+
+class AudioTranscriptAnalysisInputs(Inputs):
+    language: InputParam
+    dialect: InputParam
+    source_supplier: InputParam
+    source_audio: InputParam
+    script: InputParam
+
+class AudioTranscriptAnalysisOutputs(Outputs):
+    data: OutputParam
+
+class AudioTranscriptAnalysis(AssetNode[AudioTranscriptAnalysisInputs, AudioTranscriptAnalysisOutputs]): ...
+
+class SpeechNonSpeechClassificationInputs(Inputs):
+    audio: InputParam
+    language: InputParam
+    script: InputParam
+    dialect: InputParam
+
+class SpeechNonSpeechClassificationOutputs(Outputs):
+    data: OutputParam
+
+class SpeechNonSpeechClassification(AssetNode[SpeechNonSpeechClassificationInputs, SpeechNonSpeechClassificationOutputs]): ...
+
+class AudioGenerationMetricInputs(Inputs):
+    hypotheses: InputParam
+    references: InputParam
+    sources: InputParam
+    score_identifier: InputParam
+
+class AudioGenerationMetricOutputs(Outputs):
+    data: OutputParam
+
+class AudioGenerationMetric(BaseMetric[AudioGenerationMetricInputs, AudioGenerationMetricOutputs]): ...
+
+class NamedEntityRecognitionInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+    domain: InputParam
+
+class NamedEntityRecognitionOutputs(Outputs):
+    data: OutputParam
+
+class NamedEntityRecognition(AssetNode[NamedEntityRecognitionInputs, NamedEntityRecognitionOutputs]): ...
+
+class SpeechSynthesisInputs(Inputs):
+    audio: InputParam
+    language: InputParam
+    dialect: InputParam
+    voice: InputParam
+    script: InputParam
+    text: InputParam
+    type: InputParam
+
+class SpeechSynthesisOutputs(Outputs):
+    data: OutputParam
+
+class SpeechSynthesis(AssetNode[SpeechSynthesisInputs, SpeechSynthesisOutputs]): ...
+
+class DocumentInformationExtractionInputs(Inputs):
+    image: InputParam
+
+class DocumentInformationExtractionOutputs(Outputs):
+    data: OutputParam
+
+class DocumentInformationExtraction(AssetNode[DocumentInformationExtractionInputs, DocumentInformationExtractionOutputs]): ...
+
+class OcrInputs(Inputs):
+    image: InputParam
+    featuretypes: InputParam
+
+class OcrOutputs(Outputs):
+    data: OutputParam
+
+class Ocr(AssetNode[OcrInputs, OcrOutputs]): ...
+
+class SubtitlingTranslationInputs(Inputs):
+    text: InputParam
+    sourcelanguage: InputParam
+    dialect_in: InputParam
+    target_supplier: InputParam
+    targetlanguages: InputParam
+
+class SubtitlingTranslationOutputs(Outputs):
+    data: OutputParam
+
+class SubtitlingTranslation(AssetNode[SubtitlingTranslationInputs, SubtitlingTranslationOutputs]): ...
+
+class TextToAudioInputs(Inputs):
+    text: InputParam
+    language: InputParam
+
+class TextToAudioOutputs(Outputs):
+    data: OutputParam
+
+class TextToAudio(AssetNode[TextToAudioInputs, TextToAudioOutputs]): ...
+
+class MultilingualSpeechRecognitionInputs(Inputs):
+    source_audio: InputParam
+    language: InputParam
+
+class MultilingualSpeechRecognitionOutputs(Outputs):
+    data: OutputParam
+
+class MultilingualSpeechRecognition(AssetNode[MultilingualSpeechRecognitionInputs, MultilingualSpeechRecognitionOutputs]): ...
+
+class OffensiveLanguageIdentificationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class OffensiveLanguageIdentificationOutputs(Outputs):
+    data: OutputParam
+
+class OffensiveLanguageIdentification(AssetNode[OffensiveLanguageIdentificationInputs, OffensiveLanguageIdentificationOutputs]): ...
+
+class BenchmarkScoringMtInputs(Inputs):
+    input: InputParam
+    text: InputParam
+
+class BenchmarkScoringMtOutputs(Outputs):
+    data: OutputParam
+
+class BenchmarkScoringMt(AssetNode[BenchmarkScoringMtInputs, BenchmarkScoringMtOutputs]): ...
+
+class SpeakerDiarizationAudioInputs(Inputs):
+    audio: InputParam
+    language: InputParam
+    script: InputParam
+    dialect: InputParam
+
+class SpeakerDiarizationAudioOutputs(Outputs):
+    data: OutputParam
+    audio: OutputParam
+
+class SpeakerDiarizationAudio(BaseSegmentor[SpeakerDiarizationAudioInputs, SpeakerDiarizationAudioOutputs]): ...
+
+class VoiceCloningInputs(Inputs):
+    text: InputParam
+    audio: InputParam
+    language: InputParam
+    dialect: InputParam
+    voice: InputParam
+    script: InputParam
+    type: InputParam
+
+class VoiceCloningOutputs(Outputs):
+    data: OutputParam
+
+class VoiceCloning(AssetNode[VoiceCloningInputs, VoiceCloningOutputs]): ...
+
+class SearchInputs(Inputs):
+    text: InputParam
+
+class SearchOutputs(Outputs):
+    data: OutputParam
+
+class Search(AssetNode[SearchInputs, SearchOutputs]): ...
+
+class ObjectDetectionInputs(Inputs):
+    image: InputParam
+
+class ObjectDetectionOutputs(Outputs):
+    data: OutputParam
+
+class ObjectDetection(AssetNode[ObjectDetectionInputs, ObjectDetectionOutputs]): ...
+
+class DiacritizationInputs(Inputs):
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+    text: InputParam
+
+class DiacritizationOutputs(Outputs):
+    data: OutputParam
+
+class Diacritization(AssetNode[DiacritizationInputs, DiacritizationOutputs]): ...
+
+class SpeakerDiarizationVideoInputs(Inputs):
+    video: InputParam
+    language: InputParam
+    script: InputParam
+    dialect: InputParam
+
+class SpeakerDiarizationVideoOutputs(Outputs):
+    data: OutputParam
+
+class SpeakerDiarizationVideo(AssetNode[SpeakerDiarizationVideoInputs, SpeakerDiarizationVideoOutputs]): ...
+
+class AudioForcedAlignmentInputs(Inputs):
+    audio: InputParam
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class AudioForcedAlignmentOutputs(Outputs):
+    text: OutputParam
+    audio: OutputParam
+
+class AudioForcedAlignment(AssetNode[AudioForcedAlignmentInputs, AudioForcedAlignmentOutputs]): ...
+
+class TokenClassificationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    script: InputParam
+
+class TokenClassificationOutputs(Outputs):
+    data: OutputParam
+
+class TokenClassification(AssetNode[TokenClassificationInputs, TokenClassificationOutputs]): ...
+
+class TopicClassificationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    script: InputParam
+    dialect: InputParam
+
+class TopicClassificationOutputs(Outputs):
+    data: OutputParam
+
+class TopicClassification(AssetNode[TopicClassificationInputs, TopicClassificationOutputs]): ...
+
+class IntentClassificationInputs(Inputs):
+    language: InputParam
+    text: InputParam
+
+class IntentClassificationOutputs(Outputs):
+    data: OutputParam
+
+class IntentClassification(AssetNode[IntentClassificationInputs, IntentClassificationOutputs]): ...
+
+class VideoContentModerationInputs(Inputs):
+    video: InputParam
+    min_confidence: InputParam
+
+class VideoContentModerationOutputs(Outputs):
+    data: OutputParam
+
+class VideoContentModeration(AssetNode[VideoContentModerationInputs, VideoContentModerationOutputs]): ...
+
+class TextGenerationMetricInputs(Inputs):
+    hypotheses: InputParam
+    references: InputParam
+    sources: InputParam
+    score_identifier: InputParam
+
+class TextGenerationMetricOutputs(Outputs):
+    data: OutputParam
+
+class TextGenerationMetric(BaseMetric[TextGenerationMetricInputs, TextGenerationMetricOutputs]): ...
+
+class ImageEmbeddingInputs(Inputs):
+    language: InputParam
+    image: InputParam
+
+class ImageEmbeddingOutputs(Outputs):
+    data: OutputParam
+
+class ImageEmbedding(AssetNode[ImageEmbeddingInputs, ImageEmbeddingOutputs]): ...
+
+class ImageLabelDetectionInputs(Inputs):
+    image: InputParam
+    min_confidence: InputParam
+
+class ImageLabelDetectionOutputs(Outputs):
+    data: OutputParam
+
+class ImageLabelDetection(AssetNode[ImageLabelDetectionInputs, ImageLabelDetectionOutputs]): ...
+
+class ImageColorizationInputs(Inputs):
+    image: InputParam
+
+class ImageColorizationOutputs(Outputs):
+    image: OutputParam
+
+class ImageColorization(AssetNode[ImageColorizationInputs, ImageColorizationOutputs]): ...
+
+class MetricAggregationInputs(Inputs):
+    text: InputParam
+
+class MetricAggregationOutputs(Outputs):
+    data: OutputParam
+
+class MetricAggregation(BaseMetric[MetricAggregationInputs, MetricAggregationOutputs]): ...
+
+class InstanceSegmentationInputs(Inputs):
+    image: InputParam
+
+class InstanceSegmentationOutputs(Outputs):
+    data: OutputParam
+
+class InstanceSegmentation(AssetNode[InstanceSegmentationInputs, InstanceSegmentationOutputs]): ...
+
+class OtherMultipurposeInputs(Inputs):
+    text: InputParam
+    language: InputParam
+
+class OtherMultipurposeOutputs(Outputs):
+    data: OutputParam
+
+class OtherMultipurpose(AssetNode[OtherMultipurposeInputs, OtherMultipurposeOutputs]): ...
+
+class SpeechTranslationInputs(Inputs):
+    source_audio: InputParam
+    sourcelanguage: InputParam
+    targetlanguage: InputParam
+    dialect: InputParam
+    voice: InputParam
+    script: InputParam
+
+class SpeechTranslationOutputs(Outputs):
+    data: OutputParam
+
+class SpeechTranslation(AssetNode[SpeechTranslationInputs, SpeechTranslationOutputs]): ...
+
+class ReferencelessTextGenerationMetricDefaultInputs(Inputs):
+    hypotheses: InputParam
+    sources: InputParam
+    score_identifier: InputParam
+
+class ReferencelessTextGenerationMetricDefaultOutputs(Outputs):
+    data: OutputParam
+
+class ReferencelessTextGenerationMetricDefault(BaseMetric[ReferencelessTextGenerationMetricDefaultInputs, ReferencelessTextGenerationMetricDefaultOutputs]): ...
+
+class ReferencelessTextGenerationMetricInputs(Inputs):
+    hypotheses: InputParam
+    sources: InputParam
+    score_identifier: InputParam
+
+class ReferencelessTextGenerationMetricOutputs(Outputs):
+    data: OutputParam
+
+class ReferencelessTextGenerationMetric(BaseMetric[ReferencelessTextGenerationMetricInputs, ReferencelessTextGenerationMetricOutputs]): ...
+
+class TextDenormalizationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    lowercase_latin: InputParam
+    remove_accents: InputParam
+    remove_punctuation: InputParam
+
+class TextDenormalizationOutputs(Outputs):
+    data: OutputParam
+
+class TextDenormalization(AssetNode[TextDenormalizationInputs, TextDenormalizationOutputs]): ...
+
+class ImageCompressionInputs(Inputs):
+    image: InputParam
+    apl_qfactor: InputParam
+
+class ImageCompressionOutputs(Outputs):
+    image: OutputParam
+
+class ImageCompression(AssetNode[ImageCompressionInputs, ImageCompressionOutputs]): ...
+
+class TextClassificationInputs(Inputs):
+    text: InputParam
+    language: InputParam
+    dialect: InputParam
+    script: InputParam
+
+class TextClassificationOutputs(Outputs):
+    data: OutputParam
+
+class TextClassification(AssetNode[TextClassificationInputs, TextClassificationOutputs]): ...
+
+class AsrAgeClassificationInputs(Inputs):
+    source_audio: InputParam
+
+class AsrAgeClassificationOutputs(Outputs):
+    data: OutputParam
+
+class AsrAgeClassification(AssetNode[AsrAgeClassificationInputs, AsrAgeClassificationOutputs]): ...
+
+class AsrQualityEstimationInputs(Inputs):
+    text: InputParam
+    script: InputParam
+
+class AsrQualityEstimationOutputs(Outputs):
+    data: OutputParam
+
+class AsrQualityEstimation(AssetNode[AsrQualityEstimationInputs, AsrQualityEstimationOutputs]): ...
+
+class Pipeline(DefaultPipeline):
+    def text_normalization(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextNormalization: ...
+    def paraphrasing(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Paraphrasing: ...
+    def language_identification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> LanguageIdentification: ...
+    def benchmark_scoring_asr(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> BenchmarkScoringAsr: ...
+    def multi_class_text_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> MultiClassTextClassification: ...
+    def speech_embedding(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SpeechEmbedding: ...
+    def document_image_parsing(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> DocumentImageParsing: ...
+    def translation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Translation: ...
+    def audio_source_separation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AudioSourceSeparation: ...
+    def speech_recognition(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SpeechRecognition: ...
+    def keyword_spotting(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> KeywordSpotting: ...
+    def part_of_speech_tagging(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> PartOfSpeechTagging: ...
+    def referenceless_audio_generation_metric(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ReferencelessAudioGenerationMetric: ...
+    def voice_activity_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VoiceActivityDetection: ...
+    def sentiment_analysis(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SentimentAnalysis: ...
+    def subtitling(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Subtitling: ...
+    def multi_label_text_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> MultiLabelTextClassification: ...
+    def viseme_generation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VisemeGeneration: ...
+    def text_segmenation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextSegmenation: ...
+    def zero_shot_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ZeroShotClassification: ...
+    def text_generation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextGeneration: ...
+    def audio_intent_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AudioIntentDetection: ...
+    def entity_linking(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> EntityLinking: ...
+    def connection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Connection: ...
+    def visual_question_answering(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VisualQuestionAnswering: ...
+    def loglikelihood(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Loglikelihood: ...
+    def language_identification_audio(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> LanguageIdentificationAudio: ...
+    def fact_checking(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> FactChecking: ...
+    def table_question_answering(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TableQuestionAnswering: ...
+    def speech_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SpeechClassification: ...
+    def inverse_text_normalization(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> InverseTextNormalization: ...
+    def multi_class_image_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> MultiClassImageClassification: ...
+    def asr_gender_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AsrGenderClassification: ...
+    def summarization(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Summarization: ...
+    def topic_modeling(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TopicModeling: ...
+    def audio_reconstruction(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AudioReconstruction: ...
+    def text_embedding(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextEmbedding: ...
+    def detect_language_from_text(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> DetectLanguageFromText: ...
+    def extract_audio_from_video(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ExtractAudioFromVideo: ...
+    def scene_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SceneDetection: ...
+    def text_to_image_generation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextToImageGeneration: ...
+    def auto_mask_generation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AutoMaskGeneration: ...
+    def audio_language_identification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AudioLanguageIdentification: ...
+    def facial_recognition(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> FacialRecognition: ...
+    def question_answering(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> QuestionAnswering: ...
+    def image_impainting(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageImpainting: ...
+    def text_reconstruction(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextReconstruction: ...
+    def script_execution(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ScriptExecution: ...
+    def semantic_segmentation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SemanticSegmentation: ...
+    def audio_emotion_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AudioEmotionDetection: ...
+    def image_captioning(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageCaptioning: ...
+    def split_on_linebreak(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SplitOnLinebreak: ...
+    def style_transfer(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> StyleTransfer: ...
+    def base_model(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> BaseModel: ...
+    def image_manipulation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageManipulation: ...
+    def video_embedding(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VideoEmbedding: ...
+    def dialect_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> DialectDetection: ...
+    def fill_text_mask(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> FillTextMask: ...
+    def activity_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ActivityDetection: ...
+    def select_supplier_for_translation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SelectSupplierForTranslation: ...
+    def expression_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ExpressionDetection: ...
+    def video_generation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VideoGeneration: ...
+    def image_analysis(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageAnalysis: ...
+    def noise_removal(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> NoiseRemoval: ...
+    def image_and_video_analysis(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageAndVideoAnalysis: ...
+    def keyword_extraction(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> KeywordExtraction: ...
+    def split_on_silence(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SplitOnSilence: ...
+    def intent_recognition(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> IntentRecognition: ...
+    def depth_estimation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> DepthEstimation: ...
+    def connector(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Connector: ...
+    def speaker_recognition(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SpeakerRecognition: ...
+    def syntax_analysis(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SyntaxAnalysis: ...
+    def entity_sentiment_analysis(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> EntitySentimentAnalysis: ...
+    def classification_metric(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ClassificationMetric: ...
+    def text_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextDetection: ...
+    def guardrails(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Guardrails: ...
+    def emotion_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> EmotionDetection: ...
+    def video_forced_alignment(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VideoForcedAlignment: ...
+    def image_content_moderation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageContentModeration: ...
+    def text_summarization(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextSummarization: ...
+    def image_to_video_generation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageToVideoGeneration: ...
+    def video_understanding(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VideoUnderstanding: ...
+    def text_generation_metric_default(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextGenerationMetricDefault: ...
+    def text_to_video_generation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextToVideoGeneration: ...
+    def video_label_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VideoLabelDetection: ...
+    def text_spam_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextSpamDetection: ...
+    def text_content_moderation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextContentModeration: ...
+    def audio_transcript_improvement(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AudioTranscriptImprovement: ...
+    def audio_transcript_analysis(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AudioTranscriptAnalysis: ...
+    def speech_non_speech_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SpeechNonSpeechClassification: ...
+    def audio_generation_metric(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AudioGenerationMetric: ...
+    def named_entity_recognition(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> NamedEntityRecognition: ...
+    def speech_synthesis(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SpeechSynthesis: ...
+    def document_information_extraction(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> DocumentInformationExtraction: ...
+    def ocr(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Ocr: ...
+    def subtitling_translation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SubtitlingTranslation: ...
+    def text_to_audio(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextToAudio: ...
+    def multilingual_speech_recognition(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> MultilingualSpeechRecognition: ...
+    def offensive_language_identification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> OffensiveLanguageIdentification: ...
+    def benchmark_scoring_mt(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> BenchmarkScoringMt: ...
+    def speaker_diarization_audio(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SpeakerDiarizationAudio: ...
+    def voice_cloning(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VoiceCloning: ...
+    def search(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Search: ...
+    def object_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ObjectDetection: ...
+    def diacritization(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> Diacritization: ...
+    def speaker_diarization_video(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SpeakerDiarizationVideo: ...
+    def audio_forced_alignment(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AudioForcedAlignment: ...
+    def token_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TokenClassification: ...
+    def topic_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TopicClassification: ...
+    def intent_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> IntentClassification: ...
+    def video_content_moderation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> VideoContentModeration: ...
+    def text_generation_metric(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextGenerationMetric: ...
+    def image_embedding(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageEmbedding: ...
+    def image_label_detection(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageLabelDetection: ...
+    def image_colorization(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageColorization: ...
+    def metric_aggregation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> MetricAggregation: ...
+    def instance_segmentation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> InstanceSegmentation: ...
+    def other__multipurpose_(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> OtherMultipurpose: ...
+    def speech_translation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> SpeechTranslation: ...
+    def referenceless_text_generation_metric_default(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ReferencelessTextGenerationMetricDefault: ...
+    def referenceless_text_generation_metric(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ReferencelessTextGenerationMetric: ...
+    def text_denormalization(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextDenormalization: ...
+    def image_compression(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> ImageCompression: ...
+    def text_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> TextClassification: ...
+    def asr_age_classification(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AsrAgeClassification: ...
+    def asr_quality_estimation(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> AsrQualityEstimation: ...
+
+def __dir__() -> List[str]: ...
@@ -32,7 +32,7 @@ import traceback
 import re
 import warnings
 from enum import Enum
-from typing import Dict, List, Text, Optional, Union, Any
+from typing import Callable, Dict, Generator, List, Text, Optional, Union, Any
 from urllib.parse import urljoin
 from datetime import datetime
 
@@ -52,6 +52,7 @@ from aixplain.modules.team_agent.evolver_response_data import EvolverResponseDat
 from aixplain.utils.convert_datatype_utils import normalize_expected_output
 from aixplain.utils import config
 from aixplain.utils.request_utils import _request_with_retry
+from aixplain.utils.step_index import StepDelta, StepIndex, iter_poll_deltas, response_steps
 from aixplain.utils.user_info_utils import build_run_metadata
 from aixplain.modules.model.llm_model import LLM
 from aixplain.modules.mixins import DeployableMixin
@@ -531,6 +532,7 @@ class TeamAgent(Model, DeployableMixin[Agent]):
         wait_time: float = 0.5,
         timeout: float = 300,
         progress_verbosity: Optional[str] = "compact",
+        on_step: Optional[Callable[[StepDelta], None]] = None,
     ) -> AgentResponse:
         """Poll the platform until team agent execution completes or times out.
 
@@ -540,6 +542,9 @@ class TeamAgent(Model, DeployableMixin[Agent]):
             wait_time (float, optional): Initial wait time in seconds between polls. Defaults to 0.5.
             timeout (float, optional): Maximum total time to poll in seconds. Defaults to 300.
             progress_verbosity (Optional[str], optional): Progress display mode - "full" (detailed), "compact" (brief), or None (no progress). Defaults to "compact".
+            on_step (Callable[[StepDelta], None], optional): Called once for every intermediate step that is
+                new or changed since the previous poll. Steps are indexed by id, so finished steps are not
+                re-processed. Defaults to None.
 
         Returns:
             AgentResponse: The final response from the team agent execution.
@@ -550,16 +555,23 @@ class TeamAgent(Model, DeployableMixin[Agent]):
         completed = False
         response_body = AgentResponse(status=ResponseStatus.FAILED, completed=False)
         last_message = None  # Track last message to avoid duplicates
+        last_progress = None  # Skip re-formatting progress that did not change
+        step_index = StepIndex() if on_step is not None else None
 
         while not completed and (end - start) < timeout:
             try:
                 response_body = self.poll(poll_url, name=name)
                 completed = response_body["completed"]
 
+                if step_index is not None:
+                    for delta in step_index.iter_deltas(response_steps(response_body)):
+                        on_step(delta)
+
                 # Display progress inline if enabled
                 if progress_verbosity and not completed:
                     progress = response_body.get("progress")
-                    if progress:
+                    if progress and progress != last_progress:
+                        last_progress = progress
                         msg = self._format_team_progress(progress, progress_verbosity)
                         if msg and msg != last_message:
                             print(msg, flush=True)
@@ -602,6 +614,35 @@ class TeamAgent(Model, DeployableMixin[Agent]):
 
         return response_body
 
+    def iter_step_deltas(
+        self,
+        poll_url: Text,
+        name: Text = "model_process",
+        wait_time: float = 0.5,
+        timeout: float = 300,
+    ) -> Generator[StepDelta, None, AgentResponse]:
+        """Poll a team agent execution and yield only its new or changed intermediate steps.
+
+        Steps are indexed by id across polls and finished steps are not compared
+        again, so each poll costs O(new steps) instead of O(all steps).
+
+        Args:
+            poll_url (Text): URL to poll for operation status.
+            name (Text, optional): Identifier for the operation. Defaults to "model_process".
+            wait_time (float, optional): Initial wait time in seconds between polls. Defaults to 0.5.
+            timeout (float, optional): Maximum total time to poll in seconds. Defaults to 300.
+
+        Yields:
+            StepDelta: A step that is new or changed since the previous poll.
+
+        Returns:
+            AgentResponse: The final response, as the generator's return value.
+
+        Raises:
+            TimeoutError: If the execution does not complete within ``timeout``.
+        """
+        return (yield from iter_poll_deltas(lambda url: self.poll(url, name=name), poll_url, wait_time, timeout))
+
     def run(
         self,
         data: Optional[Union[Dict, Text]] = None,
@@ -0,0 +1,105 @@
+__author__ = "aiXplain"
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from tqdm import tqdm
+from typing import Any, Callable, List, Optional, Text
+
+DEFAULT_UPLOAD_WORKERS = 4
+
+
+class BatchUploader:
+    """Run the finalization of onboarding batches (compression and upload) in the background.
+
+    Row processing stays on the calling thread and hands each full batch to
+    :meth:`submit`; a bounded pool of workers writes, compresses and uploads
+    batches while the next ones are being built, so CPU work and network
+    transfers overlap. Once ``max_pending`` batches are queued or in flight,
+    :meth:`submit` blocks until one finishes, which keeps the number of batches
+    held in memory and on disk bounded.
+
+    Example:
+        >>> with BatchUploader(max_workers=4) as uploader:
+        ...     for number, batch in enumerate(batches, start=1):
+        ...         uploader.submit(upload_batch, number, batch)
+        ...     files = uploader.results()
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
+        max_pending: Optional[int] = None,
+        desc: Optional[Text] = None,
+    ) -> None:
+        """Create the worker pool.
+
+        Args:
+            max_workers (int, optional): Batches finalized concurrently. Defaults to 4.
+            max_pending (Optional[int], optional): Batches that may be queued or in
+                flight before :meth:`submit` blocks. Defaults to twice ``max_workers``.
+            desc (Optional[Text], optional): Label of the upload progress bar. Defaults to None.
+        """
+        max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aixplain-onboarding")
+        self._slots = threading.BoundedSemaphore(max_pending or 2 * max_workers)
+        self._futures: List[Future] = []
+        self._progress = tqdm(total=0, desc=desc or " Batch upload progress", position=3, leave=False, unit="batch")
+        self._progress_lock = threading.Lock()
+
+    @property
+    def submitted(self) -> int:
+        """Number of batches submitted so far."""
+        return len(self._futures)
+
+    def _release(self, future: Future) -> None:
+        self._slots.release()
+        with self._progress_lock:
+            self._progress.update(1)
+
+    def _raise_failed(self) -> None:
+        """Re-raise the error of the first failed batch, if any, to stop early."""
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queue ``fn(*args, **kwargs)``, blocking while ``max_pending`` batches are outstanding.
+
+        Raises:
+            Exception: The error of an earlier batch that already failed.
+        """
+        self._raise_failed()
+        self._slots.acquire()
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._release)
+        self._futures.append(future)
+        with self._progress_lock:
+            self._progress.total += 1
+            self._progress.refresh()
+
+    def results(self) -> List[Any]:
+        """Wait for every batch and return their results in submission order.
+
+        Raises:
+            Exception: The error of the first batch that failed.
+        """
+        return [future.result() for future in self._futures]
+
+    def close(self, cancel: bool = False) -> None:
+        """Shut the pool down, dropping batches that have not started when ``cancel`` is set."""
+        if cancel:
+            for future in self._futures:
+                future.cancel()
+        self._executor.shutdown(wait=True)
+        self._progress.close()
+
+    def __enter__(self) -> "BatchUploader":
+        """Return self for use as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Wait for running batches; queued ones are cancelled if the block raised."""
+        if exc_type is not None:
+            logging.debug("Data Asset Onboarding: cancelling pending batch uploads.")
+        self.close(cancel=exc_type is not None)
@@ -0,0 +1,67 @@
+__author__ = "aiXplain"
+
+import logging
+import os
+import pandas as pd
+from typing import Iterator, List, Optional, Text
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def read_header(path: Text) -> List[Text]:
+    """Read only the column names of a CSV file.
+
+    Args:
+        path (Text): Path to the CSV file.
+
+    Returns:
+        List[Text]: Column names of the file.
+
+    Raises:
+        Exception: If the file can not be found or parsed.
+    """
+    try:
+        return pd.read_csv(path, nrows=0).columns.to_list()
+    except Exception:
+        message = f'Data Asset Onboarding Error: Local file "{path}" not found.'
+        logging.exception(message)
+        raise Exception(message)
+
+
+def iter_csv_chunks(
+    path: Text, columns: Optional[List[Text]] = None, chunksize: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV file in chunks of at most ``chunksize`` rows.
+
+    Only ``columns`` are parsed, so memory stays bounded by the chunk size and
+    the number of columns onboarded rather than by the size of the file.
+
+    Args:
+        path (Text): Path to the CSV file.
+        columns (Optional[List[Text]], optional): Columns to read. All columns are
+            read when None. Defaults to None.
+        chunksize (int, optional): Maximum number of rows per chunk. Defaults to 10000.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the file, keeping their position in the
+            file as index.
+
+    Raises:
+        Exception: If the file can not be found or one of ``columns`` is missing.
+    """
+    if not os.path.exists(path):
+        message = f'Data Asset Onboarding Error: Local file "{path}" not found.'
+        logging.error(message)
+        raise Exception(message)
+
+    if columns is not None:
+        header = read_header(path)
+        for column in columns:
+            if column not in header:
+                message = f'Data Asset Onboarding Error: Column "{column}" not found in the local file "{path}".'
+                logging.error(message)
+                raise Exception(message)
+
+    with pd.read_csv(path, usecols=columns, chunksize=max(1, chunksize)) as reader:
+        for chunk in reader:
+            yield chunk
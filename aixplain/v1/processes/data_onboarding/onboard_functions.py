@@ -5,7 +5,7 @@ import aixplain.processes.data_onboarding.process_text_files as process_text_fil
 import aixplain.utils.config as config
 import logging
 import os
-import pandas as pd
+import numpy as np
 import random
 
 from aixplain.enums.data_subtype import DataSubtype
@@ -18,6 +18,8 @@ from aixplain.modules.data import Data
 from aixplain.modules.dataset import Dataset
 from aixplain.modules.file import File
 from aixplain.modules.metadata import MetaData
+from aixplain.processes.data_onboarding.batch_uploader import DEFAULT_UPLOAD_WORKERS
+from aixplain.processes.data_onboarding.csv_reader import DEFAULT_CHUNK_SIZE, iter_csv_chunks, read_header
 from aixplain.utils.request_utils import _request_with_retry
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Text, Union
@@ -83,7 +85,12 @@ def get_paths(input_paths: List[Union[str, Path]]) -> List[Path]:
 
 
 def process_data_files(
-    data_asset_name: str, metadata: MetaData, paths: List, folder: Optional[Union[str, Path]] = None
+    data_asset_name: str,
+    metadata: MetaData,
+    paths: List,
+    folder: Optional[Union[str, Path]] = None,
+    max_workers: int = DEFAULT_UPLOAD_WORKERS,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
 ) -> Tuple[List[File], int, int, int, int]:
     """Process data files based on their type and prepare them for upload to S3.
 
@@ -98,6 +105,10 @@ def process_data_files(
         paths (List): List of paths to local files that need processing.
         folder (Optional[Union[str, Path]], optional): Local folder to save processed
             files before uploading to S3. If None, uses data_asset_name. Defaults to None.
+        max_workers (int, optional): Number of batches compressed and uploaded
+            concurrently while the next batches are built. Defaults to 4.
+        chunksize (int, optional): Number of rows read from an input file at a time,
+            which bounds memory use regardless of the file size. Defaults to 10000.
 
     Returns:
         Tuple[List[File], int, int, int, int]: A tuple containing:
@@ -126,10 +137,12 @@ def process_data_files(
     )
     if metadata.dtype in [DataType.AUDIO, DataType.IMAGE, DataType.LABEL] or metadata.dsubtype == DataSubtype.INTERVAL:
         files, data_column_idx, start_column_idx, end_column_idx, nrows = process_media_files.run(
-            metadata=metadata, paths=paths, folder=folder
+            metadata=metadata, paths=paths, folder=folder, max_workers=max_workers, chunksize=chunksize
         )
     elif metadata.dtype in [DataType.TEXT]:
-        files, data_column_idx, nrows = process_text_files.run(metadata=metadata, paths=paths, folder=folder)
+        files, data_column_idx, nrows = process_text_files.run(
+            metadata=metadata, paths=paths, folder=folder, max_workers=max_workers, chunksize=chunksize
+        )
     return files, data_column_idx, start_column_idx, end_column_idx, nrows
 
 
@@ -453,7 +466,9 @@ def is_data(data_id: Text) -> bool:
         return False
 
 
-def split_data(paths: List, split_rate: List[float], split_labels: List[Text]) -> MetaData:
+def split_data(
+    paths: List, split_rate: List[float], split_labels: List[Text], chunksize: int = DEFAULT_CHUNK_SIZE
+) -> MetaData:
     """Split data files into partitions based on specified rates and labels.
 
     This function adds a new column to CSV files to indicate the split assignment
@@ -466,6 +481,8 @@ def split_data(paths: List, split_rate: List[float], split_labels: List[Text]) -
             For example, [0.8, 0.1, 0.1] for train/dev/test split.
         split_labels (List[Text]): List of labels corresponding to each split rate.
             For example, ["train", "dev", "test"].
+        chunksize (int, optional): Number of rows read and rewritten at a time, so
+            files of any size are split with bounded memory. Defaults to 10000.
 
     Returns:
         MetaData: A metadata object for the new split column with:
@@ -483,40 +500,46 @@ def split_data(paths: List, split_rate: List[float], split_labels: List[Text]) -
     # get column name
     column_name = None
     for path in paths:
-        try:
-            dataframe = pd.read_csv(path)
-            for candidate_name in ["split", "SPLIT", "_split", "_split_", "split_"]:
-                if candidate_name not in dataframe.columns:
-                    column_name = candidate_name
-                    break
-
-            if column_name is not None:
+        columns = read_header(path)
+        for candidate_name in ["split", "SPLIT", "_split", "_split_", "split_"]:
+            if candidate_name not in columns:
+                column_name = candidate_name
                 break
-        except Exception:
-            message = f'Data Asset Onboarding Error: Local file "{path}" not found.'
-            logging.exception(message)
-            raise Exception(message)
+
+        if column_name is not None:
+            break
 
     if column_name is None:
         message = "Data Asset Onboarding Error: All split names are used."
         raise Exception(message)
 
+    labels = np.array(split_labels, dtype=object)
+    default_label = [i for i, srate in enumerate(split_rate) if srate == max(split_rate)][0]
     for path in paths:
-        dataframe = pd.read_csv(path)
-        dataframe[column_name] = [
-            slabel for (slabel, srate) in zip(split_labels, split_rate) if srate == max(split_rate)
-        ][0]
+        # count the rows without holding the file in memory
+        first_column = read_header(path)[:1]
+        size = sum(len(chunk) for chunk in iter_csv_chunks(path, columns=first_column, chunksize=chunksize))
 
-        size = len(dataframe)
+        # assign one split label per row; seeded from `random` so random.seed keeps splits reproducible
+        assignment = np.full(size, default_label, dtype=np.int64)
+        indexes = np.random.default_rng(random.getrandbits(64)).permutation(size)
         start = 0
-        indexes = list(range(size))
-        random.shuffle(indexes)
-        for slabel, srate in zip(split_labels, split_rate):
+        for label_idx, srate in enumerate(split_rate):
             split_size = int(srate * size)
-
-            split_indexes = indexes[start : start + split_size]
-            dataframe.loc[split_indexes, column_name] = slabel
+            assignment[indexes[start : start + split_size]] = label_idx
             start = start + split_size
-        dataframe.to_csv(path, index=False)
+
+        # rewrite the file chunk by chunk with the new column, then swap it in place
+        tmp_path = f"{path}.split.tmp"
+        offset = 0
+        try:
+            for chunk_number, chunk in enumerate(iter_csv_chunks(path, chunksize=chunksize)):
+                chunk[column_name] = labels[assignment[offset : offset + len(chunk)]]
+                offset += len(chunk)
+                chunk.to_csv(tmp_path, mode="w" if chunk_number == 0 else "a", header=chunk_number == 0, index=False)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     return MetaData(name=column_name, dtype=DataType.LABEL, dsubtype=DataSubtype.SPLIT, storage_type=StorageType.TEXT)
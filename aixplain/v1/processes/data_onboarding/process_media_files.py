@@ -13,10 +13,12 @@ from aixplain.enums.file_type import FileType
 from aixplain.enums.storage_type import StorageType
 from aixplain.modules.file import File
 from aixplain.modules.metadata import MetaData
+from aixplain.processes.data_onboarding.batch_uploader import DEFAULT_UPLOAD_WORKERS, BatchUploader
+from aixplain.processes.data_onboarding.csv_reader import DEFAULT_CHUNK_SIZE, iter_csv_chunks
 from aixplain.utils.file_utils import upload_data
 from pathlib import Path
 from tqdm import tqdm
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 AUDIO_MAX_SIZE = 50000000
 IMAGE_TEXT_MAX_SIZE = 25000000
@@ -41,7 +43,114 @@ def compress_folder(folder_path: str) -> str:
     return folder_path + ".tgz"
 
 
-def run(metadata: MetaData, paths: List, folder: Path, batch_size: int = 100) -> Tuple[List[File], int, int, int, int]:
+def _check_media_size(metadata: MetaData, media_path: str) -> None:
+    """Check the size (and, for intervals, the format) of a local media file."""
+    if metadata.dsubtype == DataSubtype.INTERVAL:
+        assert os.path.getsize(media_path) <= IMAGE_TEXT_MAX_SIZE, (
+            f'Data Asset Onboarding Error: Local interval file "{media_path}" exceeds the size limit of 25 MB.'
+        )
+        _, file_extension = os.path.splitext(media_path)
+        assert file_extension == ".json", (
+            f'Data Asset Onboarding Error: Local interval files, such as "{media_path}", must be a JSON.'
+        )
+    elif metadata.dtype == DataType.AUDIO:
+        assert os.path.getsize(media_path) <= AUDIO_MAX_SIZE, (
+            f'Data Asset Onboarding Error: Local audio file "{media_path}" exceeds the size limit of 50 MB.'
+        )
+    elif metadata.dtype == DataType.LABEL:
+        assert os.path.getsize(media_path) <= IMAGE_TEXT_MAX_SIZE, (
+            f'Data Asset Onboarding Error: Local label file "{media_path}" exceeds the size limit of 25 MB.'
+        )
+    else:
+        assert os.path.getsize(media_path) <= IMAGE_TEXT_MAX_SIZE, (
+            f'Data Asset Onboarding Error: Local image file "{media_path}" exceeds the size limit of 25 MB.'
+        )
+
+
+def _upload_batch(
+    metadata: MetaData,
+    folder: Path,
+    batch_number: int,
+    batch: List,
+    start: int,
+    start_intervals: List,
+    end_intervals: List,
+    data_file_name: Optional[str] = None,
+) -> Tuple[File, int, int, int]:
+    """Compress and upload one batch of media and its index CSV.
+
+    Args:
+        metadata (MetaData): Metadata of the column being onboarded.
+        folder (Path): Local folder where the index and archive files are written.
+        batch_number (int): 1-based position of the batch, used in file names.
+        batch (List): Media file names (local storage) or media paths/URLs.
+        start (int): Global row index of the first media.
+        start_intervals (List): Crop start of each media (empty when not cropping).
+        end_intervals (List): Crop end of each media (empty when not cropping).
+        data_file_name (Optional[str], optional): Folder holding the batch's local
+            media files, compressed and uploaded then removed. Defaults to None.
+
+    Returns:
+        Tuple[File, int, int, int]: The uploaded index file and the indices of the
+            data, start and end columns (-1 when there are no intervals).
+    """
+    batch_index = str(batch_number).zfill(8)
+
+    # save index file with a list of the media files
+    index_file_name = f"{folder}/{metadata.name}-{batch_index}.csv.gz"
+
+    # if the media are stored locally, zip them and upload to s3
+    if data_file_name is not None:
+        df = pd.DataFrame({metadata.name: [os.path.join(data_file_name, media_fname) for media_fname in batch]})
+        # compress the folder
+        compressed_folder = compress_folder(data_file_name)
+        # upload zipped medias into s3
+        s3_compressed_folder = upload_data(
+            compressed_folder, content_type="application/x-tar", return_download_link=False
+        )
+        # update index files pointing the s3 link
+        df["@SOURCE"] = s3_compressed_folder
+        # remove media folder
+        shutil.rmtree(data_file_name)
+        # remove zipped file
+        os.remove(compressed_folder)
+    else:
+        df = pd.DataFrame({metadata.name: batch})
+
+    # adding indexes
+    df["@INDEX"] = range(start, start + len(batch))
+
+    # if there are start and end time ranges, save this into the index csv
+    start_column_idx, end_column_idx = -1, -1
+    if len(start_intervals) > 0 and len(end_intervals) > 0:
+        if metadata.dtype == DataType.AUDIO:
+            start_column = "@START_TIME"
+            end_column = "@END_TIME"
+        else:
+            start_column = "@START"
+            end_column = "@END"
+
+        df[start_column] = start_intervals
+        df[end_column] = end_intervals
+
+        start_column_idx = df.columns.to_list().index(start_column)
+        end_column_idx = df.columns.to_list().index(end_column)
+
+    df.to_csv(index_file_name, compression="gzip", index=False)
+    s3_link = upload_data(index_file_name, content_type="text/csv", content_encoding="gzip", return_download_link=False)
+    data_column_idx = df.columns.to_list().index(metadata.name)
+    index_file = File(path=s3_link, extension=FileType.CSV, compression="gzip")
+    return index_file, data_column_idx, start_column_idx, end_column_idx
+
+
+def run(
+    metadata: MetaData,
+    paths: List,
+    folder: Path,
+    batch_size: int = 100,
+    max_workers: int = DEFAULT_UPLOAD_WORKERS,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[List[File], int, int, int, int]:
     """Process media files and prepare them for upload to S3 with batch processing.
 
     This function handles the processing and uploading of media files (audio, image, etc.)
@@ -49,13 +158,13 @@ def run(metadata: MetaData, paths: List, folder: Path, batch_size: int = 100) ->
     and creates index files to track the media locations and any interval information.
 
     The process works as follows:
-    1. For each media file in the input paths:
+    1. For each media file in the input paths, streamed in chunks of rows:
        - If it's a public URL: Add the URL to an index CSV file
        - If it's a local file: Copy to a temporary folder and add path to index
-    2. After every batch_size files:
-       - For local files: Compress the folder into .tgz and upload to S3
-       - Create and upload an index CSV file with paths and metadata
-       - Reset for the next batch
+    2. After every batch_size files, hand the batch to a background worker that:
+       - For local files: Compresses the folder into .tgz and uploads it to S3
+       - Creates and uploads an index CSV file with paths and metadata
+       while the next batch is being built.
 
     Args:
         metadata (MetaData): Metadata object containing information about the media type,
@@ -65,6 +174,11 @@ def run(metadata: MetaData, paths: List, folder: Path, batch_size: int = 100) ->
             will be stored during processing.
         batch_size (int, optional): Number of media files to process in each batch.
             Defaults to 100.
+        max_workers (int, optional): Number of batches compressed and uploaded
+            concurrently. Defaults to 4.
+        chunksize (int, optional): Number of rows read from an input CSV file at a
+            time, which bounds memory use regardless of the file size. Row indices
+            stay global across chunks and files. Defaults to 10000.
 
     Returns:
         Tuple[List[File], int, int, int, int]: A tuple containing:
@@ -85,6 +199,19 @@ def run(metadata: MetaData, paths: List, folder: Path, batch_size: int = 100) ->
         assert metadata.storage_type != StorageType.TEXT, (
             f'Data Asset Onboarding Error: Column "{metadata.name}" of type "{metadata.dtype}" can not be stored in text.'
         )
+    if metadata.storage_type == StorageType.FILE and metadata.dsubtype == DataSubtype.INTERVAL:
+        # check whether the interval is in audio, image, text and video
+        assert metadata.dtype in [
+            DataType.AUDIO,
+            DataType.IMAGE,
+            DataType.TEXT,
+            DataType.VIDEO,
+        ], f'Data Asset Onboarding Error: Content Intervals do not work with "{metadata.dtype}".'
+    # crop intervals can not be used with interval data types
+    if metadata.start_column is not None or metadata.end_column is not None:
+        assert metadata.dsubtype != DataSubtype.INTERVAL, (
+            "Data Asset Onboarding Error: Interval data types can not be cropped. Remove start and end columns."
+        )
 
     # if files are stored locally, create a folder to store it
     media_folder = Path(".")
@@ -92,218 +219,84 @@ def run(metadata: MetaData, paths: List, folder: Path, batch_size: int = 100) ->
         media_folder = Path(os.path.join(folder, "data"))
         media_folder.mkdir(exist_ok=True)
 
+    # read only the onboarded columns of the input files
+    columns = [metadata.name, metadata.start_column, metadata.end_column]
+    columns = list(dict.fromkeys(column for column in columns if column is not None))
+
     idx = 0
-    data_column_idx, start_column_idx, end_column_idx = -1, -1, -1
-    files, batch, start_intervals, end_intervals = [], [], [], []
-    for i in tqdm(range(len(paths)), desc=f' Data "{metadata.name}" onboarding progress', position=1, leave=False):
-        path = paths[i]
-
-        if not os.path.exists(path):
-            message = f'Data Asset Onboarding Error: Local file "{path}" not found.'
-            logging.exception(message)
-            raise Exception(message)
-
-        dataframe = pd.read_csv(path)
-
-        # process medias
-        for j in tqdm(range(len(dataframe)), desc=" File onboarding progress", position=2, leave=False):
-            row = dataframe.iloc[j]
-            try:
-                media_path = row[metadata.name]
-            except Exception:
-                message = f'Data Asset Onboarding Error: Column "{metadata.name}" not found in the local file "{path}".'
-                logging.exception(message)
-                raise Exception(message)
-
-            # adding medias
-            if metadata.storage_type == StorageType.FILE:
-                if metadata.dsubtype == DataSubtype.INTERVAL:
-                    # check whether the interval is in audio, image, text and video
-                    assert metadata.dtype in [
-                        DataType.AUDIO,
-                        DataType.IMAGE,
-                        DataType.TEXT,
-                        DataType.VIDEO,
-                    ], f'Data Asset Onboarding Error: Content Intervals do not work with "{metadata.dtype}".'
-                    assert os.path.getsize(media_path) <= IMAGE_TEXT_MAX_SIZE, (
-                        f'Data Asset Onboarding Error: Local interval file "{media_path}" exceeds the size limit of 25 MB.'
-                    )
-                    _, file_extension = os.path.splitext(media_path)
-                    assert file_extension == ".json", (
-                        f'Data Asset Onboarding Error: Local interval files, such as "{media_path}", must be a JSON.'
-                    )
-                elif metadata.dtype == DataType.AUDIO:
-                    assert os.path.getsize(media_path) <= AUDIO_MAX_SIZE, (
-                        f'Data Asset Onboarding Error: Local audio file "{media_path}" exceeds the size limit of 50 MB.'
-                    )
-                elif metadata.dtype == DataType.LABEL:
-                    assert os.path.getsize(media_path) <= IMAGE_TEXT_MAX_SIZE, (
-                        f'Data Asset Onboarding Error: Local label file "{media_path}" exceeds the size limit of 25 MB.'
-                    )
-                else:
-                    assert os.path.getsize(media_path) <= IMAGE_TEXT_MAX_SIZE, (
-                        f'Data Asset Onboarding Error: Local image file "{media_path}" exceeds the size limit of 25 MB.'
-                    )
-                fname = os.path.basename(media_path)
-                new_path = os.path.join(media_folder, fname)
-                if os.path.exists(new_path) is False:
-                    shutil.copy2(media_path, new_path)
-                batch.append(fname)
-            else:
-                if metadata.storage_type == StorageType.TEXT and (
-                    str(media_path).startswith("s3://")
-                    or str(media_path).startswith("http://")
-                    or str(media_path).startswith("https://")
-                    or validators.url(media_path)
-                ):
-                    media_path = "DONOTDOWNLOAD" + str(media_path)
-                batch.append(media_path)
-
-            # crop intervals can not be used with interval data types
-            if metadata.start_column is not None or metadata.end_column is not None:
-                assert metadata.dsubtype != DataSubtype.INTERVAL, (
-                    "Data Asset Onboarding Error: Interval data types can not be cropped. Remove start and end columns."
-                )
-
-            # adding ranges to crop the media if it is the case
-            if metadata.start_column is not None:
-                try:
-                    start_intervals.append(row[metadata.start_column])
-                except Exception:
-                    message = f'Data Asset Onboarding Error: Column "{metadata.start_column}" not found.'
-                    logging.exception(message)
-                    raise Exception(message)
-
-            if metadata.end_column is not None:
-                try:
-                    end_intervals.append(row[metadata.end_column])
-                except Exception:
-                    message = f'Data Asset Onboarding Error: Column "{metadata.end_column}" not found.'
-                    logging.exception(message)
-                    raise Exception(message)
-
-            idx += 1
-            if ((idx) % batch_size) == 0:
-                batch_index = str(len(files) + 1).zfill(8)
-
-                # save index file with a list of the media files
-                index_file_name = f"{folder}/{metadata.name}-{batch_index}.csv.gz"
-
-                # if the media are stored locally, zip them and upload to s3
-                if metadata.storage_type == StorageType.FILE:
-                    # rename the folder where the media files are
-                    data_file_name = f"{folder}/{metadata.name}-{batch_index}"
-                    os.rename(media_folder, data_file_name)
-                    # rename the media path in the media folder
-                    for z, media_fname in enumerate(batch):
-                        batch[z] = os.path.join(data_file_name, media_fname)
-                    df = pd.DataFrame({metadata.name: batch})
-                    # compress the folder
-                    compressed_folder = compress_folder(data_file_name)
-                    # upload zipped medias into s3
-                    s3_compressed_folder = upload_data(
-                        compressed_folder, content_type="application/x-tar", return_download_link=False
-                    )
-                    # update index files pointing the s3 link
-                    df["@SOURCE"] = s3_compressed_folder
-                    # remove media folder
-                    shutil.rmtree(data_file_name)
-                    # remove zipped file
-                    os.remove(compressed_folder)
-                    # create media folder again
-                    media_folder = Path(os.path.join(folder, "data"))
-                    media_folder.mkdir(exist_ok=True)
-                else:
-                    df = pd.DataFrame({metadata.name: batch})
-
-                # adding indexes
-                start, end = idx - len(batch), idx
-                df["@INDEX"] = range(start, end)
-
-                # if there are start and end time ranges, save this into the index csv
-                if len(start_intervals) > 0 and len(end_intervals) > 0:
-                    if metadata.dtype == DataType.AUDIO:
-                        start_column = "@START_TIME"
-                        end_column = "@END_TIME"
-                    else:
-                        start_column = "@START"
-                        end_column = "@END"
-
-                    df[start_column] = start_intervals
-                    df[end_column] = end_intervals
-
-                    start_column_idx = df.columns.to_list().index(start_column)
-                    end_column_idx = df.columns.to_list().index(end_column)
-
-                df.to_csv(index_file_name, compression="gzip", index=False)
-                s3_link = upload_data(
-                    index_file_name, content_type="text/csv", content_encoding="gzip", return_download_link=False
-                )
-                files.append(File(path=s3_link, extension=FileType.CSV, compression="gzip"))
-                # get data column index
-                data_column_idx = df.columns.to_list().index(metadata.name)
-                # restart batch variables
-                batch, start_intervals, end_intervals = [], [], []
-
-    if len(batch) > 0:
-        batch_index = str(len(files) + 1).zfill(8)
-
-        # save index file with a list of the media files
-        index_file_name = f"{folder}/{metadata.name}-{batch_index}.csv.gz"
-
-        # if the media are stored locally, zip them and upload to s3
+    batch, start_intervals, end_intervals = [], [], []
+
+    def submit_batch() -> None:
+        nonlocal media_folder, batch, start_intervals, end_intervals
+        batch_number = uploader.submitted + 1
+        data_file_name = None
         if metadata.storage_type == StorageType.FILE:
-            # rename the folder where the media files are
-            data_file_name = f"{folder}/{metadata.name}-{batch_index}"
+            # hand the media folder over to the batch and start a new one
+            data_file_name = f"{folder}/{metadata.name}-{str(batch_number).zfill(8)}"
             os.rename(media_folder, data_file_name)
-            # rename the media path in the media folder
-            for z, media_fname in enumerate(batch):
-                batch[z] = os.path.join(data_file_name, media_fname)
-            df = pd.DataFrame({metadata.name: batch})
-            # compress the folder
-            compressed_folder = compress_folder(data_file_name)
-            # upload zipped medias into s3
-            s3_compressed_folder = upload_data(
-                compressed_folder, content_type="application/x-tar", return_download_link=False
-            )
-            # update index files pointing the s3 link
-            df["@SOURCE"] = s3_compressed_folder
-            # remove media folder
-            shutil.rmtree(data_file_name)
-            # remove zipped file
-            os.remove(compressed_folder)
-            # create media folder again
             media_folder = Path(os.path.join(folder, "data"))
             media_folder.mkdir(exist_ok=True)
-        else:
-            df = pd.DataFrame({metadata.name: batch})
-
-        # adding indexes
-        start, end = idx - len(batch), idx
-        df["@INDEX"] = range(start, end)
-
-        # if there are start and end time ranges, save this into the index csv
-        if len(start_intervals) > 0 and len(end_intervals) > 0:
-            if metadata.dtype == DataType.AUDIO:
-                start_column = "@START_TIME"
-                end_column = "@END_TIME"
-            else:
-                start_column = "@START"
-                end_column = "@END"
-
-            df[start_column] = start_intervals
-            df[end_column] = end_intervals
-
-            start_column_idx = df.columns.to_list().index(start_column)
-            end_column_idx = df.columns.to_list().index(end_column)
-
-        df.to_csv(index_file_name, compression="gzip", index=False)
-        s3_link = upload_data(
-            index_file_name, content_type="text/csv", content_encoding="gzip", return_download_link=False
+        uploader.submit(
+            _upload_batch,
+            metadata,
+            folder,
+            batch_number,
+            batch,
+            idx - len(batch),
+            start_intervals,
+            end_intervals,
+            data_file_name,
         )
-        files.append(File(path=s3_link, extension=FileType.CSV, compression="gzip"))
-        # get data column index
-        data_column_idx = df.columns.to_list().index(metadata.name)
         # restart batch variables
         batch, start_intervals, end_intervals = [], [], []
+
+    with BatchUploader(max_workers=max_workers) as uploader:
+        for i in tqdm(range(len(paths)), desc=f' Data "{metadata.name}" onboarding progress', position=1, leave=False):
+            path = paths[i]
+
+            with tqdm(desc=" File onboarding progress", position=2, leave=False, unit="row") as progress:
+                # stream the file so that only one chunk of it is held in memory at a time
+                for chunk in iter_csv_chunks(path, columns=columns, chunksize=chunksize):
+                    # extract whole columns at once instead of materializing each row
+                    media_paths = chunk[metadata.name].tolist()
+                    starts = chunk[metadata.start_column].tolist() if metadata.start_column is not None else None
+                    ends = chunk[metadata.end_column].tolist() if metadata.end_column is not None else None
+
+                    # process medias
+                    for j, media_path in enumerate(media_paths):
+                        # adding medias
+                        if metadata.storage_type == StorageType.FILE:
+                            _check_media_size(metadata, media_path)
+                            fname = os.path.basename(media_path)
+                            new_path = os.path.join(media_folder, fname)
+                            if os.path.exists(new_path) is False:
+                                shutil.copy2(media_path, new_path)
+                            batch.append(fname)
+                        else:
+                            if metadata.storage_type == StorageType.TEXT and (
+                                str(media_path).startswith("s3://")
+                                or str(media_path).startswith("http://")
+                                or str(media_path).startswith("https://")
+                                or validators.url(media_path)
+                            ):
+                                media_path = "DONOTDOWNLOAD" + str(media_path)
+                            batch.append(media_path)
+
+                        # adding ranges to crop the media if it is the case
+                        if starts is not None:
+                            start_intervals.append(starts[j])
+                        if ends is not None:
+                            end_intervals.append(ends[j])
+
+                        idx += 1
+                        if ((idx) % batch_size) == 0:
+                            submit_batch()
+                    progress.update(len(chunk))
+
+        if len(batch) > 0:
+            submit_batch()
+        results = uploader.results()
+
+    files = [result[0] for result in results]
+    data_column_idx, start_column_idx, end_column_idx = results[-1][1:] if results else (-1, -1, -1)
     return files, data_column_idx, start_column_idx, end_column_idx, idx
@@ -9,6 +9,8 @@ from aixplain.enums.file_type import FileType
 from aixplain.enums.storage_type import StorageType
 from aixplain.modules.file import File
 from aixplain.modules.metadata import MetaData
+from aixplain.processes.data_onboarding.batch_uploader import DEFAULT_UPLOAD_WORKERS, BatchUploader
+from aixplain.processes.data_onboarding.csv_reader import DEFAULT_CHUNK_SIZE, iter_csv_chunks
 from aixplain.utils.file_utils import upload_data
 from pathlib import Path
 from tqdm import tqdm
@@ -62,7 +64,37 @@ def process_text(content: str, storage_type: StorageType) -> Text:
     return text
 
 
-def run(metadata: MetaData, paths: List, folder: Path, batch_size: int = 1000) -> Tuple[List[File], int, int]:
+def _upload_batch(
+    metadata: MetaData, folder: Path, batch_number: int, texts: List[Text], start: int
+) -> Tuple[File, int]:
+    """Write one batch of texts to a gzipped index CSV and upload it.
+
+    Args:
+        metadata (MetaData): Metadata of the column being onboarded.
+        folder (Path): Local folder where the index file is written.
+        batch_number (int): 1-based position of the batch, used in the file name.
+        texts (List[Text]): Processed texts of the batch.
+        start (int): Global row index of the first text.
+
+    Returns:
+        Tuple[File, int]: The uploaded index file and the index of the data column.
+    """
+    file_name = f"{folder}/{metadata.name}-{str(batch_number).zfill(8)}.csv.gz"
+    df = pd.DataFrame({metadata.name: texts})
+    df["@INDEX"] = range(start, start + len(texts))
+    df.to_csv(file_name, compression="gzip", index=False)
+    s3_link = upload_data(file_name, content_type="text/csv", content_encoding="gzip", return_download_link=False)
+    return File(path=s3_link, extension=FileType.CSV, compression="gzip"), df.columns.to_list().index(metadata.name)
+
+
+def run(
+    metadata: MetaData,
+    paths: List,
+    folder: Path,
+    batch_size: int = 1000,
+    max_workers: int = DEFAULT_UPLOAD_WORKERS,
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[List[File], int, int]:
     """Process text files in batches and upload them to S3 with index tracking.
 
     This function processes text files (either local or from URLs) in batches,
@@ -71,14 +103,14 @@ def run(metadata: MetaData, paths: List, folder: Path, batch_size: int = 1000) -
 
     The process works as follows:
     1. For each input CSV file:
-       - Read the specified column containing text content/paths
-       - Process each text entry (read files, handle URLs)
-       - Add processed text to the current batch
-    2. After every batch_size entries:
-       - Create a new index CSV with the processed texts
-       - Add row indices for tracking
-       - Compress and upload the index to S3
-       - Start a new batch
+       - Stream the specified column containing text content/paths in chunks
+       - Process every text entry of the chunk (read files, handle URLs)
+       - Add processed texts to the current batch
+    2. After every batch_size entries, hand the batch to a background worker that:
+       - Creates a new index CSV with the processed texts
+       - Adds row indices for tracking
+       - Compresses and uploads the index to S3
+       while the next batch is being built.
 
     Args:
         metadata (MetaData): Metadata object containing information about the text data,
@@ -89,6 +121,11 @@ def run(metadata: MetaData, paths: List, folder: Path, batch_size: int = 1000) -
             temporarily stored before upload.
         batch_size (int, optional): Number of text entries to process in each batch.
             Defaults to 1000.
+        max_workers (int, optional): Number of batches compressed and uploaded
+            concurrently. Defaults to 4.
+        chunksize (int, optional): Number of rows read from an input CSV file at a
+            time, which bounds memory use regardless of the file size. Row indices
+            stay global across chunks and files. Defaults to 10000.
 
     Returns:
         Tuple[List[File], int, int]: A tuple containing:
@@ -104,62 +141,33 @@ def run(metadata: MetaData, paths: List, folder: Path, batch_size: int = 1000) -
     """
     logging.debug(f'Data Asset Onboarding: Processing "{metadata.name}".')
     idx = 0
-    data_column_idx = -1
-    files, batch = [], []
-    for i in tqdm(range(len(paths)), desc=f' Data "{metadata.name}" onboarding progress', position=1, leave=False):
-        path = paths[i]
-        try:
-            dataframe = pd.read_csv(path)
-        except Exception:
-            message = f'Data Asset Onboarding Error: Local file "{path}" not found.'
-            logging.exception(message)
-            raise Exception(message)
-
-        # process texts and labels
-        for j in tqdm(range(len(dataframe)), desc=" File onboarding progress", position=2, leave=False):
-            row = dataframe.iloc[j]
-            try:
-                text_path = row[metadata.name]
-            except Exception:
-                message = f'Data Asset Onboarding Error: Column "{metadata.name}" not found in the local file {path}.'
-                logging.exception(message)
-                raise Exception(message)
-
-            try:
-                text = process_text(text_path, metadata.storage_type)
-                batch.append(text)
-            except Exception as e:
-                logging.exception(e)
-                raise Exception(e)
-
-            idx += 1
-            if ((idx) % batch_size) == 0:
-                batch_index = str(len(files) + 1).zfill(8)
-                file_name = f"{folder}/{metadata.name}-{batch_index}.csv.gz"
-
-                df = pd.DataFrame({metadata.name: batch})
-                start, end = idx - len(batch), idx
-                df["@INDEX"] = range(start, end)
-                df.to_csv(file_name, compression="gzip", index=False)
-                s3_link = upload_data(
-                    file_name, content_type="text/csv", content_encoding="gzip", return_download_link=False
-                )
-                files.append(File(path=s3_link, extension=FileType.CSV, compression="gzip"))
-                # get data column index
-                data_column_idx = df.columns.to_list().index(metadata.name)
-                batch = []
-
-    if len(batch) > 0:
-        batch_index = str(len(files) + 1).zfill(8)
-        file_name = f"{folder}/{metadata.name}-{batch_index}.csv.gz"
-
-        df = pd.DataFrame({metadata.name: batch})
-        start, end = idx - len(batch), idx
-        df["@INDEX"] = range(start, end)
-        df.to_csv(file_name, compression="gzip", index=False)
-        s3_link = upload_data(file_name, content_type="text/csv", content_encoding="gzip", return_download_link=False)
-        files.append(File(path=s3_link, extension=FileType.CSV, compression="gzip"))
-        # get data column index
-        data_column_idx = df.columns.to_list().index(metadata.name)
-        batch = []
+    batch = []
+    with BatchUploader(max_workers=max_workers) as uploader:
+        for i in tqdm(range(len(paths)), desc=f' Data "{metadata.name}" onboarding progress', position=1, leave=False):
+            path = paths[i]
+            with tqdm(desc=" File onboarding progress", position=2, leave=False, unit="row") as progress:
+                # stream the file so that only one chunk of it is held in memory at a time
+                for chunk in iter_csv_chunks(path, columns=[metadata.name], chunksize=chunksize):
+                    try:
+                        texts = chunk[metadata.name].map(lambda content: process_text(content, metadata.storage_type))
+                    except Exception as e:
+                        logging.exception(e)
+                        raise Exception(e)
+
+                    for text in texts.tolist():
+                        batch.append(text)
+                        idx += 1
+                        if (idx % batch_size) == 0:
+                            uploader.submit(
+                                _upload_batch, metadata, folder, uploader.submitted + 1, batch, idx - len(batch)
+                            )
+                            batch = []
+                    progress.update(len(chunk))
+
+        if len(batch) > 0:
+            uploader.submit(_upload_batch, metadata, folder, uploader.submitted + 1, batch, idx - len(batch))
+        results = uploader.results()
+
+    files = [file for file, _ in results]
+    data_column_idx = results[-1][1] if results else -1
     return files, data_column_idx, idx
@@ -1,96 +1,228 @@
-"""aiXplain SDK v2 - Modern Python SDK for the aiXplain platform."""
+"""aiXplain SDK v2 - Modern Python SDK for the aiXplain platform.
 
-from .core import Aixplain
-from .rlm import RLM, RLMResult
-from .utility import Utility
-from .agent import Agent, Budget, ContextOverflowStrategy
-from .tool import Tool
-from .skill import Skill
-from .actions import Input, Inputs, Action, Actions
-from .integration import TriggerTypeSpec, TriggerEventOption, TriggerTypes
-from .trigger import Trigger, TriggerConfiguration, TriggerRepeatRule
-from .file import Resource
-from .upload_utils import FileUploader, upload_file, validate_file_for_upload
-from .inspector import Inspector
-from .session import (
-    ExecutionConfig,
-    Session,
-    SessionMessage,
-    SessionMessageAttachment,
-)
-from .meta_agents import Debugger, DebugResult
-from .agent_progress import AgentProgressTracker, ProgressFormat
-from .agent_evaluator import (
-    Eval,
-    AgentEvaluationResultsChatbot,
-    AgentEvaluationRow,
-    AgentEvaluationRun,
-    Dataset,
-    EvalCase,
-    Metric,
-    MetricResponse,
-    compare_agents_side_by_side,
-    normalize_eval_results_dataframe,
-)
-from .eval_experiment import (
-    EXPERIMENT_COMPARISON_COL_RUN_CREATED_AT,
-    EXPERIMENT_COMPARISON_COL_RUN_INDEX,
-    Experiment,
-    ExperimentLocalCache,
-    ExperimentRun,
-    ExperimentRunDiff,
-    ExperimentRunDiffCase,
-    ExperimentRunDiffCaseList,
-    default_experiment_cache_dir,
-)
-from .eval_results_display import (
-    case_comparison_html,
-    case_rows,
-    guess_compare_value_columns,
-    load_eval_csv,
-    pivot_agents_wide,
-    summarize_by_agent,
-)
-from .api_key import APIKey, APIKeyLimits, APIKeyUsageLimit, TokenType
-from .issue import IssueReporter, IssueSeverity
-from .exceptions import (
-    AixplainV2Error,
-    ResourceError,
-    APIError,
-    AixplainIssueError,
-    ValidationError,
-    TimeoutError,
-    FileUploadError,
-)
-from .enums import (
-    AuthenticationScheme,
-    FileType,
-    Function,
-    Language,
-    License,
-    AssetStatus,
-    Privacy,
-    OnboardStatus,
-    OwnershipType,
-    SortBy,
-    SortOrder,
-    ErrorHandler,
-    ResponseStatus,
-    StorageType,
-    Supplier,
-    FunctionType,
-    EvolveType,
-    CodeInterpreterModel,
-    SplittingOptions,
-    SessionStatus,
-    RunStatus,
-    MessageRole,
-    Reaction,
-    AttachmentType,
-)
+Public names are resolved lazily (PEP 562): the submodule defining a name is
+imported on first access, so ``import aixplain`` does not pay for resources
+(and heavy dependencies such as pandas) that a program never touches.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public name -> submodule (relative to this package) that defines it.
+_LAZY_ATTRIBUTES = {
+    "Aixplain": ".core",
+    "AsyncAixplain": ".core",
+    "AsyncAixplainClient": ".async_client",
+    "RLM": ".rlm",
+    "RLMResult": ".rlm",
+    "Utility": ".utility",
+    "Agent": ".agent",
+    "Budget": ".agent",
+    "ContextOverflowStrategy": ".agent",
+    "Tool": ".tool",
+    "Skill": ".skill",
+    "Input": ".actions",
+    "Inputs": ".actions",
+    "Action": ".actions",
+    "Actions": ".actions",
+    "TriggerTypeSpec": ".integration",
+    "TriggerEventOption": ".integration",
+    "TriggerTypes": ".integration",
+    "Trigger": ".trigger",
+    "TriggerConfiguration": ".trigger",
+    "TriggerRepeatRule": ".trigger",
+    "Resource": ".file",
+    "FileUploader": ".upload_utils",
+    "upload_file": ".upload_utils",
+    "validate_file_for_upload": ".upload_utils",
+    "Inspector": ".inspector",
+    "ExecutionConfig": ".session",
+    "Session": ".session",
+    "SessionMessage": ".session",
+    "SessionMessageAttachment": ".session",
+    "Debugger": ".meta_agents",
+    "DebugResult": ".meta_agents",
+    "AgentProgressTracker": ".agent_progress",
+    "ProgressFormat": ".agent_progress",
+    "AgentStreamEvent": ".agent_stream",
+    "AgentStepEvent": ".agent_stream",
+    "AgentUsageEvent": ".agent_stream",
+    "AgentResultEvent": ".agent_stream",
+    "PollManager": "..utils.poll_manager",
+    "ResourceCache": ".resource_cache",
+    "CacheStats": ".resource_cache",
+    "RLMCache": "..utils.rlm_cache",
+    "MemoryRLMCache": "..utils.rlm_cache",
+    "SQLiteRLMCache": "..utils.rlm_cache",
+    "LocalVectorIndex": "..utils.rlm_vector_index",
+    "Eval": ".agent_evaluator",
+    "AgentEvaluationResultsChatbot": ".agent_evaluator",
+    "AgentEvaluationRow": ".agent_evaluator",
+    "AgentEvaluationRun": ".agent_evaluator",
+    "Dataset": ".agent_evaluator",
+    "EvalCase": ".agent_evaluator",
+    "EvaluationCheckpoint": ".agent_evaluator",
+    "Metric": ".agent_evaluator",
+    "MetricResponse": ".agent_evaluator",
+    "compare_agents_side_by_side": ".agent_evaluator",
+    "normalize_eval_results_dataframe": ".agent_evaluator",
+    "EXPERIMENT_COMPARISON_COL_RUN_CREATED_AT": ".eval_experiment",
+    "EXPERIMENT_COMPARISON_COL_RUN_INDEX": ".eval_experiment",
+    "Experiment": ".eval_experiment",
+    "ExperimentLocalCache": ".eval_experiment",
+    "ExperimentRun": ".eval_experiment",
+    "ExperimentRunDiff": ".eval_experiment",
+    "ExperimentRunDiffCase": ".eval_experiment",
+    "ExperimentRunDiffCaseList": ".eval_experiment",
+    "default_experiment_cache_dir": ".eval_experiment",
+    "case_comparison_html": ".eval_results_display",
+    "case_rows": ".eval_results_display",
+    "guess_compare_value_columns": ".eval_results_display",
+    "load_eval_csv": ".eval_results_display",
+    "pivot_agents_wide": ".eval_results_display",
+    "summarize_by_agent": ".eval_results_display",
+    "APIKey": ".api_key",
+    "APIKeyLimits": ".api_key",
+    "APIKeyUsageLimit": ".api_key",
+    "TokenType": ".api_key",
+    "IssueReporter": ".issue",
+    "IssueSeverity": ".issue",
+    "AixplainV2Error": ".exceptions",
+    "ResourceError": ".exceptions",
+    "APIError": ".exceptions",
+    "AixplainIssueError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "TimeoutError": ".exceptions",
+    "FileUploadError": ".exceptions",
+    "AuthenticationScheme": ".enums",
+    "FileType": ".enums",
+    "Function": ".enums",
+    "Language": ".enums",
+    "License": ".enums",
+    "AssetStatus": ".enums",
+    "Privacy": ".enums",
+    "OnboardStatus": ".enums",
+    "OwnershipType": ".enums",
+    "SortBy": ".enums",
+    "SortOrder": ".enums",
+    "ErrorHandler": ".enums",
+    "ResponseStatus": ".enums",
+    "StorageType": ".enums",
+    "Supplier": ".enums",
+    "FunctionType": ".enums",
+    "EvolveType": ".enums",
+    "CodeInterpreterModel": ".enums",
+    "EmbeddingModel": ".enums",
+    "SplittingOptions": ".enums",
+    "SessionStatus": ".enums",
+    "RunStatus": ".enums",
+    "MessageRole": ".enums",
+    "Reaction": ".enums",
+    "AttachmentType": ".enums",
+}
+
+if TYPE_CHECKING:
+    from .core import Aixplain, AsyncAixplain
+    from .async_client import AsyncAixplainClient
+    from .rlm import RLM, RLMResult
+    from .utility import Utility
+    from .agent import Agent, Budget, ContextOverflowStrategy
+    from .tool import Tool
+    from .skill import Skill
+    from .actions import Input, Inputs, Action, Actions
+    from .integration import TriggerTypeSpec, TriggerEventOption, TriggerTypes
+    from .trigger import Trigger, TriggerConfiguration, TriggerRepeatRule
+    from .file import Resource
+    from .upload_utils import FileUploader, upload_file, validate_file_for_upload
+    from .inspector import Inspector
+    from .session import (
+        ExecutionConfig,
+        Session,
+        SessionMessage,
+        SessionMessageAttachment,
+    )
+    from .meta_agents import Debugger, DebugResult
+    from .agent_progress import AgentProgressTracker, ProgressFormat
+    from .agent_stream import AgentStreamEvent, AgentStepEvent, AgentUsageEvent, AgentResultEvent
+    from ..utils.poll_manager import PollManager
+    from .resource_cache import ResourceCache, CacheStats
+    from ..utils.rlm_cache import RLMCache, MemoryRLMCache, SQLiteRLMCache
+    from ..utils.rlm_vector_index import LocalVectorIndex
+    from .agent_evaluator import (
+        Eval,
+        AgentEvaluationResultsChatbot,
+        AgentEvaluationRow,
+        AgentEvaluationRun,
+        Dataset,
+        EvalCase,
+        EvaluationCheckpoint,
+        Metric,
+        MetricResponse,
+        compare_agents_side_by_side,
+        normalize_eval_results_dataframe,
+    )
+    from .eval_experiment import (
+        EXPERIMENT_COMPARISON_COL_RUN_CREATED_AT,
+        EXPERIMENT_COMPARISON_COL_RUN_INDEX,
+        Experiment,
+        ExperimentLocalCache,
+        ExperimentRun,
+        ExperimentRunDiff,
+        ExperimentRunDiffCase,
+        ExperimentRunDiffCaseList,
+        default_experiment_cache_dir,
+    )
+    from .eval_results_display import (
+        case_comparison_html,
+        case_rows,
+        guess_compare_value_columns,
+        load_eval_csv,
+        pivot_agents_wide,
+        summarize_by_agent,
+    )
+    from .api_key import APIKey, APIKeyLimits, APIKeyUsageLimit, TokenType
+    from .issue import IssueReporter, IssueSeverity
+    from .exceptions import (
+        AixplainV2Error,
+        ResourceError,
+        APIError,
+        AixplainIssueError,
+        ValidationError,
+        TimeoutError,
+        FileUploadError,
+    )
+    from .enums import (
+        AuthenticationScheme,
+        FileType,
+        Function,
+        Language,
+        License,
+        AssetStatus,
+        Privacy,
+        OnboardStatus,
+        OwnershipType,
+        SortBy,
+        SortOrder,
+        ErrorHandler,
+        ResponseStatus,
+        StorageType,
+        Supplier,
+        FunctionType,
+        EvolveType,
+        CodeInterpreterModel,
+        EmbeddingModel,
+        SplittingOptions,
+        SessionStatus,
+        RunStatus,
+        MessageRole,
+        Reaction,
+        AttachmentType,
+    )
 
 __all__ = [
     "Aixplain",
+    "AsyncAixplain",
+    "AsyncAixplainClient",
     "RLM",
     "RLMResult",
     "Utility",
@@ -116,12 +248,25 @@ __all__ = [
     # Progress tracking
     "AgentProgressTracker",
     "ProgressFormat",
+    "AgentStreamEvent",
+    "AgentStepEvent",
+    "AgentUsageEvent",
+    "AgentResultEvent",
+    "PollManager",
+    # Response caching
+    "ResourceCache",
+    "CacheStats",
+    "RLMCache",
+    "MemoryRLMCache",
+    "SQLiteRLMCache",
+    "LocalVectorIndex",
     # Agent evaluation
     "Eval",
     "AgentEvaluationRow",
     "AgentEvaluationRun",
     "AgentEvaluationResultsChatbot",
     "EvalCase",
+    "EvaluationCheckpoint",
     "Dataset",
     "Metric",
     "MetricResponse",
@@ -179,6 +324,7 @@ __all__ = [
     "FunctionType",
     "EvolveType",
     "CodeInterpreterModel",
+    "EmbeddingModel",
     "SplittingOptions",
     "SessionStatus",
     "RunStatus",
@@ -198,3 +344,18 @@ __all__ = [
     "TriggerEventOption",
     "TriggerTypes",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access and cache the attribute."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the lazily loaded public names alongside the loaded module globals."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
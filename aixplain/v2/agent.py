@@ -3,17 +3,21 @@
 import json
 import logging
 import re
+import time
 import warnings
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, ClassVar, List, Optional, Any, Dict, Tuple, Union, Text
+from typing import TYPE_CHECKING, ClassVar, Iterator, List, Optional, Any, Dict, Tuple, Union, Text
 from typing_extensions import Unpack, NotRequired, TypedDict, Literal
 from dataclasses_json import dataclass_json, config
 
 from pydantic import BaseModel
 
+from .agent_stream import AgentResultEvent, AgentStreamEvent, StepDeltaTracker, events_from_sse, steps_from_response
+from .decoders import dataclass_decoder
 from .enums import AssetStatus, ResponseStatus
+from .exceptions import APIError
 from .model import Model
 from .skill import Skill
 from .mixins import ToolableMixin
@@ -1033,6 +1037,180 @@ class Agent(
         """
         return super().sync_poll(self._resolve_poll_url(poll_url), **kwargs)
 
+    def run_stream(self, *args: Any, **kwargs: Unpack[AgentRunParams]) -> Iterator[AgentStreamEvent]:
+        """Run the agent and yield its progress as incremental typed events.
+
+        The run is started immediately. Progress is then read from the poll
+        URL as a server-sent event stream when the backend offers one
+        (``Accept: text/event-stream``); otherwise the poll URL is polled and
+        only new or changed steps are reported.
+
+        Args:
+            *args: Positional arguments (first arg is treated as query)
+            query: The query to run
+            progress_format: Optional progress display, as in :meth:`run`
+            **kwargs: Additional run parameters including ``timeout`` and ``wait_time``
+
+        Returns:
+            Iterator[AgentStreamEvent]: :class:`~aixplain.v2.agent_stream.AgentStepEvent`
+                and :class:`~aixplain.v2.agent_stream.AgentUsageEvent` updates, ending
+                with one :class:`~aixplain.v2.agent_stream.AgentResultEvent`.
+
+        Example:
+            >>> for event in agent.run_stream("Summarize the report"):
+            ...     if isinstance(event, AgentStepEvent) and event.completed:
+            ...         print(event.step.get("unit"))
+            ...     elif isinstance(event, AgentResultEvent):
+            ...         print(event.result.data.output)
+        """
+        if len(args) > 0:
+            kwargs["query"] = args[0]
+            args = args[1:]
+
+        if kwargs.pop("session", None) is not None:
+            raise NotImplementedError("session=… runs are not streamed yet; use agent.run(...) instead.")
+
+        try:
+            result = super().run_async(**kwargs)
+        except Exception as e:
+            self._finish_progress_tracker(e)
+            raise
+        return self._stream_run_events(result, **kwargs)
+
+    def _stream_run_events(
+        self, result: AgentRunResult, **kwargs: Unpack[AgentRunParams]
+    ) -> Iterator[AgentStreamEvent]:
+        """Yield the events of a started run, then apply ``after_run`` to its result."""
+        deltas = StepDeltaTracker()
+        try:
+            if result.completed or not result.url:
+                events = deltas.update_steps(steps_from_response(result)) + [AgentResultEvent(result=result)]
+            else:
+                events = self._iter_progress_events(result.url, deltas, **kwargs)
+            for event in events:
+                if isinstance(event, AgentResultEvent):
+                    final = event.result
+                    if getattr(result, "request_id", None) and not final.request_id:
+                        final.request_id = result.request_id
+                    if self._progress_tracker is not None:
+                        self._progress_tracker.update(final)
+                    yield AgentResultEvent(result=self._apply_after_run(final, **kwargs))
+                    return
+                if self._progress_tracker is not None:
+                    self._progress_tracker.handle_event(event)
+                yield event
+        except Exception as e:
+            self._finish_progress_tracker(e)
+            raise
+
+    def _iter_progress_events(
+        self, poll_url: str, deltas: StepDeltaTracker, **kwargs: Unpack[AgentRunParams]
+    ) -> Iterator[AgentStreamEvent]:
+        """Read progress events from an SSE stream, falling back to delta-aware polling.
+
+        The poll URL is requested with ``Accept: text/event-stream``. A backend
+        without streaming support answers with the regular JSON poll body,
+        which is used as the first polling snapshot.
+        """
+        timeout = kwargs.get("timeout", 300)
+        wait_time = max(kwargs.get("wait_time", 0.5), 0.2)
+        start_time = time.time()
+        poll_url = self._resolve_poll_url(poll_url)
+
+        snapshot = None
+        try:
+            response = self.context.client.request_stream("GET", poll_url, headers={"Accept": "text/event-stream"})
+        except APIError as e:
+            logger.debug(f"Agent progress stream unavailable ({e}); falling back to polling")
+            response = None
+
+        if response is not None:
+            try:
+                content_type = response.headers.get("Content-Type", "")
+                if "text/event-stream" in content_type:
+                    if getattr(response, "encoding", None) in (None, "ISO-8859-1"):
+                        response.encoding = "utf-8"
+                    lines = response.iter_lines(decode_unicode=True)
+                    try:
+                        for event in events_from_sse(lines, deltas, self._build_poll_result):
+                            yield event
+                            if isinstance(event, AgentResultEvent):
+                                return
+                    except OSError as e:  # requests' connection errors derive from IOError
+                        logger.debug(f"Agent progress stream interrupted ({e}); falling back to polling")
+                    else:
+                        logger.debug("Agent progress stream ended before the result; falling back to polling")
+                else:
+                    snapshot = self._build_poll_result(response.json())
+            finally:
+                response.close()
+
+        while (time.time() - start_time) < timeout:
+            if snapshot is None:
+                snapshot = self.poll(poll_url)
+            yield from deltas.update_steps(steps_from_response(snapshot))
+            if snapshot.completed:
+                yield AgentResultEvent(result=snapshot)
+                return
+            snapshot = None
+            time.sleep(wait_time)
+            if wait_time < 60:
+                wait_time *= 1.1
+
+        raise TimeoutError(f"Operation timed out after {timeout} seconds")
+
+    async def arun(self, *args: Any, **kwargs: Unpack[AgentRunParams]) -> AgentRunResult:
+        """Run the agent and wait for the result without blocking the event loop.
+
+        Async twin of :meth:`run`; requires an
+        :class:`~aixplain.v2.core.AsyncAixplain` context. Session runs are not
+        supported yet.
+
+        Args:
+            *args: Positional arguments (first arg is treated as query)
+            query: The query to run
+            **kwargs: Additional run parameters
+
+        Returns:
+            AgentRunResult: The result of the agent execution
+        """
+        if len(args) > 0:
+            kwargs["query"] = args[0]
+            args = args[1:]
+
+        if kwargs.pop("session", None) is not None:
+            raise NotImplementedError("session=… runs are sync-only for now; use agent.run(...) instead.")
+
+        return await super().arun(*args, **kwargs)
+
+    async def arun_async(self, *args: Any, **kwargs: Unpack[AgentRunParams]) -> AgentRunResult:
+        """Start an agent run without waiting for completion (async twin of :meth:`run_async`).
+
+        Args:
+            *args: Positional arguments (first arg is treated as query)
+            query: The query to run
+            **kwargs: Additional run parameters
+
+        Returns:
+            AgentRunResult: Result whose ``url`` can be passed to :meth:`async_poll`.
+        """
+        if len(args) > 0:
+            kwargs["query"] = args[0]
+            args = args[1:]
+
+        if kwargs.pop("session", None) is not None:
+            raise NotImplementedError("session=… runs are sync-only for now; use agent.run(...) instead.")
+
+        return await super().arun_async(**kwargs)
+
+    async def apoll(self, poll_url: str) -> AgentRunResult:
+        """Poll once for an agent execution; accepts a full URL or an execution ID."""
+        return await super().apoll(self._resolve_poll_url(poll_url))
+
+    async def async_poll(self, poll_url: str, **kwargs: Unpack[AgentRunParams]) -> AgentRunResult:
+        """Poll until an agent execution completes; accepts a full URL or an execution ID."""
+        return await super().async_poll(self._resolve_poll_url(poll_url), **kwargs)
+
     def _validate_expected_output(self) -> None:
         if self.output_format == OutputFormat.JSON.value:
             # JSON output requires an explicit schema; the empty default is not enough.
@@ -2225,7 +2403,9 @@ _dataclass_json_agent_from_dict = Agent.from_dict.__func__
 
 def _agent_from_dict(cls, kvs: Any, *, infer_missing: bool = False) -> "Agent":
     kvs = cls._fold_legacy_max_iterations(kvs)
-    return _dataclass_json_agent_from_dict(cls, kvs, infer_missing=infer_missing)
+    if infer_missing:
+        return _dataclass_json_agent_from_dict(cls, kvs, infer_missing=infer_missing)
+    return dataclass_decoder(cls)(kvs)
 
 
 Agent.from_dict = classmethod(_agent_from_dict)
@@ -13,10 +13,26 @@ import ast
 import enum
 import json
 import re
+import threading
 import warnings
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 if TYPE_CHECKING:
     from .eval_experiment import Experiment, ExperimentLocalCache
@@ -25,6 +41,7 @@ import pandas as pd
 from dataclasses_json import config as dj_config, dataclass_json
 
 from .agent import Agent, AgentResponseData, AgentRunResult
+from .enums import AssetStatus
 from .eval_results_display import _is_metric_data_column
 from .model import Model, ModelResult
 from .exceptions import AixplainV2Error, ValidationError, create_operation_failed_error
@@ -1208,6 +1225,11 @@ class AgentEvaluationRow:
     step's ``unit``, joined as ``type:name``, or breakdown keys from
     ``execution_stats`` when steps are absent) to ``run_time``, ``used_credits``,
     and ``n_steps`` aggregates.
+
+    ``agent_key`` identifies the agent within its evaluation: the agent id, or
+    ``#<position>`` in the evaluated agents when it has no (unique) id.
+    :class:`EvaluationCheckpoint` keys rows by it, so agents sharing a name
+    stay apart.
     """
 
     case_index: int
@@ -1230,6 +1252,7 @@ class AgentEvaluationRow:
     assets_used: List[str] = field(default_factory=list)
     total_tool_calls: int = 0
     per_asset_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    agent_key: Optional[str] = None
 
     def metric_value(self, tool_prefix: str, key: str) -> Any:
         """Return ``metrics[tool_prefix][key]`` when present, else ``None``."""
@@ -3051,6 +3074,134 @@ def _record_metrics_skipped_for_agent_failure(metrics: Dict[str, Dict[str, Any]]
     b["metric_skip_reason"] = "agent_run_failed"
 
 
+def _agent_concurrency_limits(
+    agents: Sequence[Agent], per_agent_concurrency: Optional[Union[int, Mapping[str, int]]]
+) -> Dict[int, threading.Semaphore]:
+    """Build one semaphore per rate-limited agent, keyed by ``id(agent)``."""
+    limits: Dict[int, threading.Semaphore] = {}
+    if per_agent_concurrency is None:
+        return limits
+    for agent in agents:
+        if isinstance(per_agent_concurrency, Mapping):
+            limit = per_agent_concurrency.get(getattr(agent, "name", None) or "")
+            if limit is None:
+                limit = per_agent_concurrency.get(getattr(agent, "id", None) or "")
+        else:
+            limit = per_agent_concurrency
+        if limit is not None:
+            if limit < 1:
+                raise ValueError("per_agent_concurrency limits must be at least 1")
+            limits[id(agent)] = threading.Semaphore(limit)
+    return limits
+
+
+def _agent_keys(agents: Sequence[Agent]) -> List[str]:
+    """Checkpoint key of each agent: its id, or ``#<position>`` when missing or shared."""
+    ids = [getattr(agent, "id", None) for agent in agents]
+    ids = [agent_id if isinstance(agent_id, str) and agent_id else None for agent_id in ids]
+    return [
+        agent_id if agent_id is not None and ids.count(agent_id) == 1 else f"#{position}"
+        for position, agent_id in enumerate(ids)
+    ]
+
+
+def _save_modified_drafts(agents: Sequence[Agent]) -> None:
+    """Save modified draft agents once, before their runs share them across threads.
+
+    ``Agent.before_run`` auto-saves a modified draft on every call; concurrent
+    runs of an agent that was never saved would each create a new draft.
+    Agents with unsaved tools or sub-agents are left for ``run`` to reject.
+    """
+    for agent in agents:
+        if not isinstance(agent, Agent) or agent.status not in (AssetStatus.DRAFT, None) or not agent.is_modified:
+            continue
+        try:
+            agent._validate_run_dependencies()
+        except ValueError:
+            continue
+        agent.save(as_draft=True)
+
+
+def _metric_needs_run(row: AgentEvaluationRow, prefix: str) -> bool:
+    """Whether a metric has no usable result on a checkpointed row."""
+    bucket = row.metrics.get(prefix)
+    return not bucket or bucket.get("metric_status") in ("FAILED", "SKIPPED")
+
+
+def _pending_metric_indices(row: AgentEvaluationRow, metrics_list: Sequence[Metric]) -> List[int]:
+    """Indices of the metrics that still have to run for a checkpointed row."""
+    return [
+        metric_index
+        for metric_index, metric in enumerate(metrics_list)
+        if _metric_needs_run(row, _metric_prefix(metric, metric_index))
+    ]
+
+
+def _row_to_checkpoint_record(row: AgentEvaluationRow) -> Dict[str, Any]:
+    """JSON-ready dict of every row field (``agent_response`` via ``to_dict`` when available)."""
+    record = {f.name: getattr(row, f.name) for f in fields(row)}
+    response = row.agent_response
+    if hasattr(response, "to_dict"):
+        record["agent_response"] = response.to_dict()
+    return record
+
+
+def _row_from_checkpoint_record(record: Dict[str, Any]) -> AgentEvaluationRow:
+    """Inverse of :func:`_row_to_checkpoint_record`."""
+    names = {f.name for f in fields(AgentEvaluationRow)}
+    values = {k: v for k, v in record.items() if k in names}
+    response = values.get("agent_response")
+    if isinstance(response, dict):
+        values["agent_response"] = AgentResponseData.from_dict(response)
+    return AgentEvaluationRow(**values)
+
+
+class EvaluationCheckpoint:
+    """Append-only JSONL log of the rows finished by :meth:`Eval.evaluate`.
+
+    Each line holds one :class:`AgentEvaluationRow`; a later line for the same
+    ``(case_index, agent_key)`` supersedes earlier ones. Lines are written as
+    each cell finishes, so an interrupted evaluation only loses the cells that
+    were still in flight.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Use the log file at ``path`` (created on the first append)."""
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def append(self, row: AgentEvaluationRow) -> None:
+        """Write ``row`` as one line at the end of the log."""
+        line = json.dumps(_row_to_checkpoint_record(row), default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+                fh.flush()
+
+    def load(self) -> Dict[Tuple[int, Optional[str]], AgentEvaluationRow]:
+        """Return the latest logged row per ``(case_index, agent_key)``.
+
+        Unreadable lines (for example one cut short by a crash) are skipped.
+        """
+        rows: Dict[Tuple[int, Optional[str]], AgentEvaluationRow] = {}
+        if not self.path.is_file():
+            return rows
+        with self._lock, self.path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    row = _row_from_checkpoint_record(json.loads(line))
+                except (ValueError, TypeError, KeyError):
+                    continue
+                rows[(row.case_index, row.agent_key)] = row
+        return rows
+
+    def clear(self) -> None:
+        """Delete the log file."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+
 def _normalize_agents(agents: Union[Agent, Sequence[Agent]]) -> List[Agent]:
     if isinstance(agents, Agent):
         return [agents]
@@ -3370,6 +3521,11 @@ class Eval:
         agents: Union[Agent, Sequence[Agent]],
         dataset: Dataset,
         metrics: Optional[Sequence[Metric]] = None,
+        *,
+        max_concurrency: int = 1,
+        per_agent_concurrency: Optional[Union[int, Mapping[str, int]]] = None,
+        checkpoint: Optional[Union[str, Path, EvaluationCheckpoint]] = None,
+        resume: bool = False,
         **agent_run_kwargs: Any,
     ) -> AgentEvaluationRun:
         """Execute all cases against all agents and build a structured result.
@@ -3380,88 +3536,256 @@ class Eval:
             metrics: Optional sequence of :class:`Metric` instances. When a
                 tool sets :attr:`Metric.threshold`, each successful metric row
                 includes ``metric_pass`` (boolean) from the score and threshold.
-            **agent_run_kwargs: Forwarded to each ``agent.run`` call.
+            max_concurrency: Maximum number of agent runs (and, separately, metric
+                calls) in flight at once. ``1`` (default) evaluates sequentially.
+            per_agent_concurrency: Cap on concurrent runs of each agent, either one
+                limit for every agent or a mapping from agent name or id to its
+                limit (agents not in the mapping are only bound by ``max_concurrency``).
+            checkpoint: Path of an :class:`EvaluationCheckpoint` log (or the log
+                itself) that each row is appended to as soon as it finishes.
+                Without ``resume`` any existing log is discarded first.
+            resume: Reuse the rows already in ``checkpoint``: a (case, agent) whose
+                agent run succeeded is not run again, and only its missing or
+                failed metrics are measured on the logged agent response.
+            **agent_run_kwargs: Forwarded to each ``agent.run`` call. With
+                ``max_concurrency > 1`` each agent is shared by its concurrent
+                runs: modified drafts are saved once up front, and the
+                per-run ``progress_format`` display is not available.
 
         Returns:
             :class:`AgentEvaluationRun` with one :class:`AgentEvaluationRow` per
-            (case, agent). Agent or metric failures are recorded per row instead of
-            aborting the batch. Empty ``dataset.cases`` yields an empty run.
+            (case, agent), ordered by case then agent regardless of concurrency.
+            Agent or metric failures are recorded per row instead of aborting the
+            batch. Empty ``dataset.cases`` yields an empty run.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is below 1, ``resume`` is set
+                without a ``checkpoint``, or ``progress_format`` is passed to
+                concurrent runs.
         """
-        out_rows: List[AgentEvaluationRow] = []
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if resume and checkpoint is None:
+            raise ValueError("resume=True requires a checkpoint")
         metrics_list: List[Metric] = list(metrics) if metrics is not None else []
         agents_list: List[Agent] = _normalize_agents(agents)
+        keyed_agents = list(zip(agents_list, _agent_keys(agents_list)))
+        cells = [
+            (case_index, case, agent, agent_key)
+            for case_index, case in enumerate(dataset.cases)
+            for agent, agent_key in keyed_agents
+        ]
+        concurrent = max_concurrency > 1 and len(cells) > 1
+        if concurrent:
+            # The progress display lives on the agent instance, which concurrent runs share.
+            if agent_run_kwargs.get("progress_format") is not None:
+                raise ValueError("progress_format is not supported with max_concurrency > 1")
+            _save_modified_drafts(agents_list)
+
+        log: Optional[EvaluationCheckpoint] = None
+        finished: Dict[Tuple[int, Optional[str]], AgentEvaluationRow] = {}
+        if checkpoint is not None:
+            log = checkpoint if isinstance(checkpoint, EvaluationCheckpoint) else EvaluationCheckpoint(checkpoint)
+            if resume:
+                finished = log.load()
+            else:
+                log.clear()
+
+        def run_cell(
+            case_index: int,
+            case: EvalCase,
+            agent: Agent,
+            agent_key: str,
+            agent_slots: Optional[threading.Semaphore] = None,
+            metric_pool: Optional[ThreadPoolExecutor] = None,
+        ) -> AgentEvaluationRow:
+            prior = finished.get((case_index, agent_key))
+            pending: Optional[Set[int]] = None
+            if prior is not None and not prior.agent_run_failed and prior.query == case.query:
+                pending = set(_pending_metric_indices(prior, metrics_list))
+                if not pending:
+                    return prior
+                if prior.agent_response is None:
+                    prior, pending = None, None
+            else:
+                prior = None
+            row = self._evaluate_cell(
+                case_index,
+                case,
+                agent,
+                metrics_list,
+                agent_run_kwargs,
+                agent_slots,
+                metric_pool,
+                prior=prior,
+                metric_indices=pending,
+                agent_key=agent_key,
+            )
+            if log is not None:
+                log.append(row)
+            return row
+
+        if not concurrent:
+            out_rows = [run_cell(case_index, case, agent, agent_key) for case_index, case, agent, agent_key in cells]
+            return AgentEvaluationRun(rows=out_rows)
+
+        limits = _agent_concurrency_limits(agents_list, per_agent_concurrency)
+        # Separate pools: a run worker waiting on its metrics never blocks a metric worker
+        run_pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="aixplain-eval")
+        metric_pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="aixplain-eval-metric")
+        with run_pool, metric_pool:
+            futures = [
+                run_pool.submit(run_cell, case_index, case, agent, agent_key, limits.get(id(agent)), metric_pool)
+                for case_index, case, agent, agent_key in cells
+            ]
+            out_rows = [future.result() for future in futures]
+        return AgentEvaluationRun(rows=out_rows)
 
-        for case_index, case in enumerate(dataset.cases):
-            for agent in agents_list:
-                case_metadata = dict(case.metadata) if case.metadata else {}
-                metrics_by_prefix: Dict[str, Dict[str, Any]] = {}
-                result: Optional[AgentRunResult] = None
-                try:
+    @staticmethod
+    def _evaluate_cell(
+        case_index: int,
+        case: EvalCase,
+        agent: Agent,
+        metrics_list: List[Metric],
+        agent_run_kwargs: Dict[str, Any],
+        agent_slots: Optional[threading.Semaphore] = None,
+        metric_pool: Optional[ThreadPoolExecutor] = None,
+        prior: Optional[AgentEvaluationRow] = None,
+        metric_indices: Optional[Set[int]] = None,
+        agent_key: Optional[str] = None,
+    ) -> AgentEvaluationRow:
+        """Run one (case, agent) pair and its metrics into an :class:`AgentEvaluationRow`.
+
+        Args:
+            case_index: Position of ``case`` in the dataset.
+            case: The evaluation case.
+            agent: The agent to run.
+            metrics_list: Metric tools to run on the agent response.
+            agent_run_kwargs: Forwarded to ``agent.run``.
+            agent_slots: Per-agent concurrency limit held while the agent runs.
+            metric_pool: Pool to run the metrics on concurrently; sequential when omitted.
+            prior: Checkpointed row whose successful agent run is reused instead of
+                calling ``agent.run`` again.
+            metric_indices: Indices into ``metrics_list`` to measure; all when omitted.
+            agent_key: Identity of ``agent`` in this evaluation, stored on the row.
+        """
+        case_metadata = dict(case.metadata) if case.metadata else {}
+        if prior is not None:
+            row = replace(
+                prior,
+                reference=case.reference,
+                case_metadata=case_metadata,
+                metrics={prefix: dict(bucket) for prefix, bucket in prior.metrics.items()},
+            )
+            Eval._measure_metrics(row, prior.agent_response, metrics_list, metric_pool, metric_indices)
+            return row
+
+        metrics_by_prefix: Dict[str, Dict[str, Any]] = {}
+        try:
+            if agent_slots is not None:
+                with agent_slots:
                     result = agent.run(case.query, **agent_run_kwargs)
-                except Exception as exc:
-                    out_rows.append(
-                        AgentEvaluationRow(
-                            case_index=case_index,
-                            query=case.query,
-                            reference=case.reference,
-                            agent_name=getattr(agent, "name", None),
-                            output=None,
-                            agent_response=None,
-                            status="FAILED",
-                            completed=False,
-                            error_message=_eval_exception_message(exc),
-                            run_time=0.0,
-                            used_credits=0.0,
-                            agent_run_failed=True,
-                            agent_error_type=type(exc).__name__,
-                            agent_error_details=_eval_agent_error_details(exc),
-                            case_metadata=case_metadata,
-                            metrics=metrics_by_prefix,
-                            request_id=None,
-                            assets_used=[],
-                            total_tool_calls=0,
-                            per_asset_stats={},
-                        )
-                    )
-                    for metric_index, metric in enumerate(metrics_list):
-                        prefix = _metric_prefix(metric, metric_index)
-                        _record_metrics_skipped_for_agent_failure(metrics_by_prefix, prefix)
-                    continue
+            else:
+                result = agent.run(case.query, **agent_run_kwargs)
+        except Exception as exc:
+            for metric_index, metric in enumerate(metrics_list):
+                prefix = _metric_prefix(metric, metric_index)
+                _record_metrics_skipped_for_agent_failure(metrics_by_prefix, prefix)
+            return AgentEvaluationRow(
+                case_index=case_index,
+                query=case.query,
+                reference=case.reference,
+                agent_name=getattr(agent, "name", None),
+                output=None,
+                agent_response=None,
+                status="FAILED",
+                completed=False,
+                error_message=_eval_exception_message(exc),
+                run_time=0.0,
+                used_credits=0.0,
+                agent_run_failed=True,
+                agent_error_type=type(exc).__name__,
+                agent_error_details=_eval_agent_error_details(exc),
+                case_metadata=case_metadata,
+                metrics=metrics_by_prefix,
+                request_id=None,
+                assets_used=[],
+                total_tool_calls=0,
+                per_asset_stats={},
+                agent_key=agent_key,
+            )
 
-                assert result is not None
-                output = _extract_agent_output(result)
-                ex_insights = _extract_execution_insights(result)
-                out_rows.append(
-                    AgentEvaluationRow(
-                        case_index=case_index,
-                        query=case.query,
-                        reference=case.reference,
-                        agent_name=getattr(agent, "name", None),
-                        output=output,
-                        agent_response=result.data,
-                        status=result.status,
-                        completed=result.completed,
-                        error_message=result.error_message,
-                        run_time=result.run_time,
-                        used_credits=result.used_credits,
-                        agent_run_failed=False,
-                        agent_error_type=None,
-                        agent_error_details=None,
-                        case_metadata=case_metadata,
-                        metrics=metrics_by_prefix,
-                        request_id=ex_insights["request_id"],
-                        assets_used=ex_insights["assets_used"],
-                        total_tool_calls=ex_insights["total_tool_calls"],
-                        per_asset_stats=ex_insights["per_asset_stats"],
-                    )
-                )
-                current = out_rows[-1]
-                for metric_index, metric in enumerate(metrics_list):
-                    prefix = _metric_prefix(metric, metric_index)
-                    try:
-                        metric_result = metric.measure(result.data)
-                        _merge_metric_columns(current.metrics, prefix, metric_result, metric)
-                    except Exception as exc:
-                        _record_metric_failure(current.metrics, prefix, exc)
+        output = _extract_agent_output(result)
+        ex_insights = _extract_execution_insights(result)
+        row = AgentEvaluationRow(
+            case_index=case_index,
+            query=case.query,
+            reference=case.reference,
+            agent_name=getattr(agent, "name", None),
+            output=output,
+            agent_response=result.data,
+            status=result.status,
+            completed=result.completed,
+            error_message=result.error_message,
+            run_time=result.run_time,
+            used_credits=result.used_credits,
+            agent_run_failed=False,
+            agent_error_type=None,
+            agent_error_details=None,
+            case_metadata=case_metadata,
+            metrics=metrics_by_prefix,
+            request_id=ex_insights["request_id"],
+            assets_used=ex_insights["assets_used"],
+            total_tool_calls=ex_insights["total_tool_calls"],
+            per_asset_stats=ex_insights["per_asset_stats"],
+            agent_key=agent_key,
+        )
+        Eval._measure_metrics(row, result.data, metrics_list, metric_pool, metric_indices)
+        return row
 
-        return AgentEvaluationRun(rows=out_rows)
+    @staticmethod
+    def _measure_metrics(
+        row: AgentEvaluationRow,
+        agent_response: Any,
+        metrics_list: List[Metric],
+        metric_pool: Optional[ThreadPoolExecutor] = None,
+        metric_indices: Optional[Set[int]] = None,
+    ) -> None:
+        """Run metrics on ``agent_response`` and merge their results into ``row.metrics``.
+
+        Args:
+            row: Row whose metric buckets are filled in.
+            agent_response: Agent response data passed to :meth:`Metric.measure`.
+            metrics_list: All metric tools of the evaluation (their position sets the prefix).
+            metric_pool: Pool to run the metrics on concurrently; sequential when omitted.
+            metric_indices: Indices into ``metrics_list`` to run; all when omitted.
+        """
+        selected = [
+            (metric_index, metric)
+            for metric_index, metric in enumerate(metrics_list)
+            if metric_indices is None or metric_index in metric_indices
+        ]
+
+        def measure(metric: Metric) -> Union[MetricResponse, Exception]:
+            try:
+                return metric.measure(agent_response)
+            except Exception as exc:
+                return exc
+
+        to_run = [metric for _, metric in selected]
+        if metric_pool is not None and len(to_run) > 1:
+            outcomes = list(metric_pool.map(measure, to_run))
+        else:
+            outcomes = [measure(metric) for metric in to_run]
+        # Merge in metric order so bucket contents do not depend on completion order
+        for (metric_index, metric), outcome in zip(selected, outcomes):
+            prefix = _metric_prefix(metric, metric_index)
+            # A rerun replaces the previous attempt rather than merging into it
+            row.metrics.pop(prefix, None)
+            if isinstance(outcome, Exception):
+                _record_metric_failure(row.metrics, prefix, outcome)
+                continue
+            try:
+                _merge_metric_columns(row.metrics, prefix, outcome, metric)
+            except Exception as exc:
+                _record_metric_failure(row.metrics, prefix, exc)
@@ -16,7 +16,9 @@ import sys
 import time
 import threading
 from enum import Enum
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, Iterator, List, Optional, Callable
+
+from ..utils.step_index import StepDelta, StepIndex
 
 
 # Internal flag to use legacy time format (MM:SS.cc always)
@@ -107,6 +109,8 @@ class AgentProgressTracker:
         # Tracking state
         self._seen_steps: Dict[str, Dict] = {}
         self._first_seen: Dict[str, float] = {}
+        self._step_index = StepIndex()  # Raw steps seen so far, keyed by step id
+        self._display_steps: List[Dict] = []  # Normalized steps, updated only where they changed
         self._poll_count = 0
         self._total_start_time: Optional[float] = None
         self._total_credits = 0.0
@@ -162,6 +166,31 @@ class AgentProgressTracker:
         Returns:
             List of normalized step dictionaries
         """
+        steps = self._raw_steps(response)
+        if not steps:
+            return []
+
+        # Normalize steps with unique IDs
+        normalized = []
+        for i, s in enumerate(steps):
+            step = dict(s) if isinstance(s, dict) else s
+            sid = step.get("id") or step.get("step_id") or f"idx-{i}"
+            step["_progress_id"] = sid
+            normalized.append(step)
+        return normalized
+
+    def _raw_steps(self, response: Any) -> Optional[List]:
+        """Return the un-normalized step list of a poll response.
+
+        The raw poll body (``_raw_data``) is read directly when present so a
+        poll does not pay for serializing the whole result with ``to_dict``.
+        """
+        raw_data = getattr(response, "_raw_data", None)
+        if isinstance(raw_data, dict) and isinstance(raw_data.get("data"), dict):
+            steps = raw_data["data"].get("steps")
+            if steps is not None:
+                return steps
+
         raw = {}
         if hasattr(response, "to_dict"):
             try:
@@ -187,17 +216,7 @@ class AgentProgressTracker:
         if steps is None and hasattr(response, "steps"):
             steps = response.steps
 
-        if not steps:
-            return []
-
-        # Normalize steps with unique IDs
-        normalized = []
-        for i, s in enumerate(steps):
-            step = dict(s) if isinstance(s, dict) else s
-            sid = step.get("id") or step.get("step_id") or f"idx-{i}"
-            step["_progress_id"] = sid
-            normalized.append(step)
-        return normalized
+        return steps
 
     def _format_elapsed(self, seconds: Optional[float]) -> str:
         """Format elapsed time as MM:SS.cc."""
@@ -461,7 +480,7 @@ class AgentProgressTracker:
             if self._format == ProgressFormat.STATUS:
                 self._refresh_status_display(steps)
             elif self._format == ProgressFormat.LOGS:
-                self._refresh_logs_display(steps)
+                self._refresh_logs_display(steps, data.get("start", 0))
 
             time.sleep(self.DISPLAY_REFRESH_RATE)
 
@@ -513,9 +532,10 @@ class AgentProgressTracker:
         print(f"\r{status_line}", end="", flush=True)
         self._status_lines_count = current_len
 
-    def _refresh_logs_display(self, steps: List[Dict]) -> None:
-        """Refresh logs mode display (update running step spinners)."""
-        for idx, step in enumerate(steps):
+    def _refresh_logs_display(self, steps: List[Dict], start: int = 0) -> None:
+        """Refresh logs mode display (update running step spinners from step ``start`` on)."""
+        for idx in range(start, len(steps)):
+            step = steps[idx]
             sid = step.get("_progress_id")
             has_output = step.get("output")
 
@@ -673,10 +693,14 @@ class AgentProgressTracker:
         # Reset tracking state
         self._seen_steps = {}
         self._first_seen = {}
+        self._step_index = StepIndex()
+        self._display_steps = []
         self._poll_count = 0
         self._total_start_time = self._now()
         self._total_credits = 0.0
         self._total_api_calls = 0
+        self._total_input_tokens = 0
+        self._total_output_tokens = 0
         self._printed_events = {}
         self._printed_thoughts = {}
         self._status_lines_count = 0
@@ -697,43 +721,91 @@ class AgentProgressTracker:
             self._display_thread = threading.Thread(target=self._display_refresh_loop, daemon=True)
             self._display_thread.start()
 
+    @staticmethod
+    def _step_metrics(step: Optional[Dict]) -> tuple:
+        """Return ``(credits, api_calls, input_tokens, output_tokens)`` used by one step."""
+        if not step:
+            return 0.0, 0, 0, 0
+        credits = float(step.get("used_credits") or step.get("usedCredits") or 0)
+        api_calls = int(step.get("api_calls") or 0)
+        tokens = []
+        for key in ("input_tokens", "output_tokens"):
+            try:
+                tokens.append(int(step.get(key) or 0))
+            except (ValueError, TypeError):
+                tokens.append(0)
+        return credits, api_calls, tokens[0], tokens[1]
+
+    def _account_step(self, previous: Optional[Dict], step: Dict) -> None:
+        """Record ``step`` and replace the metrics of its ``previous`` version in the totals."""
+        sid = step.get("_progress_id")
+        if sid not in self._first_seen:
+            self._first_seen[sid] = self._now()
+        self._seen_steps[sid] = step
+
+        old = self._step_metrics(previous)
+        new = self._step_metrics(step)
+        self._total_credits += new[0] - old[0]
+        self._total_api_calls += new[1] - old[1]
+        self._total_input_tokens += new[2] - old[2]
+        self._total_output_tokens += new[3] - old[3]
+
     def _update_metrics(self, steps: List[Dict]) -> None:
         """Update tracking metrics from steps data."""
         self._total_credits = 0.0
         self._total_api_calls = 0
         self._total_input_tokens = 0
         self._total_output_tokens = 0
-        for idx, s in enumerate(steps):
-            sid = s.get("_progress_id")
-            if sid not in self._first_seen:
-                self._first_seen[sid] = self._now()
-            self._seen_steps[sid] = s
-
-            credits = s.get("used_credits") or s.get("usedCredits") or 0
-            if credits:
-                self._total_credits += float(credits)
-
-            api_calls = s.get("api_calls") or 0
-            if api_calls:
-                self._total_api_calls += int(api_calls)
-
-            input_tokens = s.get("input_tokens")
-            if input_tokens is not None:
-                try:
-                    self._total_input_tokens += int(input_tokens)
-                except (ValueError, TypeError):
-                    pass
+        for s in steps:
+            self._account_step(None, s)
 
-            output_tokens = s.get("output_tokens")
-            if output_tokens is not None:
-                try:
-                    self._total_output_tokens += int(output_tokens)
-                except (ValueError, TypeError):
-                    pass
+    def iter_step_deltas(self, response: Any) -> Iterator[StepDelta]:
+        """Yield the steps of ``response`` that are new or changed since the last update.
 
-    def _display_logs_format(self, steps: List[Dict]) -> None:
-        """Handle display for LOGS format (event timeline)."""
-        for idx, step in enumerate(steps):
+        Steps are indexed by id; finished steps are not compared again, so the
+        work per poll grows with the number of new or running steps rather
+        than with the length of the run. Metrics and the display state are
+        updated for every yielded delta.
+
+        Args:
+            response: Poll response from agent execution
+
+        Yields:
+            StepDelta: New or changed steps, in execution order
+        """
+        for delta in self._step_index.iter_deltas(self._raw_steps(response)):
+            self._apply_delta(delta)
+            yield delta
+
+    def _apply_delta(self, delta: StepDelta) -> None:
+        """Normalize a changed step into the display list and update metrics."""
+        step = dict(delta.step)
+        step["_progress_id"] = delta.step_id
+        previous = None
+        if delta.index < len(self._display_steps):
+            previous = self._display_steps[delta.index]
+            self._display_steps[delta.index] = step
+        else:
+            while len(self._display_steps) < delta.index:
+                self._display_steps.append({"_progress_id": f"idx-{len(self._display_steps)}"})
+            self._display_steps.append(step)
+        self._account_step(previous, step)
+
+    def _apply_response(self, response: Any) -> Optional[int]:
+        """Fold the changed steps of ``response`` into the tracker state.
+
+        Returns:
+            Index of the first step that may need redrawing, or None if no step was seen yet
+        """
+        start = self._step_index.stable
+        for _ in self.iter_step_deltas(response):
+            pass
+        return start if self._display_steps else None
+
+    def _display_logs_format(self, steps: List[Dict], start: int = 0) -> None:
+        """Handle display for LOGS format (event timeline), from step ``start`` on."""
+        for idx in range(start, len(steps)):
+            step = steps[idx]
             sid = step.get("_progress_id")
             prev = self._printed_events.get(sid, {})
             has_output = step.get("output")
@@ -821,24 +893,59 @@ class AgentProgressTracker:
             return
 
         self._poll_count += 1
-        steps = self._parse_steps(response)
-
-        if not steps:
+        start = self._apply_response(response)
+        if start is None:
             return
 
-        # Update metrics
-        self._update_metrics(steps)
+        self._render(list(self._display_steps), start)
 
+    def _render(self, steps: List[Dict], start: int = 0) -> None:
+        """Publish ``steps`` to the display thread and print format-specific output.
+
+        Steps before ``start`` have finished and were already displayed.
+        """
         # Update shared display data for background thread (terminal mode)
         with self._display_lock:
-            self._current_display_data = {"steps": steps}
+            self._current_display_data = {"steps": steps, "start": start}
 
         # Handle display based on format
         if self._format == ProgressFormat.LOGS:
-            self._display_logs_format(steps)
+            self._display_logs_format(steps, start)
         elif self._format == ProgressFormat.STATUS and self._is_notebook:
             self._display_status_format_notebook(steps)
 
+    def handle_event(self, event: Any) -> None:
+        """Update progress from an incremental ``Agent.run_stream`` event.
+
+        Step events go through the same step index as polled snapshots, so
+        only the changed step is normalized; usage events overwrite the
+        running totals.
+
+        Args:
+            event: An event from :mod:`aixplain.v2.agent_stream`
+        """
+        from .agent_stream import AgentStepEvent, AgentUsageEvent
+
+        if self._format == ProgressFormat.NONE:
+            return
+
+        if isinstance(event, AgentUsageEvent):
+            self._total_input_tokens = event.input_tokens
+            self._total_output_tokens = event.output_tokens
+            self._total_credits = event.used_credits
+            self._total_api_calls = event.api_calls
+            return
+
+        if not isinstance(event, AgentStepEvent):
+            return
+
+        self._poll_count += 1
+        start = min(self._step_index.stable, event.index)
+        delta = self._step_index.upsert(event.step, event.index)
+        if delta is not None:
+            self._apply_delta(delta)
+        self._render(list(self._display_steps), start)
+
     def finish(self, response: Any) -> None:
         """Finish progress tracking and print completion (call from after_run hook).
 
@@ -897,25 +1004,16 @@ class AgentProgressTracker:
                 status = getattr(resp, "status", None)
                 status_up = (str(status) if status else "").upper()
 
-                steps = self._parse_steps(resp)
+                start = self._apply_response(resp)
+                steps = self._display_steps
 
                 if steps and self._total_start_time is None:
                     self._total_start_time = self._now()
 
                 # Update metrics and display using shared logic
-                if steps:
+                if start is not None:
                     self._poll_count += 1
-                    self._update_metrics(steps)
-
-                    # Update shared display data for background thread (terminal mode)
-                    with self._display_lock:
-                        self._current_display_data = {"steps": steps}
-
-                    # Handle display based on format
-                    if self._format == ProgressFormat.LOGS:
-                        self._display_logs_format(steps)
-                    elif self._format == ProgressFormat.STATUS and self._is_notebook:
-                        self._display_status_format_notebook(steps)
+                    self._render(list(steps), start)
 
                 # Check termination conditions
                 if status_up == terminal_success:
@@ -0,0 +1,298 @@
+"""Incremental agent execution events.
+
+:meth:`Agent.run_stream <aixplain.v2.agent.Agent.run_stream>` reports progress
+as typed events instead of full poll snapshots:
+
+- :class:`AgentStepEvent` for each step that is new or changed,
+- :class:`AgentUsageEvent` whenever the cumulative token/credit usage changes,
+- :class:`AgentResultEvent` once, with the final :class:`AgentRunResult`.
+
+When the backend answers the poll URL with ``text/event-stream`` the events are
+read from that stream as they are produced. Otherwise the run falls back to
+polling and :class:`StepDeltaTracker` turns each snapshot into the same events,
+skipping steps that were already reported as finished.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.step_index import StepIndex, step_finished, step_id
+
+logger = logging.getLogger(__name__)
+
+# SSE event names carrying a single step, a usage update, or the final poll body.
+# Any other event (including the default "message") is treated as a poll-shaped
+# snapshot so a server may also stream plain poll responses.
+STEP_EVENTS = frozenset({"step", "step_delta", "step_update"})
+USAGE_EVENTS = frozenset({"usage", "token_usage"})
+RESULT_EVENTS = frozenset({"result", "done", "complete", "completed"})
+
+
+@dataclass
+class AgentStreamEvent:
+    """Base class of the events yielded by ``Agent.run_stream``."""
+
+
+@dataclass
+class AgentStepEvent(AgentStreamEvent):
+    """A step that started or changed since the previous event.
+
+    Attributes:
+        index: Position of the step in the execution.
+        step: The step payload as sent by the backend.
+        is_new: True the first time a step is reported, False for updates.
+    """
+
+    index: int
+    step: Dict[str, Any]
+    is_new: bool = True
+
+    @property
+    def step_id(self) -> str:
+        """Stable identifier of the step (``id``, ``step_id`` or its index)."""
+        return step_id(self.step, self.index)
+
+    @property
+    def completed(self) -> bool:
+        """Whether the step has produced its output (or failed)."""
+        return step_finished(self.step)
+
+
+@dataclass
+class AgentUsageEvent(AgentStreamEvent):
+    """Cumulative resource usage of the run so far.
+
+    Attributes:
+        input_tokens: Prompt tokens consumed by all steps.
+        output_tokens: Completion tokens produced by all steps.
+        used_credits: Credits consumed by all steps.
+        api_calls: Number of API calls made by all steps.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    used_credits: float = 0.0
+    api_calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens."""
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass
+class AgentResultEvent(AgentStreamEvent):
+    """The final result of the run.
+
+    Attributes:
+        result: The completed ``AgentRunResult``.
+    """
+
+    result: Any = None
+
+
+def _to_int(value: Any) -> int:
+    """Coerce a token count to int, treating missing/invalid values as 0."""
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_float(value: Any) -> float:
+    """Coerce a credit amount to float, treating missing/invalid values as 0."""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def usage_from_steps(steps: Iterable[Dict[str, Any]]) -> AgentUsageEvent:
+    """Sum token, credit and API-call usage over ``steps``."""
+    usage = AgentUsageEvent()
+    for step in steps:
+        usage.input_tokens += _to_int(step.get("input_tokens"))
+        usage.output_tokens += _to_int(step.get("output_tokens"))
+        usage.used_credits += _to_float(step.get("used_credits") or step.get("usedCredits"))
+        usage.api_calls += _to_int(step.get("api_calls"))
+    return usage
+
+
+def usage_from_payload(payload: Dict[str, Any]) -> AgentUsageEvent:
+    """Build a usage event from a ``usage`` SSE payload (snake or camel case keys)."""
+    return AgentUsageEvent(
+        input_tokens=_to_int(payload.get("input_tokens", payload.get("inputTokens"))),
+        output_tokens=_to_int(payload.get("output_tokens", payload.get("outputTokens"))),
+        used_credits=_to_float(payload.get("used_credits", payload.get("usedCredits"))),
+        api_calls=_to_int(payload.get("api_calls", payload.get("apiCalls"))),
+    )
+
+
+def steps_from_response(response: Any) -> List[Dict[str, Any]]:
+    """Extract the raw step list from a poll body or an ``AgentRunResult``."""
+    if isinstance(response, dict):
+        data = response.get("data")
+        steps = data.get("steps") if isinstance(data, dict) else None
+        return list(steps or [])
+    data = getattr(response, "data", None)
+    if isinstance(data, dict):
+        return list(data.get("steps") or [])
+    return list(getattr(data, "steps", None) or [])
+
+
+def iter_sse_messages(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Group raw SSE lines into ``(event, data)`` messages.
+
+    Follows the event-stream format: ``data:`` lines are joined with newlines,
+    a blank line dispatches the message, lines starting with ``:`` are
+    comments (keep-alives) and the event name defaults to ``"message"``.
+
+    Args:
+        lines: Decoded lines of the response body, without line terminators.
+
+    Yields:
+        Tuple[str, str]: The event name and its data payload.
+    """
+    event = "message"
+    data: List[str] = []
+    for line in lines:
+        if line is None:
+            continue
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+            continue
+        if line.startswith(":"):
+            continue
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            event = value or "message"
+        elif name == "data":
+            data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
+class StepDeltaTracker:
+    """Turn full step snapshots or single-step updates into incremental events.
+
+    Backed by a :class:`~aixplain.utils.step_index.StepIndex`, so finished
+    steps are skipped without being compared again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty tracker."""
+        self.index = StepIndex()
+        self._totals = AgentUsageEvent()
+        self._usage: Optional[AgentUsageEvent] = None
+
+    @property
+    def steps(self) -> List[Dict[str, Any]]:
+        """Latest known version of every step, in execution order."""
+        return self.index.steps
+
+    def _usage_event(self, usage: AgentUsageEvent) -> Optional[AgentUsageEvent]:
+        """Return ``usage`` if it differs from the last reported usage."""
+        if usage == self._usage:
+            return None
+        self._usage = usage
+        return usage
+
+    def update_steps(self, steps: List[Dict[str, Any]]) -> List[AgentStreamEvent]:
+        """Diff a full step snapshot against what was already reported.
+
+        Args:
+            steps: All steps of the execution so far.
+
+        Returns:
+            List[AgentStreamEvent]: Step events for new/changed steps, followed by a
+                usage event when usage changed.
+        """
+        events: List[AgentStreamEvent] = []
+        for delta in self.index.iter_deltas(steps):
+            self._account(delta.previous, delta.step)
+            events.append(AgentStepEvent(index=delta.index, step=delta.step, is_new=delta.is_new))
+        if events:
+            usage = self._usage_event(AgentUsageEvent(**vars(self._totals)))
+            if usage is not None:
+                events.append(usage)
+        return events
+
+    def _account(self, previous: Optional[Dict[str, Any]], step: Dict[str, Any]) -> None:
+        """Replace the usage of ``previous`` with that of ``step`` in the running totals."""
+        before = usage_from_steps([previous]) if previous else AgentUsageEvent()
+        after = usage_from_steps([step])
+        self._totals.input_tokens += after.input_tokens - before.input_tokens
+        self._totals.output_tokens += after.output_tokens - before.output_tokens
+        self._totals.used_credits += after.used_credits - before.used_credits
+        self._totals.api_calls += after.api_calls - before.api_calls
+
+    def update_step(self, step: Dict[str, Any], index: Optional[int] = None) -> List[AgentStreamEvent]:
+        """Record a single step pushed by the server.
+
+        Args:
+            step: The step payload.
+            index: Its position; looked up by id (or appended) when omitted.
+
+        Returns:
+            List[AgentStreamEvent]: The step event, if the step is new or changed.
+        """
+        delta = self.index.upsert(step, index=index)
+        if delta is None:
+            return []
+        return [AgentStepEvent(index=delta.index, step=delta.step, is_new=delta.is_new)]
+
+    def update_usage(self, usage: AgentUsageEvent) -> List[AgentStreamEvent]:
+        """Record a usage update pushed by the server."""
+        event = self._usage_event(usage)
+        return [event] if event is not None else []
+
+
+def events_from_sse(
+    lines: Iterable[str],
+    deltas: StepDeltaTracker,
+    build_result: Callable[[Dict[str, Any]], Any],
+) -> Iterator[AgentStreamEvent]:
+    """Decode an agent progress event stream.
+
+    Args:
+        lines: Decoded lines of the SSE response body.
+        deltas: Tracker holding the steps reported so far.
+        build_result: Converts a poll-shaped body into an ``AgentRunResult``
+            (raises for failed runs, like polling does).
+
+    Yields:
+        AgentStreamEvent: Step, usage and result events. The stream ends after
+            the result event.
+    """
+    for event, raw in iter_sse_messages(lines):
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping non-JSON agent progress event {event!r}: {raw[:200]}")
+            continue
+        if not isinstance(payload, dict):
+            continue
+
+        if event in STEP_EVENTS:
+            step = payload.get("step", payload)
+            if isinstance(step, dict):
+                index = payload.get("index") if "step" in payload else None
+                yield from deltas.update_step(step, index=index)
+            continue
+
+        if event in USAGE_EVENTS:
+            yield from deltas.update_usage(usage_from_payload(payload))
+            continue
+
+        yield from deltas.update_steps(steps_from_response(payload))
+        if event in RESULT_EVENTS or payload.get("completed") is True:
+            yield AgentResultEvent(result=build_result(payload))
+            return
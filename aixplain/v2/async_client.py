@@ -0,0 +1,289 @@
+"""Asyncio HTTP client for the aiXplain API.
+
+Mirrors :class:`~aixplain.v2.client.AixplainClient` on top of
+``httpx.AsyncClient`` so many runs can be in flight from a single event loop
+over one pooled set of connections. ``httpx`` is an optional dependency
+(``pip install "aiXplain[async]"``) and is only imported when the client is
+constructed.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
+from urllib.parse import urljoin
+
+from ..utils.json_utils import response_json
+from ..utils.request_hooks import RequestHook, RequestHooks, emit, error_event, hooks_enabled, response_event
+from .client import (
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    DEFAULT_RETRY_STATUS_FORCELIST,
+    DEFAULT_RETRY_TOTAL,
+    TimeoutType,
+    default_timeout,
+)
+from .exceptions import APIError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+def _import_httpx() -> Any:
+    """Import httpx lazily with an actionable error when it is missing."""
+    try:
+        import httpx  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise ImportError(
+            "AsyncAixplain requires httpx. Install with: pip install httpx (or pip install 'aiXplain[async]')"
+        ) from exc
+    return httpx
+
+
+def _raise_for_response(response: Any, default_message: Optional[str] = None) -> None:
+    """Raise :class:`APIError` for a non-2xx httpx response.
+
+    Args:
+        response: The ``httpx.Response`` to check (body must already be read).
+        default_message: Message used when the body carries no error details.
+    """
+    if response.is_success:
+        return
+    error_obj = None
+    try:
+        error_obj = response_json(response)
+    except Exception as e:
+        logger.error(f"Error parsing error response: {e}")
+
+    if isinstance(error_obj, dict) and error_obj:
+        raise APIError(
+            error_obj.get("message", error_obj.get("error", default_message or response.text)),
+            status_code=error_obj.get("statusCode", response.status_code),
+            response_data=error_obj,
+            error=error_obj.get("error", response.text),
+        )
+    message = default_message or response.text
+    raise APIError(message, status_code=response.status_code, error=response.text)
+
+
+class AsyncAixplainClient:
+    """Async HTTP client for aiXplain API with connection pooling and retry support.
+
+    Retries cover transport errors (connection failures) and the configured
+    retryable status codes for idempotent-by-contract ``GET`` and ``POST``
+    requests, matching the retry policy of the synchronous client.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        aixplain_api_key: Optional[str] = None,
+        team_api_key: Optional[str] = None,
+        retry_total: int = DEFAULT_RETRY_TOTAL,
+        retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+        retry_status_forcelist: List[int] = DEFAULT_RETRY_STATUS_FORCELIST,
+        timeout: Optional[TimeoutType] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        transport: Any = None,
+        hooks: Optional[List[RequestHook]] = None,
+    ) -> None:
+        """Initialize AsyncAixplainClient with authentication, pooling and retry configuration.
+
+        Args:
+            base_url (str): The base URL for the API.
+            aixplain_api_key (str, optional): The individual API key.
+            team_api_key (str, optional): The team API key.
+            retry_total (int): Total number of retries allowed. Defaults to 5.
+            retry_backoff_factor (float): Backoff factor between retry attempts. Defaults to 0.1.
+            retry_status_forcelist (list): HTTP status codes that trigger a retry. Defaults to [500, 502, 503, 504].
+            timeout (float or (float, float) tuple, optional): Default (connect, read) timeout.
+                Defaults to the same values as the synchronous client.
+            max_connections (int): Maximum number of concurrent connections. Defaults to 100.
+            max_keepalive_connections (int): Maximum idle keep-alive connections. Defaults to 20.
+            transport (httpx.AsyncBaseTransport, optional): Custom transport, e.g. for testing.
+            hooks (list, optional): Request hooks called after each request of this
+                client, see :mod:`aixplain.utils.request_hooks`.
+        """
+        httpx = _import_httpx()
+
+        self.base_url = base_url
+        self.team_api_key = team_api_key
+        self.aixplain_api_key = aixplain_api_key
+        self.timeout: TimeoutType = timeout if timeout is not None else default_timeout()
+        self.retry_total = retry_total
+        self.retry_backoff_factor = retry_backoff_factor
+        self.retry_status_forcelist = list(retry_status_forcelist)
+        self.hooks = RequestHooks(hooks or ())
+
+        if not (self.aixplain_api_key or self.team_api_key):
+            raise ValueError("Either `aixplain_api_key` or `team_api_key` should be set")
+
+        if self.aixplain_api_key and self.team_api_key:
+            raise ValueError("Either `aixplain_api_key` or `team_api_key` should be set")
+
+        headers = {"Content-Type": "application/json"}
+        if self.aixplain_api_key:
+            headers["x-aixplain-key"] = self.aixplain_api_key
+
+        if self.team_api_key:
+            headers["x-api-key"] = self.team_api_key
+
+        self.http = httpx.AsyncClient(
+            headers=headers,
+            timeout=self._httpx_timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+
+    @staticmethod
+    def _httpx_timeout(timeout: TimeoutType) -> Any:
+        """Convert a requests-style timeout into an ``httpx.Timeout``."""
+        httpx = _import_httpx()
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def _url(self, path: str) -> str:
+        """Resolve ``path`` against the base URL unless it is already absolute."""
+        if path.startswith(("http://", "https://")):
+            return path
+        return urljoin(self.base_url, path)
+
+    def _prepare_kwargs(self, kwargs: dict) -> dict:
+        """Translate requests-style keyword arguments to their httpx equivalents."""
+        if "data" in kwargs and isinstance(kwargs["data"], (str, bytes)):
+            kwargs["content"] = kwargs.pop("data")
+        if "timeout" in kwargs:
+            kwargs["timeout"] = self._httpx_timeout(kwargs["timeout"])
+        return kwargs
+
+    async def request_raw(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Sends an HTTP request, retrying transport errors and retryable statuses.
+
+        Args:
+            method (str): HTTP method (e.g. 'GET', 'POST')
+            path (str): URL path or full URL
+            kwargs (dict, optional): Additional keyword arguments for the request
+
+        Returns:
+            httpx.Response: The response from the request
+
+        Raises:
+            APIError: If the request fails
+        """
+        httpx = _import_httpx()
+        url = self._url(path)
+        kwargs = self._prepare_kwargs(kwargs)
+        method = method.upper()
+        retryable = method in {"GET", "POST"}
+
+        logger.debug("Requesting %s %s", method, url)
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                response = await self.http.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if not retryable or attempt >= self.retry_total:
+                    if hooks_enabled(self.hooks):
+                        emit(error_event(method, url, e, started, retries=attempt), self.hooks)
+                    raise APIError(f"Request failed: {e}", status_code=0, error=str(e))
+            else:
+                if not (retryable and response.status_code in self.retry_status_forcelist) or (
+                    attempt >= self.retry_total
+                ):
+                    break
+            await asyncio.sleep(self.retry_backoff_factor * (2**attempt))
+            attempt += 1
+
+        if hooks_enabled(self.hooks):
+            emit(response_event(method, url, response, started, retries=attempt), self.hooks)
+        _raise_for_response(response)
+        return response
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> dict:
+        """Sends an HTTP request and decodes the JSON body.
+
+        Args:
+            method (str): HTTP method (e.g. 'GET', 'POST')
+            path (str): URL path
+            kwargs (dict, optional): Additional keyword arguments for the request
+
+        Returns:
+            dict: The response from the request
+        """
+        response = await self.request_raw(method, path, **kwargs)
+        return response_json(response)
+
+    async def get(self, path: str, **kwargs: Any) -> dict:
+        """Sends an HTTP GET request.
+
+        Args:
+            path (str): URL path
+            kwargs (dict, optional): Additional keyword arguments for the request
+
+        Returns:
+            dict: The JSON response from the request
+        """
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> dict:
+        """Sends an HTTP POST request.
+
+        Args:
+            path (str): URL path
+            kwargs (dict, optional): Additional keyword arguments for the request
+
+        Returns:
+            dict: The JSON response from the request
+        """
+        return await self.request("POST", path, **kwargs)
+
+    @asynccontextmanager
+    async def request_stream(self, method: str, path: str, **kwargs: Any) -> AsyncIterator[Any]:
+        """Sends a streaming HTTP request.
+
+        Used as ``async with client.request_stream("POST", url, json=...) as response``;
+        the connection is released when the block exits.
+
+        Args:
+            method (str): HTTP method (e.g. 'GET', 'POST')
+            path (str): URL path or full URL
+            kwargs (dict, optional): Additional keyword arguments for the request
+
+        Yields:
+            httpx.Response: The streaming response (body not consumed)
+
+        Raises:
+            APIError: If the request fails
+        """
+        url = self._url(path)
+        kwargs = self._prepare_kwargs(kwargs)
+        logger.debug("Requesting streaming %s %s", method, url)
+        started = time.perf_counter()
+        async with self.http.stream(method.upper(), url, **kwargs) as response:
+            if hooks_enabled(self.hooks):
+                emit(response_event(method, url, response, started, retries=0, stream=True), self.hooks)
+            if not response.is_success:
+                await response.aread()
+                _raise_for_response(response, f"Stream request failed with status {response.status_code}")
+            yield response
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.http.aclose()
+
+    async def __aenter__(self) -> "AsyncAixplainClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - closes the connection pool."""
+        await self.aclose()
@@ -7,6 +7,8 @@ import requests
 from requests.adapters import HTTPAdapter, Retry
 from urllib.parse import urljoin
 
+from ..utils.json_utils import response_json
+from ..utils.request_hooks import RequestHook, RequestHooks, instrumented_request
 from .exceptions import APIError
 
 logger = logging.getLogger(__name__)
@@ -107,6 +109,7 @@ class AixplainClient:
         retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
         retry_status_forcelist: List[int] = DEFAULT_RETRY_STATUS_FORCELIST,
         timeout: Optional[TimeoutType] = None,
+        hooks: Optional[List[RequestHook]] = None,
     ) -> None:
         """Initialize AixplainClient with authentication and retry configuration.
 
@@ -121,9 +124,14 @@ class AixplainClient:
                 request that doesn't pass its own ``timeout=``. Defaults to
                 (AIXPLAIN_HTTP_CONNECT_TIMEOUT or 10, AIXPLAIN_HTTP_READ_TIMEOUT or 300)
                 seconds. Individual calls can still override it per request.
+            hooks (list, optional): Request hooks called with a
+                :class:`~aixplain.utils.request_hooks.RequestEvent` after each request of
+                this client, see :mod:`aixplain.utils.request_hooks`. More can be added
+                with ``client.hooks.add(hook)``.
         """
         self.base_url = base_url
         self.timeout: TimeoutType = timeout if timeout is not None else default_timeout()
+        self.hooks = RequestHooks(hooks or ())
         self.team_api_key = team_api_key
         self.aixplain_api_key = aixplain_api_key
 
@@ -165,13 +173,14 @@ class AixplainClient:
             url = urljoin(self.base_url, path)
 
         kwargs.setdefault("timeout", self.timeout)
-        logger.debug(f"Requesting {method} {url} with kwargs: {kwargs}")
-        response = self.session.request(method=method, url=url, **kwargs)
-        logger.debug(f"Response: {response.text}")
+        logger.debug("Requesting %s %s with kwargs: %s", method, url, kwargs)
+        response = instrumented_request(self.session, method, url, self.hooks, **kwargs)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response: %s", response.text)
         if not response.ok:
             error_obj = None
             try:
-                error_obj = response.json()
+                error_obj = response_json(response)
             except Exception as e:
                 logger.error(f"Error parsing error response: {e}")
 
@@ -199,7 +208,7 @@ class AixplainClient:
             dict: The response from the request
         """
         response = self.request_raw(method, path, **kwargs)
-        return response.json()
+        return response_json(response)
 
     def get(self, path: str, **kwargs: Any) -> dict:
         """Sends an HTTP GET request.
@@ -248,7 +257,7 @@ class AixplainClient:
         else:
             url = urljoin(self.base_url, path)
 
-        logger.debug(f"Requesting streaming {method} {url}")
+        logger.debug("Requesting streaming %s %s", method, url)
 
         # Enable streaming mode
         kwargs["stream"] = True
@@ -257,14 +266,14 @@ class AixplainClient:
         # as the server keeps sending (events or keep-alives).
         kwargs.setdefault("timeout", self.timeout)
 
-        response = self.session.request(method=method, url=url, **kwargs)
+        response = instrumented_request(self.session, method, url, self.hooks, **kwargs)
 
         # For streaming, we check status but don't consume the response body
         if not response.ok:
             error_obj = None
             try:
                 # Try to get error details from response
-                error_obj = response.json()
+                error_obj = response_json(response)
             except Exception as e:
                 logger.error(f"Error parsing error response: {e}")
 
@@ -1,16 +1,17 @@
 """Core module for aiXplain v2 API."""
 
+import importlib
 import os
 import sys
-from typing import Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 
 from .client import AixplainClient
+from .async_client import AsyncAixplainClient, DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS
 from .model import Model
 from .agent import Agent
 from .utility import Utility
 from .tool import Tool
 from .skill import Skill
-from .agent_evaluator import Eval as EvalClass, Metric as MetricBase
 from .integration import Integration
 from .trigger import Trigger
 from .file import Resource
@@ -19,16 +20,20 @@ from .meta_agents import Debugger
 from .api_key import APIKey
 from .session import Session
 from .rlm import RLM, RLMResult
+from .resource_cache import ResourceCache
 from .issue import IssueReporter
 from . import enums
 
+if TYPE_CHECKING:
+    from .agent_evaluator import Metric as MetricBase
+
 
 ModelType = TypeVar("ModelType", bound=Model)
 AgentType = TypeVar("AgentType", bound=Agent)
 UtilityType = TypeVar("UtilityType", bound=Utility)
 ToolType = TypeVar("ToolType", bound=Tool)
 SkillType = TypeVar("SkillType", bound=Skill)
-MetricType = TypeVar("MetricType", bound=MetricBase)
+MetricType = TypeVar("MetricType", bound="MetricBase")
 IntegrationType = TypeVar("IntegrationType", bound=Integration)
 TriggerType = TypeVar("TriggerType", bound=Trigger)
 ResourceType = TypeVar("ResourceType", bound=Resource)
@@ -40,6 +45,37 @@ RLMType = TypeVar("RLMType", bound=RLM)
 IssueReporterType = TypeVar("IssueReporterType", bound=IssueReporter)
 
 
+class _LazyResource:
+    """Class attribute whose per-context value is built on first instance access.
+
+    Used for resources whose modules pull heavy dependencies (the evaluation
+    stack needs pandas), so creating an :class:`Aixplain` context stays cheap
+    until they are actually used. Accessed on the class it is ``None``, like
+    the other resource placeholders.
+    """
+
+    def __init__(self, factory: Callable[["Aixplain"], Any]) -> None:
+        """Store the factory building the value from a context."""
+        self.factory = factory
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remember the attribute name to cache the value under."""
+        self.name = name
+
+    def __get__(self, instance: Optional["Aixplain"], owner: Optional[type] = None) -> Any:
+        """Build and cache the value on the instance, which then shadows the descriptor."""
+        if instance is None:
+            return None
+        value = self.factory(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _agent_evaluator() -> Any:
+    """Import the evaluation module on demand."""
+    return importlib.import_module(".agent_evaluator", __package__)
+
+
 class Aixplain:
     """Main class for the Aixplain API.
 
@@ -58,8 +94,10 @@ class Aixplain:
     Utility: UtilityType = None
     Tool: ToolType = None
     Skill: SkillType = None
-    Metric: MetricType = None
-    Eval: type = None
+    Metric: MetricType = _LazyResource(
+        lambda context: type("Metric", (_agent_evaluator().Metric,), {"context": context})
+    )
+    Eval: type = _LazyResource(lambda context: _agent_evaluator().Eval)
     Integration: IntegrationType = None
     Trigger: TriggerType = None
     Resource: ResourceType = None
@@ -103,6 +141,7 @@ class Aixplain:
         backend_url: Optional[str] = None,
         pipeline_url: Optional[str] = None,
         model_url: Optional[str] = None,
+        cache: Union[bool, ResourceCache, None] = None,
     ) -> None:
         """Initialize the Aixplain class.
 
@@ -111,6 +150,8 @@ class Aixplain:
             backend_url (str, optional): The backend URL. Falls back to BACKEND_URL env var.
             pipeline_url (str, optional): The pipeline execution URL. Falls back to PIPELINES_RUN_URL env var.
             model_url (str, optional): The model execution URL. Falls back to MODELS_RUN_URL env var.
+            cache (bool or ResourceCache, optional): Cache ``get``/``search`` responses of this
+                context. ``True`` uses a ``ResourceCache`` with default limits. Disabled by default.
         """
         resolved = api_key or os.getenv("TEAM_API_KEY") or os.getenv("AIXPLAIN_API_KEY") or ""
         self.api_key = resolved
@@ -128,6 +169,9 @@ class Aixplain:
         self.backend_url = backend_url or os.getenv("BACKEND_URL") or self.BACKEND_URL
         self.pipeline_url = pipeline_url or os.getenv("PIPELINES_RUN_URL") or self.PIPELINES_RUN_URL
         self.model_url = model_url or os.getenv("MODELS_RUN_URL") or self.MODELS_RUN_URL
+        if cache is True:
+            cache = ResourceCache()
+        self.cache = cache if isinstance(cache, ResourceCache) else None
 
         self.init_client()
         self.init_resources()
@@ -150,8 +194,7 @@ class Aixplain:
         self.Utility = type("Utility", (Utility,), {"context": self})
         self.Tool = type("Tool", (Tool,), {"context": self})
         self.Skill = type("Skill", (Skill,), {"context": self})
-        self.Metric = type("Metric", (MetricBase,), {"context": self})
-        self.Eval = EvalClass
+        # Metric and Eval are built on first access, see _LazyResource
         self.Integration = type("Integration", (Integration,), {"context": self})
         self.Trigger = type("Trigger", (Trigger,), {"context": self})
         self.Resource = type("Resource", (Resource,), {"context": self})
@@ -161,3 +204,67 @@ class Aixplain:
         self.Session = type("Session", (Session,), {"context": self})
         self.RLM = type("RLM", (RLM,), {"context": self})
         self.issue = IssueReporter(context=self)
+
+
+class AsyncAixplain(Aixplain):
+    """Aixplain context with an asyncio client for concurrent runs.
+
+    Resources are the same classes as on :class:`Aixplain`; besides the usual
+    blocking methods they gain ``arun`` / ``arun_async`` / ``async_poll`` (and
+    ``Model.arun_stream``) which go through a pooled ``httpx.AsyncClient``.
+    Use it as an async context manager so the pool is closed on exit.
+
+    Example:
+        >>> async with AsyncAixplain(api_key="...") as aix:
+        ...     agent = aix.Agent.get("my-agent-id")
+        ...     results = await asyncio.gather(*(agent.arun(q) for q in queries))
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        backend_url: Optional[str] = None,
+        pipeline_url: Optional[str] = None,
+        model_url: Optional[str] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        cache: Union[bool, ResourceCache, None] = None,
+    ) -> None:
+        """Initialize the AsyncAixplain class.
+
+        Args:
+            api_key (str, optional): The API key. Falls back to TEAM_API_KEY or AIXPLAIN_API_KEY env var.
+            backend_url (str, optional): The backend URL. Falls back to BACKEND_URL env var.
+            pipeline_url (str, optional): The pipeline execution URL. Falls back to PIPELINES_RUN_URL env var.
+            model_url (str, optional): The model execution URL. Falls back to MODELS_RUN_URL env var.
+            max_connections (int, optional): Maximum concurrent connections of the async pool.
+            max_keepalive_connections (int, optional): Maximum idle keep-alive connections of the async pool.
+            cache (bool or ResourceCache, optional): Cache ``get``/``search`` responses of this context.
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        super().__init__(
+            api_key=api_key, backend_url=backend_url, pipeline_url=pipeline_url, model_url=model_url, cache=cache
+        )
+
+    def init_client(self) -> None:
+        """Initialize the blocking and the async clients."""
+        super().init_client()
+        self.async_client = AsyncAixplainClient(
+            base_url=self.backend_url,
+            team_api_key=self.api_key,
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+        )
+
+    async def aclose(self) -> None:
+        """Close the async connection pool."""
+        await self.async_client.aclose()
+
+    async def __aenter__(self) -> "AsyncAixplain":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - closes the async connection pool."""
+        await self.aclose()
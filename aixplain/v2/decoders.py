@@ -0,0 +1,264 @@
+"""Compiled ``from_dict`` decoders for ``dataclasses_json`` classes.
+
+``dataclasses_json`` re-derives everything it needs on each ``from_dict``
+call: the field overrides, the ``config(field_name=...)`` renames, the type
+hints of the class and how every annotation has to be decoded. Listing a
+thousand models or polling large results repeats that work per item.
+
+:func:`dataclass_decoder` does the same analysis once per class, from
+``__dataclass_fields__`` and the field metadata, and returns a closure that
+only renames keys, fills defaults and converts the values whose annotation
+needs it. The decoded objects are the ones ``from_dict`` builds: nested
+dataclasses, enums, collections and custom field decoders are handled the same
+way, and the shapes the compiler does not specialize (unions, tuples, classes
+with an ``undefined`` policy, global decoders) are delegated to
+``dataclasses_json`` itself.
+
+Example:
+    >>> decode = dataclass_decoder(Model)
+    >>> models = [decode(item) for item in items]
+"""
+
+import warnings
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, get_type_hints
+from uuid import UUID
+
+from dataclasses_json import DataClassJsonMixin
+
+try:
+    from dataclasses_json import cfg
+    from dataclasses_json.core import (
+        _decode_dataclass,
+        _decode_generic,
+        _decode_letter_case_overrides,
+        _is_supported_generic,
+        _resolve_collection_type_to_decode_to,
+        _user_overrides_or_exts,
+    )
+    from dataclasses_json.utils import (
+        _NO_ARGS,
+        _get_type_arg_param,
+        _get_type_args,
+        _get_type_origin,
+        _is_collection,
+        _is_counter,
+        _is_generic_dataclass,
+        _is_mapping,
+        _is_new_type,
+        _is_optional,
+        _is_tuple,
+        _issubclass_safe,
+        _undefined_parameter_action_safe,
+    )
+except ImportError:  # dataclasses_json releases before 0.6.7 lack some helpers; decode with from_dict
+    _decode_dataclass = None
+
+T = TypeVar("T")
+Converter = Optional[Callable[[Any], Any]]
+
+_DECODERS: Dict[type, Callable[[Any], Any]] = {}
+_DEFAULT_FROM_DICT = DataClassJsonMixin.from_dict.__func__
+
+
+def from_dict(cls: Type[T], data: Any) -> T:
+    """Decode ``data`` into ``cls``, like ``cls.from_dict(data)``.
+
+    Classes overriding ``from_dict`` keep their own implementation; the others
+    use the compiled decoder of :func:`dataclass_decoder`.
+    """
+    if getattr(cls.from_dict, "__func__", None) is _DEFAULT_FROM_DICT:
+        return dataclass_decoder(cls)(data)
+    return cls.from_dict(data)
+
+
+def dataclass_decoder(cls: Type[T]) -> Callable[[Any], T]:
+    """Return the cached decoder of the dataclass ``cls``, compiling it on first use.
+
+    The decoder behaves like ``dataclasses_json``'s ``from_dict`` (with
+    ``infer_missing=False``), ignoring any ``from_dict`` override of ``cls``
+    as ``dataclasses_json`` does for nested dataclasses.
+    """
+    decoder = _DECODERS.get(cls)
+    if decoder is None:
+        decoder = _compile(cls)
+        if decoder is None:
+            # Not cached: unresolved forward references may resolve later.
+            return lambda kvs: _decode_dataclass(cls, kvs, False)
+        _DECODERS[cls] = decoder
+    return decoder
+
+
+def _compile(cls: type) -> Optional[Callable[[Any], Any]]:
+    """Build the decoder of ``cls``, or None when ``dataclasses_json`` has to decode it."""
+    if _decode_dataclass is None:
+        # Not ``cls.from_dict``: overrides may call back into this decoder.
+        return lambda kvs: _DEFAULT_FROM_DICT(cls, kvs)
+    if _undefined_parameter_action_safe(cls) is not None:
+        return None
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        return None
+
+    overrides = _user_overrides_or_exts(cls)
+    all_fields = fields(cls)
+    renames = {
+        key: name
+        for key, name in _decode_letter_case_overrides([f.name for f in all_fields], overrides).items()
+        if key != name
+    }
+    plan = [
+        (
+            f.name,
+            f.default,
+            f.default_factory,
+            _is_optional(hints[f.name]),
+            _field_converter(hints[f.name], overrides[f.name].decoder),
+        )
+        for f in all_fields
+        if f.init
+    ]
+    class_name = cls.__name__
+    global_decoders = cfg.global_config.decoders
+
+    def decode(kvs: Any) -> Any:
+        if isinstance(kvs, cls):
+            return kvs
+        if global_decoders:
+            return _decode_dataclass(cls, kvs, False)
+        if renames:
+            kvs = {renames.get(key, key): value for key, value in kvs.items()}
+        elif not isinstance(kvs, dict):
+            kvs = dict(kvs.items())
+        init_kwargs = {}
+        for name, default, default_factory, nullable, convert in plan:
+            if name in kvs:
+                value = kvs[name]
+            elif default is not MISSING:
+                value = default
+            elif default_factory is not MISSING:
+                value = default_factory()
+            else:
+                raise KeyError(name)
+            if value is None:
+                if not nullable:
+                    warnings.warn(
+                        f"'NoneType' object value of non-optional type {name} detected when decoding {class_name}.",
+                        RuntimeWarning,
+                    )
+            elif convert is not None:
+                value = convert(value)
+            init_kwargs[name] = value
+        return cls(**init_kwargs)
+
+    decode.__qualname__ = f"dataclass_decoder.<{class_name}>"
+    return decode
+
+
+def _field_converter(field_type: Any, decoder: Converter) -> Converter:
+    """Converter of a non-None field value, following ``_decode_dataclass``."""
+    while _is_new_type(field_type):
+        field_type = field_type.__supertype__
+    if decoder is not None:
+        return lambda value: value if type(value) is field_type else decoder(value)
+    if is_dataclass(field_type):
+        return lambda value: value if is_dataclass(value) else dataclass_decoder(field_type)(value)
+    if _is_supported_generic(field_type) and field_type != str:
+        return _generic_converter(field_type)
+    return _extended_converter(field_type)
+
+
+def _type_converter(type_: Any) -> Converter:
+    """Converter of a collection item or optional value, following ``_decode_type``."""
+    if _is_supported_generic(type_):
+        return _generic_converter(type_)
+    if is_dataclass(type_):
+        return lambda value: dataclass_decoder(type_)(value)
+    extended = _extended_converter(type_)
+    if extended is None:
+        return None
+
+    def convert(value: Any) -> Any:
+        if is_dataclass(value):
+            return _decode_dataclass(type_, value, False)
+        return extended(value)
+
+    if _issubclass_safe(type_, (int, float, str, bool)):
+        return lambda value: value if isinstance(value, type_) else convert(value)
+    return convert
+
+
+def _generic_converter(type_: Any) -> Converter:
+    """Converter of enums, collections and optionals, following ``_decode_generic``."""
+    convert = _generic_value_converter(type_)
+    if convert is None:
+        return None
+    return lambda value: None if value is None else convert(value)
+
+
+def _generic_value_converter(type_: Any) -> Converter:
+    if _issubclass_safe(type_, Enum):
+        return type_
+    if _is_collection(type_):
+        if _is_tuple(type_) or _is_counter(type_):
+            return lambda value: _decode_generic(type_, value, False)
+        collection = _resolve_collection_type_to_decode_to(type_)
+        if _is_mapping(type_):
+            key_type, value_type = _get_type_args(type_, (Any, Any))
+            convert_key, convert_value = _key_converter(key_type), _type_converter(value_type)
+            if convert_key is None and convert_value is None:
+                return lambda value: collection(zip(value.keys(), value.values()))
+            if convert_key is None:
+                return lambda value: collection(zip(value.keys(), map(convert_value, value.values())))
+            if convert_value is None:
+                return lambda value: collection(zip(map(convert_key, value.keys()), value.values()))
+            return lambda value: collection(zip(map(convert_key, value.keys()), map(convert_value, value.values())))
+        convert_item = _type_converter(_get_type_arg_param(type_, 0))
+        if convert_item is None:
+            return lambda value: collection(list(value))
+        return lambda value: collection([convert_item(item) for item in value])
+    if _is_generic_dataclass(type_):
+        origin = _get_type_origin(type_)
+        return lambda value: dataclass_decoder(origin)(value)
+    args = _get_type_args(type_)
+    if args is _NO_ARGS:
+        return None
+    if _is_optional(type_) and len(args) == 2:
+        return _type_converter(_get_type_arg_param(type_, 0))
+    return lambda value: _decode_generic(type_, value, False)
+
+
+def _key_converter(key_type: Any) -> Converter:
+    """Converter of mapping keys, following ``_decode_dict_keys``."""
+    if key_type is None or key_type == Any or isinstance(key_type, TypeVar):
+        return None
+    if _get_type_origin(key_type) is tuple:
+        convert = _type_converter(key_type)
+        return lambda key: tuple(convert(key)) if convert else tuple(key)
+    if key_type is str:
+        return str
+    convert = _type_converter(key_type)
+    if convert is None:
+        return key_type
+    return lambda key: key_type(convert(key))
+
+
+def _extended_converter(type_: Any) -> Converter:
+    """Converter of scalar values, following ``_support_extended_types``."""
+    if _issubclass_safe(type_, datetime):
+        return lambda value: (
+            value
+            if isinstance(value, datetime)
+            else datetime.fromtimestamp(value, tz=datetime.now(timezone.utc).astimezone().tzinfo)
+        )
+    if _issubclass_safe(type_, Decimal):
+        return lambda value: value if isinstance(value, Decimal) else Decimal(value)
+    if _issubclass_safe(type_, UUID):
+        return lambda value: value if isinstance(value, UUID) else UUID(value)
+    if _issubclass_safe(type_, (int, float, str, bool)):
+        return lambda value: value if isinstance(value, type_) else type_(value)
+    return None
@@ -200,6 +200,15 @@ class CodeInterpreterModel(str, Enum):
     CLAUDE_3_CODE_INTERPRETER = "CLAUDE_3_CODE_INTERPRETER"
 
 
+class EmbeddingModel(str, Enum):
+    """Platform IDs of the embedding models supported by aIR indexes."""
+
+    OPENAI_ADA002 = "6734c55df127847059324d9e"
+    JINA_CLIP_V2_MULTIMODAL = "67c5f705d8f6a65d6f74d732"
+    MULTILINGUAL_E5_LARGE = "67efd0772a0a850afa045af3"
+    BGE_M3 = "67efd4f92a0a850afa045af7"
+
+
 class DataType(str, Enum):
     """Enumeration of supported data types in the aiXplain system.
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import math
 import os
 import sys
@@ -16,6 +15,7 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 import pandas as pd
 
+from ..utils.json_utils import JSONDecodeError, dumps, loads
 from .agent import Agent
 from .exceptions import ValidationError
 from .eval_results_display import _is_metric_data_column
@@ -160,7 +160,7 @@ def _serialize_evaluation_records(run: AgentEvaluationRun) -> List[Dict[str, Any
     if df.empty:
         return []
     blob = df.to_json(orient="records", date_format="iso")
-    return json.loads(blob) if blob else []
+    return loads(blob) if blob else []
 
 
 def _deserialize_evaluation_records(records: List[Dict[str, Any]]) -> AgentEvaluationRun:
@@ -498,9 +498,17 @@ class Experiment:
         agents: Optional[Union[Agent, Sequence[Agent]]] = None,
         metrics: Optional[Sequence[Metric]] = None,
         run_metadata: Optional[Dict[str, Any]] = None,
+        resume: bool = False,
         **agent_run_kwargs: Any,
     ) -> ExperimentRun:
-        """Execute the experiment and append a new :class:`ExperimentRun` (does not replace prior runs)."""
+        """Execute the experiment and append a new :class:`ExperimentRun` (does not replace prior runs).
+
+        When the executor caches experiments, every finished row is also appended to
+        a checkpoint log next to the experiment file (see
+        :meth:`ExperimentLocalCache.checkpoint_path`); the log is removed once the
+        run is saved. Pass ``resume=True`` after an interrupted run to skip the
+        (case, agent, metric) cells the log already holds.
+        """
         executor = self._executor
         if executor is None:
             raise ValidationError(
@@ -522,6 +530,15 @@ class Experiment:
         else:
             metrics_effective = list(self._metrics) if self._metrics is not None else None
 
+        store = None
+        if getattr(executor, "cache_experiments", True):
+            store = getattr(executor, "_experiment_cache_store", lambda: None)()
+        if store is not None:
+            agent_run_kwargs["checkpoint"] = store.checkpoint_path(self.id)
+            agent_run_kwargs["resume"] = resume
+        elif resume:
+            raise ValidationError("resume=True requires an executor with cache_experiments enabled.")
+
         eval_run = executor.evaluate(agents_effective, self.dataset, metrics_effective, **agent_run_kwargs)
         run = ExperimentRun(
             id=str(uuid.uuid4()),
@@ -531,11 +548,9 @@ class Experiment:
             results=eval_run,
         )
         self.runs.append(run)
-        persist = getattr(executor, "cache_experiments", True)
-        if persist:
-            store = getattr(executor, "_experiment_cache_store", lambda: None)()
-            if store is not None:
-                store.save(self)
+        if store is not None:
+            store.save(self)
+            store.checkpoint_path(self.id).unlink(missing_ok=True)
         return run
 
     def diff(
@@ -863,12 +878,19 @@ class ExperimentLocalCache:
         safe = str(experiment_id).replace("/", "_").replace("\\", "_")
         return self.base_dir / f"{safe}.json"
 
+    def checkpoint_path(self, experiment_id: str) -> Path:
+        """Return the path of the in-progress run log for a given experiment id.
+
+        The ``.jsonl`` suffix keeps the log out of :meth:`list_experiments`.
+        """
+        return self.path_for(experiment_id).with_suffix(".checkpoint.jsonl")
+
     def save(self, experiment: Experiment) -> Path:
         """Write ``experiment`` to disk atomically."""
         path = self.path_for(experiment.id)
         payload = experiment.to_cache_payload()
         tmp = path.with_suffix(path.suffix + ".tmp")
-        text = json.dumps(payload, indent=2, default=str)
+        text = dumps(payload, indent=2, default=str, ensure_ascii=False)
         tmp.write_text(text, encoding="utf-8")
         tmp.replace(path)
         return path
@@ -878,7 +900,7 @@ class ExperimentLocalCache:
         summaries: List[Dict[str, Any]] = []
         for path in sorted(self.base_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
             try:
-                data = json.loads(path.read_text(encoding="utf-8"))
+                data = loads(path.read_bytes())
                 exp = data.get("experiment") or {}
                 summaries.append(
                     {
@@ -889,7 +911,7 @@ class ExperimentLocalCache:
                         "path": str(path),
                     },
                 )
-            except (json.JSONDecodeError, OSError, KeyError, TypeError):
+            except (JSONDecodeError, OSError, KeyError, TypeError):
                 continue
         return summaries
 
@@ -898,7 +920,7 @@ class ExperimentLocalCache:
         path = self.path_for(experiment_id)
         if not path.is_file():
             raise ValidationError(f"No cached experiment found for id {experiment_id!r} at {path}.")
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = loads(path.read_bytes())
         exp = Experiment.from_cache_payload(data, executor=executor)
         if exp.id != experiment_id:
             raise ValidationError("Cached file experiment id does not match requested id.")
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
 import time
-from typing import Dict, Union, List, Optional, Any, TYPE_CHECKING, Iterator
+from typing import AsyncIterator, Dict, Union, List, Optional, Any, TYPE_CHECKING, Iterator
 from typing_extensions import NotRequired, Unpack
 from dataclasses_json import dataclass_json, config
 from dataclasses import dataclass, field
@@ -26,6 +27,7 @@ from .enums import Function, Supplier, Language, AssetStatus, ResponseStatus
 from .mixins import ToolableMixin, ToolDict
 from .exceptions import APIError, ValidationError
 from .actions import Actions, Action, Inputs
+from .decoders import dataclass_decoder
 
 if TYPE_CHECKING:
     import requests
@@ -168,7 +170,8 @@ def _decode_details(value: Any) -> Any:
     shape into ``Detail`` objects and pass any other shape through untouched.
     """
     if isinstance(value, list):
-        return [Detail.from_dict(item) if isinstance(item, dict) else item for item in value]
+        decode = dataclass_decoder(Detail)
+        return [decode(item) if isinstance(item, dict) else item for item in value]
     return value
 
 
@@ -215,6 +218,65 @@ class StreamChunk:
             self.data = ""
 
 
+def _chunk_from_stream_data(data: Any, status: ResponseStatus) -> Optional[StreamChunk]:
+    """Convert one decoded SSE payload into a :class:`StreamChunk`.
+
+    Shared by the sync and async streamers.
+
+    Returns:
+        The chunk, or ``None`` when the payload is the in-band completion signal.
+    """
+    # OpenAI-style stream chunk format:
+    # {"choices":[{"delta":{"content":"...", "tool_calls":[...]},"finish_reason":...}],"usage":...}
+    if isinstance(data, dict) and "choices" in data:
+        choices = data.get("choices")
+        choice = choices[0] if isinstance(choices, list) and choices else {}
+        if not isinstance(choice, dict):
+            choice = {}
+
+        delta = choice.get("delta")
+        if not isinstance(delta, dict):
+            delta = {}
+
+        content = delta.get("content")
+        content = content if isinstance(content, str) else ""
+
+        raw_details = delta.get("reasoning_details")
+        reasoning_content = _normalize_reasoning(
+            delta.get("reasoning_content") if isinstance(delta.get("reasoning_content"), str) else None,
+            delta.get("reasoning") if isinstance(delta.get("reasoning"), str) else None,
+            raw_details if isinstance(raw_details, list) else None,
+        )
+
+        tool_calls = delta.get("tool_calls")
+        if tool_calls is not None and not isinstance(tool_calls, list):
+            tool_calls = [tool_calls]
+
+        finish_reason = choice.get("finish_reason")
+        finish_reason = finish_reason if isinstance(finish_reason, str) else None
+
+        usage = data.get("usage")
+        usage = usage if isinstance(usage, dict) else None
+
+        return StreamChunk(
+            status=status,
+            data=content,
+            reasoning_content=reasoning_content,
+            tool_calls=tool_calls,
+            usage=usage,
+            finish_reason=finish_reason,
+        )
+
+    content = data.get("data", "") if isinstance(data, dict) else ""
+    content = content if isinstance(content, str) else ""
+
+    # Check if this is the completion signal inside JSON
+    if content == "[DONE]":
+        return None
+
+    return StreamChunk(status=status, data=content)
+
+
 class ModelResponseStreamer(Iterator[StreamChunk]):
     """A streamer for model responses that yields chunks as they arrive.
 
@@ -326,57 +388,12 @@ class ModelResponseStreamer(Iterator[StreamChunk]):
                     return StreamChunk(status=self.status, data=buffered_payload)
                 continue
 
-            # OpenAI-style stream chunk format:
-            # {"choices":[{"delta":{"content":"...", "tool_calls":[...]},"finish_reason":...}],"usage":...}
-            if isinstance(data, dict) and "choices" in data:
-                choices = data.get("choices")
-                choice = choices[0] if isinstance(choices, list) and choices else {}
-                if not isinstance(choice, dict):
-                    choice = {}
-
-                delta = choice.get("delta")
-                if not isinstance(delta, dict):
-                    delta = {}
-
-                content = delta.get("content")
-                content = content if isinstance(content, str) else ""
-
-                raw_details = delta.get("reasoning_details")
-                reasoning_content = _normalize_reasoning(
-                    delta.get("reasoning_content") if isinstance(delta.get("reasoning_content"), str) else None,
-                    delta.get("reasoning") if isinstance(delta.get("reasoning"), str) else None,
-                    raw_details if isinstance(raw_details, list) else None,
-                )
-
-                tool_calls = delta.get("tool_calls")
-                if tool_calls is not None and not isinstance(tool_calls, list):
-                    tool_calls = [tool_calls]
-
-                finish_reason = choice.get("finish_reason")
-                finish_reason = finish_reason if isinstance(finish_reason, str) else None
-
-                usage = data.get("usage")
-                usage = usage if isinstance(usage, dict) else None
-
-                return StreamChunk(
-                    status=self.status,
-                    data=content,
-                    reasoning_content=reasoning_content,
-                    tool_calls=tool_calls,
-                    usage=usage,
-                    finish_reason=finish_reason,
-                )
-
-            content = data.get("data", "") if isinstance(data, dict) else ""
-            content = content if isinstance(content, str) else ""
-
-            # Check if this is the completion signal inside JSON
-            if content == "[DONE]":
+            chunk = _chunk_from_stream_data(data, self.status)
+            if chunk is None:
                 self._done = True
                 self.status = ResponseStatus.SUCCESS
                 raise StopIteration
-
-            return StreamChunk(status=self.status, data=content)
+            return chunk
 
     def close(self) -> None:
         """Close the underlying response connection."""
@@ -392,6 +409,71 @@ class ModelResponseStreamer(Iterator[StreamChunk]):
         self.close()
 
 
+async def _aiter_stream_chunks(lines: AsyncIterator[str]) -> AsyncIterator[StreamChunk]:
+    """Parse SSE lines from an async line iterator into :class:`StreamChunk` objects.
+
+    Async counterpart of :meth:`ModelResponseStreamer.__next__`, including the
+    reassembly of JSON payloads split across consecutive ``data:`` lines.
+    """
+    iterator = lines.__aiter__()
+    status = ResponseStatus.IN_PROGRESS
+    buffered_line: Optional[str] = None
+
+    while True:
+        if buffered_line is not None:
+            line, buffered_line = buffered_line, None
+        else:
+            try:
+                line = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+
+        if not line:
+            continue
+
+        if line.startswith("data:"):
+            line = line[5:].lstrip()
+
+        if line == "[DONE]":
+            return
+
+        buffered_payload = line
+        data = None
+        while True:
+            try:
+                data = json.loads(buffered_payload)
+                break
+            except json.JSONDecodeError:
+                try:
+                    continuation_line = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+
+                if not continuation_line:
+                    break
+
+                if not continuation_line.startswith("data:"):
+                    buffered_line = continuation_line
+                    break
+
+                continuation_payload = continuation_line[5:].lstrip()
+                if continuation_payload == "[DONE]":
+                    buffered_line = continuation_line
+                    break
+
+                buffered_payload += continuation_payload
+
+        if data is None:
+            if buffered_payload.strip():
+                yield StreamChunk(status=status, data=buffered_payload)
+            continue
+
+        chunk = _chunk_from_stream_data(data, status)
+        if chunk is None:
+            return
+        yield chunk
+
+
 InputsProxy = Inputs
 
 
@@ -836,6 +918,25 @@ class Model(
         Returns:
             ModelResult: Result with polling URL from V1 endpoint
         """
+        url, json_payload = self._build_v1_async_request(kwargs)
+
+        # Use the v2 client's raw request method (raises APIError on non-2xx)
+        try:
+            r = self.context.client.request_raw("post", url, data=json_payload)
+            resp = r.json()
+        except Exception as e:
+            logger.error(f"Error in V1 async request: {e}")
+            return ModelResult(
+                status=ResponseStatus.FAILED.value,
+                completed=True,
+                data="",
+                error_message=f"Model Run: {e}",
+            )
+
+        return self._handle_v1_async_response(resp)
+
+    def _build_v1_async_request(self, kwargs: dict) -> tuple[str, str]:
+        """Build the V1 execute URL and JSON body for an async run of a sync-only model."""
         self._ensure_valid_state()
 
         # Build V1 payload: V1 expects 'data' parameter, map from 'text' if needed
@@ -851,19 +952,11 @@ class Model(
         v1_base_url = self.context.model_url.replace("/api/v2/", "/api/v1/")
         url = f"{v1_base_url}/{self.id}"
 
-        # Use the v2 client's raw request method (raises APIError on non-2xx)
-        try:
-            r = self.context.client.request_raw("post", url, data=json_payload)
-            resp = r.json()
-        except Exception as e:
-            logger.error(f"Error in V1 async request: {e}")
-            return ModelResult(
-                status=ResponseStatus.FAILED.value,
-                completed=True,
-                data="",
-                error_message=f"Model Run: {e}",
-            )
+        return url, json_payload
 
+    @staticmethod
+    def _handle_v1_async_response(resp: dict) -> ModelResult:
+        """Parse a successful V1 async execute response into a :class:`ModelResult`."""
         # request_raw only returns on 2xx; parse the response
         status = resp.get("status", "IN_PROGRESS")
         resp_data = resp.get("data", None)
@@ -924,6 +1017,16 @@ class Model(
             >>> for chunk in model.run_stream(text="Hello"):
             ...     print(chunk.data, end="", flush=True)
         """
+        run_url, payload = self._build_stream_request(**kwargs)
+
+        logger.debug(f"Model Run Stream: Start service for {run_url}")
+
+        response = self.context.client.request_stream("POST", run_url, json=payload)
+
+        return ModelResponseStreamer(response)
+
+    def _build_stream_request(self, **kwargs: Unpack[ModelRunParams]) -> tuple[str, dict]:
+        """Validate streaming support and build the run URL and payload for a streamed run."""
         if self.supports_streaming is False:
             raise ValidationError(
                 f"Model '{self.name}' (id={self.id}) does not support streaming. "
@@ -948,12 +1051,86 @@ class Model(
             payload["options"]["raw"] = True
 
         run_url = self.build_run_url(**effective_params)
+        return run_url, payload
 
-        logger.debug(f"Model Run Stream: Start service for {run_url}")
+    async def arun(self, **kwargs: Unpack[ModelRunParams]) -> ModelResult:
+        """Run the model and wait for the result without blocking the event loop.
 
-        response = self.context.client.request_stream("POST", run_url, json=payload)
+        Async twin of :meth:`run`; requires an
+        :class:`~aixplain.v2.core.AsyncAixplain` context.
 
-        return ModelResponseStreamer(response)
+        Example:
+            >>> async with AsyncAixplain(api_key="...") as aix:
+            ...     model = aix.Model.get("69b7e5f1b2fe44704ab0e7d0")
+            ...     results = await asyncio.gather(*(model.arun(text=q) for q in questions))
+        """
+        effective_params = self._merge_with_dynamic_attrs(**kwargs)
+
+        if self.params:
+            param_errors = self._validate_params(**effective_params)
+            if param_errors:
+                raise ValueError(f"Parameter validation failed: {'; '.join(param_errors)}")
+
+        if not self.is_sync_only:
+            return await super().arun(**effective_params)
+
+        run_retries, run_retry_wait = self._run_retry_settings(effective_params)
+        for attempt in range(run_retries + 1):
+            try:
+                result = await self._apost_and_handle_run(**effective_params)
+                break
+            except APIError as e:
+                if not self._is_retryable_run_error(e) or attempt >= run_retries:
+                    raise
+                await asyncio.sleep(run_retry_wait)
+        if result.url and result.status == "IN_PROGRESS" and not result.completed and self._is_poll_url(result.url):
+            result = await self.async_poll(result.url, **effective_params)
+        return result
+
+    async def arun_async(self, **kwargs: Unpack[ModelRunParams]) -> ModelResult:
+        """Start a model run without waiting for completion (async twin of :meth:`run_async`).
+
+        Returns:
+            ModelResult: Result with polling URL for async models,
+                        or immediate result via V1 for sync-only models
+        """
+        effective_params = self._merge_with_dynamic_attrs(**kwargs)
+
+        if self.params:
+            param_errors = self._validate_params(**effective_params)
+            if param_errors:
+                raise ValueError(f"Parameter validation failed: {'; '.join(param_errors)}")
+
+        if not self.is_sync_only:
+            return await super().arun_async(**effective_params)
+
+        url, json_payload = self._build_v1_async_request(effective_params)
+        try:
+            resp = await self._async_client().request("post", url, data=json_payload)
+        except Exception as e:
+            logger.error(f"Error in V1 async request: {e}")
+            return ModelResult(
+                status=ResponseStatus.FAILED.value,
+                completed=True,
+                data="",
+                error_message=f"Model Run: {e}",
+            )
+        return self._handle_v1_async_response(resp)
+
+    async def arun_stream(self, **kwargs: Unpack[ModelRunParams]) -> AsyncIterator[StreamChunk]:
+        """Run the model and yield response chunks as they arrive (async twin of :meth:`run_stream`).
+
+        Example:
+            >>> async for chunk in model.arun_stream(text="Hello"):
+            ...     print(chunk.data, end="", flush=True)
+        """
+        run_url, payload = self._build_stream_request(**kwargs)
+
+        logger.debug(f"Model Run Stream (async): Start service for {run_url}")
+
+        async with self._async_client().request_stream("POST", run_url, json=payload) as response:
+            async for chunk in _aiter_stream_chunks(response.aiter_lines()):
+                yield chunk
 
     def _merge_with_dynamic_attrs(self, **kwargs) -> dict:
         """Merge provided parameters with dynamic attributes.
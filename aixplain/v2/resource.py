@@ -1,5 +1,6 @@
 """Resource management module for v2 API."""
 
+import asyncio
 import requests
 import logging
 import time
@@ -21,12 +22,14 @@ from typing import (
     runtime_checkable,
     Union,
     Callable,
+    Iterator,
 )
 from typing_extensions import Unpack, NotRequired
 from functools import wraps
 from copy import deepcopy
 
 
+from .decoders import from_dict
 from .enums import OwnershipType, SortBy, SortOrder
 from .exceptions import (
     ResourceError,
@@ -35,6 +38,8 @@ from .exceptions import (
     TimeoutError,
     create_operation_failed_error,
 )
+from .resource_cache import GET, SEARCH, ResourceCache, make_key
+from ..utils.pagination import iter_paginated
 
 
 if TYPE_CHECKING:
@@ -43,6 +48,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Operations after which cached ``get``/``search`` responses may be stale.
+_CACHE_INVALIDATING_OPERATIONS = frozenset({"save", "delete"})
+
+
+def _resource_cache(context: Any) -> Optional[ResourceCache]:
+    """Return the response cache of ``context``, if one is enabled."""
+    cache = getattr(context, "cache", None)
+    return cache if isinstance(cache, ResourceCache) else None
+
+
+def _invalidate_cached(resource: Any, resource_id: Optional[str]) -> None:
+    """Drop cached responses made stale by a change to ``resource``."""
+    cache = _resource_cache(getattr(resource, "context", None))
+    if cache is not None:
+        cache.invalidate(type(resource).__name__, resource_id or getattr(resource, "id", None))
+
 
 # Hook decorator system
 def with_hooks(func: Callable) -> Callable:
@@ -65,6 +86,7 @@ def with_hooks(func: Callable) -> Callable:
             # operation implementation with positional args
     """
     operation_name = func.__name__
+    invalidates_cache = operation_name in _CACHE_INVALIDATING_OPERATIONS
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
@@ -75,9 +97,14 @@ def with_hooks(func: Callable) -> Callable:
             if early_result is not None:
                 return early_result
 
+        # delete() clears the id, so remember it for cache invalidation
+        resource_id = getattr(self, "id", None) if invalidates_cache else None
+
         # Execute the operation
         try:
             result = func(self, *args, **kwargs)
+            if invalidates_cache:
+                _invalidate_cached(self, resource_id)
 
             # Call after hook (success case)
             after_method = getattr(self, f"after_{operation_name}", None)
@@ -89,6 +116,10 @@ def with_hooks(func: Callable) -> Callable:
             return result
 
         except Exception as e:
+            # A failed write may still have reached the backend
+            if invalidates_cache:
+                _invalidate_cached(self, resource_id)
+
             # Transform low-level exceptions to domain-specific errors
             if not isinstance(e, ResourceError):
                 raise ResourceError(f"Failed to {operation_name} resource: {e}")
@@ -795,12 +826,11 @@ class SearchResourceMixin(BaseMixin, Generic[SearchParamsT, ResourceT]):
         for item in items:
             # Flatten assetInfo structure before deserialization
             item = _flatten_asset_info(dict(item)) if isinstance(item, dict) else item
-            # Use dataclasses_json's from_dict to handle field aliasing
-            # This will automatically map API field names to dataclass field
-            # names
+            # Decode like dataclasses_json's from_dict (mapping API field names
+            # to dataclass field names) with the decoder compiled for cls
             if isinstance(cls, HasFromDict):
                 try:
-                    obj = cls.from_dict(item)
+                    obj = from_dict(cls, item)
                 except Exception as e:
                     logger.warning("Skipping item during %s deserialization: %s", cls.__name__, e)
                     continue
@@ -859,10 +889,43 @@ class SearchResourceMixin(BaseMixin, Generic[SearchParamsT, ResourceT]):
 
         # Make request
         paginate_method = getattr(cls, "PAGINATE_METHOD", "post")
-        response = context.client.request(paginate_method, paginate_path, json=filters)
+        cache = _resource_cache(context)
+        cache_key = make_key(SEARCH, cls.__name__, paginate_method, paginate_path, filters)
+        response = cache.get(cache_key) if cache is not None else None
+        if response is None:
+            response = context.client.request(paginate_method, paginate_path, json=filters)
+            if cache is not None:
+                if hasattr(response, "json"):
+                    response = response.json()
+                cache.put(cache_key, response)
 
         return cls._build_page(response, context, **kwargs)
 
+    @classmethod
+    def iter_search(cls: type, prefetch: bool = True, **kwargs: Any) -> Iterator[ResourceT]:
+        """Iterate over every search result across pages.
+
+        Pages are fetched lazily through ``search`` with the same filters; the
+        next page is requested in the background while the current one is
+        consumed, and consumed pages are not retained.
+
+        Args:
+            prefetch: Fetch the next page on a worker thread. Defaults to True.
+            kwargs: Search parameters, as for ``search``. ``page_number`` sets
+                the first page and ``page_size`` the page size.
+
+        Yields:
+            ResourceT: Resources in search order.
+        """
+        page_size = kwargs.pop("page_size", None) or getattr(cls, "PAGINATE_DEFAULT_PAGE_SIZE", 20)
+        start_page = kwargs.pop("page_number", None) or getattr(cls, "PAGINATE_DEFAULT_PAGE_NUMBER", 0)
+
+        def fetch_page(page_number: int) -> Tuple[List[ResourceT], Optional[int]]:
+            page = cls.search(page_number=page_number, page_size=page_size, **kwargs)
+            return page.results, page.total
+
+        return iter_paginated(fetch_page, page_size=page_size, start_page=start_page, prefetch=prefetch)
+
     @classmethod
     def _build_page(cls: type, response: "Any", context: "Aixplain", **kwargs: Any) -> Page[ResourceT]:
         """Build a page of resources from the response.
@@ -971,14 +1034,22 @@ class GetResourceMixin(BaseMixin, Generic[GetParamsT, ResourceT]):
         if host is not None:
             kwargs["params"] = {"host": host}
 
-        obj = context.client.get(path, **kwargs)
+        cache = _resource_cache(context)
+        cache_key = make_key(GET, cls.__name__, path, kwargs)
+        obj = cache.get(cache_key) if cache is not None else None
+        if obj is None:
+            obj = context.client.get(path, **kwargs)
+            if cache is not None:
+                # Key by the resource's own id: save()/delete() invalidate by it, not by the path-style lookup id.
+                resource_id = obj.get("id") if isinstance(obj, dict) else None
+                cache.put(cache_key, obj, resource_id=str(resource_id or id))
 
         # Flatten assetInfo structure before deserialization
         obj = _flatten_asset_info(dict(obj)) if isinstance(obj, dict) else obj
 
         if isinstance(cls, HasFromDict):
             try:
-                instance = cls.from_dict(obj)
+                instance = from_dict(cls, obj)
             except Exception as e:
                 raise ResourceError(f"Failed to deserialize {cls.__name__} (id={id}): {e}") from e
         else:
@@ -1367,24 +1438,26 @@ class RunnableResourceMixin(BaseMixin, Generic[RunParamsT, ResultT]):
         if status == "IN_PROGRESS" and data and isinstance(data, str) and data.startswith("http"):
             # This is a polling URL case
             response_class = getattr(self, "RESPONSE_CLASS", Result)
-            return response_class.from_dict(
+            return from_dict(
+                response_class,
                 {
                     "status": status,
                     "url": data,
                     "completed": False,
                     "requestId": response.get("requestId"),
-                }
+                },
             )
         elif status == "IN_PROGRESS" and data:
             # This is a polling URL case
             response_class = getattr(self, "RESPONSE_CLASS", Result)
-            return response_class.from_dict(
+            return from_dict(
+                response_class,
                 {
                     "status": status,
                     "url": data,
                     "completed": False,
                     "requestId": response.get("requestId"),
-                }
+                },
             )
         else:
             # Direct response case - pass the entire response to let dataclass_json handle field mapping
@@ -1399,7 +1472,7 @@ class RunnableResourceMixin(BaseMixin, Generic[RunParamsT, ResultT]):
             if any(k in response for k in top_usage_keys) or rt != 0.0 or uc != 0.0:
                 resp_for_parse["runTime"] = rt
                 resp_for_parse["usedCredits"] = uc
-            result = response_class.from_dict(resp_for_parse)
+            result = from_dict(response_class, resp_for_parse)
             result._raw_data = response
             return result
 
@@ -1528,6 +1601,23 @@ class RunnableResourceMixin(BaseMixin, Generic[RunParamsT, ResultT]):
 
             raise APIError(f"Polling failed: {str(e)}", 0, {"poll_url": poll_url})
 
+        return self._build_poll_result(response)
+
+    def _build_poll_result(self, response: dict) -> ResultT:
+        """Build a result instance from a decoded poll response.
+
+        Shared by :meth:`poll` and :meth:`apoll` so both transports parse
+        poll responses identically.
+
+        Args:
+            response: Decoded JSON body of the poll request
+
+        Returns:
+            Response instance from the configured RESPONSE_CLASS
+
+        Raises:
+            OperationFailedError: If the operation has failed
+        """
         # Handle polling response - use camelCase keys (what backend sends)
         # dataclass_json with config(field_name=...) handles mapping to snake_case
         run_time, used_credits = _extract_run_time_and_used_credits(response)
@@ -1558,19 +1648,20 @@ class RunnableResourceMixin(BaseMixin, Generic[RunParamsT, ResultT]):
         response_class = getattr(self, "RESPONSE_CLASS", Result)
 
         try:
-            result = response_class.from_dict(filtered_response)
+            result = from_dict(response_class, filtered_response)
         except Exception:
             if filtered_response.get("completed"):
                 logger.warning(
                     "Poll response deserialization failed for a completed response. "
                     "Building fallback result from raw data."
                 )
-                result = response_class.from_dict(
+                result = from_dict(
+                    response_class,
                     {
                         "status": filtered_response["status"],
                         "completed": True,
                         "data": filtered_response.get("data") or {},
-                    }
+                    },
                 )
             else:
                 raise
@@ -1641,3 +1732,151 @@ class RunnableResourceMixin(BaseMixin, Generic[RunParamsT, ResultT]):
         if show_progress:
             logger.error(f"Operation timeout - No response after {timeout}s")
         raise TimeoutError(f"Operation timed out after {timeout} seconds")
+
+    # -- asyncio variants ------------------------------------------------------
+    # These mirror run/run_async/poll/sync_poll over ``context.async_client``
+    # (see :class:`~aixplain.v2.core.AsyncAixplain`) and share the same payload
+    # builders, response handlers and hooks. Hooks stay synchronous.
+
+    def _async_client(self) -> Any:
+        """Return the context's async client or raise if the context has none."""
+        client = getattr(self.context, "async_client", None)
+        if client is None:
+            raise ResourceError(
+                f"{self.__class__.__name__} async operations require an AsyncAixplain context "
+                "(e.g. `async with AsyncAixplain(api_key=...) as aix: ...`)"
+            )
+        return client
+
+    async def _apost_and_handle_run(self, **kwargs: Unpack[RunParamsT]) -> ResultT:
+        """Async twin of :meth:`_post_and_handle_run`."""
+        self._ensure_valid_state()
+        payload_input = self._payload_kwargs_for_run(kwargs)
+        payload = self.build_run_payload(**payload_input)
+        run_url = self.build_run_url(**payload_input)
+        request_kwargs = {"json": payload}
+        headers = self._headers_for_run(kwargs)
+        if headers:
+            request_kwargs["headers"] = headers
+        response = await self._async_client().request("post", run_url, **request_kwargs)
+        return self.handle_run_response(response, **kwargs)
+
+    async def arun(self, *args: Any, **kwargs: Unpack[RunParamsT]) -> ResultT:
+        """Run the resource with automatic polling without blocking the event loop.
+
+        Args:
+            *args: Positional arguments (converted to kwargs by subclasses)
+            **kwargs: Run parameters including timeout, wait_time, run_retries, run_retry_wait
+
+        Returns:
+            Response instance from the configured response class
+        """
+        early = self._begin_run(**kwargs)
+        if early is not None:
+            return self._apply_after_run(early, **kwargs)
+
+        run_retries, run_retry_wait = self._run_retry_settings(kwargs)
+        for attempt in range(run_retries + 1):
+            try:
+                result = await self._apost_and_handle_run(**kwargs)
+                if result.url and not result.completed:
+                    request_id = getattr(result, "request_id", None)
+                    result = await self.async_poll(result.url, **kwargs)
+                    if request_id is not None and hasattr(result, "request_id") and not result.request_id:
+                        result.request_id = request_id
+                return self._apply_after_run(result, **kwargs)
+            except APIError as e:
+                if not self._is_retryable_run_error(e) or attempt >= run_retries:
+                    raise
+                await asyncio.sleep(run_retry_wait)
+
+        raise RuntimeError("arun() retry loop exhausted without return")
+
+    async def arun_async(self, **kwargs: Unpack[RunParamsT]) -> ResultT:
+        """Start a run without waiting for completion (async twin of :meth:`run_async`).
+
+        Args:
+            **kwargs: Run parameters specific to the resource type
+
+        Returns:
+            Response instance from the configured RESPONSE_CLASS
+        """
+        early = self._begin_run(**kwargs)
+        if early is not None:
+            return early
+
+        run_retries, run_retry_wait = self._run_retry_settings(kwargs)
+        for attempt in range(run_retries + 1):
+            try:
+                return await self._apost_and_handle_run(**kwargs)
+            except APIError as e:
+                if not self._is_retryable_run_error(e) or attempt >= run_retries:
+                    raise
+                await asyncio.sleep(run_retry_wait)
+
+        raise RuntimeError("arun_async() retry loop exhausted without return")
+
+    async def apoll(self, poll_url: str) -> ResultT:
+        """Poll once for the result of an asynchronous operation (async twin of :meth:`poll`).
+
+        Args:
+            poll_url: URL to poll for results
+
+        Returns:
+            Response instance from the configured RESPONSE_CLASS
+
+        Raises:
+            APIError: If the polling request fails
+            OperationFailedError: If the operation has failed
+        """
+        client = self._async_client()
+        try:
+            response = await client.get(poll_url)
+        except Exception as e:
+            raise APIError(f"Polling failed: {str(e)}", 0, {"poll_url": poll_url})
+        return self._build_poll_result(response)
+
+    async def async_poll(self, poll_url: str, **kwargs: Unpack[RunParamsT]) -> ResultT:
+        """Keep polling until an asynchronous operation is complete, yielding to the event loop.
+
+        Args:
+            poll_url: URL to poll for results (e.g. ``result.url`` from :meth:`arun_async`)
+            **kwargs: Run parameters including timeout and wait_time
+
+        Returns:
+            Response instance from the configured RESPONSE_CLASS
+
+        Raises:
+            TimeoutError: If the operation exceeds the timeout duration
+        """
+        timeout = kwargs.get("timeout", 300)
+        wait_time = kwargs.get("wait_time", 0.5)
+        show_progress = kwargs.get("show_progress", False)
+
+        start_time = time.time()
+        wait_time = max(wait_time, 0.2)  # Minimum wait time
+
+        while (time.time() - start_time) < timeout:
+            try:
+                result = await self.apoll(poll_url)
+
+                self.on_poll(result, **kwargs)
+
+                if result.completed:
+                    if show_progress:
+                        elapsed_time = time.time() - start_time
+                        logger.info(f"Operation completed successfully ({elapsed_time:.1f}s total)")
+                    return result
+
+            except (APIError, ResourceError) as e:
+                raise e
+            except Exception as e:
+                logger.warning(f"Polling error: {e}, continuing...")
+
+            await asyncio.sleep(wait_time)
+            if wait_time < 60:
+                wait_time *= 1.1  # Exponential backoff
+
+        if show_progress:
+            logger.error(f"Operation timeout - No response after {timeout}s")
+        raise TimeoutError(f"Operation timed out after {timeout} seconds")
@@ -0,0 +1,212 @@
+"""Opt-in response cache for resource ``get`` and ``search`` calls.
+
+A :class:`ResourceCache` is attached to an :class:`~aixplain.v2.core.Aixplain`
+context (``Aixplain(api_key=..., cache=True)``) and memoizes the backend
+payloads returned by ``Resource.get`` and ``Resource.search`` of that context.
+Entries expire after a per-resource-type TTL, the least recently used entry is
+evicted once ``max_size`` is reached, and ``save()`` / ``delete()`` on a
+resource drop the entries it may have made stale.
+
+Raw payloads are cached rather than resource instances, so every call still
+returns a fresh object that can be modified without affecting the cache.
+
+Example:
+    >>> aix = Aixplain(api_key="...", cache=ResourceCache(ttl=600, ttl_by_type={"Model": 3600}))
+    >>> aix.Model.get("model-id")  # backend
+    >>> aix.Model.get("model-id")  # cache
+    >>> aix.cache.stats().hits
+    1
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL = 300.0
+
+GET = "get"
+SEARCH = "search"
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a :class:`ResourceCache`.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that went to the backend (absent or expired entries).
+        evictions: Entries dropped to respect ``max_size``.
+        invalidations: Entries dropped by ``save()``/``delete()`` or ``invalidate``.
+        size: Number of entries currently cached.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    resource_type: str
+    resource_id: Optional[str]
+
+
+class ResourceCache:
+    """Thread-safe LRU cache with per-resource-type TTLs.
+
+    Keys are ``(operation, resource_type, ...)`` tuples built by the resource
+    mixins; values are deep-copied on the way in and out.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        ttl_by_type: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached responses.
+            ttl: Time to live in seconds for resource types without an override.
+            ttl_by_type: TTL overrides keyed by resource class name
+                (e.g. ``{"Model": 3600, "Agent": 30}``). A TTL of 0 disables
+                caching for that type.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttl_by_type = dict(ttl_by_type or {})
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        """Number of cached entries (including expired ones not yet dropped)."""
+        return len(self._entries)
+
+    def __deepcopy__(self, memo: dict) -> "ResourceCache":
+        """Return self: the cache is shared state of its context, not a value.
+
+        Resource serialization deep-copies attributes, including the context.
+        """
+        return self
+
+    def ttl_for(self, resource_type: str) -> float:
+        """Return the TTL in seconds applied to ``resource_type``."""
+        return self.ttl_by_type.get(resource_type, self.ttl)
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return a copy of the cached value for ``key``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry.value
+        return copy.deepcopy(value)
+
+    def put(self, key: Tuple, value: Any, resource_id: Optional[str] = None) -> None:
+        """Cache ``value`` under ``key``.
+
+        Args:
+            key: Cache key; its second element is the resource type name.
+            value: Backend payload to cache.
+            resource_id: Id of the resource the payload describes (``get``
+                entries), used by :meth:`invalidate`.
+        """
+        resource_type = key[1]
+        ttl = self.ttl_for(resource_type)
+        if ttl <= 0:
+            return
+        entry = _Entry(copy.deepcopy(value), time.monotonic() + ttl, resource_type, resource_id)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, resource_type: Optional[str] = None, resource_id: Optional[str] = None) -> int:
+        """Drop entries that a change to a resource may have made stale.
+
+        With ``resource_id``, every ``get`` entry for that id is dropped along
+        with all ``search`` entries (a saved or deleted resource can appear in
+        any listing). With only ``resource_type``, every entry of that type is
+        dropped. With neither, the cache is cleared.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        with self._lock:
+            if resource_type is None and resource_id is None:
+                stale = list(self._entries)
+            elif resource_id is not None:
+                stale = [
+                    key for key, entry in self._entries.items() if key[0] == SEARCH or entry.resource_id == resource_id
+                ]
+            else:
+                stale = [key for key, entry in self._entries.items() if entry.resource_type == resource_type]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+
+def make_key(operation: str, resource_type: str, *parts: Any) -> Tuple:
+    """Build a hashable cache key from request parts (dicts and lists included)."""
+    return (operation, resource_type) + tuple(_freeze(part) for part in parts)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert ``value`` into a hashable equivalent."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
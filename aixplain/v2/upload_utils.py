@@ -11,6 +11,15 @@ from typing import Dict, List, Optional, Union, Any
 from urllib.parse import urljoin
 import requests
 
+from ..utils.transfer_utils import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PART_ATTEMPTS,
+    MultipartUpload,
+    TransferError,
+    TransferStats,
+    multipart_upload,
+    stream_upload,
+)
 from .exceptions import FileUploadError
 
 
@@ -170,19 +179,51 @@ class S3Uploader:
     """Handles S3 file uploads using pre-signed URLs."""
 
     @classmethod
-    def upload_file(cls, file_path: str, presigned_url: str, content_type: str) -> None:
-        """Upload file to S3 using pre-signed URL."""
+    def upload_file(cls, file_path: str, presigned_url: str, content_type: str) -> TransferStats:
+        """Upload file to S3 using pre-signed URL, streaming it from disk.
+
+        Returns:
+            Size and throughput of the upload.
+        """
         headers = {"Content-Type": content_type}
 
         try:
-            with open(file_path, "rb") as f:
-                file_data = f.read()
+            return stream_upload(file_path, presigned_url, headers=headers, request=RequestManager.request_with_retry)
+        except TransferError:
+            raise FileUploadError("File Uploading Error: Failure on Uploading to S3.")
+        except Exception as e:
+            raise FileUploadError(f"File Uploading Error: {e}")
 
-            response = RequestManager.request_with_retry("put", presigned_url, headers=headers, data=file_data)
+    @classmethod
+    def upload_multipart(
+        cls,
+        file_path: str,
+        upload: MultipartUpload,
+        content_type: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        part_attempts: int = DEFAULT_PART_ATTEMPTS,
+    ) -> TransferStats:
+        """Upload file as an S3 multipart upload with parallel, individually retried parts.
 
-            if response.status_code != 200:
-                raise FileUploadError("File Uploading Error: Failure on Uploading to S3.")
+        Args:
+            file_path: Path to the file to upload.
+            upload: Presigned part, complete and abort URLs of the multipart upload.
+            content_type: MIME type sent with each part.
+            max_workers: Number of parts uploaded at once.
+            part_attempts: Attempts per part before the upload is aborted.
 
+        Returns:
+            Size, part count, retries and throughput of the upload.
+        """
+        try:
+            return multipart_upload(
+                file_path,
+                upload,
+                headers={"Content-Type": content_type},
+                max_workers=max_workers,
+                part_attempts=part_attempts,
+                request=RequestManager.request_with_retry,
+            )
         except Exception as e:
             raise FileUploadError(f"File Uploading Error: {e}")
 
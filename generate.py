@@ -51,7 +51,9 @@ RECONSTRUCTOR_FUNCTIONS = ["text-reconstruction", "audio-reconstruction"]
 
 # Centralized enum generation - only generate in main enums directory
 ENUMS_MODULE_PATH = "aixplain/enums/generated_enums.py"
+FUNCTION_SPECS_MODULE_PATH = "aixplain/enums/generated_function_specs.py"
 PIPELINE_MODULE_PATH = "aixplain/modules/pipeline/pipeline.py"
+PIPELINE_STUB_PATH = "aixplain/modules/pipeline/pipeline.pyi"
 
 ENUMS_MODULE_TEMPLATE = """\"\"\"Auto-generated enum module containing static values from the backend API.\"\"\"
 
@@ -59,7 +61,8 @@ ENUMS_MODULE_TEMPLATE = """\"\"\"Auto-generated enum module containing static va
 # This module contains static enums that were previously loaded dynamically
 
 from enum import Enum
-from typing import Dict, Any, Tuple
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, Tuple
 from dataclasses import dataclass
 from aixplain.base.parameters import BaseParameters, Parameter
 
@@ -99,47 +102,29 @@ class Function(str, Enum):
             self._parameters = FunctionParameters(input_params)
         return self._parameters
 
-# Static FunctionInputOutput dictionary
-FunctionInputOutput = {
-    {% for function in functions %}
-    "{{ function.id }}": {
-        "input": {
-            {% for param in function.params %}
-            {% if param.required %}"{{ param.dataType }}"{% if not loop.last %}, {% endif %}{% endif %}
-            {% endfor %}
-        },
-        "output": {
-            {% for output in function.output %}"{{ output.dataType }}"{% if not loop.last %}, {% endif %}{% endfor %}
-        },
-        "spec": {
-            "id": "{{ function.id }}",
-            "name": "{{ function.name }}",
-            "description": "{{ function.metaData.description|escape_quotes }}",
-            "params": [
-                {% for param in function.params %}
-                {
-                    "code": "{{ param.code }}",
-                    "dataType": "{{ param.dataType }}",
-                    "required": {{ param.required }},
-                    "multipleValues": {{ param.multipleValues|default(false) }},
-                    "defaultValues": {{ param.defaultValues|none_to_none|default("None") }},
-                    "isFixed": {{ param.isFixed|default(false) }}
-                }{% if not loop.last %},{% endif %}
-                {% endfor %}
-            ],
-            "output": [
-                {% for output in function.output %}
-                {
-                    "code": "{{ output.code }}",
-                    "dataType": "{{ output.dataType }}",
-                    "defaultValue": {{ output.defaultValue|none_to_none|default("None") }}
-                }{% if not loop.last %},{% endif %}
-                {% endfor %}
-            ]
-        }
-    }{% if not loop.last %},{% endif %}
-    {% endfor %}
-}
+class _FunctionInputOutput(Mapping):
+    \"\"\"Read-only mapping of function id to its input/output spec.
+
+    The specs live in generated_function_specs and are only imported on first lookup.
+    \"\"\"
+
+    @staticmethod
+    def _specs() -> Dict[str, Any]:
+        from .generated_function_specs import FUNCTION_INPUT_OUTPUT
+
+        return FUNCTION_INPUT_OUTPUT
+
+    def __getitem__(self, function: str) -> Dict[str, Any]:
+        return self._specs()[function]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs())
+
+    def __len__(self) -> int:
+        return len(self._specs())
+
+
+FunctionInputOutput = _FunctionInputOutput()
 
 class FunctionParameters(BaseParameters):
     \"\"\"Class to store and manage function parameters.\"\"\"
@@ -201,107 +186,178 @@ class License(str, Enum):
 
 """
 
-PIPELINE_MODULE_TEMPLATE = """\"\"\"Auto-generated pipeline module containing node classes and Pipeline factory methods.\"\"\"
+FUNCTION_SPECS_MODULE_TEMPLATE = """\"\"\"Auto-generated input/output specs of the functions available in the aiXplain platform.\"\"\"
 
 # This is an auto generated module. PLEASE DO NOT EDIT
+# Loaded on demand through generated_enums.FunctionInputOutput
 
+FUNCTION_INPUT_OUTPUT = {
+    {% for function in functions %}
+    "{{ function.id }}": {
+        "input": {
+            {% for param in function.params %}
+            {% if param.required %}"{{ param.dataType }}"{% if not loop.last %}, {% endif %}{% endif %}
+            {% endfor %}
+        },
+        "output": {
+            {% for output in function.output %}"{{ output.dataType }}"{% if not loop.last %}, {% endif %}{% endfor %}
+        },
+        "spec": {
+            "id": "{{ function.id }}",
+            "name": "{{ function.name }}",
+            "description": "{{ function.metaData.description|escape_quotes }}",
+            "params": [
+                {% for param in function.params %}
+                {
+                    "code": "{{ param.code }}",
+                    "dataType": "{{ param.dataType }}",
+                    "required": {{ param.required }},
+                    "multipleValues": {{ param.multipleValues|default(false) }},
+                    "defaultValues": {{ param.defaultValues|none_to_none|default("None") }},
+                    "isFixed": {{ param.isFixed|default(false) }}
+                }{% if not loop.last %},{% endif %}
+                {% endfor %}
+            ],
+            "output": [
+                {% for output in function.output %}
+                {
+                    "code": "{{ output.code }}",
+                    "dataType": "{{ output.dataType }}",
+                    "defaultValue": {{ output.defaultValue|none_to_none|default("None") }}
+                }{% if not loop.last %},{% endif %}
+                {% endfor %}
+            ]
+        }
+    }{% if not loop.last %},{% endif %}
+    {% endfor %}
+}
+"""
+
+PIPELINE_MODULE_TEMPLATE = """\"\"\"Auto-generated pipeline module containing node specs and Pipeline factory methods.\"\"\"
+
+# This is an auto generated module. PLEASE DO NOT EDIT
+#
+# Node classes (e.g. ``Translation``, ``TranslationInputs`` and ``TranslationOutputs``)
+# are built from NODE_SPECS on first use, see node_registry.
+
+from typing import Any, List
 
-from typing import Union, Type
-from aixplain.enums import DataType
-
-from .designer import (
-    InputParam,
-    OutputParam,
-    Inputs,
-    Outputs,
-    TI,
-    TO,
-    AssetNode,
-    BaseReconstructor,
-    BaseSegmentor,
-    BaseMetric
-)
 from .default import DefaultPipeline
-from aixplain.modules import asset
+from .node_registry import NodeRegistry, NodeSpec
 
+# (class name, function, factory method, base class, input type, output type, inputs, outputs, description)
+NODE_SPECS = (
 {% for spec in specs %}
+    NodeSpec(
+        "{{ spec.class_name }}",
+        "{{ spec.id }}",
+        "{{ spec.function_name }}",
+        "{{ spec.base_class }}",
+        "{{ spec.input_type | upper }}",
+        "{{ spec.output_type | upper }}",
+        {{ spec.inputs | input_params }},
+        {{ spec.outputs | output_params }},
+        "{{ spec.description | escape_quotes }}",
+    ),
+{% endfor %}
+)
 
-class {{ spec.class_name }}Inputs(Inputs):
-    \"\"\"Input parameters for {{ spec.class_name }}.\"\"\"
+_registry = NodeRegistry(__name__, NODE_SPECS)
 
-{% for input in spec.inputs %}
-    {{ input.name }}: InputParam = None
-{% endfor %}
 
-    def __init__(self, node=None):
-        \"\"\"Initialize {{ spec.class_name }}Inputs.\"\"\"
-        super().__init__(node=node)
-{% for input in spec.inputs %}
-        self.{{ input.name }} = self.create_param(
-            code="{{ input.name }}",
-            data_type=DataType.{{ input.data_type | upper }},
-            is_required={{ input.is_required }}
-        )
-{% endfor %}
+class Pipeline(DefaultPipeline):
+    \"\"\"Pipeline class for creating and managing AI processing pipelines.
 
+    Every node spec adds a factory method to this class, e.g. ``pipeline.translation(asset_id)``.
+    \"\"\"
 
-class {{ spec.class_name }}Outputs(Outputs):
-    \"\"\"Output parameters for {{ spec.class_name }}.\"\"\"
 
-{% for output in spec.outputs %}
-    {{ output.name }}: OutputParam = None
-{% endfor %}
-{% if spec.is_segmentor %}
-    audio: OutputParam = None
-{% endif %}
+_registry.install_factories(Pipeline)
 
-    def __init__(self, node=None):
-        \"\"\"Initialize {{ spec.class_name }}Outputs.\"\"\"
-        super().__init__(node=node)
-{% for output in spec.outputs %}
-        self.{{ output.name }} = self.create_param(
-            code="{{ output.name }}",
-            data_type=DataType.{{ output.data_type | upper }}
-        )
-{% endfor %}
-{% if spec.is_segmentor %}
-        self.audio = self.create_param(code="audio", data_type=DataType.AUDIO)
-{% endif %}
 
+def __getattr__(name: str) -> Any:
+    \"\"\"Build the node, inputs or outputs class called ``name`` on first access.\"\"\"
+    try:
+        return _registry.get(name)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-class {{ spec.class_name }}({{spec.base_class}}[{{ spec.class_name }}Inputs, {{ spec.class_name }}Outputs]):
-    \"\"\"{{ spec.class_name }} node.
 
-    {{ spec.description | wordwrap }}
+def __dir__() -> List[str]:
+    \"\"\"List the module globals along with the lazily built node classes.\"\"\"
+    return sorted(set(globals()) | set(_registry.names()))
+"""
 
-    InputType: {{ spec.input_type }}
-    OutputType: {{ spec.output_type }}
-    \"\"\"
-    function: str = "{{ spec.id }}"
-    input_type: str = DataType.{{ spec.input_type | upper }}
-    output_type: str = DataType.{{ spec.output_type | upper }}
+PIPELINE_STUB_TEMPLATE = """\"\"\"Type stub of the auto-generated pipeline module.
 
-    inputs_class: Type[TI] = {{ spec.class_name }}Inputs
-    outputs_class: Type[TO] = {{ spec.class_name }}Outputs
+The node classes and ``Pipeline`` factory methods declared here are built at
+runtime from NODE_SPECS, see node_registry.
+\"\"\"
 
-{% endfor %}
+# This is an auto generated module. PLEASE DO NOT EDIT
 
+from typing import Any, List, Tuple, Union
 
-class Pipeline(DefaultPipeline):
-    \"\"\"Pipeline class for creating and managing AI processing pipelines.\"\"\"
+from aixplain.modules.asset import Asset
 
+from .default import DefaultPipeline
+from .designer import AssetNode, BaseMetric, BaseReconstructor, BaseSegmentor, InputParam, Inputs, OutputParam, Outputs
+from .node_registry import NodeSpec
+
+NODE_SPECS: Tuple[NodeSpec, ...]
 {% for spec in specs %}
-    def {{ spec.function_name }}(self, asset_id: Union[str, asset.Asset], *args, **kwargs) -> {{ spec.class_name }}:
-        \"\"\"Create a {{ spec.class_name }} node.
 
-        {{ spec.description | wordwrap }}
-        \"\"\"
-        return {{ spec.class_name }}(*args, asset_id=asset_id, pipeline=self, **kwargs)
+class {{ spec.class_name }}Inputs(Inputs):
+{% for input in spec.inputs %}
+    {{ input.name }}: InputParam
+{% else %}
+    ...
+{% endfor %}
 
+class {{ spec.class_name }}Outputs(Outputs):
+{% for output in spec.outputs %}
+    {{ output.name }}: OutputParam
 {% endfor %}
+{% if spec.is_segmentor %}
+    audio: OutputParam
+{% endif %}
+{% if not spec.outputs and not spec.is_segmentor %}
+    ...
+{% endif %}
+
+class {{ spec.class_name }}({{ spec.base_class }}[{{ spec.class_name }}Inputs, {{ spec.class_name }}Outputs]): ...
+{% endfor %}
+
+class Pipeline(DefaultPipeline):
+{% for spec in specs %}
+    def {{ spec.function_name }}(self, asset_id: Union[str, Asset], *args: Any, **kwargs: Any) -> {{ spec.class_name }}: ...
+{% endfor %}
+
+def __dir__() -> List[str]: ...
 """
 
 
+def tuple_literal(items):
+    """Render a sequence of tuples as a Python tuple literal."""
+    rendered = []
+    for item in items:
+        values = [f'"{value}"' if isinstance(value, str) else str(value) for value in item]
+        rendered.append(f"({', '.join(values)})")
+    if len(rendered) == 1:
+        return f"({rendered[0]},)"
+    return f"({', '.join(rendered)})"
+
+
+def input_params(inputs):
+    """Render node inputs as ``(code, data type, is_required)`` tuples."""
+    return tuple_literal([(i["name"], i["data_type"].upper(), i["is_required"]) for i in inputs])
+
+
+def output_params(outputs):
+    """Render node outputs as ``(code, data type)`` tuples."""
+    return tuple_literal([(o["name"], o["data_type"].upper()) for o in outputs])
+
+
 def get_config():
     """Get configuration from environment variables."""
     return {
@@ -443,6 +499,8 @@ if __name__ == "__main__":
     env.filters["enumify"] = enumify
     env.filters["none_to_none"] = none_to_none
     env.filters["escape_quotes"] = escape_quotes
+    env.filters["input_params"] = input_params
+    env.filters["output_params"] = output_params
 
     # Generate pipeline module
     pipeline_template = env.from_string(PIPELINE_MODULE_TEMPLATE)
@@ -452,6 +510,13 @@ if __name__ == "__main__":
     with open(PIPELINE_MODULE_PATH, "w") as f:
         f.write(pipeline_output)
 
+    # Generate the type stub declaring the node classes built at runtime
+    stub_template = env.from_string(PIPELINE_STUB_TEMPLATE)
+    stub_output = stub_template.render(specs=specs)
+    print(f"Writing type stub to file: {PIPELINE_STUB_PATH}")
+    with open(PIPELINE_STUB_PATH, "w") as f:
+        f.write(stub_output + "\n")
+
     # Generate centralized enums file
     enums_template = env.from_string(ENUMS_MODULE_TEMPLATE)
     enums_output = enums_template.render(
@@ -461,4 +526,11 @@ if __name__ == "__main__":
     with open(ENUMS_MODULE_PATH, "w") as f:
         f.write(enums_output)
 
+    # Generate the function specs, loaded lazily by the enums module
+    specs_template = env.from_string(FUNCTION_SPECS_MODULE_TEMPLATE)
+    specs_output = specs_template.render(functions=functions)
+    print(f"Writing function specs module to file: {FUNCTION_SPECS_MODULE_PATH}")
+    with open(FUNCTION_SPECS_MODULE_PATH, "w") as f:
+        f.write(specs_output)
+
     print("Modules generated successfully")
@@ -9,6 +9,7 @@ load_dotenv(override=True)
 SDK_VERSION_ARG = "--sdk_version"
 SDK_VERSION_PARAM_ARG = "--sdk_version_param"
 PIPELINE_VERSION_ARG = "--pipeline_version"
+RUN_BENCHMARKS_ARG = "--run-benchmarks"
 
 SDK_VERSION_V1 = "v1"
 SDK_VERSION_V2 = "v2"
@@ -24,6 +25,11 @@ def pytest_addoption(parser: pytest.Parser):
     parser.addoption(f"{PIPELINE_VERSION_ARG}", action="store", help="pipeline version")
     parser.addoption(f"{SDK_VERSION_ARG}", action="store", help="sdk version")
     parser.addoption(f"{SDK_VERSION_PARAM_ARG}", action="store", help="sdk version parameter")
+    parser.addoption(f"{RUN_BENCHMARKS_ARG}", action="store_true", default=False, help="run tests marked as benchmarks")
+
+
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line("markers", f"benchmark: timing micro-benchmark, only run with {RUN_BENCHMARKS_ARG}")
 
 
 def filter_items(items: list, param_name: str, predicate: Callable):
@@ -83,7 +89,7 @@ def filter_sdk_version(items: list, sdk_version: str, sdk_param: str):
 
 
 def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config, items: list):
-    """Modify the items based on the pipeline version and the SDK version.
+    """Skip benchmarks unless requested, and filter the items by pipeline and SDK version.
 
     Args:
         session (pytest.Session): The pytest session.
@@ -93,6 +99,12 @@ def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config
     Raises:
         ValueError: If the pipeline version or the SDK version is invalid.
     """
+    if not config.getoption(RUN_BENCHMARKS_ARG):
+        skip_benchmark = pytest.mark.skip(reason=f"benchmark, pass {RUN_BENCHMARKS_ARG} to run")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
+
     pipeline_version = config.getoption(f"{PIPELINE_VERSION_ARG}")
     sdk_version = config.getoption(f"{SDK_VERSION_ARG}")
 
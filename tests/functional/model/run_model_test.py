@@ -6,6 +6,7 @@ import requests
 from aixplain.enums import Function, EmbeddingModel
 from aixplain.factories import ModelFactory
 from aixplain.modules import LLM
+from aixplain.utils.asset_cache import AssetCache
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from aixplain.factories.index_factory.utils import (
@@ -16,6 +17,7 @@ from aixplain.factories.index_factory.utils import (
 import time
 import os
 import json
+import sqlite3
 
 CACHE_FOLDER = ".cache"
 
@@ -249,11 +251,12 @@ def test_llm_run_with_file():
 def test_aixplain_model_cache_creation():
     """Ensure AssetCache is triggered and cache is created."""
 
-    cache_file = os.path.join(CACHE_FOLDER, "model.json")
+    cache_file = os.path.join(CACHE_FOLDER, "model.sqlite")
 
     # Clean up cache before the test
     if os.path.exists(cache_file):
         os.remove(cache_file)
+    AssetCache.clear_instances()
 
     # Instantiate the Model (replace this with a real model ID from your env)
     model_id = "6239efa4822d7a13b8e20454"  # Translate from Punjabi to Portuguese (Brazil)
@@ -262,13 +265,12 @@ def test_aixplain_model_cache_creation():
     # Assert the cache file was created
     assert os.path.exists(cache_file), "Expected cache file was not created."
 
-    with open(cache_file, "r", encoding="utf-8") as f:
-        cache_data = json.load(f)
+    # Cache structure is one row per asset: assets(id, data)
+    with sqlite3.connect(cache_file) as conn:
+        row = conn.execute("SELECT data FROM assets WHERE id = ?", (model_id,)).fetchone()
 
-    assert "data" in cache_data, "Cache file structure invalid - missing 'data' key."
-    # Cache structure is: {"expiry": ..., "data": {"model_id": {...}}}
-    # So we check if the model_id exists as a key in cache_data["data"]
-    assert model_id in cache_data["data"], "Instantiated model not found in cache."
+    assert row is not None, "Instantiated model not found in cache."
+    assert json.loads(row[0])["id"] == model_id
 
 
 @pytest.mark.skip(reason="Flaky on test env: sample image asset returns 404 during document parsing")
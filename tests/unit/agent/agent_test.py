@@ -1687,3 +1687,46 @@ def test_run_normalizes_expected_output_tuple_to_list_in_execution_params():
         assert "executionParams" in sent
         assert "expectedOutput" in sent["executionParams"]
         assert sent["executionParams"]["expectedOutput"] == "[1, 2, 3]", "tuple should normalize to JSON string"
+
+
+def test_sync_poll_reports_step_deltas_and_skips_unchanged_progress(capsys):
+    agent = Agent("123", "Test Agent(-)", "Sample Description", instructions="Test Agent Instructions")
+    poll_url = "https://models.aixplain.com/api/v1/data/abc"
+    step_a = {"id": "a", "output": None}
+    progress = {"stage": "working", "tool": "search", "success": None}
+    responses = [
+        {"json": {"completed": False, "status": "IN_PROGRESS", "data": {"steps": [step_a]}, "progress": progress}},
+        {"json": {"completed": False, "status": "IN_PROGRESS", "data": {"steps": [step_a]}, "progress": progress}},
+        {
+            "json": {
+                "completed": True,
+                "status": "SUCCESS",
+                "data": {"output": "done", "steps": [{"id": "a", "output": "x"}, {"id": "b", "output": "y"}]},
+            }
+        },
+    ]
+    seen = []
+
+    with requests_mock.Mocker() as mock, patch("aixplain.modules.agent.time.sleep"):
+        mock.get(poll_url, responses)
+        response = agent.sync_poll(poll_url, on_step=seen.append)
+
+    assert response["completed"] is True
+    assert [(d.step_id, d.is_new) for d in seen] == [("a", True), ("a", False), ("b", True)]
+    assert capsys.readouterr().out.count("search") == 1
+
+
+def test_iter_step_deltas_yields_only_changes():
+    agent = Agent("123", "Test Agent(-)", "Sample Description", instructions="Test Agent Instructions")
+    poll_url = "https://models.aixplain.com/api/v1/data/abc"
+    responses = [
+        {"json": {"completed": False, "data": {"steps": [{"id": "a"}]}}},
+        {"json": {"completed": False, "data": {"steps": [{"id": "a"}]}}},
+        {"json": {"completed": True, "data": {"steps": [{"id": "a", "output": "x"}]}}},
+    ]
+
+    with requests_mock.Mocker() as mock, patch("aixplain.utils.step_index.time.sleep"):
+        mock.get(poll_url, responses)
+        deltas = list(agent.iter_step_deltas(poll_url))
+
+    assert [(d.step_id, d.finished) for d in deltas] == [("a", False), ("a", True)]
@@ -0,0 +1,13 @@
+import pytest
+
+from aixplain.utils import asset_cache
+from aixplain.utils.asset_cache import AssetCache
+
+
+@pytest.fixture(autouse=True)
+def asset_cache_folder(tmp_path, monkeypatch):
+    """Point the asset cache at a per-test folder so unit tests never write into the checkout."""
+    monkeypatch.setattr(asset_cache, "CACHE_FOLDER", str(tmp_path / "cache"))
+    AssetCache.clear_instances()
+    yield
+    AssetCache.clear_instances()
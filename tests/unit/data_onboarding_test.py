@@ -0,0 +1,185 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import random
+import tarfile
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from aixplain.enums import DataSubtype, DataType, StorageType
+from aixplain.modules.metadata import MetaData
+from aixplain.processes.data_onboarding import onboard_functions, process_media_files, process_text_files
+from aixplain.processes.data_onboarding.batch_uploader import BatchUploader
+
+
+class FakeS3:
+    """Records uploads; keeps a copy of each file since onboarding deletes some after upload."""
+
+    def __init__(self):
+        self.uploads = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, file_name, **kwargs):
+        name = os.path.basename(str(file_name))
+        with open(file_name, "rb") as f:
+            data = f.read()
+        with self.lock:
+            self.uploads[name] = data
+        return f"s3://bucket/{name}"
+
+
+def _index(s3, name, tmp_path):
+    path = tmp_path / f"copy-{name}"
+    path.write_bytes(s3.uploads[name])
+    return pd.read_csv(path, compression="gzip")
+
+
+def test_text_onboarding_keeps_global_indices_across_files_and_batches(tmp_path):
+    pd.DataFrame({"text": ["a", "b", "c"]}).to_csv(tmp_path / "one.csv", index=False)
+    pd.DataFrame({"text": ["d", "https://example.com/e"]}).to_csv(tmp_path / "two.csv", index=False)
+    metadata = MetaData(name="text", dtype=DataType.TEXT, storage_type=StorageType.TEXT)
+    s3 = FakeS3()
+
+    with patch.object(process_text_files, "upload_data", side_effect=s3):
+        files, data_column_idx, nrows = process_text_files.run(
+            metadata, [tmp_path / "one.csv", tmp_path / "two.csv"], tmp_path, batch_size=2, max_workers=2
+        )
+
+    assert nrows == 5 and data_column_idx == 0
+    assert [str(f.path) for f in files] == [f"s3://bucket/text-0000000{n}.csv.gz" for n in (1, 2, 3)]
+    third = _index(s3, "text-00000003.csv.gz", tmp_path)
+    assert third["@INDEX"].tolist() == [4]
+    assert third["text"].tolist() == ["DONOTDOWNLOADhttps://example.com/e"]
+    assert _index(s3, "text-00000002.csv.gz", tmp_path)["@INDEX"].tolist() == [2, 3]
+
+
+def test_text_onboarding_reports_missing_column(tmp_path):
+    pd.DataFrame({"other": ["a"]}).to_csv(tmp_path / "one.csv", index=False)
+    metadata = MetaData(name="text", dtype=DataType.TEXT, storage_type=StorageType.TEXT)
+
+    with patch.object(process_text_files, "upload_data") as upload, pytest.raises(Exception, match="Column"):
+        process_text_files.run(metadata, [tmp_path / "one.csv"], tmp_path)
+    upload.assert_not_called()
+
+
+def test_media_onboarding_archives_each_batch_of_local_files(tmp_path):
+    media = []
+    for n in range(3):
+        path = tmp_path / f"clip{n}.wav"
+        path.write_bytes(b"RIFF" + bytes([n]))
+        media.append(str(path))
+    pd.DataFrame({"audio": media, "start": [0, 1, 2], "end": [1, 2, 3]}).to_csv(tmp_path / "in.csv", index=False)
+    work = tmp_path / "work"
+    work.mkdir()
+    metadata = MetaData(
+        name="audio", dtype=DataType.AUDIO, storage_type=StorageType.FILE, start_column="start", end_column="end"
+    )
+    s3 = FakeS3()
+
+    with patch.object(process_media_files, "upload_data", side_effect=s3):
+        files, data_idx, start_idx, end_idx, nrows = process_media_files.run(
+            metadata, [tmp_path / "in.csv"], work, batch_size=2
+        )
+
+    assert nrows == 3 and len(files) == 2
+    first = _index(s3, "audio-00000001.csv.gz", tmp_path)
+    assert first["@SOURCE"].tolist() == ["s3://bucket/audio-00000001.tgz"] * 2
+    assert first["@START_TIME"].tolist() == [0, 1]
+    assert (data_idx, start_idx, end_idx) == (0, 3, 4)
+    archive = tmp_path / "archive.tgz"
+    archive.write_bytes(s3.uploads["audio-00000002.tgz"])
+    with tarfile.open(archive) as tar:
+        assert [os.path.basename(name) for name in tar.getnames()] == ["clip2.wav"]
+    assert not (work / "audio-00000001").exists() and not (work / "audio-00000001.tgz").exists()
+
+
+def test_batch_uploader_bounds_pending_batches_and_keeps_order():
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work(n):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return n
+
+    with BatchUploader(max_workers=2, max_pending=2) as uploader:
+        for n in range(8):
+            uploader.submit(work, n)
+        assert uploader.results() == list(range(8))
+    assert peak[0] <= 2
+
+
+def test_batch_uploader_stops_submitting_after_a_failure():
+    def fail():
+        raise RuntimeError("upload failed")
+
+    with pytest.raises(RuntimeError):
+        with BatchUploader(max_workers=1) as uploader:
+            uploader.submit(fail)
+            time.sleep(0.05)
+            uploader.submit(lambda: None)
+
+
+def test_text_onboarding_streams_input_in_chunks(tmp_path):
+    pd.DataFrame({"text": [f"t{n}" for n in range(7)], "unused": range(7)}).to_csv(tmp_path / "in.csv", index=False)
+    metadata = MetaData(name="text", dtype=DataType.TEXT, storage_type=StorageType.TEXT)
+    s3 = FakeS3()
+    read_csv = pd.read_csv
+
+    with patch.object(process_text_files, "upload_data", side_effect=s3), patch(
+        "pandas.read_csv", side_effect=read_csv
+    ) as reader:
+        files, _, nrows = process_text_files.run(metadata, [tmp_path / "in.csv"], tmp_path, batch_size=3, chunksize=2)
+
+    assert nrows == 7 and len(files) == 3
+    streamed = [call.kwargs for call in reader.call_args_list if "chunksize" in call.kwargs]
+    assert streamed == [{"usecols": ["text"], "chunksize": 2}]
+    second = _index(s3, "text-00000002.csv.gz", tmp_path)
+    assert second["@INDEX"].tolist() == [3, 4, 5]
+    assert second["text"].tolist() == ["t3", "t4", "t5"]
+
+
+def test_split_data_rewrites_files_in_chunks(tmp_path):
+    path = tmp_path / "in.csv"
+    pd.DataFrame({"text": [f"t{n}" for n in range(10)], "split": range(10)}).to_csv(path, index=False)
+
+    metadata = onboard_functions.split_data([path], split_rate=[0.6, 0.4], split_labels=["train", "test"], chunksize=3)
+
+    dataframe = pd.read_csv(path)
+    assert metadata.name == "SPLIT" and metadata.dsubtype == DataSubtype.SPLIT
+    assert dataframe["text"].tolist() == [f"t{n}" for n in range(10)]
+    assert dataframe["SPLIT"].value_counts().to_dict() == {"train": 6, "test": 4}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_split_data_is_reproducible_with_random_seed(tmp_path):
+    frames = []
+    for name in ("a.csv", "b.csv"):
+        path = tmp_path / name
+        pd.DataFrame({"text": range(20)}).to_csv(path, index=False)
+        random.seed(0)
+        onboard_functions.split_data([path], split_rate=[0.5, 0.5], split_labels=["x", "y"], chunksize=7)
+        frames.append(pd.read_csv(path)["split"].tolist())
+    assert frames[0] == frames[1]
@@ -854,3 +854,78 @@ def test_pipeline_serialize():
     assert {"from": "output2", "to": "input2"} in serialized["links"][0]["paramMapping"]
     assert serialized["nodes"][0] == node1.serialize()
     assert serialized["nodes"][1] == node2.serialize()
+
+
+def test_generated_nodes_are_built_on_demand():
+    from aixplain.modules.pipeline import pipeline as generated
+    from aixplain.modules.pipeline.designer import BaseSegmentor
+
+    registry = generated._registry
+    registry._classes.pop("Translation", None)
+    assert "Translation" in dir(generated)
+
+    translation = generated.Translation
+    assert translation is generated.Translation
+    assert generated.TranslationInputs is translation.inputs_class
+    assert translation.function == "translation"
+    assert translation.__module__ == generated.__name__
+    node = translation()
+    assert {param.code for param in node.inputs} >= {"text", "sourcelanguage", "targetlanguage"}
+    assert node.inputs.text.data_type == DataType.TEXT and node.inputs.text.is_required
+    assert [param.code for param in node.outputs] == ["data"]
+
+    segmentor = generated.SpeakerDiarizationAudio
+    assert issubclass(segmentor, BaseSegmentor)
+    assert "audio" in segmentor().outputs
+
+    with pytest.raises(AttributeError):
+        generated.NotANode
+
+
+def test_pipeline_factory_methods_create_generated_nodes():
+    from aixplain.modules.pipeline import Pipeline
+    from aixplain.modules.pipeline import pipeline as generated
+
+    pipeline = Pipeline(id="", name="test", api_key="key")
+    with patch("aixplain.modules.pipeline.designer.AssetNode.populate_asset") as populate:
+        node = pipeline.translation(asset_id="asset-id")
+    populate.assert_called_once()
+    assert isinstance(node, generated.Translation)
+    assert node.asset_id == "asset-id" and node in pipeline.nodes
+    assert "Translation" in Pipeline.translation.__doc__
+
+
+def test_pipeline_stub_declares_every_generated_node():
+    import ast
+    import inspect
+    from pathlib import Path
+    from typing import Union
+
+    from aixplain.modules.asset import Asset
+    from aixplain.modules.pipeline import Pipeline
+    from aixplain.modules.pipeline import pipeline as generated
+
+    stub = ast.parse(Path(generated.__file__).with_suffix(".pyi").read_text())
+    classes = {node.name: node for node in stub.body if isinstance(node, ast.ClassDef)}
+    methods = {node.name for node in classes["Pipeline"].body if isinstance(node, ast.FunctionDef)}
+    for spec in generated.NODE_SPECS:
+        assert {spec.class_name, f"{spec.class_name}Inputs", f"{spec.class_name}Outputs"} <= set(classes)
+        assert spec.method_name in methods
+    assert len(methods) == len(generated.NODE_SPECS)
+
+    signature = inspect.signature(Pipeline.translation)
+    assert signature.parameters["asset_id"].annotation == Union[str, Asset]
+    assert signature.return_annotation is generated.Translation
+
+
+def test_function_specs_are_loaded_on_first_lookup():
+    from collections.abc import Mapping
+
+    from aixplain.enums import Function, FunctionInputOutput
+
+    assert isinstance(FunctionInputOutput, Mapping)
+    assert FunctionInputOutput["translation"]["spec"]["id"] == "translation"
+    assert "translation" in FunctionInputOutput and FunctionInputOutput.get("unknown") is None
+    assert len(FunctionInputOutput) == len(list(FunctionInputOutput))
+    input_params, _ = Function.TRANSLATION.get_input_output_params()
+    assert "text" in input_params
@@ -6,6 +6,8 @@ from aixplain.modules.model.response import ModelResponse
 from aixplain.modules.model.index_model import IndexModel
 from aixplain.utils import config
 import logging
+import threading
+import time
 import pytest
 
 data = {"data": "Model Index", "description": "This is a dummy collection for testing."}
@@ -281,3 +283,118 @@ def test_upsert_with_invalid_file_path(mocker):
     with pytest.raises(Exception) as e:
         index_model.upsert("nonexistent.pdf")
     assert str(e.value) == "File not found"
+
+
+def _bulk_index(mocker, respond=None):
+    """IndexModel whose ingest calls go to ``respond(call_number, data)``, recording each request."""
+    mocker.patch("aixplain.factories.FileFactory.check_storage_type", return_value=StorageType.TEXT)
+    calls = []
+    lock = threading.Lock()
+
+    def run(data):
+        with lock:
+            calls.append(data)
+            call_number = len(calls)
+        if respond is not None:
+            return respond(call_number, data)
+        return ModelResponse(status=ResponseStatus.SUCCESS, used_credits=0.5)
+
+    index_model = IndexModel(id=index_id, data=data, name="name", function=Function.SEARCH)
+    mocker.patch.object(index_model, "run", side_effect=run)
+    return index_model, calls
+
+
+def _records(count, size=10):
+    for i in range(count):
+        yield Record(value=f"{i:08d}".ljust(size, "x"), id=f"doc-{i}")
+
+
+def test_upsert_bulk_splits_by_count(mocker):
+    index_model, calls = _bulk_index(mocker)
+
+    stats = index_model.upsert_bulk(_records(250), batch_size=100, max_workers=2)
+
+    assert [(batch.index, batch.records, batch.status, batch.attempts) for batch in stats] == [
+        (0, 100, ResponseStatus.SUCCESS, 1),
+        (1, 100, ResponseStatus.SUCCESS, 1),
+        (2, 50, ResponseStatus.SUCCESS, 1),
+    ]
+    ids = sorted(payload["document_id"] for call in calls for payload in call["data"])
+    assert ids == sorted(f"doc-{i}" for i in range(250))
+    assert all(call["action"] == "ingest" for call in calls)
+    assert sum(batch.used_credits for batch in stats) == 1.5
+
+
+def test_upsert_bulk_splits_by_size(mocker):
+    index_model, calls = _bulk_index(mocker)
+    records = [Record(value="a" * 900, id="small-1"), Record(value="b" * 5000, id="large"), Record(value="c", id="s2")]
+
+    stats = index_model.upsert_bulk(_records(20, size=900), batch_size=100, max_batch_bytes=4000)
+    oversized = index_model.upsert_bulk(records, max_batch_bytes=4000)
+
+    assert len(stats) == 5 and all(batch.bytes <= 4000 for batch in stats)
+    assert sum(batch.records for batch in stats) == 20
+    assert [batch.records for batch in oversized] == [1, 1, 1]
+
+
+def test_upsert_bulk_retries_failed_batches_with_the_same_records(mocker, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+    def respond(call_number, data):
+        if call_number == 1:
+            return ModelResponse(status=ResponseStatus.FAILED, error_message="busy")
+        if call_number == 2:
+            raise ConnectionError("reset")
+        return ModelResponse(status=ResponseStatus.SUCCESS)
+
+    index_model, calls = _bulk_index(mocker, respond)
+
+    (batch,) = index_model.upsert_bulk(_records(5), max_workers=1)
+
+    assert (batch.status, batch.attempts, batch.error_message) == (ResponseStatus.SUCCESS, 3, "")
+    assert batch.document_ids is None
+    assert calls[0] == calls[1] == calls[2]
+
+
+def test_upsert_bulk_reports_batches_that_keep_failing(mocker, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+    def respond(call_number, data):
+        if data["data"][0]["document_id"] == "doc-2":
+            return ModelResponse(status=ResponseStatus.FAILED, error_message="quota exceeded")
+        return ModelResponse(status=ResponseStatus.SUCCESS)
+
+    index_model, _ = _bulk_index(mocker, respond)
+
+    stats = index_model.upsert_bulk(_records(6), batch_size=2, max_retries=2)
+
+    assert [batch.status for batch in stats] == [ResponseStatus.SUCCESS, ResponseStatus.FAILED, ResponseStatus.SUCCESS]
+    assert (stats[1].attempts, stats[1].error_message) == (3, "quota exceeded")
+    assert stats[1].document_ids == ["doc-2", "doc-3"]
+
+
+def test_upsert_bulk_uploads_concurrently_while_streaming(mocker):
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def respond(call_number, data):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return ModelResponse(status=ResponseStatus.SUCCESS)
+
+    index_model, calls = _bulk_index(mocker, respond)
+    consumed = []
+
+    def records():
+        for record in _records(200):
+            consumed.append(record.id)
+            yield record
+
+    stats = index_model.upsert_bulk(records(), batch_size=10, max_workers=4)
+
+    assert len(stats) == 20 and len(calls) == 20 and len(consumed) == 200
+    assert 1 < peak[0] <= 4
@@ -41,9 +41,9 @@ from aixplain.modules.model.connection import ConnectionTool, ConnectAction
 def test_build_payload():
     data = "input_data"
     parameters = {"context": "context_data"}
-    ref_payload = json.dumps({"data": data, **parameters})
+    ref_payload = {"data": data, **parameters}
     hyp_payload = build_payload(data, parameters)
-    assert hyp_payload == ref_payload
+    assert json.loads(hyp_payload) == ref_payload
 
 
 def test_call_run_endpoint_async():
@@ -340,7 +340,7 @@ def test_run_with_parameters():
 
     input_data = "test input"
     parameters = {"temperature": 0.7, "max_tokens": 100}
-    expected_payload = json.dumps({"data": input_data, **parameters})
+    expected_payload = {"data": input_data, **parameters}
 
     ref_response = {
         "completed": True,
@@ -357,7 +357,7 @@ def test_run_with_parameters():
         response = test_model.run(data=input_data, parameters=parameters)
 
         # Verify the payload was constructed correctly
-        assert mock.last_request.text == expected_payload
+        assert mock.last_request.json() == expected_payload
         assert isinstance(response, ModelResponse)
         assert response.status == ResponseStatus.SUCCESS
         assert response.data == "Test Model Result"
@@ -370,7 +370,7 @@ def test_run_async_with_parameters():
 
     input_data = "test input"
     parameters = {"temperature": 0.7, "max_tokens": 100}
-    expected_payload = json.dumps({"data": input_data, **parameters})
+    expected_payload = {"data": input_data, **parameters}
 
     ref_response = {
         "completed": False,
@@ -386,7 +386,7 @@ def test_run_async_with_parameters():
         response = test_model.run_async(data=input_data, parameters=parameters)
 
         # Verify the payload was constructed correctly
-        assert mock.last_request.text == expected_payload
+        assert mock.last_request.json() == expected_payload
         assert isinstance(response, ModelResponse)
         assert response.status == "IN_PROGRESS"
         assert response.url == ref_response["url"]
@@ -1102,3 +1102,58 @@ def test_tool_factory(mocker):
     assert tool.function_type == FunctionType.CONNECTION
     assert tool.api_key == "api_key"
     assert tool.version == {"id": "1.0"}
+
+
+def test_get_model_revalidates_stale_cache_entry(tmp_path, monkeypatch):
+    """A stale cached model is revalidated with a conditional GET instead of listing all models."""
+    from aixplain.utils import asset_cache
+
+    monkeypatch.setattr(asset_cache, "CACHE_FOLDER", str(tmp_path))
+    monkeypatch.setenv("CACHE_EXPIRY_TIME", "0")
+    asset_cache.AssetCache.clear_instances()
+    model_id = "test-model-id"
+    model_response = {
+        "id": model_id,
+        "name": "Test Model",
+        "status": "onboarded",
+        "function": {"id": "text-generation"},
+        "supplier": {"id": "aiXplain"},
+        "pricing": {"price": 10, "currency": "USD"},
+        "version": {"id": "1.0.0"},
+        "params": [],
+        "updatedAt": "2024-01-02T03:04:05Z",
+    }
+    url = urljoin(config.BACKEND_URL, f"sdk/models/{model_id}")
+    try:
+        with requests_mock.Mocker() as mock:
+            mock.get(url, json=model_response, headers={"ETag": '"v1"'})
+            cached = ModelFactory.get(model_id)
+
+            mock.get(url, status_code=304)
+            assert ModelFactory.get(model_id, use_cache=True) is cached
+            assert mock.last_request.headers["If-None-Match"] == '"v1"'
+            assert mock.last_request.headers["If-Modified-Since"] == "Tue, 02 Jan 2024 03:04:05 GMT"
+
+            mock.get(url, json={**model_response, "name": "Renamed"}, headers={"ETag": '"v2"'})
+            assert ModelFactory.get(model_id, use_cache=True).name == "Renamed"
+
+            monkeypatch.setenv("CACHE_EXPIRY_TIME", "3600")
+            calls = mock.call_count
+            assert ModelFactory.get(model_id, use_cache=True).name == "Renamed"
+            assert mock.call_count == calls
+            assert not any(r.url.endswith("paginate") for r in mock.request_history)
+    finally:
+        asset_cache.AssetCache.clear_instances()
+
+
+def test_iter_list_streams_models_across_pages():
+    pages = {
+        0: {"results": [Model(id="m1", name="a"), Model(id="m2", name="b")], "total": 3},
+        1: {"results": [Model(id="m3", name="c")], "total": 3},
+    }
+    with patch.object(ModelFactory, "list", side_effect=lambda page_number, **kw: pages[page_number]) as list_mock:
+        ids = [model.id for model in ModelFactory.iter_list(page_size=2, function=Function.TRANSLATION)]
+
+    assert ids == ["m1", "m2", "m3"]
+    assert list_mock.call_count == 2
+    assert list_mock.call_args.kwargs == {"page_number": 1, "page_size": 2, "function": Function.TRANSLATION}
@@ -1,11 +1,14 @@
 """Unit tests for RLM context resolution, sandbox setup, credit tracking, and context window."""
 
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from aixplain.v1.modules.model.rlm import RLM as RLMV1
+from aixplain.utils.rlm_cache import MemoryRLMCache, SQLiteRLMCache
+from aixplain.utils.rlm_vector_index import LocalVectorIndex
 from aixplain.v2.rlm import RLM as RLMV2, RLMResult
 
 
@@ -439,3 +442,226 @@ class TestV2WorkerContextWindow:
         mock_worker.attributes = {"max_context_length": 32000}
         rlm._worker = mock_worker
         assert rlm._get_worker_context_window() == "32K tokens"
+
+
+# Worker output cache
+def _cached_rlm(RLM, answer, cache):
+    """RLM whose worker answers prompts with ``answer(prompt)``, counting calls."""
+    prompts = []
+
+    def run(prompt):
+        prompts.append(prompt)
+        return answer(prompt)
+
+    if RLM is RLMV1:
+        rlm = _make_v1_rlm()
+        rlm.worker.additional_info = {"attributes": [{"name": "max_context_length", "code": "8000"}]}
+        rlm.worker.run.side_effect = lambda data, max_tokens: _model_response_v1(run(data), used_credits=0.1)
+    else:
+        rlm = _make_v2_rlm()
+        worker = MagicMock()
+        worker.attributes = {"max_context_length": 8000}
+
+        def worker_run(text, max_tokens):
+            response = MagicMock(completed=True, status="SUCCESS", used_credits=0.1)
+            response.data = run(text)
+            return response
+
+        worker.run.side_effect = worker_run
+        rlm._worker = worker
+    rlm.cache = cache
+    rlm._cache_hits = 0
+    rlm._credits_lock = threading.Lock()
+    return rlm, prompts
+
+
+_CACHED_CONTEXT = "\n".join(f"Paragraph {i}: the value of item {i} is {i * 7}." for i in range(500))
+
+
+def _map_or_reduce(prompt):
+    return "final answer" if "synthesizing" in prompt else "facts"
+
+
+class TestWorkerCache:
+    @pytest.mark.parametrize("RLM", RLM_IMPLS)
+    def test_repeated_run_is_answered_from_cache(self, RLM):
+        cache = MemoryRLMCache()
+        rlm, prompts = _cached_rlm(RLM, _map_or_reduce, cache)
+        data = {"context": _CACHED_CONTEXT, "query": "What are the values?"}
+
+        first = rlm.run(data=data, mode="parallel")
+        calls = len(prompts)
+        second = rlm.run(data=data, mode="parallel")
+
+        assert calls > 2 and len(prompts) == calls
+        assert first.data == second.data == "final answer"
+        assert second.used_credits == 0 and first.used_credits == pytest.approx(0.1 * calls)
+        assert cache.stats().hits == calls
+
+    @pytest.mark.parametrize("RLM", RLM_IMPLS)
+    def test_new_query_misses_cache(self, RLM):
+        rlm, prompts = _cached_rlm(RLM, _map_or_reduce, MemoryRLMCache())
+
+        rlm.run(data={"context": _CACHED_CONTEXT, "query": "What are the values?"}, mode="parallel")
+        calls = len(prompts)
+        rlm.run(data={"context": _CACHED_CONTEXT, "query": "Which item is largest?"}, mode="parallel")
+
+        assert len(prompts) == 2 * calls
+
+    @pytest.mark.parametrize("RLM", RLM_IMPLS)
+    def test_rerun_after_partial_failure_only_repeats_failed_calls(self, RLM):
+        failing = {"Paragraph 250:"}
+
+        def answer(prompt):
+            if any(marker in prompt for marker in failing) and "synthesizing" not in prompt:
+                raise RuntimeError("worker unavailable")
+            return _map_or_reduce(prompt)
+
+        rlm, prompts = _cached_rlm(RLM, answer, MemoryRLMCache())
+        data = {"context": _CACHED_CONTEXT, "query": "What are the values?"}
+
+        rlm.run(data=data, mode="parallel")
+        map_calls = [p for p in prompts if "synthesizing" not in p]
+        failing.clear()
+        prompts.clear()
+        result = rlm.run(data=data, mode="parallel")
+
+        retried = [p for p in prompts if "synthesizing" not in p]
+        assert len(map_calls) > 2 and len(retried) == 1 and "Paragraph 250:" in retried[0]
+        assert result.data == "final answer"
+
+    def test_sqlite_cache_is_shared_across_instances(self, tmp_path):
+        path = str(tmp_path / "rlm.sqlite")
+        data = {"context": _CACHED_CONTEXT, "query": "What are the values?"}
+        rlm, prompts = _cached_rlm(RLMV2, _map_or_reduce, SQLiteRLMCache(path))
+        rlm.run(data=data, mode="parallel")
+
+        other, other_prompts = _cached_rlm(RLMV2, _map_or_reduce, SQLiteRLMCache(path))
+        result = other.run(data=data, mode="parallel")
+
+        assert prompts and other_prompts == []
+        assert result.data == "final answer"
+        assert result._raw_data["cache_hits"] == len(prompts)
+
+
+class TestLazyChunking:
+    @pytest.mark.parametrize("RLM", RLM_IMPLS)
+    def test_map_starts_before_chunking_finishes(self, RLM):
+        first_call = threading.Event()
+
+        def answer(prompt):
+            first_call.set()
+            return "facts"
+
+        rlm, prompts = _cached_rlm(RLM, answer, None)
+
+        def chunks():
+            for i in range(40):
+                if i == 30:
+                    assert first_call.wait(5)
+                yield f"chunk {i}"
+
+        answers = rlm._parallel_map(chunks(), "query")
+
+        assert answers == ["facts"] * 40 and len(prompts) == 40
+        assert all("part " in p and "of a larger document" in p for p in prompts)
+
+    @pytest.mark.parametrize("RLM", RLM_IMPLS)
+    def test_map_prompts_hold_whole_sentences(self, RLM):
+        rlm, prompts = _cached_rlm(RLM, _map_or_reduce, None)
+
+        rlm.run(data={"context": _CACHED_CONTEXT, "query": "What are the values?"}, mode="parallel")
+
+        contents = [p.split("Content:\n", 1)[1].strip() for p in prompts if "Content:\n" in p]
+        assert len(contents) > 1
+        assert all(c.startswith("Paragraph") and c.endswith(".") for c in contents)
+
+
+class TestStreamingReduce:
+    @staticmethod
+    def _stage_metrics(result):
+        return result._raw_data["stage_metrics"] if isinstance(result, RLMResult) else result["stage_metrics"]
+
+    @pytest.mark.parametrize("RLM", RLM_IMPLS)
+    def test_large_answers_are_tree_reduced(self, RLM):
+        def answer(prompt):
+            return "summary" if "synthesizing" in prompt else "a long extracted fact. " * 100
+
+        rlm, prompts = _cached_rlm(RLM, answer, None)
+        with patch(f"{RLM.__module__}._REDUCE_FAN_IN", 2):
+            result = rlm.run(data={"context": _CACHED_CONTEXT, "query": "What are the values?"}, mode="parallel")
+
+        map_calls = [p for p in prompts if "synthesizing" not in p]
+        reduce_calls = [p for p in prompts if "synthesizing" in p]
+        metrics = self._stage_metrics(result)
+        assert result.data == "summary"
+        assert len(map_calls) == 5 and len(reduce_calls) == 4
+        assert metrics["stages"]["map"]["count"] == len(map_calls)
+        assert metrics["stages"]["reduce"]["count"] == len(reduce_calls)
+
+    @pytest.mark.parametrize("RLM", RLM_IMPLS)
+    def test_small_answers_use_a_single_reduce_call(self, RLM):
+        rlm, prompts = _cached_rlm(RLM, _map_or_reduce, None)
+        result = rlm.run(data={"context": _CACHED_CONTEXT, "query": "What are the values?"}, mode="parallel")
+
+        assert result.data == "final answer"
+        assert sum("synthesizing" in p for p in prompts) == 1
+        assert self._stage_metrics(result)["stages"]["reduce"]["count"] == 1
+
+
+# Local rag retrieval
+_RAG_CONTEXT = "\n".join(
+    "Paragraph 123: the needle is hidden in the barn." if i == 123 else f"Paragraph {i}: filler about item {i}."
+    for i in range(200)
+)
+
+
+def _local_rag_rlm(RLM, index):
+    """RLM whose rag mode retrieves from ``index`` with a fake embedding model, recording embedded texts."""
+    rlm, prompts = _cached_rlm(RLM, lambda prompt: "final answer", None)
+    embedded = []
+
+    def vector(text):
+        embedded.append(text)
+        return [text.count("needle") + 0.01, 1.0]
+
+    embedder = MagicMock()
+    if RLM is RLMV1:
+        embedder.run.side_effect = lambda data: _model_response_v1(vector(data), used_credits=0.01)
+        rlm.rag_index_id = None
+    else:
+        embedder.run.side_effect = lambda text: MagicMock(completed=True, data=vector(text), used_credits=0.01)
+        rlm.rag_index_id = ""
+    rlm._embedder = embedder
+    rlm.rag_local_index = index
+    rlm.rag_embedding_model_id = "embedding-id"
+    rlm.rag_top_k = 3
+    rlm.rag_max_chunk_chars = 500
+    return rlm, prompts, embedded
+
+
+class TestLocalRag:
+    @pytest.mark.parametrize("RLM", RLM_IMPLS)
+    def test_rag_retrieves_locally_and_embeds_only_new_texts(self, RLM):
+        rlm, prompts, embedded = _local_rag_rlm(RLM, LocalVectorIndex())
+
+        first = rlm.run(data={"context": _RAG_CONTEXT, "query": "Where is the needle?"}, mode="rag")
+        chunk_calls = len(embedded) - 1
+        second = rlm.run(data={"context": _RAG_CONTEXT, "query": "Who hid the needle?"}, mode="rag")
+
+        assert first.data == second.data == "final answer"
+        assert chunk_calls > 3 and embedded[-2:] == ["Where is the needle?", "Who hid the needle?"]
+        assert "the needle is hidden in the barn" in prompts[0] and prompts[0].count("\n\n---\n\n") == 2
+        assert first.used_credits == pytest.approx(0.1 + 0.01 * (chunk_calls + 1))
+        if RLM is RLMV2:
+            rlm.context.Tool.assert_not_called()
+
+    @pytest.mark.parametrize("RLM", RLM_IMPLS)
+    def test_embedding_failure_fails_the_run(self, RLM):
+        rlm, prompts, _ = _local_rag_rlm(RLM, LocalVectorIndex())
+        rlm._embedder.run.side_effect = RuntimeError("embedding service down")
+
+        result = rlm.run(data={"context": _RAG_CONTEXT, "query": "Where is the needle?"}, mode="rag")
+
+        assert result.status == "FAILED" and "embedding service down" in result.error_message
+        assert prompts == []
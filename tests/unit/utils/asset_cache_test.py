@@ -0,0 +1,137 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from aixplain.utils import asset_cache
+from aixplain.utils.asset_cache import AssetCache
+from aixplain.utils.cache_utils import CacheValidators
+
+
+class Asset:
+    from_dict_calls = 0
+
+    def __init__(self, id, name=""):
+        self.id = id
+        self.name = name
+
+    @classmethod
+    def from_dict(cls, data):
+        cls.from_dict_calls += 1
+        return cls(data["id"], data.get("name", ""))
+
+
+@pytest.fixture(autouse=True)
+def cache_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_cache, "CACHE_FOLDER", str(tmp_path))
+    monkeypatch.delenv("CACHE_EXPIRY_TIME", raising=False)
+    AssetCache.clear_instances()
+    Asset.from_dict_calls = 0
+    yield tmp_path
+    AssetCache.clear_instances()
+
+
+def test_one_instance_per_asset_type():
+    assert AssetCache(Asset) is AssetCache(Asset)
+    assert AssetCache(Asset) is not AssetCache(Asset, cache_filename="other")
+
+
+def test_warm_lookup_does_not_touch_disk():
+    cache = AssetCache(Asset)
+    cache.add(Asset("a1", "first"))
+
+    with patch.object(asset_cache.sqlite3, "connect") as connect:
+        assert cache.get("a1").name == "first"
+        assert AssetCache(Asset).get("a1").name == "first"
+        assert cache.get("missing") is None
+
+    connect.assert_not_called()
+
+
+def test_entries_are_deserialized_lazily_after_reload(cache_folder):
+    AssetCache(Asset).add_list([Asset("a1", "first"), Asset("a2", "second")])
+    AssetCache.clear_instances()
+
+    cache = AssetCache(Asset)
+    assert cache.has_valid_cache()
+    assert Asset.from_dict_calls == 0
+
+    assert cache.get("a2").name == "second"
+    assert cache.get("a2") is cache.get("a2")
+    assert Asset.from_dict_calls == 1
+    assert cache.store.data.get("a1").name == "first"
+    assert Asset.from_dict_calls == 2
+    assert (cache_folder / "asset.sqlite").exists()
+
+
+def test_add_list_replaces_existing_assets():
+    cache = AssetCache(Asset)
+    cache.add(Asset("old"))
+    cache.add_list([Asset("new")])
+    AssetCache.clear_instances()
+
+    cache = AssetCache(Asset)
+    assert cache.get("old") is None
+    assert [asset.id for asset in cache.get_all()] == ["new"]
+
+
+def test_save_persists_in_place_changes_like_add():
+    class ApiAsset(Asset):
+        def to_dict(self):
+            # Like v1 assets whose to_dict expects fields the cache does not need.
+            raise AttributeError("'NoneType' object has no attribute 'to_dict'")
+
+    cache = AssetCache(ApiAsset)
+    cache.add(ApiAsset("m1", "first"))
+    cache.get("m1").name = "renamed"
+    cache.save()
+    AssetCache.clear_instances()
+
+    assert AssetCache(ApiAsset).get("m1").name == "renamed"
+
+
+def test_expired_entries_are_kept_stale_until_revalidated(monkeypatch):
+    monkeypatch.setenv("CACHE_EXPIRY_TIME", "0")
+    AssetCache(Asset).add(Asset("a1"), CacheValidators(etag='"v1"'))
+    AssetCache.clear_instances()
+
+    cache = AssetCache(Asset)
+    assert not cache.has_valid_cache()
+    assert cache.get("a1").id == "a1"
+    assert not cache.is_fresh("a1")
+
+    monkeypatch.setenv("CACHE_EXPIRY_TIME", "3600")
+    cache.mark_valid("a1", CacheValidators(updated_at="2024-01-01T00:00:00Z"))
+    AssetCache.clear_instances()
+
+    cache = AssetCache(Asset)
+    assert cache.is_fresh("a1")
+    assert cache.validators("a1").etag == '"v1"'
+    assert cache.validators("a1").updated_at == "2024-01-01T00:00:00Z"
+
+
+def test_imports_legacy_json_cache(cache_folder):
+    legacy = cache_folder / "asset.json"
+    legacy.write_text(json.dumps({"expiry": time.time() + 100, "data": {"a1": {"id": "a1", "name": "legacy"}}}))
+
+    cache = AssetCache(Asset)
+
+    assert cache.get("a1").name == "legacy"
+    assert not legacy.exists()
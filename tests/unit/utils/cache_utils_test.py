@@ -0,0 +1,25 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from aixplain.utils.cache_utils import CacheValidators, conditional_headers
+
+
+def test_conditional_headers():
+    assert conditional_headers(None) == {}
+    headers = conditional_headers(CacheValidators(etag='"abc"', updated_at="2024-01-02T03:04:05.000Z"))
+    assert headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Tue, 02 Jan 2024 03:04:05 GMT"}
+    http_date = "Tue, 02 Jan 2024 03:04:05 GMT"
+    assert conditional_headers(CacheValidators(updated_at=http_date)) == {"If-Modified-Since": http_date}
@@ -0,0 +1,130 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import math
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from aixplain.utils import json_utils
+
+INSTALLED = [name for name in json_utils.BACKENDS if json_utils._import(name) is not None]
+
+
+@pytest.fixture(params=INSTALLED)
+def backend(request):
+    previous = json_utils.get_backend()
+    json_utils.set_backend(request.param)
+    yield request.param
+    json_utils.set_backend(previous)
+
+
+def _poll_response(n_items: int = 5000) -> bytes:
+    """A completed poll response carrying a large list of detailed results."""
+    details = [
+        {
+            "index": n,
+            "text": f"Segment {n}: the quick brown fox jumps over the lazy dog éè \U0001f600",
+            "score": n / 7,
+            "tokens": list(range(20)),
+            "metadata": {"start": n * 0.5, "end": n * 0.5 + 0.5, "speaker": None, "final": True},
+        }
+        for n in range(n_items)
+    ]
+    body = {"completed": True, "status": "SUCCESS", "data": "ok", "details": details, "usedCredits": 0.01}
+    return json.dumps(body).encode("utf-8")
+
+
+def test_loads_matches_stdlib(backend):
+    document = _poll_response(50)
+    assert json_utils.loads(document) == json.loads(document)
+    assert json_utils.loads(document.decode("utf-8")) == json.loads(document)
+
+
+def test_loads_accepts_documents_only_the_stdlib_parses(backend):
+    assert math.isnan(json_utils.loads('{"score": NaN}')["score"])
+    assert json_utils.loads("[-Infinity]") == [-math.inf]
+
+
+def test_loads_raises_stdlib_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads("data: not json")
+
+
+def test_dumps_round_trips_and_escapes_non_ascii_by_default(backend):
+    obj = {"text": "café \U0001f600", "nested": [1, 2.5, None, True, 2**70], 3: "int key"}
+    assert json_utils.dumps(obj).isascii()
+    assert json.loads(json_utils.dumps(obj)) == json.loads(json.dumps(obj))
+    assert "café" in json_utils.dumps(obj, ensure_ascii=False)
+
+
+def test_dumps_supports_indent_sort_keys_and_default(backend):
+    obj = {"b": datetime(2024, 1, 2, 3, 4, 5), "a": [1, {"c": None}]}
+    assert json_utils.dumps(obj, indent=2, sort_keys=True, default=str) == json.dumps(
+        obj, indent=2, sort_keys=True, default=str
+    )
+    assert json_utils.dumps([1], indent=4) == json.dumps([1], indent=4)
+    with pytest.raises(TypeError):
+        json_utils.dumps({"value": object()})
+
+
+def test_response_json_decodes_body_and_keeps_requests_errors(backend):
+    response = requests.Response()
+    response._content = b'{"completed": true}'
+    assert json_utils.response_json(response) == {"completed": True}
+
+    response._content = b"<html>Bad gateway</html>"
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        json_utils.response_json(response)
+
+    mocked = Mock()
+    mocked.json.return_value = {"status": "SUCCESS"}
+    assert json_utils.response_json(mocked) == {"status": "SUCCESS"}
+
+
+def test_set_backend_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        json_utils.set_backend("simplejson")
+
+
+@pytest.mark.benchmark
+def test_decode_throughput_of_large_poll_responses():
+    """Micro-benchmark: decode throughput (MB/s) of a ~1.5MB poll response per installed backend.
+
+    Skipped by default; run with ``pytest --run-benchmarks -s``.
+    """
+    document = _poll_response()
+    size_mb = len(document) / 1e6
+    throughput = {}
+    previous = json_utils.get_backend()
+    try:
+        for name in INSTALLED:
+            json_utils.set_backend(name)
+            best = math.inf
+            for _ in range(5):
+                start = time.perf_counter()
+                json_utils.loads(document)
+                best = min(best, time.perf_counter() - start)
+            throughput[name] = size_mb / best
+    finally:
+        json_utils.set_backend(previous)
+
+    rates = ", ".join(f"{name} {rate:.0f}MB/s" for name, rate in throughput.items())
+    print(f"\nDecoding a {size_mb:.1f}MB poll response: {rates}")
@@ -0,0 +1,72 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+
+from aixplain.utils.pagination import iter_list, iter_paginated
+
+
+def make_fetch(total, calls):
+    def fetch(page_number):
+        calls.append(page_number)
+        start = page_number * 3
+        return list(range(start, min(start + 3, total))), total
+
+    return fetch
+
+
+def test_yields_every_item_without_extra_requests():
+    calls = []
+    assert list(iter_paginated(make_fetch(7, calls), page_size=3)) == list(range(7))
+    assert calls == [0, 1, 2]
+
+    calls = []
+    assert list(iter_paginated(make_fetch(6, calls), page_size=3, prefetch=False)) == list(range(6))
+    assert calls == [0, 1]
+
+
+def test_next_page_is_fetched_while_current_page_is_consumed():
+    started = threading.Event()
+
+    def fetch(page_number):
+        if page_number == 1:
+            started.set()
+        return [page_number] * 2, 4
+
+    items = iter_paginated(fetch, page_size=2, start_page=0)
+    assert next(items) == 0
+    assert started.wait(timeout=5)
+    assert list(items) == [0, 1, 1]
+
+
+def test_closing_early_stops_fetching():
+    calls = []
+    items = iter_paginated(make_fetch(30, calls), page_size=3)
+    assert [next(items) for _ in range(4)] == [0, 1, 2, 3]
+    items.close()
+    assert max(calls) <= 2
+
+
+def test_iter_list_reads_a_factory_list_from_the_given_page():
+    calls = []
+
+    def list_fn(page_number, page_size, **filters):
+        calls.append((page_number, page_size, filters))
+        start = page_number * page_size
+        return {"results": list(range(start, min(start + page_size, 7))), "total": 7}
+
+    assert list(iter_list(list_fn, page_size=3, prefetch=False, page_number=1, query="x")) == [3, 4, 5, 6]
+    assert calls == [(1, 3, {"query": "x"}), (2, 3, {"query": "x"})]
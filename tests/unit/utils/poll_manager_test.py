@@ -0,0 +1,193 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from aixplain.utils.poll_manager import PollManager
+from aixplain.v2.exceptions import APIError
+
+
+class FakeRunnable:
+    """Completes each poll URL after a configured number of polls."""
+
+    def __init__(self, polls_needed, as_dict=False, error_on=None):
+        self.polls_needed = polls_needed
+        self.as_dict = as_dict
+        self.error_on = error_on
+        self.calls = {}
+        self.timestamps = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def poll(self, poll_url):
+        with self._lock:
+            self.calls[poll_url] = self.calls.get(poll_url, 0) + 1
+            count = self.calls[poll_url]
+            self.timestamps.append(time.monotonic())
+            self.threads.add(threading.get_ident())
+        if poll_url == self.error_on:
+            raise ValueError("boom")
+        completed = count >= self.polls_needed.get(poll_url, 1)
+        response = {"completed": completed, "data": poll_url if completed else None}
+        return response if self.as_dict else SimpleNamespace(**response)
+
+
+def test_resolves_many_jobs_from_shared_workers():
+    urls = [f"https://models.aixplain.com/api/v1/data/{i}" for i in range(50)]
+    runnable = FakeRunnable({url: (i % 3) + 1 for i, url in enumerate(urls)})
+
+    with PollManager(max_requests_per_second=None, max_workers=4, wait_time=0.01) as manager:
+        futures = [manager.submit(runnable, url) for url in urls]
+        results = [future.result(timeout=10) for future in futures]
+
+    assert [result.data for result in results] == urls
+    assert all(runnable.calls[url] == (i % 3) + 1 for i, url in enumerate(urls))
+    assert len(runnable.threads) <= 4
+    assert manager.pending == 0
+
+
+def test_supports_v1_style_dict_responses_and_callbacks():
+    runnable = FakeRunnable({"url-1": 2}, as_dict=True)
+    done = []
+
+    with PollManager(max_requests_per_second=None, wait_time=0.01) as manager:
+        future = manager.submit(runnable, "url-1", callback=lambda f: done.append(f.result()["data"]))
+        assert future.result(timeout=5)["completed"] is True
+
+    assert done == ["url-1"]
+
+
+def test_rate_cap_throttles_beyond_burst():
+    urls = [f"url-{i}" for i in range(6)]
+    runnable = FakeRunnable({})
+
+    start = time.monotonic()
+    with PollManager(max_requests_per_second=2, wait_time=0.0) as manager:
+        for future in [manager.submit(runnable, url) for url in urls]:
+            future.result(timeout=10)
+
+    # Bucket capacity is 2, then 2 tokens/s: 4 extra polls need at least ~2s.
+    assert time.monotonic() - start >= 1.5
+
+
+def test_per_job_backoff_grows_delay():
+    runnable = FakeRunnable({"slow": 4})
+
+    with PollManager(max_requests_per_second=None, wait_time=0.05, backoff_factor=2.0) as manager:
+        manager.submit(runnable, "slow").result(timeout=5)
+
+    gaps = [b - a for a, b in zip(runnable.timestamps, runnable.timestamps[1:])]
+    assert len(gaps) == 3
+    assert gaps[2] > gaps[0]
+
+
+def test_poll_error_and_timeout_propagate():
+    runnable = FakeRunnable({"never": 10**6}, error_on="broken")
+
+    with PollManager(max_requests_per_second=None, wait_time=0.01) as manager:
+        broken = manager.submit(runnable, "broken")
+        slow = manager.submit(runnable, "never", timeout=0.1)
+        with pytest.raises(ValueError):
+            broken.result(timeout=5)
+        with pytest.raises(TimeoutError):
+            slow.result(timeout=5)
+
+
+def test_transient_poll_errors_are_retried_with_backoff():
+    runnable = FakeRunnable({"flaky": 3})
+    original_poll = runnable.poll
+    failures = iter([True, True, False, False, False])
+
+    def flaky_poll(poll_url):
+        if next(failures):
+            original_poll(poll_url)
+            raise ConnectionError("reset")
+        return original_poll(poll_url)
+
+    runnable.poll = flaky_poll
+    with PollManager(max_requests_per_second=None, wait_time=0.01, max_poll_errors=2) as manager:
+        result = manager.submit(runnable, "flaky").result(timeout=5)
+
+    assert result.completed is True
+    assert runnable.calls["flaky"] == 3
+
+
+def _http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+@pytest.mark.parametrize(
+    "error, polls",
+    [
+        (APIError("Operation failed: boom", status_code=500), 1),
+        (_http_error(404), 1),
+        (_http_error(503), 3),
+        (requests.ConnectionError("reset"), 3),
+    ],
+)
+def test_only_transport_errors_and_5xx_are_retried(error, polls):
+    runnable = FakeRunnable({})
+    attempts = []
+
+    def failing_poll(poll_url):
+        attempts.append(poll_url)
+        raise error
+
+    runnable.poll = failing_poll
+    with PollManager(max_requests_per_second=None, wait_time=0.01, max_poll_errors=2) as manager:
+        with pytest.raises(type(error)):
+            manager.submit(runnable, "failing").result(timeout=5)
+
+    assert len(attempts) == polls
+
+
+def test_shutdown_with_cancel_pending_does_not_wait_for_the_poll_interval():
+    runnable = FakeRunnable({"slow": 10**6})
+    manager = PollManager(max_requests_per_second=None, wait_time=30.0)
+    future = manager.submit(runnable, "slow")
+    while not runnable.calls:
+        time.sleep(0.01)
+
+    start = time.monotonic()
+    manager.shutdown(wait=True, cancel_pending=True)
+
+    assert time.monotonic() - start < 5
+    assert future.cancelled()
+    assert manager.pending == 0
+
+
+def test_submit_result_short_circuits_completed_runs():
+    runnable = FakeRunnable({})
+    manager = PollManager()
+    completed = SimpleNamespace(completed=True, url=None, data="done")
+
+    assert manager.submit_result(runnable, completed).result(timeout=1) is completed
+    assert runnable.calls == {}
+    manager.shutdown()
+
+
+def test_submit_after_shutdown_fails():
+    manager = PollManager()
+    manager.shutdown()
+    with pytest.raises(RuntimeError):
+        manager.submit(FakeRunnable({}), "url")
@@ -0,0 +1,231 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import http.server
+import logging
+import threading
+
+import pytest
+import requests
+import requests_mock
+
+from aixplain.utils import request_hooks
+from aixplain.utils.request_hooks import (
+    LatencyHistogram,
+    OpenTelemetryExporter,
+    RequestEvent,
+    RequestMetrics,
+    add_request_hook,
+    endpoint_template,
+    remove_request_hook,
+)
+from aixplain.utils.request_utils import SessionPool, _request_with_retry
+from aixplain.v2.client import AixplainClient
+from aixplain.v2.exceptions import APIError
+
+BACKEND_URL = "https://platform-api.aixplain.com/"
+
+
+@pytest.fixture
+def events():
+    received = []
+    add_request_hook(received.append)
+    yield received
+    remove_request_hook(received.append)
+
+
+def _event(**kwargs):
+    values = dict(method="GET", endpoint="/sdk/models/{id}", host="h", status=200, latency=0.1)
+    values.update(kwargs)
+    return RequestEvent(**values)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://Platform-API.aixplain.com/sdk/models/6414bd3cd09663e9225130e8",
+            ("platform-api.aixplain.com", "/sdk/models/{id}"),
+        ),
+        (
+            "https://models.aixplain.com/api/v1/data/1f0b4a7e-3c2d-4e5f-8a9b-0c1d2e3f4a5b",
+            ("models.aixplain.com", "/api/v1/data/{id}"),
+        ),
+        ("/sdk/pipelines/42/run?debug=1", ("", "/sdk/pipelines/{id}/run")),
+        ("https://h/api/v2/execute/openai/gpt-4o-mini", ("h", "/api/v2/execute/openai/gpt-4o-mini")),
+        ("https://h/sdk/agents/abcdef0123456789abcdef0123456789/run", ("h", "/sdk/agents/{id}/run")),
+    ],
+)
+def test_endpoint_template_replaces_resource_ids(url, expected):
+    assert endpoint_template(url) == expected
+
+
+def test_v1_helper_reports_requests_to_global_hooks(events):
+    url = "https://models.aixplain.com/api/v1/execute/6414bd3cd09663e9225130e8"
+    with requests_mock.Mocker() as mock:
+        mock.post(url, json={"status": "IN_PROGRESS"}, status_code=201)
+        _request_with_retry("post", url, data='{"data": "hi"}')
+
+    (event,) = events
+    assert (event.method, event.endpoint, event.host) == ("POST", "/api/v1/execute/{id}", "models.aixplain.com")
+    assert (event.status, event.request_bytes, event.response_bytes) == (201, 14, 25)
+    assert event.ok and event.retries == 0 and event.latency >= 0
+
+
+def test_v1_helper_counts_urllib3_retries(events):
+    calls = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            calls.append(self.path)
+            body = b'{"completed": true}'
+            self.send_response(503 if len(calls) < 3 else 200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    pool = SessionPool(retry_backoff_factor=0)
+    try:
+        session = pool.get(f"http://127.0.0.1:{server.server_port}")
+        request_hooks.instrumented_request(session, "GET", f"http://127.0.0.1:{server.server_port}/api/v1/data/7")
+    finally:
+        pool.close()
+        server.shutdown()
+
+    assert [(e.status, e.retries, e.endpoint) for e in events] == [(200, 2, "/api/v1/data/{id}")]
+
+
+def test_failed_requests_report_the_error(events):
+    url = "https://models.aixplain.com/api/v1/data/7"
+    with requests_mock.Mocker() as mock, pytest.raises(requests.ConnectionError):
+        mock.get(url, exc=requests.ConnectionError)
+        _request_with_retry("get", url)
+
+    (event,) = events
+    assert (event.status, event.error, event.ok) == (None, "ConnectionError", False)
+
+
+def test_client_hooks_only_observe_their_client(events):
+    own = []
+    client = AixplainClient(base_url=BACKEND_URL, team_api_key="key", hooks=[own.append])
+    other = AixplainClient(base_url=BACKEND_URL, team_api_key="key")
+
+    with requests_mock.Mocker() as mock:
+        mock.get(f"{BACKEND_URL}sdk/models/42", json={"id": "42"})
+        mock.get(f"{BACKEND_URL}sdk/models/43", status_code=404, json={"message": "missing"})
+        assert client.get("sdk/models/42") == {"id": "42"}
+        with pytest.raises(APIError):
+            client.get("sdk/models/43")
+        other.get("sdk/models/42")
+
+    assert [(e.endpoint, e.status, e.ok) for e in own] == [
+        ("/sdk/models/{id}", 200, True),
+        ("/sdk/models/{id}", 404, False),
+    ]
+    assert len(events) == 3
+
+
+def test_failing_hook_does_not_break_requests(caplog):
+    def broken(event):
+        raise RuntimeError("boom")
+
+    client = AixplainClient(base_url=BACKEND_URL, team_api_key="key", hooks=[broken])
+    with requests_mock.Mocker() as mock, caplog.at_level(logging.WARNING):
+        mock.get(f"{BACKEND_URL}sdk/models/42", json={"id": "42"})
+        assert client.get("sdk/models/42") == {"id": "42"}
+    assert "Request hook" in caplog.text
+
+
+def test_response_body_is_only_logged_at_debug_level(caplog):
+    client = AixplainClient(base_url=BACKEND_URL, team_api_key="key")
+    with requests_mock.Mocker() as mock:
+        mock.get(f"{BACKEND_URL}sdk/models/42", text='{"id": "42"}')
+        with caplog.at_level(logging.INFO, logger="aixplain.v2.client"):
+            client.get("sdk/models/42")
+        assert "Response" not in caplog.text
+        with caplog.at_level(logging.DEBUG, logger="aixplain.v2.client"):
+            client.get("sdk/models/42")
+        assert 'Response: {"id": "42"}' in caplog.text
+
+
+def test_latency_histogram_quantiles():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 2.0):
+        histogram.observe(value)
+
+    summary = histogram.to_dict()
+    assert summary["count"] == 10 and summary["min"] == 0.05 and summary["max"] == 2.0
+    assert summary["buckets"] == {"0.1": 2, "1.0": 7, "+Inf": 1}
+    assert 0.1 <= summary["p50"] <= 1.0 and summary["p99"] > 1.0
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+def test_request_metrics_aggregate_per_endpoint():
+    metrics = RequestMetrics()
+    metrics(_event(latency=0.02, response_bytes=100, request_bytes=10))
+    metrics(_event(latency=0.2, status=500, retries=2, response_bytes=50))
+    metrics(_event(method="POST", endpoint="/api/v1/execute/{id}", status=None, error="Timeout"))
+
+    snapshot = metrics.snapshot()
+    model_get = snapshot["GET /sdk/models/{id}"]
+    assert (model_get["count"], model_get["errors"], model_get["retries"]) == (2, 1, 2)
+    assert model_get["statuses"] == {"200": 1, "500": 1}
+    assert (model_get["request_bytes"], model_get["response_bytes"]) == (10, 150)
+    assert model_get["latency"]["min"] == 0.02 and model_get["latency"]["max"] == 0.2
+    assert snapshot["POST /api/v1/execute/{id}"]["statuses"] == {"Timeout": 1}
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_opentelemetry_exporter_records_instruments():
+    class Instrument:
+        def __init__(self):
+            self.calls = []
+
+        def record(self, value, attributes):
+            self.calls.append((value, attributes))
+
+        add = record
+
+    class Meter:
+        def __init__(self):
+            self.instruments = {}
+
+        def create_histogram(self, name, **kwargs):
+            return self.instruments.setdefault(name, Instrument())
+
+        create_counter = create_histogram
+
+    meter = Meter()
+    exporter = OpenTelemetryExporter(meter=meter)
+    exporter(_event(status=503, retries=1, response_bytes=20))
+
+    attributes = {
+        "http.request.method": "GET",
+        "url.template": "/sdk/models/{id}",
+        "server.address": "h",
+        "http.response.status_code": 503,
+        "error.type": "503",
+    }
+    assert meter.instruments["aixplain.client.request.duration"].calls == [(0.1, attributes)]
+    assert meter.instruments["aixplain.client.response.body.size"].calls == [(20, attributes)]
+    assert meter.instruments["aixplain.client.request.retries"].calls == [(1, attributes)]
+    assert meter.instruments["aixplain.client.request.body.size"].calls == []
@@ -0,0 +1,84 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests_mock
+
+from aixplain.utils.request_utils import SessionPool, _request_with_retry, get_session, session_pool_stats
+
+
+def test_session_is_shared_per_host():
+    pool = SessionPool()
+    first = pool.get("https://models.aixplain.com/api/v1/execute/abc")
+    second = pool.get("https://MODELS.aixplain.com/api/v1/data/xyz")
+    other = pool.get("https://platform-api.aixplain.com/sdk/models/abc")
+
+    assert first is second
+    assert first is not other
+    stats = pool.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["sessions"] == 2
+
+
+def test_session_pool_applies_settings():
+    pool = SessionPool(pool_maxsize=32, retry_total=2, keep_alive=False)
+    session = pool.get("https://platform-api.aixplain.com")
+    adapter = session.get_adapter("https://platform-api.aixplain.com")
+
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 2
+    assert session.headers["Connection"] == "close"
+
+
+def test_configure_drops_existing_sessions():
+    pool = SessionPool()
+    before = pool.get("https://platform-api.aixplain.com")
+    pool.configure(pool_maxsize=4)
+    after = pool.get("https://platform-api.aixplain.com")
+
+    assert before is not after
+    assert after.get_adapter("https://platform-api.aixplain.com")._pool_maxsize == 4
+
+
+def test_configure_rejects_unknown_setting():
+    with pytest.raises(TypeError):
+        SessionPool().configure(pool_size=4)
+
+
+def test_session_pool_is_thread_safe():
+    pool = SessionPool()
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        sessions = list(executor.map(lambda _: pool.get("https://platform-api.aixplain.com"), range(200)))
+
+    assert len({id(session) for session in sessions}) == 1
+    stats = pool.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 199
+
+
+def test_request_with_retry_uses_shared_session():
+    url = "https://platform-api.aixplain.com/sdk/models/test-id"
+    before = session_pool_stats()["hits"]
+    with requests_mock.Mocker() as mock:
+        mock.get(url, json={"id": "test-id"})
+        assert _request_with_retry("get", url).json() == {"id": "test-id"}
+        assert _request_with_retry("get", url).json() == {"id": "test-id"}
+
+    assert session_pool_stats()["hits"] >= before + 1
+    assert get_session(url) is get_session("https://platform-api.aixplain.com/other")
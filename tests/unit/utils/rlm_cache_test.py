@@ -0,0 +1,121 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from aixplain.utils import rlm_cache
+from aixplain.utils.rlm_cache import MemoryRLMCache, SQLiteRLMCache, rlm_cache_key
+
+
+def test_key_depends_on_every_input():
+    key = rlm_cache_key("worker", "template {chunk}", "chunk", "query")
+
+    variants = [
+        rlm_cache_key("other-worker", "template {chunk}", "chunk", "query"),
+        rlm_cache_key("worker", "other {chunk}", "chunk", "query"),
+        rlm_cache_key("worker", "template {chunk}", "chunk", "other query"),
+        rlm_cache_key("worker", "template {chunk}", "chunkq", "uery"),
+    ]
+    assert key == rlm_cache_key("worker", "template {chunk}", "chunk", "query")
+    assert len({key, *variants}) == 5
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryRLMCache(max_size=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"
+    cache.put("c", "3")
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("1", None, "3")
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (3, 1, 2)
+    assert stats.hit_rate == pytest.approx(0.75)
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryRLMCache(ttl=10)
+    with patch.object(rlm_cache.time, "monotonic", return_value=100.0):
+        cache.put("a", "1")
+    with patch.object(rlm_cache.time, "monotonic", return_value=109.0):
+        assert cache.get("a") == "1"
+    with patch.object(rlm_cache.time, "monotonic", return_value=111.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_memory_cache_rejects_empty_size():
+    with pytest.raises(ValueError):
+        MemoryRLMCache(max_size=0)
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "nested" / "rlm.sqlite")
+    cache = SQLiteRLMCache(path)
+    cache.put("a", "café")
+    cache.put("a", "updated")
+    cache.close()
+
+    reopened = SQLiteRLMCache(path)
+    assert reopened.get("a") == "updated"
+    assert reopened.get("b") is None
+    assert reopened.stats().size == 1
+    reopened.clear()
+    assert reopened.stats() == rlm_cache.RLMCacheStats()
+
+
+def test_sqlite_cache_expires_and_prunes_entries(tmp_path):
+    path = str(tmp_path / "rlm.sqlite")
+    with patch.object(rlm_cache.time, "time", return_value=1000.0):
+        cache = SQLiteRLMCache(path, ttl=60)
+        cache.put("old", "1")
+    with patch.object(rlm_cache.time, "time", return_value=1050.0):
+        cache.put("new", "2")
+    with patch.object(rlm_cache.time, "time", return_value=1070.0):
+        assert cache.get("old") is None and cache.get("new") == "2"
+        assert cache.prune() == 1
+    assert cache.stats().size == 1
+
+
+def test_sqlite_cache_bounds_size_by_recent_use(tmp_path):
+    cache = SQLiteRLMCache(str(tmp_path / "rlm.sqlite"), max_size=2)
+    with patch.object(rlm_cache.time, "time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("1", None, "3")
+
+
+def test_sqlite_cache_is_thread_safe(tmp_path):
+    cache = SQLiteRLMCache(str(tmp_path / "rlm.sqlite"))
+
+    def work(n):
+        for i in range(50):
+            cache.put(f"{n}-{i}", str(i))
+            assert cache.get(f"{n}-{i}") == str(i)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.stats().size == 400
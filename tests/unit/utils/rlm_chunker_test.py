@@ -0,0 +1,131 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from aixplain.utils import rlm_chunker
+from aixplain.utils.rlm_chunker import estimate_tokens, get_token_counter, iter_chunks
+
+PARAGRAPHS = [
+    " ".join(f"Sentence {p}.{s} states that item {s} of section {p} is worth {s * 7} credits." for s in range(10))
+    for p in range(40)
+]
+TEXT = "\n\n".join(PARAGRAPHS)
+
+
+def test_text_chunks_fit_budget_and_end_on_sentences():
+    chunks = list(iter_chunks(TEXT, 300, overlap_tokens=0))
+
+    assert len(chunks) > 5
+    assert all(estimate_tokens(chunk) <= 300 for chunk in chunks)
+    assert all(chunk.endswith("credits.") and chunk.startswith("Sentence") for chunk in chunks)
+    assert " ".join(" ".join(chunks).split()) == " ".join(TEXT.split())
+
+
+def test_text_chunks_overlap_by_whole_sentences():
+    chunks = list(iter_chunks(TEXT, 300, overlap_tokens=60))
+
+    for previous, chunk in zip(chunks, chunks[1:]):
+        first_sentence = chunk.split(" credits. ")[0] + " credits."
+        assert first_sentence in previous
+        assert estimate_tokens(chunk) <= 300
+
+
+def test_paragraphs_are_kept_whole_when_they_fit():
+    chunks = list(iter_chunks(TEXT, 500, overlap_tokens=0))
+
+    assert all(chunk.split("\n\n")[0] in PARAGRAPHS for chunk in chunks)
+
+
+def test_text_without_boundaries_is_cut_by_characters():
+    chunks = list(iter_chunks("x" * 10_000, 100))
+
+    assert "".join(chunks) == "x" * 10_000
+    assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+
+
+def test_max_chars_caps_chunks():
+    chunks = list(iter_chunks(TEXT, 10_000, max_chars=1_000))
+
+    assert len(chunks) > 1 and all(len(chunk) <= 1_000 for chunk in chunks)
+
+
+def test_list_items_are_serialized_once_and_grouped_as_json():
+    items = [{"id": i, "text": f"record {i}"} for i in range(200)]
+
+    with patch.object(rlm_chunker.json, "dumps", wraps=json.dumps) as dumps:
+        chunks = list(iter_chunks(items, 200))
+
+    assert dumps.call_count == len(items)
+    assert len(chunks) > 1
+    assert [item for chunk in chunks for item in json.loads(chunk)] == items
+
+
+def test_string_lists_are_joined_and_oversize_items_split():
+    chunks = list(iter_chunks(["first", "Long. " * 400, "last"], 200))
+
+    assert chunks[0] == "first"
+    assert chunks[-1] == "last"
+    assert all(estimate_tokens(chunk) <= 200 for chunk in chunks)
+
+
+def test_dict_entries_are_grouped_into_json_objects():
+    mapping = {f"key-{i}": {"values": list(range(i % 7))} for i in range(120)}
+
+    chunks = list(iter_chunks(mapping, 150))
+
+    merged = {}
+    for chunk in chunks:
+        merged.update(json.loads(chunk))
+    assert len(chunks) > 1 and merged == mapping
+
+
+def test_chunks_are_produced_lazily():
+    counted = []
+
+    def count(text):
+        counted.append(text)
+        return estimate_tokens(text)
+
+    chunks = iter_chunks(TEXT, 300, count=count)
+    next(chunks)
+
+    assert sum(map(len, counted)) < len(TEXT) / 2
+
+
+def test_estimator_is_conservative():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("a" * 400) == 100
+    assert estimate_tokens("你好世界") == 4
+    assert estimate_tokens('{"a": [1, 2, 3]}') >= 10
+
+
+def test_token_counter_falls_back_without_tiktoken():
+    get_token_counter.cache_clear()
+    try:
+        with patch.dict(sys.modules, {"tiktoken": None}):
+            assert get_token_counter() is estimate_tokens
+    finally:
+        get_token_counter.cache_clear()
+
+
+@pytest.mark.parametrize("context", ["", "short text", [], {}])
+def test_small_contexts_yield_at_most_one_chunk(context):
+    assert len(list(iter_chunks(context, 100))) <= 1
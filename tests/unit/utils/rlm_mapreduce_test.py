@@ -0,0 +1,149 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+import time
+
+import pytest
+
+from aixplain.utils.rlm_mapreduce import StreamingMapReduce
+
+
+def _runner(map_call, reduce_call=None, budget_tokens=None, **kwargs):
+    return StreamingMapReduce(
+        map_call,
+        reduce_call or (lambda parts: "(" + "+".join(parts) + ")"),
+        is_empty=lambda answer: answer == "NONE",
+        count_tokens=len,
+        budget_tokens=budget_tokens,
+        map_error=lambda idx, e: f"error {idx}: {e}",
+        **kwargs,
+    )
+
+
+def test_small_answers_are_returned_in_order_without_reducing():
+    def map_call(idx, chunk):
+        time.sleep(0.01 * (5 - idx))
+        if idx == 2:
+            raise RuntimeError("boom")
+        return chunk.upper()
+
+    answers, final = _runner(map_call, budget_tokens=1000).run(iter("abcde"))
+
+    assert answers == ["A", "B", "error 2: boom", "D", "E"]
+    assert final is None
+
+
+def test_groups_are_reduced_before_the_map_finishes():
+    reduced = threading.Event()
+
+    def map_call(idx, chunk):
+        if idx >= 4:
+            assert reduced.wait(5), "no group was reduced while chunks were still mapped"
+        return chunk
+
+    def reduce_call(parts):
+        reduced.set()
+        return "(" + "+".join(parts) + ")"
+
+    runner = _runner(map_call, reduce_call, budget_tokens=10, fan_in=2, max_workers=4)
+    answers, final = runner.run(["a" * 5, "b" * 5, "c" * 5, "d" * 5, "e" * 5, "f" * 5])
+
+    assert answers == ["aaaaa", "bbbbb", "ccccc", "ddddd", "eeeee", "fffff"]
+    assert final == "(((aaaaa+bbbbb)+(ccccc+ddddd))+(eeeee+fffff))"
+    assert runner.metrics.latency["reduce"].count == 5
+
+
+def test_empty_answers_are_skipped_in_the_tree():
+    answers = ["NONE", "NONE", "x" * 20, "NONE", "NONE", "y" * 20]
+    runner = _runner(lambda idx, chunk: chunk, budget_tokens=30, fan_in=2)
+
+    _, final = runner.run(answers)
+
+    assert final == "(" + "x" * 20 + "+" + "y" * 20 + ")"
+
+
+def test_lone_answer_still_goes_through_one_reduce_call():
+    runner = _runner(lambda idx, chunk: chunk, budget_tokens=5, fan_in=2)
+
+    _, final = runner.run(["NONE", "x" * 20, "NONE"])
+
+    assert final == "(" + "x" * 20 + ")"
+
+
+def test_reduce_failures_are_raised():
+    def reduce_call(parts):
+        raise RuntimeError("reduce failed")
+
+    with pytest.raises(RuntimeError, match="reduce failed"):
+        _runner(lambda idx, chunk: chunk, reduce_call, budget_tokens=5, fan_in=2).run(["x" * 10, "y" * 10])
+
+
+def test_stragglers_are_hedged_and_the_first_copy_wins():
+    release = threading.Event()
+    attempts = []
+
+    def map_call(idx, chunk):
+        attempts.append(idx)
+        if idx == 5 and attempts.count(5) == 1:
+            release.wait(10)
+            return "late"
+        time.sleep(0.02)
+        return chunk
+
+    runner = _runner(map_call, max_workers=4, hedge_min_samples=4, hedge_min_delay=0.1, hedge_max_fraction=0.5)
+    started = time.monotonic()
+    try:
+        answers, _ = runner.run(list("abcdef"))
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 5
+    assert answers == list("abcdef") and attempts.count(5) == 2
+    metrics = runner.metrics.to_dict()
+    assert (metrics["hedged"], metrics["hedge_wins"]) == (1, 1)
+    assert metrics["stages"]["map"]["count"] == 6 and metrics["stages"]["map"]["wall_time"] > 0
+
+
+def test_hedging_can_be_disabled():
+    attempts = []
+
+    def map_call(idx, chunk):
+        attempts.append(idx)
+        time.sleep(0.3 if idx == 4 else 0.01)
+        return chunk
+
+    runner = _runner(map_call, hedge_min_delay=0.01, hedge_max_fraction=0)
+    runner.run(list("abcde"))
+
+    assert sorted(attempts) == [0, 1, 2, 3, 4] and runner.metrics.hedged == 0
+
+
+@pytest.mark.parametrize("chunks, fan_in, max_pending", [(3, 2, 1), (40, 8, 16)])
+def test_tree_starts_before_the_chunks_are_exhausted(chunks, fan_in, max_pending):
+    consumed = []
+
+    def produce():
+        for i in range(chunks):
+            consumed.append(i)
+            yield f"{i:02d}" * 5
+
+    runner = _runner(lambda idx, chunk: chunk, budget_tokens=15, fan_in=fan_in, max_workers=4, max_pending=max_pending)
+    answers, final = runner.run(produce())
+
+    assert len(consumed) == chunks and len(answers) == chunks
+    assert final is not None and all(answer in final for answer in answers)
+    assert len(runner._levels) <= chunks
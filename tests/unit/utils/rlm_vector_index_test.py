@@ -0,0 +1,161 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import os
+import threading
+
+import pytest
+
+from aixplain.utils import rlm_vector_index
+from aixplain.utils.rlm_vector_index import LocalVectorIndex, parse_embedding
+
+_WORDS = ("apple", "banana", "cherry", "date")
+
+
+class _Embedder:
+    """Counts word occurrences; records the texts it is asked to embed."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.extend(texts)
+        return [[text.count(word) + 0.01 for word in _WORDS] for text in texts]
+
+
+_CHUNKS = ["apple apple pie", "banana split", "cherry tart and banana", "date loaf"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [1, 2.5],
+        "[1, 2.5]",
+        {"embedding": [1, 2.5]},
+        [{"vector": [1, 2.5]}],
+        json.dumps({"data": [[1, 2.5]]}),
+    ],
+)
+def test_parse_embedding_accepts_common_shapes(data):
+    assert parse_embedding(data) == [1.0, 2.5]
+
+
+@pytest.mark.parametrize("data", ["not json", {"text": "x"}, [], ["a", "b"]])
+def test_parse_embedding_rejects_non_vectors(data):
+    with pytest.raises(ValueError):
+        parse_embedding(data)
+
+
+def test_search_ranks_chunks_by_cosine_similarity():
+    hits = LocalVectorIndex().search("model", _CHUNKS, "banana", _Embedder(), top_k=2)
+
+    assert [position for position, _ in hits] == [1, 2]
+    assert hits[0][1] > hits[1][1] > 0
+
+
+def test_repeated_documents_and_queries_are_not_embedded_again():
+    index, embed = LocalVectorIndex(), _Embedder()
+
+    index.search("model", _CHUNKS, "banana", embed, top_k=1)
+    index.search("model", _CHUNKS, "banana", embed, top_k=1)
+    index.search("model", _CHUNKS, "cherry", embed, top_k=1)
+    index.search("model", _CHUNKS[:3] + ["date bread"], "banana", embed, top_k=1)
+
+    assert embed.calls == _CHUNKS + ["banana", "cherry", "date bread"]
+    assert index.stats().embedded == 7
+
+
+def test_namespaces_do_not_share_embeddings():
+    index, embed = LocalVectorIndex(), _Embedder()
+
+    index.search("model-a", _CHUNKS, "banana", embed, top_k=1)
+    index.search("model-b", _CHUNKS, "banana", embed, top_k=1)
+
+    assert len(embed.calls) == 2 * (len(_CHUNKS) + 1)
+
+
+def test_embeddings_persist_across_instances(tmp_path):
+    first = _Embedder()
+    expected = LocalVectorIndex(str(tmp_path)).search("model", _CHUNKS, "banana", first, top_k=2)
+
+    second = _Embedder()
+    other = LocalVectorIndex(str(tmp_path))
+    assert other.search("model", _CHUNKS, "banana", second, top_k=2) == pytest.approx(expected)
+    other.search("model", _CHUNKS + ["apple crumble"], "apple", second, top_k=2)
+
+    assert len(first.calls) == 5 and second.calls == ["apple crumble", "apple"]
+    (namespace,) = os.listdir(tmp_path)
+    assert len(os.listdir(tmp_path / namespace / "documents")) == 2
+
+
+def test_stored_rows_are_reread_only_when_keys_grow(tmp_path, monkeypatch):
+    monkeypatch.setattr(rlm_vector_index, "EMBED_BATCH_SIZE", 1)
+    memmaps = []
+    original_memmap = rlm_vector_index.np.memmap
+    monkeypatch.setattr(
+        rlm_vector_index.np, "memmap", lambda *args, **kwargs: memmaps.append(args) or original_memmap(*args, **kwargs)
+    )
+
+    index = LocalVectorIndex(str(tmp_path))
+    index.search("model", _CHUNKS, "banana", _Embedder(), top_k=1)
+    index.search("model", _CHUNKS, "cherry", _Embedder(), top_k=1)
+
+    # One read per stored batch: four chunks and two queries.
+    assert len(memmaps) == len(_CHUNKS) + 2
+
+
+def test_embedding_calls_do_not_hold_the_index_lock():
+    index = LocalVectorIndex()
+    started, release = threading.Event(), threading.Event()
+    timed_out = []
+
+    def slow_embed(texts):
+        started.set()
+        timed_out.append(not release.wait(timeout=5))
+        return _Embedder()(texts)
+
+    worker = threading.Thread(target=index.search, args=("slow", _CHUNKS, "banana", slow_embed, 1))
+    worker.start()
+    assert started.wait(timeout=5)
+    try:
+        assert index.search("fast", _CHUNKS, "banana", _Embedder(), top_k=1)
+    finally:
+        release.set()
+        worker.join(timeout=10)
+
+    assert not any(timed_out)
+
+
+def test_interrupted_write_is_ignored(tmp_path):
+    LocalVectorIndex(str(tmp_path)).search("model", _CHUNKS, "banana", _Embedder(), top_k=1)
+    (namespace,) = os.listdir(tmp_path)
+    with open(tmp_path / namespace / "vectors.f32", "ab") as f:
+        f.write(b"\0" * 10)
+
+    embed = _Embedder()
+    chunks = ["banana banana bread"] + _CHUNKS
+    hits = LocalVectorIndex(str(tmp_path)).search("model", chunks, "banana banana", embed, top_k=1)
+
+    assert embed.calls == ["banana banana bread", "banana banana"] and hits[0][0] == 0
+
+
+def test_embedding_dimension_change_is_rejected():
+    index = LocalVectorIndex()
+    index.search("model", _CHUNKS, "banana", _Embedder(), top_k=1)
+
+    with pytest.raises(ValueError, match="dimension"):
+        index.search("model", ["new text"], "banana", lambda texts: [[1.0, 2.0] for _ in texts], top_k=1)
@@ -0,0 +1,106 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from aixplain.utils.step_index import StepIndex, iter_poll_deltas, response_steps
+
+
+def _step(sid, output=None, **extra):
+    return {"id": sid, "output": output, **extra}
+
+
+def test_reports_new_and_changed_steps_once():
+    index = StepIndex()
+
+    first = index.update([_step("a")])
+    second = index.update([_step("a")])
+    third = index.update([_step("a", output="x"), _step("b")])
+
+    assert [(d.step_id, d.is_new) for d in first] == [("a", True)]
+    assert second == []
+    assert [(d.step_id, d.is_new, d.finished) for d in third] == [("a", False, True), ("b", True, False)]
+    assert third[0].previous == _step("a")
+    assert index.stable == 1
+    assert len(index) == 2
+
+
+def test_finished_steps_are_not_compared_again():
+    index = StepIndex()
+    index.update([_step(str(i), output="done") for i in range(50)] + [_step("running")])
+
+    with patch("aixplain.utils.step_index.json.dumps", wraps=json.dumps) as dumps:
+        deltas = index.update([_step(str(i), output="done") for i in range(50)] + [_step("running", output="ok")])
+
+    assert [d.step_id for d in deltas] == ["running"]
+    assert dumps.call_count == 1
+
+
+def test_steps_without_id_are_keyed_by_position():
+    index = StepIndex()
+    index.update([{"output": None}])
+
+    deltas = index.update([{"output": "x"}, {"output": None}])
+
+    assert [(d.step_id, d.is_new) for d in deltas] == [("idx-0", False), ("idx-1", True)]
+
+
+def test_upsert_looks_up_position_by_id():
+    index = StepIndex()
+    index.update([_step("a"), _step("b")])
+
+    delta = index.upsert(_step("b", output="y"))
+
+    assert delta.index == 1 and not delta.is_new
+    assert index.get("b")["output"] == "y"
+
+
+def test_response_steps_supports_v1_and_v2_shapes():
+    steps = [_step("a")]
+    assert response_steps({"data": {"steps": steps}}) == steps
+    assert response_steps(SimpleNamespace(data={"steps": steps})) == steps
+    assert response_steps(SimpleNamespace(data=SimpleNamespace(steps=steps))) == steps
+    assert response_steps(SimpleNamespace(data="text")) == []
+
+
+def test_iter_poll_deltas_returns_final_response():
+    snapshots = iter(
+        [
+            {"completed": False, "data": {"steps": [_step("a")]}},
+            {"completed": False, "data": {"steps": [_step("a")]}},
+            {"completed": True, "data": {"steps": [_step("a", output="x")]}},
+        ]
+    )
+
+    with patch("aixplain.utils.step_index.time.sleep"):
+        generator = iter_poll_deltas(lambda url: next(snapshots), "url")
+        deltas = []
+        with pytest.raises(StopIteration) as stop:
+            while True:
+                deltas.append(next(generator))
+
+    assert [(d.step_id, d.is_new) for d in deltas] == [("a", True), ("a", False)]
+    assert stop.value.value["completed"] is True
+
+
+def test_iter_poll_deltas_times_out():
+    with patch("aixplain.utils.step_index.time.sleep"):
+        with pytest.raises(TimeoutError):
+            list(iter_poll_deltas(lambda url: {"completed": False}, "url", timeout=0))
@@ -0,0 +1,270 @@
+"""
+Copyright 2022 The aiXplain SDK authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+     http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from aixplain.utils.file_utils import save_file
+from aixplain.utils.transfer_utils import (
+    FileSlice,
+    MultipartUpload,
+    TransferError,
+    download_file,
+    multipart_upload,
+    stream_upload,
+)
+
+
+class S3Stub(BaseHTTPRequestHandler):
+    """Minimal S3-compatible endpoint: object PUT, part PUT, complete POST, abort DELETE."""
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(("PUT", self.path, dict(self.headers)))
+            fail = server.failures.get(self.path, 0)
+            if fail:
+                server.failures[self.path] = fail - 1
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if fail:
+            return self._reply(500)
+        with server.lock:
+            server.objects[self.path] = body
+        self._reply(200, headers={"ETag": f'"{hashlib.md5(body).hexdigest()}"'})
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        with server.lock:
+            etags = re.findall(r"<ETag>(.*?)</ETag>", body)
+            parts = [server.objects[f"/part/{n}"] for n in range(1, len(etags) + 1)]
+            assert etags == [f'"{hashlib.md5(p).hexdigest()}"' for p in parts]
+            server.objects["/object"] = b"".join(parts)
+        self._reply(200, b"<CompleteMultipartUploadResult/>")
+
+    def do_GET(self):
+        server = self.server
+        data = server.objects[self.path]
+        range_header = self.headers.get("Range")
+        with server.lock:
+            server.requests.append(("GET", self.path, dict(self.headers)))
+            key = (self.path, range_header)
+            fail = server.failures.get(key, 0)
+            if fail:
+                server.failures[key] = fail - 1
+        if fail:
+            return self._reply(500)
+        if range_header is None or server.ignore_ranges:
+            return self._reply(200, data, {"ETag": '"v1"'})
+        first, last = (int(x) for x in range_header[len("bytes=") :].split("-"))
+        if first >= len(data):
+            return self._reply(416)
+        last = min(last, len(data) - 1)
+        headers = {"ETag": '"v1"', "Content-Range": f"bytes {first}-{last}/{len(data)}"}
+        self._reply(206, data[first : last + 1], headers)
+
+    def do_DELETE(self):
+        with self.server.lock:
+            self.server.requests.append(("DELETE", self.path, dict(self.headers)))
+        self._reply(204)
+
+
+@pytest.fixture
+def s3():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), S3Stub)
+    server.lock = threading.Lock()
+    server.objects, server.requests, server.failures = {}, [], {}
+    server.ignore_ranges = False
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def payload(tmp_path):
+    data = os.urandom(1024 * 100 + 17)
+    path = tmp_path / "payload.bin"
+    path.write_bytes(data)
+    return path, data
+
+
+def test_file_slice_reads_and_rewinds_its_window(payload):
+    path, data = payload
+    with FileSlice(path, offset=10, length=20) as view:
+        assert len(view) == 20
+        assert view.read(5) == data[10:15]
+        assert view.read() == data[15:30]
+        assert view.read() == b""
+        view.seek(0)
+        assert b"".join(view) == data[10:30]
+
+
+def test_stream_upload_sends_file_with_content_length(s3, payload):
+    path, data = payload
+
+    stats = stream_upload(path, f"{s3.url}/object", headers={"Content-Type": "application/octet-stream"})
+
+    assert s3.objects["/object"] == data
+    headers = s3.requests[0][2]
+    assert headers["Content-Length"] == str(len(data))
+    assert "Transfer-Encoding" not in headers
+    assert stats.bytes_transferred == len(data) and stats.parts == 1
+
+
+def test_stream_upload_raises_on_rejected_upload(s3, payload):
+    s3.failures["/object"] = 1
+    with pytest.raises(TransferError):
+        stream_upload(payload[0], f"{s3.url}/object", request=requests.request)
+
+
+def test_multipart_upload_sends_parts_in_parallel_and_retries_failed_parts(s3, payload):
+    path, data = payload
+    part_size = 1024 * 16
+    n_parts = MultipartUpload.part_count(len(data), part_size)
+    upload = MultipartUpload(
+        part_urls=[f"{s3.url}/part/{n}" for n in range(1, n_parts + 1)],
+        complete_url=f"{s3.url}/complete",
+        part_size=part_size,
+    )
+    s3.failures["/part/3"] = 2
+
+    stats = multipart_upload(path, upload, max_workers=3, retry_backoff=0, request=requests.request)
+
+    assert s3.objects["/object"] == data
+    assert n_parts == 7
+    assert stats.parts == 7 and stats.retries == 2
+    assert stats.bytes_transferred == len(data) and stats.throughput > 0
+
+
+def test_multipart_upload_aborts_when_a_part_keeps_failing(s3, payload):
+    path, data = payload
+    upload = MultipartUpload(
+        part_urls=[f"{s3.url}/part/1", f"{s3.url}/part/2"],
+        complete_url=f"{s3.url}/complete",
+        part_size=len(data) - 1,
+        abort_url=f"{s3.url}/abort",
+    )
+    s3.failures["/part/2"] = 5
+
+    with pytest.raises(TransferError):
+        multipart_upload(path, upload, part_attempts=2, retry_backoff=0, request=requests.request)
+
+    assert ("DELETE", "/abort") in [(method, path) for method, path, _ in s3.requests]
+    assert "/object" not in s3.objects
+
+
+def test_multipart_upload_rejects_mismatched_part_count(payload):
+    upload = MultipartUpload(part_urls=["http://unused"], complete_url="http://unused", part_size=1024)
+    with pytest.raises(ValueError):
+        multipart_upload(payload[0], upload)
+
+
+def _ranged_gets(s3):
+    return [headers.get("Range") for method, _, headers in s3.requests if method == "GET"]
+
+
+def test_download_file_fetches_ranges_in_parallel(s3, payload, tmp_path):
+    _, data = payload
+    s3.objects["/report.csv"] = data
+    target = tmp_path / "out" / "report.csv"
+    target.parent.mkdir()
+    checksum = hashlib.sha256(data).hexdigest()
+
+    stats = download_file(f"{s3.url}/report.csv", target, segment_size=1024 * 16, checksum=checksum)
+
+    assert target.read_bytes() == data
+    assert stats.parts == 7 and stats.bytes_transferred == len(data)
+    assert _ranged_gets(s3)[0] == "bytes=0-0"
+    assert not list(target.parent.glob("*.part*"))
+
+
+def test_download_file_resumes_after_interruption(s3, payload, tmp_path):
+    _, data = payload
+    s3.objects["/report.csv"] = data
+    target = tmp_path / "report.csv"
+    segment = 1024 * 16
+    s3.failures[("/report.csv", f"bytes={2 * segment}-{3 * segment - 1}")] = 10
+
+    with pytest.raises(TransferError):
+        download_file(
+            f"{s3.url}/report.csv",
+            target,
+            segment_size=segment,
+            segment_attempts=2,
+            retry_backoff=0,
+            request=requests.request,
+        )
+    assert not target.exists()
+    assert (tmp_path / "report.csv.part.json").exists()
+
+    s3.requests.clear()
+    s3.failures.clear()
+    stats = download_file(f"{s3.url}/report.csv", target, segment_size=segment, retry_backoff=0)
+
+    assert target.read_bytes() == data
+    assert _ranged_gets(s3) == ["bytes=0-0", f"bytes={2 * segment}-{3 * segment - 1}"]
+    assert stats.parts == 1 and stats.bytes_transferred == segment
+
+
+def test_download_file_streams_when_ranges_are_not_supported(s3, payload, tmp_path):
+    _, data = payload
+    s3.objects["/report.csv"] = data
+    s3.ignore_ranges = True
+    target = tmp_path / "report.csv"
+
+    stats = download_file(f"{s3.url}/report.csv", target)
+
+    assert target.read_bytes() == data
+    assert stats.parts == 1 and len(_ranged_gets(s3)) == 1
+
+
+def test_download_file_rejects_checksum_mismatch(s3, tmp_path):
+    s3.objects["/report.csv"] = b"a,b\n1,2\n"
+    target = tmp_path / "report.csv"
+
+    with pytest.raises(TransferError):
+        download_file(f"{s3.url}/report.csv", target, checksum="0" * 64)
+
+    assert not target.exists()
+    assert not list(tmp_path.glob("*.part*"))
+
+
+def test_save_file_downloads_empty_file(s3, tmp_path):
+    s3.objects["/empty.csv"] = b""
+    target = tmp_path / "empty.csv"
+
+    assert save_file(f"{s3.url}/empty.csv", target) == target
+    assert target.read_bytes() == b""
@@ -1,6 +1,8 @@
 """Unit tests for Eval and eval row aggregation."""
 
 import json
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
@@ -10,7 +12,7 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
-from aixplain.v2.agent import AgentResponseData
+from aixplain.v2.agent import Agent, AgentResponseData
 from aixplain.v2.agent_evaluator import (
     Eval,
     AgentEvaluationResultsChatbot,
@@ -18,6 +20,7 @@ from aixplain.v2.agent_evaluator import (
     AgentEvaluationRun,
     Dataset,
     EvalCase,
+    EvaluationCheckpoint,
     Metric,
     _infer_prompt_input_field_name,
     _reply_text_from_model_result,
@@ -31,6 +34,7 @@ from aixplain.v2.eval_experiment import (
     ExperimentLocalCache,
     ExperimentRun,
 )
+from aixplain.v2.enums import AssetStatus
 from aixplain.v2.model import Detail, Message, ModelResult
 from aixplain.v2.exceptions import APIError, ValidationError
 
@@ -475,6 +479,7 @@ def _sample_eval_row(
     run_time: float = 5.0,
     used_credits: float = 0.1,
     metrics: Optional[dict] = None,
+    agent_key: Optional[str] = None,
 ) -> AgentEvaluationRow:
     return AgentEvaluationRow(
         case_index=case_index,
@@ -493,6 +498,7 @@ def _sample_eval_row(
         agent_error_details=None,
         case_metadata={},
         metrics=dict(metrics or {}),
+        agent_key=agent_key,
     )
 
 
@@ -1442,3 +1448,202 @@ def test_experiment_diff_case_falls_back_to_agent_response_for_output() -> None:
     assert len(diff.regressions) == 1
     assert diff.regressions[0].baseline_output == "from_agent"
     assert diff.regressions[0].candidate_output == "from_agent2"
+
+
+def test_evaluate_concurrently_keeps_row_order_and_per_agent_limits() -> None:
+    """max_concurrency overlaps runs; rows stay ordered and per-agent caps hold."""
+    lock = threading.Lock()
+    active = {"fast": 0, "slow": 0}
+    peak = {"fast": 0, "slow": 0, "total": 0}
+
+    def make_agent(name: str) -> MagicMock:
+        def run(query: str, **kwargs: Any) -> MagicMock:
+            with lock:
+                active[name] += 1
+                peak[name] = max(peak[name], active[name])
+                peak["total"] = max(peak["total"], active["fast"] + active["slow"])
+            time.sleep(0.05)
+            with lock:
+                active[name] -= 1
+            return _successful_run_result(AgentResponseData(input=query, output=f"{name}:{query}", steps=[]))
+
+        agent = MagicMock()
+        agent.name = name
+        agent.run.side_effect = run
+        return agent
+
+    metrics = []
+    for metric_name in ("m1", "m2"):
+        metric = MagicMock(spec=Metric)
+        metric.name = metric_name
+        mr = MagicMock(status="SUCCESS", completed=True, validated_data={"score": 1.0})
+        metric.measure.return_value = mr
+        metrics.append(metric)
+
+    cases = [EvalCase(query=f"q{i}") for i in range(4)]
+    run = Eval().evaluate(
+        [make_agent("fast"), make_agent("slow")],
+        _eval_ds(*cases),
+        metrics=metrics,
+        max_concurrency=4,
+        per_agent_concurrency={"slow": 1},
+    )
+
+    assert [(row.case_index, row.agent_name) for row in run.rows] == [
+        (i, name) for i in range(4) for name in ("fast", "slow")
+    ]
+    assert [row.output for row in run.rows[:2]] == ["fast:q0", "slow:q0"]
+    assert all(row.metric_value("m2", "score") == 1.0 for row in run.rows)
+    assert peak["slow"] == 1
+    assert peak["total"] > 1
+
+
+def test_evaluate_rejects_invalid_concurrency() -> None:
+    """max_concurrency must be positive."""
+    with pytest.raises(ValueError):
+        Eval().evaluate(MagicMock(), _eval_ds(EvalCase(query="q")), max_concurrency=0)
+
+
+def test_evaluate_concurrently_saves_a_modified_draft_once_before_the_runs() -> None:
+    """Concurrent runs share the agent, so its draft is saved up front instead of by every run."""
+    events: List[str] = []
+    agent = MagicMock(spec=Agent)
+    agent.name = "draft"
+    agent.status = AssetStatus.DRAFT
+    agent.is_modified = True
+    agent.save.side_effect = lambda **kwargs: events.append("save")
+
+    def run(query: str, **kwargs: Any) -> MagicMock:
+        events.append("run")
+        return _successful_run_result(AgentResponseData(input=query, output=query, steps=[]))
+
+    agent.run.side_effect = run
+    Eval().evaluate(agent, _eval_ds(*(EvalCase(query=f"q{i}") for i in range(3))), max_concurrency=3)
+
+    agent.save.assert_called_once_with(as_draft=True)
+    assert events == ["save", "run", "run", "run"]
+
+
+def test_evaluate_concurrently_rejects_progress_display() -> None:
+    """The progress tracker lives on the shared agent instance."""
+    agent = MagicMock()
+    with pytest.raises(ValueError, match="progress_format"):
+        Eval().evaluate(
+            agent, _eval_ds(EvalCase(query="q0"), EvalCase(query="q1")), max_concurrency=2, progress_format="status"
+        )
+    agent.run.assert_not_called()
+
+
+def _checkpoint_metric(name: str, fail_first: bool = False) -> MagicMock:
+    metric = MagicMock(spec=Metric)
+    metric.name = name
+    ok = MagicMock(status="SUCCESS", completed=True, validated_data={"score": 1.0})
+    metric.measure.return_value = ok
+    if fail_first:
+        metric.measure.side_effect = [RuntimeError("judge down"), ok, ok]
+    return metric
+
+
+def test_evaluate_resume_skips_checkpointed_cells(tmp_path: Path) -> None:
+    """Resuming reruns failed agent cells and failed metrics only, reusing logged responses."""
+    log_path = tmp_path / "run.checkpoint.jsonl"
+    agent = MagicMock()
+    agent.name = "a"
+    agent.run.side_effect = [
+        _successful_run_result(AgentResponseData(input="q0", output="o0", steps=[])),
+        APIError("boom"),
+        _successful_run_result(AgentResponseData(input="q1", output="o1", steps=[])),
+    ]
+    steady, flaky = _checkpoint_metric("steady"), _checkpoint_metric("flaky", fail_first=True)
+    ds = _eval_ds(EvalCase(query="q0"), EvalCase(query="q1"))
+
+    first = Eval().evaluate(agent, ds, metrics=[steady, flaky], checkpoint=log_path)
+    assert first.rows[0].metric_value("flaky", "metric_status") == "FAILED"
+    assert first.rows[1].agent_run_failed
+    assert len(EvaluationCheckpoint(log_path).load()) == 2
+
+    resumed = Eval().evaluate(agent, ds, metrics=[steady, flaky], checkpoint=log_path, resume=True)
+
+    assert agent.run.call_count == 3
+    assert [c.args[0] for c in agent.run.call_args_list] == ["q0", "q1", "q1"]
+    # q0: only the failed metric is remeasured, on the response read back from the log
+    remeasured = flaky.measure.call_args_list[1].args[0]
+    assert isinstance(remeasured, AgentResponseData) and remeasured.output == "o0"
+    assert steady.measure.call_count == 2
+    assert [row.output for row in resumed.rows] == ["o0", "o1"]
+    assert all(row.metric_value("flaky", "score") == 1.0 for row in resumed.rows)
+    assert "metric_error" not in resumed.rows[0].metrics["flaky"]
+
+    Eval().evaluate(agent, ds, metrics=[steady, flaky], checkpoint=log_path, resume=True)
+    assert agent.run.call_count == 3
+
+
+def test_checkpoint_load_ignores_truncated_lines(tmp_path: Path) -> None:
+    """A line cut short by a crash is skipped; later lines win per (case, agent)."""
+    log = EvaluationCheckpoint(tmp_path / "log.jsonl")
+    log.append(_sample_eval_row(agent_name="a", agent_key="agent-1", metrics={"m": {"score": 1}}))
+    log.append(_sample_eval_row(agent_name="a", agent_key="agent-1", metrics={"m": {"score": 2}}))
+    with log.path.open("a", encoding="utf-8") as fh:
+        fh.write('{"case_index": 1, "agent')
+
+    rows = log.load()
+    assert list(rows) == [(0, "agent-1")]
+    assert rows[(0, "agent-1")].metric_value("m", "score") == 2
+
+    log.clear()
+    assert log.load() == {}
+
+
+def test_evaluate_resume_keys_agents_by_id_then_position(tmp_path: Path) -> None:
+    """Agents sharing a name keep separate checkpoint rows: by id, else by position."""
+    log_path = tmp_path / "run.checkpoint.jsonl"
+
+    def make_agent(agent_id: Optional[str], output: str) -> MagicMock:
+        agent = MagicMock()
+        agent.name = "same"
+        agent.id = agent_id
+        agent.run.return_value = _successful_run_result(AgentResponseData(input="q", output=output, steps=[]))
+        return agent
+
+    agents = [make_agent("agent-1", "v1"), make_agent("agent-2", "v2"), make_agent(None, "draft")]
+    ds = _eval_ds(EvalCase(query="q"))
+
+    first = Eval().evaluate(agents, ds, checkpoint=log_path)
+    assert [row.agent_key for row in first.rows] == ["agent-1", "agent-2", "#2"]
+    assert sorted(EvaluationCheckpoint(log_path).load()) == [(0, "#2"), (0, "agent-1"), (0, "agent-2")]
+
+    resumed = Eval().evaluate(agents, ds, checkpoint=log_path, resume=True)
+    assert [row.output for row in resumed.rows] == ["v1", "v2", "draft"]
+    assert all(agent.run.call_count == 1 for agent in agents)
+
+
+def test_evaluate_resume_requires_checkpoint() -> None:
+    with pytest.raises(ValueError):
+        Eval().evaluate(MagicMock(), _eval_ds(EvalCase(query="q")), resume=True)
+
+
+def test_experiment_run_resume_uses_checkpoint_under_experiment_id(tmp_path: Path) -> None:
+    """An interrupted Experiment.run leaves a log that resume=True picks up; success removes it."""
+    agent = MagicMock()
+    agent.name = "a"
+    agent.to_dict.return_value = {"id": "agent-1"}
+    agent.run.side_effect = [
+        _successful_run_result(AgentResponseData(input="q0", output="o0", steps=[])),
+        KeyboardInterrupt(),
+        _successful_run_result(AgentResponseData(input="q1", output="o1", steps=[])),
+    ]
+    ex = Eval(cache_experiments=True, experiment_cache_dir=tmp_path)
+    exp = ex.create_experiment(agent, _eval_ds(EvalCase(query="q0"), EvalCase(query="q1")))
+    log_path = ExperimentLocalCache(tmp_path).checkpoint_path(exp.id)
+
+    with pytest.raises(KeyboardInterrupt):
+        exp.run()
+    assert log_path.is_file()
+    assert [s["id"] for s in ex.list_cached_experiments()] == [exp.id]
+
+    run = exp.run(resume=True)
+
+    assert agent.run.call_count == 3
+    assert [row.output for row in run.results.rows] == ["o0", "o1"]
+    assert not log_path.exists()
+    assert len(ex.load_cached_experiment(exp.id).runs) == 1
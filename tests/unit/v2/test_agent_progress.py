@@ -61,3 +61,28 @@ def test_completion_message_includes_arrow_style_totals(capsys):
 
     captured = capsys.readouterr().out
     assert "↓510 ↑536 (1046)" in captured
+
+
+def test_update_processes_only_new_or_changed_steps():
+    """Polls re-normalize only steps that changed; finished steps are skipped."""
+    from types import SimpleNamespace
+
+    tracker = _tracker()
+    tracker.start(format="none")
+    tracker._format = "logs"
+    rendered = []
+    tracker._render = lambda steps, start=0: rendered.append(start)
+
+    def response(steps):
+        return SimpleNamespace(_raw_data={"data": {"steps": steps}})
+
+    done = {"id": "a", "output": "x", "input_tokens": 4, "api_calls": 1}
+    tracker.update(response([done, {"id": "b"}]))
+    deltas = list(tracker.iter_step_deltas(response([done, {"id": "b", "output": "y", "input_tokens": 6}])))
+
+    assert [d.step_id for d in deltas] == ["b"]
+    assert tracker._total_input_tokens == 10
+    assert tracker._total_api_calls == 1
+    assert rendered == [0]
+    tracker.update(response([done, {"id": "b", "output": "y", "input_tokens": 6}, {"id": "c"}]))
+    assert rendered == [0, 2]
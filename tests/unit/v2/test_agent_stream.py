@@ -0,0 +1,215 @@
+"""Unit tests for incremental agent progress (Agent.run_stream).
+
+Covers: SSE message parsing, step-delta tracking of poll snapshots, the
+tracker's event mode, and Agent.run_stream against a local stub server in
+both streaming (text/event-stream) and polling-fallback modes.
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+from dataclasses_json import dataclass_json
+
+from aixplain.v2.agent import Agent, AgentRunResult
+from aixplain.v2.agent_progress import AgentProgressTracker, ProgressFormat
+from aixplain.v2.agent_stream import (
+    AgentResultEvent,
+    AgentStepEvent,
+    AgentUsageEvent,
+    StepDeltaTracker,
+    iter_sse_messages,
+)
+from aixplain.v2.client import AixplainClient
+
+
+def _step(sid, output=None, **extra):
+    step = {"id": sid, "unit": {"name": sid, "type": "llm"}, "output": output}
+    step.update(extra)
+    return step
+
+
+def _poll_body(steps, completed=False, output=None):
+    return {
+        "status": "SUCCESS" if completed else "IN_PROGRESS",
+        "completed": completed,
+        "data": {"output": output, "steps": steps},
+    }
+
+
+class _StubServer:
+    """Local HTTP server standing in for the agent run and result endpoints.
+
+    ``stream_events`` is sent as an event stream when the client asks for one;
+    otherwise each GET returns the next of ``snapshots``.
+    """
+
+    def __init__(self, snapshots=None, stream_events=None):
+        self.snapshots = list(snapshots or [])
+        self.stream_events = stream_events
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, body):
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                stub.requests.append(("POST", self.path, None))
+                self._send_json({"status": "IN_PROGRESS", "data": f"{stub.url}/sdk/agents/exec-1/result"})
+
+            def do_GET(self):
+                accept = self.headers.get("Accept", "")
+                stub.requests.append(("GET", self.path, accept))
+                if stub.stream_events is not None and "text/event-stream" in accept:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.end_headers()
+                    for event, data in stub.stream_events:
+                        self.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+                        self.wfile.flush()
+                    return
+                body = stub.snapshots.pop(0) if len(stub.snapshots) > 1 else stub.snapshots[0]
+                self._send_json(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _agent(base_url):
+    @dataclass_json
+    @dataclass
+    class BoundAgent(Agent):
+        pass
+
+    agent = BoundAgent(id="agent-123", name="test-agent")
+    agent.context = Mock()
+    agent.context.backend_url = base_url
+    agent.context.client = AixplainClient(base_url=base_url, team_api_key="test-key", retry_total=0)
+    return agent
+
+
+def _run_stream(agent, *args, **kwargs):
+    with patch.object(Agent, "before_run", return_value=None):
+        return list(agent.run_stream(*args, **kwargs))
+
+
+class TestSSEParsing:
+    """Tests for iter_sse_messages."""
+
+    def test_groups_multiline_data_and_skips_comments(self):
+        """Data lines join with newlines; comments and bare blank lines are ignored."""
+        lines = [": keep-alive", "", "event: step", 'data: {"a":', "data: 1}", "", 'data: {"b": 2}']
+
+        assert list(iter_sse_messages(lines)) == [("step", '{"a":\n1}'), ("message", '{"b": 2}')]
+
+
+class TestStepDeltaTracker:
+    """Tests for turning snapshots into step deltas."""
+
+    def test_reports_each_change_once(self):
+        """Unchanged steps are not reported again; finished steps are skipped."""
+        deltas = StepDeltaTracker()
+
+        first = deltas.update_steps([_step("s1")])
+        second = deltas.update_steps([_step("s1")])
+        third = deltas.update_steps([_step("s1", output="x", input_tokens=3), _step("s2")])
+
+        assert [(e.step_id, e.is_new) for e in first if isinstance(e, AgentStepEvent)] == [("s1", True)]
+        assert second == []
+        steps = [(e.step_id, e.is_new, e.completed) for e in third if isinstance(e, AgentStepEvent)]
+        assert steps == [("s1", False, True), ("s2", True, False)]
+        assert isinstance(third[-1], AgentUsageEvent) and third[-1].input_tokens == 3
+
+    def test_finished_prefix_is_not_rediffed(self):
+        """Finished steps are skipped without fingerprinting them again."""
+        deltas = StepDeltaTracker()
+        deltas.update_steps([_step("s1", output="x"), _step("s2")])
+
+        with patch("aixplain.v2.agent_stream.json.dumps", wraps=json.dumps) as dumps:
+            deltas.update_steps([_step("s1", output="x"), _step("s2", output="y")])
+
+        assert dumps.call_count == 1
+
+
+class TestTrackerEvents:
+    """Tests for AgentProgressTracker.handle_event."""
+
+    def test_step_and_usage_events_update_state(self, capsys):
+        """Step events update a single step; usage events set totals."""
+        tracker = AgentProgressTracker(poll_func=lambda _: None)
+        tracker.start(format=ProgressFormat.LOGS)
+        tracker._stop_display.set()
+
+        tracker.handle_event(AgentStepEvent(index=0, step=_step("s1")))
+        tracker.handle_event(AgentStepEvent(index=0, step=_step("s1", output="done"), is_new=False))
+        tracker.handle_event(AgentUsageEvent(input_tokens=5, output_tokens=7, used_credits=0.5, api_calls=2))
+
+        assert tracker._seen_steps["s1"]["output"] == "done"
+        assert tracker._total_input_tokens == 5 and tracker._total_api_calls == 2
+        assert "✓" in capsys.readouterr().out
+
+
+class TestAgentRunStream:
+    """Tests for Agent.run_stream against a local stub server."""
+
+    def test_consumes_event_stream(self):
+        """Events pushed by the server are yielded as typed events, ending with the result."""
+        events = [
+            ("step", {"index": 0, "step": _step("s1")}),
+            ("step", {"index": 0, "step": _step("s1", output="found")}),
+            ("usage", {"inputTokens": 10, "outputTokens": 4, "usedCredits": 0.01, "apiCalls": 1}),
+            ("result", _poll_body([_step("s1", output="found")], completed=True, output="answer")),
+        ]
+        with _StubServer(snapshots=[_poll_body([])], stream_events=events) as stub:
+            out = _run_stream(_agent(stub.url), "hi")
+            gets = [r for r in stub.requests if r[0] == "GET"]
+
+        assert [type(e) for e in out] == [AgentStepEvent, AgentStepEvent, AgentUsageEvent, AgentResultEvent]
+        assert out[1].completed and not out[1].is_new
+        assert out[2].total_tokens == 14
+        assert isinstance(out[-1].result, AgentRunResult)
+        assert out[-1].result.data.output == "answer"
+        assert gets == [("GET", "/sdk/agents/exec-1/result", "text/event-stream")]
+
+    def test_falls_back_to_delta_polling(self):
+        """Without an event stream the poll body is diffed, reporting only changes."""
+        snapshots = [
+            _poll_body([_step("s1")]),
+            _poll_body([_step("s1")]),
+            _poll_body([_step("s1", output="x"), _step("s2")]),
+            _poll_body([_step("s1", output="x"), _step("s2", output="y")], completed=True, output="done"),
+        ]
+        with _StubServer(snapshots=snapshots) as stub:
+            out = _run_stream(_agent(stub.url), "hi", wait_time=0.2)
+
+        steps = [(e.step_id, e.is_new, e.completed) for e in out if isinstance(e, AgentStepEvent)]
+        assert steps == [("s1", True, False), ("s1", False, True), ("s2", True, False), ("s2", False, True)]
+        assert isinstance(out[-1], AgentResultEvent)
+        assert out[-1].result.data.output == "done"
+
+    def test_rejects_session(self):
+        """Session runs are not streamed."""
+        with pytest.raises(NotImplementedError):
+            _agent("http://127.0.0.1:1").run_stream("hi", session="s-1")
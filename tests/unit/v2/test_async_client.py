@@ -0,0 +1,286 @@
+"""Unit tests for the asyncio client layer (AsyncAixplain / AsyncAixplainClient).
+
+Covers: request/retry/error handling over an in-process httpx transport, and
+the async run paths of Model and Agent (arun, arun_async, async_poll,
+arun_stream) sharing the same result types as the blocking API.
+"""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass
+from unittest.mock import Mock, patch
+
+import pytest
+from dataclasses_json import dataclass_json
+
+httpx = pytest.importorskip("httpx")
+
+from aixplain.v2.agent import Agent, AgentRunResult  # noqa: E402
+from aixplain.v2.async_client import AsyncAixplainClient  # noqa: E402
+from aixplain.v2.core import AsyncAixplain  # noqa: E402
+from aixplain.v2.exceptions import APIError, ResourceError  # noqa: E402
+from aixplain.v2.model import Model, ModelResult, StreamChunk  # noqa: E402
+
+BACKEND_URL = "https://platform-api.aixplain.com"
+MODEL_URL = "https://models.aixplain.com/api/v2/execute"
+
+
+def _client(handler, **kwargs):
+    """Build an AsyncAixplainClient backed by an in-process mock transport."""
+    kwargs.setdefault("retry_backoff_factor", 0)
+    return AsyncAixplainClient(
+        base_url=BACKEND_URL,
+        team_api_key="test-key",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def _context(handler):
+    """Build a context exposing a mocked async client."""
+    context = Mock()
+    context.backend_url = BACKEND_URL
+    context.model_url = MODEL_URL
+    context.async_client = _client(handler)
+    return context
+
+
+def _model(handler, connection_type=None):
+    """Create a Model bound to a context with a mocked async client."""
+    model = Model.__new__(Model)
+    model.id = "test-model-id"
+    model.name = "Test Model"
+    model.connection_type = connection_type or ["asynchronous"]
+    model.params = None
+    model.supports_streaming = None
+    model.__post_init__()
+    model.context = _context(handler)
+    return model
+
+
+class TestAsyncAixplainClient:
+    """Tests for request handling of AsyncAixplainClient."""
+
+    def test_get_sends_auth_header_and_decodes_json(self):
+        """Should send the API key header and decode the JSON body."""
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["key"] = request.headers.get("x-api-key")
+            return httpx.Response(200, json={"ok": True})
+
+        async def scenario():
+            async with _client(handler) as client:
+                return await client.get("sdk/models/abc")
+
+        assert asyncio.run(scenario()) == {"ok": True}
+        assert seen == {"url": f"{BACKEND_URL}/sdk/models/abc", "key": "test-key"}
+
+    def test_retries_retryable_status(self):
+        """Should retry 5xx responses up to the configured total."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503, json={"message": "busy"})
+            return httpx.Response(200, json={"ok": True})
+
+        async def scenario():
+            async with _client(handler, retry_total=3) as client:
+                return await client.get("sdk/models/abc")
+
+        assert asyncio.run(scenario()) == {"ok": True}
+        assert len(calls) == 3
+
+    def test_hooks_observe_retried_requests(self):
+        """Should report one event per logical request, with its retries."""
+        calls, events = [], []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 2:
+                return httpx.Response(503, json={"message": "busy"})
+            return httpx.Response(200, json={"ok": True})
+
+        async def scenario():
+            async with _client(handler, retry_total=3, hooks=[events.append]) as client:
+                return await client.get("sdk/models/6414bd3cd09663e9225130e8")
+
+        assert asyncio.run(scenario()) == {"ok": True}
+        (event,) = events
+        assert (event.method, event.endpoint, event.status, event.retries) == ("GET", "/sdk/models/{id}", 200, 1)
+
+    def test_error_response_raises_api_error(self):
+        """Should raise APIError carrying the backend message and status."""
+
+        def handler(request):
+            return httpx.Response(404, json={"message": "Not found", "statusCode": 404})
+
+        async def scenario():
+            async with _client(handler) as client:
+                await client.get("sdk/models/missing")
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(scenario())
+        assert exc_info.value.status_code == 404
+        assert "Not found" in str(exc_info.value)
+
+    def test_requires_exactly_one_api_key(self):
+        """Should reject missing or duplicated API keys like the sync client."""
+        with pytest.raises(ValueError):
+            AsyncAixplainClient(base_url=BACKEND_URL)
+        with pytest.raises(ValueError):
+            AsyncAixplainClient(base_url=BACKEND_URL, team_api_key="a", aixplain_api_key="b")
+
+
+class TestAsyncAixplainContext:
+    """Tests for the AsyncAixplain context."""
+
+    def test_context_builds_async_client_and_resources(self):
+        """Should expose an async client next to the blocking one."""
+        with patch.dict(os.environ, {}, clear=False):
+
+            async def scenario():
+                async with AsyncAixplain(api_key="test-key", max_connections=7) as aix:
+                    assert isinstance(aix.async_client, AsyncAixplainClient)
+                    assert aix.Model.context is aix
+                    return aix.async_client.http.is_closed
+
+            assert asyncio.run(scenario()) is False
+
+    def test_async_methods_require_async_context(self):
+        """Resources bound to a plain context should explain what is missing."""
+        model = _model(lambda request: httpx.Response(200))
+        model.context = Mock(spec=["client", "model_url"])
+
+        with pytest.raises(ResourceError, match="AsyncAixplain"):
+            asyncio.run(model.apoll("https://models.aixplain.com/api/v1/data/abc"))
+
+
+class TestModelAsyncRun:
+    """Tests for Model.arun / arun_async / arun_stream."""
+
+    def test_arun_posts_then_polls_until_completed(self):
+        """Should start the run and poll the returned URL until completion."""
+        poll_url = "https://models.aixplain.com/api/v1/data/req-1"
+        polls = []
+
+        def handler(request):
+            if request.method == "POST":
+                assert str(request.url) == f"{MODEL_URL}/test-model-id"
+                assert json.loads(request.content)["text"] == "hello"
+                return httpx.Response(200, json={"status": "IN_PROGRESS", "data": poll_url, "requestId": "req-1"})
+            polls.append(str(request.url))
+            if len(polls) < 2:
+                return httpx.Response(200, json={"status": "IN_PROGRESS", "completed": False})
+            return httpx.Response(200, json={"status": "SUCCESS", "completed": True, "data": "hi there"})
+
+        model = _model(handler)
+        result = asyncio.run(model.arun(text="hello", wait_time=0.2))
+
+        assert isinstance(result, ModelResult)
+        assert result.completed is True
+        assert result.data == "hi there"
+        assert polls == [poll_url, poll_url]
+
+    def test_arun_fans_out_concurrently(self):
+        """Many runs should share one event loop and client."""
+
+        def handler(request):
+            text = json.loads(request.content)["text"]
+            return httpx.Response(200, json={"status": "SUCCESS", "completed": True, "data": text.upper()})
+
+        model = _model(handler, connection_type=["synchronous"])
+
+        async def scenario():
+            return await asyncio.gather(*(model.arun(text=f"q{i}") for i in range(20)))
+
+        results = asyncio.run(scenario())
+        assert [r.data for r in results] == [f"Q{i}" for i in range(20)]
+
+    def test_arun_async_returns_poll_url(self):
+        """Should return an in-progress result carrying the poll URL."""
+        poll_url = "https://models.aixplain.com/api/v1/data/req-2"
+
+        def handler(request):
+            return httpx.Response(200, json={"status": "IN_PROGRESS", "data": poll_url})
+
+        result = asyncio.run(_model(handler).arun_async(text="hello"))
+
+        assert result.completed is False
+        assert result.url == poll_url
+
+    def test_arun_stream_yields_chunks(self):
+        """Should parse SSE lines, including JSON split across data lines."""
+        body = (
+            'data: {"data": "Hel"}\n\n'
+            'data: {"choices": [{"delta": {"content": "lo"}, \n'
+            'data: "finish_reason": null}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+
+        def handler(request):
+            assert json.loads(request.content)["options"]["stream"] is True
+            return httpx.Response(200, content=body.encode(), headers={"content-type": "text/event-stream"})
+
+        model = _model(handler)
+
+        async def scenario():
+            return [chunk async for chunk in model.arun_stream(text="hello")]
+
+        chunks = asyncio.run(scenario())
+        assert all(isinstance(chunk, StreamChunk) for chunk in chunks)
+        assert "".join(chunk.data for chunk in chunks) == "Hello"
+
+
+class TestAgentAsyncRun:
+    """Tests for Agent.arun / apoll."""
+
+    def _agent(self, handler):
+        @dataclass_json
+        @dataclass
+        class BoundAgent(Agent):
+            pass
+
+        agent = BoundAgent(id="agent-123", name="test-agent")
+        agent.context = _context(handler)
+        return agent
+
+    def test_apoll_resolves_execution_id(self):
+        """A bare execution ID should be polled on the agent result endpoint."""
+        seen = []
+
+        def handler(request):
+            seen.append(str(request.url))
+            return httpx.Response(200, json={"status": "SUCCESS", "completed": True, "data": {"output": "done"}})
+
+        result = asyncio.run(self._agent(handler).apoll("exec-1"))
+
+        assert isinstance(result, AgentRunResult)
+        assert seen == [f"{BACKEND_URL}/sdk/agents/exec-1/result"]
+
+    def test_arun_runs_and_polls(self):
+        """Should post the query and poll until completion."""
+        poll_url = f"{BACKEND_URL}/sdk/agents/exec-2/result"
+
+        def handler(request):
+            if request.method == "POST":
+                assert json.loads(request.content)["query"] == {"input": "hi"}
+                return httpx.Response(200, json={"status": "IN_PROGRESS", "data": poll_url})
+            return httpx.Response(200, json={"status": "SUCCESS", "completed": True, "data": {"output": "hello"}})
+
+        agent = self._agent(handler)
+        with patch.object(Agent, "before_run", return_value=None):
+            result = asyncio.run(agent.arun("hi", wait_time=0.2))
+
+        assert result.completed is True
+        assert result.data.output == "hello"
+
+    def test_arun_rejects_session(self):
+        """Session runs stay sync-only."""
+        agent = self._agent(lambda request: httpx.Response(200))
+        with pytest.raises(NotImplementedError):
+            asyncio.run(agent.arun("hi", session="s-1"))
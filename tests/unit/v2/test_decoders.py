@@ -0,0 +1,211 @@
+"""Unit tests for the compiled ``dataclasses_json`` decoders.
+
+Covers: parity with ``from_dict`` on model listings and poll results (renames,
+nested dataclasses, enums, custom field decoders, defaults), the edge cases
+``from_dict`` warns or fails on, delegation to overridden ``from_dict`` and
+``undefined`` policies, the fallback without ``dataclasses_json`` helpers, and
+a benchmark against the ``from_dict`` path (skipped unless ``--run-benchmarks``).
+"""
+
+import importlib
+import time
+import warnings
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pytest
+from dataclasses_json import CatchAll, Undefined, config, dataclass_json
+
+from aixplain.v2 import decoders
+from aixplain.v2.decoders import dataclass_decoder, from_dict
+from aixplain.v2.enums import AssetStatus
+from aixplain.v2.model import Model, ModelResult, Parameter, Usage, VendorInfo
+
+
+def _model_item(n: int) -> dict:
+    return {
+        "id": f"model-{n}",
+        "name": f"Model {n}",
+        "description": "A model",
+        "serviceName": "svc",
+        "status": "onboarded",
+        "host": "openai",
+        "vendor": {"id": n, "name": "OpenAI", "code": "openai"},
+        "function": {"id": "text-generation"},
+        "pricing": {"price": 0.1, "unitType": "TOKEN", "unitTypeScale": "1K"},
+        "version": {"name": "v1", "id": "1"},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "supportsStreaming": True,
+        "connectionType": ["synchronous"],
+        "params": [
+            {"name": "text", "required": True, "dataType": "text", "defaultValues": [{"value": "hi"}]},
+            {"name": "temperature", "multipleValues": False, "values": [0.1, 0.5]},
+        ],
+        "attributes": {"context_length": 8192, "tags": ["chat"]},
+        "unknownKey": "ignored",
+    }
+
+
+def _poll_response() -> dict:
+    return {
+        "status": "SUCCESS",
+        "completed": True,
+        "data": "answer",
+        "details": [{"index": 0, "message": {"role": "assistant", "content": "answer"}, "finish_reason": "stop"}],
+        "runTime": 1.5,
+        "usedCredits": 0.002,
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        "supplierError": None,
+    }
+
+
+def test_model_listing_matches_from_dict():
+    items = [_model_item(n) for n in range(3)]
+    decode = dataclass_decoder(Model)
+
+    for item in items:
+        expected, decoded = Model.from_dict(item), decode(item)
+        assert decoded.to_dict() == expected.to_dict()
+        assert decoded.status is AssetStatus.ONBOARDED
+        assert isinstance(decoded.vendor, VendorInfo) and decoded.vendor.id == item["vendor"]["id"]
+        assert decoded.function == expected.function
+        assert all(isinstance(p, Parameter) for p in decoded.params)
+        assert decoded.params[0].default_values == [{"value": "hi"}]
+        assert decoded.attributes == item["attributes"] and decoded.attributes is not item["attributes"]
+
+
+def test_poll_result_matches_from_dict():
+    response = _poll_response()
+    expected, decoded = ModelResult.from_dict(response), from_dict(ModelResult, response)
+
+    assert decoded == expected
+    assert isinstance(decoded.usage, Usage) and decoded.usage.total_tokens == 15
+    assert decoded.details[0].message.content == "answer"
+    assert (decoded.run_time, decoded.used_credits) == (1.5, 0.002)
+
+
+@dataclass_json
+@dataclass
+class _Inner:
+    value: int
+    label: str = "x"
+
+
+@dataclass_json
+@dataclass
+class _Outer:
+    name: str
+    inners: List[_Inner] = field(default_factory=list)
+    by_key: Dict[str, _Inner] = field(default_factory=dict)
+    first: Optional[_Inner] = field(default=None, metadata=config(field_name="firstInner"))
+
+
+def test_nested_collections_and_defaults():
+    data = {"name": "o", "inners": [{"value": "1"}], "by_key": {"a": {"value": 2}}, "firstInner": {"value": 3}}
+
+    decoded = dataclass_decoder(_Outer)(data)
+
+    assert decoded == _Outer.from_dict(data)
+    assert decoded.inners == [_Inner(value=1)] and decoded.by_key == {"a": _Inner(value=2)}
+    assert decoded.first == _Inner(value=3)
+    assert dataclass_decoder(_Outer)({"name": "o"}) == _Outer(name="o")
+    assert dataclass_decoder(_Outer)(decoded) is decoded
+
+
+def test_missing_and_none_values_behave_like_from_dict():
+    with pytest.raises(KeyError):
+        dataclass_decoder(_Outer)({"inners": []})
+    with pytest.warns(RuntimeWarning, match="non-optional type name"):
+        decoded = dataclass_decoder(_Outer)({"name": None})
+    assert decoded.name is None
+
+
+def test_decoder_is_built_once_per_class():
+    assert dataclass_decoder(_Outer) is dataclass_decoder(_Outer)
+
+
+def test_undefined_policy_is_delegated_to_dataclasses_json():
+    @dataclass_json(undefined=Undefined.INCLUDE)
+    @dataclass
+    class WithCatchAll:
+        name: str
+        rest: CatchAll = None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        decoded = dataclass_decoder(WithCatchAll)({"name": "n", "other": 1})
+    assert decoded.rest == {"other": 1}
+
+
+def test_overridden_from_dict_is_respected():
+    calls = []
+
+    @dataclass_json
+    @dataclass
+    class Custom:
+        name: str
+
+    original = Custom.from_dict.__func__
+
+    def custom_from_dict(cls, kvs, *, infer_missing=False):
+        calls.append(kvs)
+        return original(cls, kvs, infer_missing=infer_missing)
+
+    Custom.from_dict = classmethod(custom_from_dict)
+
+    assert from_dict(Custom, {"name": "n"}) == Custom(name="n")
+    assert calls == [{"name": "n"}]
+
+
+def test_fallback_decoder_does_not_recurse_into_from_dict_overrides(monkeypatch):
+    """Without the ``dataclasses_json`` helpers, overrides calling the decoder still terminate."""
+    monkeypatch.setattr("aixplain.v2.decoders._decode_dataclass", None)
+    monkeypatch.setattr("aixplain.v2.decoders._DECODERS", {})
+
+    @dataclass_json
+    @dataclass
+    class Wrapped:
+        name: str
+
+    Wrapped.from_dict = classmethod(lambda cls, kvs, **kwargs: dataclass_decoder(cls)(kvs))
+
+    assert Wrapped.from_dict({"name": "n"}) == Wrapped(name="n")
+    assert from_dict(Wrapped, {"name": "n"}) == Wrapped(name="n")
+
+
+def test_older_dataclasses_json_without_helpers_falls_back_to_from_dict(monkeypatch):
+    """With a ``dataclasses_json`` release lacking the helpers, decoding still matches ``from_dict``."""
+    monkeypatch.delattr("dataclasses_json.utils._is_generic_dataclass")
+    try:
+        importlib.reload(decoders)
+        assert decoders._decode_dataclass is None
+        item = _model_item(0)
+        assert decoders.from_dict(Model, item).to_dict() == Model.from_dict(item).to_dict()
+    finally:
+        monkeypatch.undo()
+        importlib.reload(decoders)
+
+
+@pytest.mark.benchmark
+def test_compiled_decoder_throughput():
+    """Benchmark: decode a 1,000-model listing and 200 poll results both ways."""
+    items = [_model_item(n) for n in range(1000)]
+    polls = [_poll_response() for _ in range(200)]
+    decode_model, decode_result = dataclass_decoder(Model), dataclass_decoder(ModelResult)
+
+    def best_of(fn, repeat=2):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    timings = {
+        "listing from_dict": best_of(lambda: [Model.from_dict(item) for item in items]),
+        "listing compiled": best_of(lambda: [decode_model(item) for item in items]),
+        "polls from_dict": best_of(lambda: [ModelResult.from_dict(poll) for poll in polls]),
+        "polls compiled": best_of(lambda: [decode_result(poll) for poll in polls]),
+    }
+
+    print("\n" + ", ".join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in timings.items()))
@@ -0,0 +1,67 @@
+"""Import-time guards for the lazily loaded ``aixplain`` package.
+
+Each check runs in a fresh interpreter so modules imported by other tests do
+not hide regressions. Besides asserting which heavy modules stay unloaded, a
+benchmark (run with ``--run-benchmarks``) holds the ``-X importtime``
+cumulative figure of ``aixplain`` under a budget.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Generous ceiling (microseconds) for `import aixplain`; it takes ~15ms when lazy
+# and over 800ms when the v2 resources are imported eagerly.
+IMPORT_BUDGET_US = 250_000
+
+HEAVY_MODULES = ["aixplain.v2.core", "aixplain.v2.agent_evaluator", "pandas", "numpy", "requests"]
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, TEAM_API_KEY="test-key")
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], env=env, capture_output=True, text=True, check=True, timeout=120
+    )
+
+
+def _loaded(code: str, modules=HEAVY_MODULES) -> dict:
+    probe = f"{code}\nimport json, sys\nprint(json.dumps({{m: m in sys.modules for m in {modules!r}}}))"
+    return json.loads(_run(probe).stdout.strip().splitlines()[-1])
+
+
+def test_import_aixplain_loads_no_resources():
+    loaded = _loaded("import aixplain")
+    assert not any(loaded.values()), loaded
+
+
+@pytest.mark.benchmark
+def test_import_aixplain_stays_within_budget():
+    stderr = _run("import aixplain", "-X", "importtime").stderr
+    cumulative = [int(line.split("|")[1]) for line in stderr.splitlines() if line.rstrip().endswith("| aixplain")]
+    assert cumulative and cumulative[0] < IMPORT_BUDGET_US, cumulative
+
+
+def test_context_creation_defers_evaluation_stack():
+    loaded = _loaded("from aixplain import Aixplain\nAixplain(api_key='k')")
+    assert loaded["aixplain.v2.core"]
+    assert not loaded["aixplain.v2.agent_evaluator"] and not loaded["pandas"] and not loaded["numpy"]
+
+
+def test_lazy_names_resolve_on_access():
+    code = (
+        "import aixplain, aixplain.v2 as v2\n"
+        "ctx = aixplain.Aixplain(api_key='k')\n"
+        "assert ctx.Metric.context is ctx and ctx.Eval is v2.Eval\n"
+        "assert aixplain.Aixplain.Metric is None\n"
+        "assert isinstance(aixplain.aixplain_v2, aixplain.Aixplain)\n"
+        "assert set(v2.__all__) <= set(dir(v2))"
+    )
+    _run(code)
+
+
+@pytest.mark.parametrize("module", ["aixplain", "aixplain.v2"])
+def test_unknown_attribute_raises_attribute_error(module):
+    _run(f"import {module} as m\ntry:\n    m.does_not_exist\nexcept AttributeError:\n    pass\nelse:\n    raise SystemExit(1)")
@@ -1239,3 +1239,22 @@ class TestBaseResourceEncodedId:
 
         with pytest.raises(ValidationError, match="deleted"):
             _ = resource.encoded_id
+
+
+def test_iter_search_streams_all_pages():
+    class FixtureResource(BaseResource, SearchResourceMixin[BaseSearchParams, "FixtureResource"]):
+        RESOURCE_PATH = "demo"
+
+    def paginate(method, path, json):
+        start = json["pageNumber"] * json["pageSize"]
+        items = [{"id": str(i), "name": f"r{i}"} for i in range(start, min(start + json["pageSize"], 5))]
+        return {"results": items, "total": 5, "pageTotal": 3}
+
+    FixtureResource.context = Mock(client=Mock(request=Mock(side_effect=paginate)))
+
+    ids = [resource.id for resource in FixtureResource.iter_search(page_size=2, query="r")]
+
+    assert ids == ["0", "1", "2", "3", "4"]
+    filters = [call.kwargs["json"] for call in FixtureResource.context.client.request.call_args_list]
+    assert [f["pageNumber"] for f in filters] == [0, 1, 2]
+    assert all(f["q"] == "r" for f in filters)
@@ -0,0 +1,174 @@
+"""Unit tests for the opt-in get/search response cache.
+
+Covers: LRU eviction, per-type TTLs, statistics, memoization of
+``GetResourceMixin.get`` / ``SearchResourceMixin.search`` on a context with a
+cache, and invalidation on ``save()`` / ``delete()``.
+"""
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from dataclasses_json import dataclass_json
+
+from aixplain.v2.core import Aixplain
+from aixplain.v2.resource import (
+    BaseDeleteParams,
+    BaseGetParams,
+    BaseResource,
+    BaseSearchParams,
+    DeleteResourceMixin,
+    DeleteResult,
+    GetResourceMixin,
+    SearchResourceMixin,
+)
+from aixplain.v2.resource_cache import GET, ResourceCache, make_key
+
+
+def _resource_class(cache):
+    @dataclass_json
+    @dataclass
+    class Demo(
+        BaseResource,
+        GetResourceMixin[BaseGetParams, "Demo"],
+        SearchResourceMixin[BaseSearchParams, "Demo"],
+        DeleteResourceMixin[BaseDeleteParams, DeleteResult],
+    ):
+        RESOURCE_PATH = "demo"
+
+    Demo.context = SimpleNamespace(
+        cache=cache,
+        client=Mock(
+            get=Mock(side_effect=lambda path, **kw: {"id": path.rsplit("/", 1)[-1], "name": "fresh"}),
+            request=Mock(return_value={"results": [{"id": "1", "name": "a"}], "total": 1, "pageTotal": 1}),
+            request_raw=Mock(return_value=None),
+        ),
+    )
+    return Demo
+
+
+class TestResourceCache:
+    """Tests for the cache data structure."""
+
+    def test_evicts_least_recently_used(self):
+        """The entry not used for longest is evicted once max_size is exceeded."""
+        cache = ResourceCache(max_size=2)
+        cache.put(make_key(GET, "Model", "a"), 1)
+        cache.put(make_key(GET, "Model", "b"), 2)
+        cache.get(make_key(GET, "Model", "a"))
+        cache.put(make_key(GET, "Model", "c"), 3)
+
+        assert cache.get(make_key(GET, "Model", "b")) is None
+        assert cache.get(make_key(GET, "Model", "a")) == 1
+        assert cache.stats().evictions == 1
+
+    def test_ttl_per_resource_type(self):
+        """Entries expire after their type's TTL; a TTL of 0 disables caching."""
+        cache = ResourceCache(ttl=60, ttl_by_type={"Agent": 0, "Tool": 5})
+        cache.put(make_key(GET, "Agent", "a"), 1)
+        cache.put(make_key(GET, "Tool", "t"), 2)
+        cache.put(make_key(GET, "Model", "m"), 3)
+
+        with patch("aixplain.v2.resource_cache.time.monotonic", return_value=10**9):
+            assert cache.get(make_key(GET, "Tool", "t")) is None
+        assert cache.get(make_key(GET, "Agent", "a")) is None
+        assert cache.get(make_key(GET, "Model", "m")) == 3
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+
+    def test_values_are_copied(self):
+        """Mutating a returned value does not change the cached one."""
+        cache = ResourceCache()
+        key = make_key(GET, "Model", "a", {"params": {"host": "x"}})
+        cache.put(key, {"nested": [1]})
+        cache.get(key)["nested"].append(2)
+
+        assert cache.get(key) == {"nested": [1]}
+
+
+class TestResourceMemoization:
+    """Tests for get/search going through the context cache."""
+
+    def test_get_is_memoized_per_id(self):
+        """Repeated gets of the same id hit the backend once and return distinct objects."""
+        Demo = _resource_class(ResourceCache())
+
+        first = Demo.get("1")
+        second = Demo.get("1")
+        Demo.get("2")
+
+        assert Demo.context.client.get.call_count == 2
+        assert first is not second and second.name == "fresh"
+        assert Demo.context.cache.stats().hits == 1
+
+    def test_search_is_memoized_per_filters(self):
+        """Identical searches are served from the cache; different filters are not."""
+        Demo = _resource_class(ResourceCache())
+
+        Demo.search(query="x")
+        page = Demo.search(query="x")
+        Demo.search(query="y")
+
+        assert Demo.context.client.request.call_count == 2
+        assert page.results[0].id == "1"
+
+    def test_save_and_delete_invalidate(self):
+        """Writes drop cached gets of the resource and every cached search."""
+        Demo = _resource_class(ResourceCache())
+        Demo.context.client.request.side_effect = lambda method, path, **kw: (
+            {"results": [], "total": 0, "pageTotal": 0} if path.endswith("paginate") else {}
+        )
+        resource = Demo.get("1")
+        Demo.get("2")
+        Demo.search()
+
+        resource.save(name="renamed")
+        Demo.get("1")
+        Demo.get("2")
+        Demo.search()
+        assert Demo.context.client.get.call_count == 3
+
+        resource.delete()
+        Demo.get("1")
+        assert Demo.context.client.get.call_count == 4
+        assert Demo.context.cache.stats().invalidations == 4
+
+    def test_save_invalidates_get_by_path(self):
+        """A get by a path-style id is dropped when the resource is saved under its own id."""
+        Demo = _resource_class(ResourceCache())
+        Demo.context.client.get.side_effect = lambda path, **kw: {"id": "m1", "name": "fresh"}
+        Demo.context.client.request.return_value = {}
+
+        resource = Demo.get("openai/gpt-4o")
+        resource.save(name="renamed")
+        Demo.get("openai/gpt-4o")
+
+        assert Demo.context.client.get.call_count == 2
+
+    def test_disabled_without_cache(self):
+        """Without a cache every call goes to the backend."""
+        Demo = _resource_class(None)
+
+        Demo.get("1")
+        Demo.get("1")
+
+        assert Demo.context.client.get.call_count == 2
+
+
+class TestContextOption:
+    """Tests for the Aixplain(cache=...) option."""
+
+    def test_cache_is_opt_in_and_per_context(self):
+        """cache=True creates a private ResourceCache; the default is no cache."""
+        assert Aixplain(api_key="k").cache is None
+
+        first = Aixplain(api_key="k", cache=True)
+        second = Aixplain(api_key="k", cache=True)
+        custom = ResourceCache(max_size=10)
+
+        assert isinstance(first.cache, ResourceCache)
+        assert first.cache is not second.cache
+        assert Aixplain(api_key="k", cache=custom).cache is custom